@@ -1,4 +1,5 @@
 __version__ = "0.3.3"
 
 from .detect_pitfalls_main import main
+from .api import Assessment, analyze, analyze_many
 from .cli import cli
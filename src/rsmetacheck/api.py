@@ -0,0 +1,131 @@
+"""
+Library API: analysis of SoMEF outputs held in memory.
+
+analyze and analyze_many run the same detectors as the command line on SoMEF dicts and
+return Assessment objects. They read and write no files, print nothing and keep no state
+between calls, so they can be used from services and notebooks:
+
+    from rsmetacheck import analyze_many
+
+    for assessment in analyze_many(somef_outputs):
+        print(assessment.name, assessment.codes)
+
+The JSON-LD assessment is only built on request (Assessment.to_jsonld). P008 and P015
+request the URLs they check; ignore them in the configuration for a fully offline analysis.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from rsmetacheck.config import AnalysisConfig
+from rsmetacheck.detect_pitfalls_main import (
+    PITFALL_DETECTORS,
+    detector_calls,
+    evaluate_checks,
+    has_timeouts,
+    prepare_somef_data,
+)
+from rsmetacheck.detector_worker import DetectorWorker, run_detectors_in_process
+from rsmetacheck.utils.detector_plan import detector_plan
+from rsmetacheck.utils.detector_result import DetectorResult
+from rsmetacheck.utils.json_ld_utils import create_pitfall_jsonld
+from rsmetacheck.utils.pitfall_utils import extract_programming_languages, shared_category_views
+
+DEFAULT_NAME = "somef_output.json"
+
+
+@dataclass
+class Assessment:
+    """
+    Outcome of every check on one SoMEF output.
+
+    results holds one DetectorResult per check and finding (negative for the checks that
+    found nothing); errors maps the code of each check whose detector failed to its error.
+    """
+    name: str
+    results: List[DetectorResult]
+    languages: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    somef_data: Dict = field(default_factory=dict, repr=False)
+
+    @property
+    def issues(self) -> List[DetectorResult]:
+        return [result for result in self.results if result.has_issue]
+
+    @property
+    def codes(self) -> List[str]:
+        """Codes of the pitfalls and warnings found, in catalog order."""
+        return list(dict.fromkeys(result.code for result in self.issues))
+
+    @property
+    def has_pitfalls(self) -> bool:
+        return any(result.has_pitfall for result in self.results)
+
+    @property
+    def has_warnings(self) -> bool:
+        return any(result.has_warning for result in self.results)
+
+    @property
+    def incomplete(self) -> List[str]:
+        """Codes of the checks that did not finish within their time budget."""
+        return [result.code for result in self.results if result.incomplete]
+
+    def notes(self) -> List[Tuple[str, str]]:
+        """(code, text) of every note."""
+        return [(result.code, text) for result in self.results if result.has_note for text in result.note_texts()]
+
+    def to_jsonld(self, verbose: bool = False, commit_id: str = "Unknown") -> Dict:
+        """
+        JSON-LD assessment, as written by the command line. The commit ID is not looked up:
+        pass it when it is known.
+        """
+        return create_pitfall_jsonld(self.somef_data, self.results, self.name, verbose=verbose, commit_id=commit_id)
+
+
+def _assess(somef_data: Dict, name: str, config: AnalysisConfig, worker: Optional[DetectorWorker]) -> Assessment:
+    if not isinstance(somef_data, dict):
+        raise TypeError(f"SoMEF output must be a dict, got {type(somef_data).__name__}")
+
+    somef_data = prepare_somef_data(somef_data, config)
+    assessment = Assessment(name, [], extract_programming_languages(somef_data), somef_data=somef_data)
+
+    plan = detector_plan(PITFALL_DETECTORS, somef_data, config.is_ignored)
+    calls = detector_calls(plan, config)
+    # The detectors of a repository share their parsed views of its categories.
+    with shared_category_views():
+        outcomes = worker.run(calls, somef_data, name) if worker else run_detectors_in_process(calls, somef_data, name)
+        for check in evaluate_checks(plan, outcomes, name, config):
+            assessment.results.extend(check.results)
+            if check.error is not None:
+                assessment.errors[check.code] = check.error
+    return assessment
+
+
+def analyze(somef_data: Dict, config: AnalysisConfig = None, name: str = DEFAULT_NAME) -> Assessment:
+    """
+    Run every check on one SoMEF output (the parsed JSON). name stands for the SoMEF file
+    name in the results. somef_data is not modified.
+    """
+    return next(analyze_many([(name, somef_data)], config))
+
+
+def analyze_many(
+    somef_outputs: Iterable[Union[Dict, Tuple[str, Dict]]],
+    config: AnalysisConfig = None,
+) -> Iterator[Assessment]:
+    """
+    Run every check on each SoMEF output, given as a dict or a (name, dict) pair, and yield
+    the assessments one at a time as the outputs are consumed. Outputs without a name are
+    named somef_output_<position>.json.
+
+    With time budgets in the configuration, the detectors run in a worker process that
+    lives as long as the iteration.
+    """
+    config = config or AnalysisConfig.empty()
+    worker = DetectorWorker() if has_timeouts(config) else None
+    try:
+        for position, item in enumerate(somef_outputs):
+            name, somef_data = item if isinstance(item, tuple) else (f"somef_output_{position}.json", item)
+            yield _assess(somef_data, name, config, worker)
+    finally:
+        if worker:
+            worker.shutdown()
@@ -1,22 +1,76 @@
 import argparse
-import json
+import contextlib
 import os
 import sys
 from pathlib import Path
 
-from rsmetacheck.config import AnalysisConfig, load_analysis_config
-from rsmetacheck.run_analyzer import run_analysis
+from rsmetacheck.config import DEFAULT_TIMEOUT_KEY, AnalysisConfig, load_analysis_config
+from rsmetacheck.detect_pitfalls_main import AnalysisSession
+from rsmetacheck.run_analyzer import run_analysis, run_pipelined_analysis
 from rsmetacheck.run_somef import (
+    RetryPolicy,
     ensure_somef_configured,
     run_somef_batch,
     run_somef_single,
+    write_failed_repositories,
 )
+from rsmetacheck.shard import (
+    DEFAULT_LEASE,
+    STATUS_CLAIMED,
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    WorkQueue,
+    collect_work_items,
+    merge_shards,
+    run_shard_worker,
+)
+from rsmetacheck.somef_worker import SomefWorkerPool
+from rsmetacheck.utils.github_rate_limit import DEFAULT_MAX_WAIT, DEFAULT_RESERVE, configure_token_pool
+from rsmetacheck.utils import serialization
+from rsmetacheck.utils.jsonld_stream import export_pitfall_stream
+from rsmetacheck.utils.results_store import ResultsStore
+from rsmetacheck.utils.serialization import read_json
+from rsmetacheck.utils.somef_inputs import expand_somef_inputs
+from rsmetacheck.watch import DEFAULT_DEBOUNCE, DirectoryWatch
+
+
+def _watch(args, analysis_config: AnalysisConfig) -> None:
+    if not args.skip_somef:
+        print("Error: --watch requires --skip-somef.")
+        return
+    if args.pitfalls_stream or args.results_db:
+        print("Error: --watch cannot be combined with --pitfalls-stream or --results-db.")
+        return
+    directories = [path for path in args.input if os.path.isdir(path)]
+    for path in args.input:
+        if path not in directories:
+            print(f"Warning: --watch only watches directories, skipping: {path}")
+    if not directories:
+        print("Error: No directory to watch.")
+        return
+
+    session = AnalysisSession(
+        args.pitfalls_output,
+        args.analysis_output,
+        verbose=args.verbose,
+        notes_output=args.notes_output,
+        analysis_config=analysis_config,
+        stats_output=args.stats_output,
+        profile_output=args.profile_output,
+        detector_cache=args.detector_cache,
+    )
+    DirectoryWatch(session, directories, debounce=args.watch_debounce).run()
+
+
+def _apply_detector_timeout(analysis_config: AnalysisConfig, seconds: float) -> None:
+    if seconds:
+        analysis_config.detector_timeouts[DEFAULT_TIMEOUT_KEY] = seconds
 
 
 def _exit_on_findings(analysis_output: str, analysis_config: AnalysisConfig) -> None:
     try:
-        with open(analysis_output) as f:
-            data = json.load(f)
+        data = read_json(analysis_output)
     except Exception as e:
         print(f"Warning: Could not read analysis output to evaluate exit code: {e}")
         return
@@ -37,7 +91,282 @@ def _exit_on_findings(analysis_output: str, analysis_config: AnalysisConfig) ->
         sys.exit(1)
 
 
+def _run_somef_inputs(args, on_output=None, worker_pool=None, failures=None) -> bool:
+    """
+    Run SoMEF on every --input item (repository URL or JSON file listing repositories).
+    Returns True if SoMEF produced at least one output.
+    """
+    any_somef_success = False
+    retry_policy = RetryPolicy(
+        timeout=args.somef_timeout or None,
+        max_retries=args.somef_retries,
+        backoff=args.somef_retry_backoff,
+    )
+
+    for input_item in args.input:
+        if input_item.startswith("http://") or input_item.startswith("https://"):
+            print(f"Processing repository URL: {input_item}")
+            success = run_somef_single(
+                input_item,
+                args.somef_output,
+                args.threshold,
+                branch=args.branch,
+                generate_codemeta=args.generate_codemeta,
+                on_output=on_output,
+                worker_pool=worker_pool,
+                retry_policy=retry_policy,
+                failures=failures,
+            )
+            any_somef_success = any_somef_success or bool(success)
+        elif os.path.exists(input_item):
+            print(f"Processing repositories from file: {input_item}")
+            success = run_somef_batch(
+                input_item,
+                args.somef_output,
+                args.threshold,
+                branch=args.branch,
+                generate_codemeta=args.generate_codemeta,
+                on_output=on_output,
+                worker_pool=worker_pool,
+                retry_policy=retry_policy,
+                failures=failures,
+            )
+            any_somef_success = any_somef_success or bool(success)
+        else:
+            print(
+                f"Warning: Skipping invalid input (not a URL or existing file): {input_item}"
+            )
+
+    return any_somef_success
+
+
+def export_cli(argv):
+    parser = argparse.ArgumentParser(
+        prog="rsmetacheck export",
+        description="Write one JSON-LD file per repository from a --pitfalls-stream file.",
+    )
+    parser.add_argument(
+        "stream",
+        help="JSON Lines file (.jsonl or .jsonl.gz) produced with --pitfalls-stream.",
+    )
+    parser.add_argument(
+        "--pitfalls-output",
+        default=os.path.join(os.getcwd(), "pitfalls_outputs"),
+        help="Directory to store pitfall JSON-LD files (default: ./pitfalls_outputs).",
+    )
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.stream):
+        print(f"Error: Stream file not found: {args.stream}")
+        return
+
+    files_created = export_pitfall_stream(args.stream, args.pitfalls_output)
+    print(f"Exported {files_created} JSON-LD files to: {args.pitfalls_output}")
+
+
+def shard_cli(argv):
+    parser = argparse.ArgumentParser(
+        prog="rsmetacheck shard",
+        description="Split a run across several machines through a shared SQLite work queue.",
+    )
+    actions = parser.add_subparsers(dest="action", required=True)
+
+    init_parser = actions.add_parser("init", help="Create (or extend) the work queue.")
+    init_parser.add_argument("--queue", required=True, help="SQLite queue file on a filesystem shared by all nodes.")
+    init_parser.add_argument(
+        "--input",
+        nargs="+",
+        required=True,
+        help="GitHub/GitLab URLs, JSON or CSV files listing repositories, or SoMEF output files and directories.",
+    )
+
+    work_parser = actions.add_parser("work", help="Process queue items until the queue is empty.")
+    work_parser.add_argument("--queue", required=True, help="SQLite queue file created with 'shard init'.")
+    work_parser.add_argument(
+        "--shard-output",
+        default=os.path.join(os.getcwd(), "shards"),
+        help="Directory receiving one sub-directory per node (default: ./shards).",
+    )
+    work_parser.add_argument("--node", default=None, help="Name of this node (default: <hostname>-<pid>).")
+    work_parser.add_argument(
+        "--lease",
+        type=float,
+        default=DEFAULT_LEASE,
+        help=f"Seconds a claimed item stays reserved for this node; must exceed --somef-timeout (default: {DEFAULT_LEASE:.0f}).",
+    )
+    work_parser.add_argument("--threshold", type=float, default=0.8, help="SoMEF confidence threshold (default: 0.8).")
+    work_parser.add_argument("-b", "--branch", help="Branch of the repositories to analyze.")
+    work_parser.add_argument("--somef-backend", choices=["cli", "in-process"], default="cli",
+                             help="How SoMEF is run (default: cli).")
+    work_parser.add_argument("--somef-timeout", type=float, default=1800,
+                             help="Maximum time in seconds for SoMEF on one repository (default: 1800, 0 for no limit).")
+    work_parser.add_argument("--somef-retries", type=int, default=2,
+                             help="How many times a repository is put back in the queue after a retriable failure (default: 2).")
+    work_parser.add_argument("--detector-timeout", type=float, default=0,
+                             help="Default time budget in seconds for each check (default: 0, no limit).")
+    work_parser.add_argument("--verbose", action="store_true", help="Include undetected pitfalls in the JSON-LD.")
+    work_parser.add_argument("--config", default=None, help="Path to RsMetaCheck TOML config file.")
+    work_parser.add_argument("--config-profile", default=None, help="Name of config profile to apply.")
+
+    merge_parser = actions.add_parser("merge", help="Combine the shard outputs.")
+    merge_parser.add_argument(
+        "shards",
+        nargs="+",
+        help="Shard directories, or the --shard-output directory holding them.",
+    )
+    merge_parser.add_argument("--queue", default=None, help="Queue file, to report items that are not done.")
+    merge_parser.add_argument(
+        "--pitfalls-output",
+        default=os.path.join(os.getcwd(), "pitfalls_outputs"),
+        help="Directory to store pitfall JSON-LD files (default: ./pitfalls_outputs).",
+    )
+    merge_parser.add_argument(
+        "--analysis-output",
+        default=os.path.join(os.getcwd(), "analysis_results.json"),
+        help="File path for summary results (default: ./analysis_results.json).",
+    )
+    merge_parser.add_argument("--notes-output", default=None, help="File path for notes output.")
+
+    status_parser = actions.add_parser("status", help="Show how many items are pending, claimed, done or failed.")
+    status_parser.add_argument("--queue", required=True, help="SQLite queue file created with 'shard init'.")
+
+    args = parser.parse_args(argv)
+
+    if args.action == "init":
+        items = collect_work_items(args.input)
+        with WorkQueue(args.queue) as queue:
+            try:
+                added = queue.add_items(items)
+            except ValueError as exc:
+                print(f"Error: {exc}")
+                return
+        print(f"Added {added} work item(s) to {args.queue} ({len(items) - added} already queued).")
+
+    elif args.action == "work":
+        try:
+            analysis_config = load_analysis_config(config_path=args.config, profile=args.config_profile)
+        except (FileNotFoundError, ValueError, OSError, Exception) as exc:
+            print(f"Error loading config: {exc}")
+            return
+        _apply_detector_timeout(analysis_config, args.detector_timeout)
+        retry_policy = RetryPolicy(timeout=args.somef_timeout or None, max_retries=args.somef_retries)
+        worker_pool_context = SomefWorkerPool() if args.somef_backend == "in-process" else contextlib.nullcontext()
+        with worker_pool_context as worker_pool:
+            processed = run_shard_worker(
+                args.queue,
+                args.shard_output,
+                node=args.node,
+                lease=args.lease,
+                verbose=args.verbose,
+                analysis_config=analysis_config,
+                threshold=args.threshold,
+                branch=args.branch,
+                worker_pool=worker_pool,
+                retry_policy=retry_policy,
+            )
+        print(f"Node finished after analyzing {processed} item(s).")
+
+    elif args.action == "merge":
+        if args.queue:
+            with WorkQueue(args.queue) as queue:
+                counts = queue.counts()
+            unfinished = {status: n for status, n in counts.items() if status != STATUS_DONE}
+            if unfinished:
+                print(f"Warning: queue items not done: {unfinished}")
+        merge_shards(args.shards, args.pitfalls_output, args.analysis_output, args.notes_output)
+
+    else:
+        with WorkQueue(args.queue) as queue:
+            counts = queue.counts()
+            failed = queue.failed_items()
+        for status in (STATUS_PENDING, STATUS_CLAIMED, STATUS_DONE, STATUS_FAILED):
+            print(f"{status}: {counts.get(status, 0)}")
+        for value, error in failed:
+            print(f"  failed {value}: {error}")
+
+
+def _print_rows(rows, columns):
+    """Print a list of dicts as an aligned text table."""
+    if not rows:
+        print("No results.")
+        return
+    widths = [max(len(column), *(len(str(row[column])) for row in rows)) for column in columns]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[column]).ljust(width) for column, width in zip(columns, widths)))
+
+
+def query_cli(argv):
+    parser = argparse.ArgumentParser(
+        prog="rsmetacheck query",
+        description="Query the findings stored with --results-db.",
+    )
+    parser.add_argument("--db", required=True, help="Results database written with --results-db.")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON.")
+    queries = parser.add_subparsers(dest="query", required=True)
+
+    queries.add_parser("runs", help="List the stored runs.")
+    codes_parser = queries.add_parser("codes", help="Repositories affected by each pitfall and warning.")
+    codes_parser.add_argument("--run", default=None, help="Run ID or ISO date (default: latest run).")
+    languages_parser = queries.add_parser("languages", help="Repositories with findings per language.")
+    languages_parser.add_argument("--run", default=None, help="Run ID or ISO date (default: latest run).")
+    languages_parser.add_argument("--code", default=None, help="Only count this pitfall or warning code.")
+    delta_parser = queries.add_parser("delta", help="Repositories that gained or lost a code between two runs.")
+    delta_parser.add_argument("--code", required=True, help="Pitfall or warning code, e.g. P015.")
+    delta_parser.add_argument("--from", dest="old_run", required=True, help="Earlier run ID or ISO date.")
+    delta_parser.add_argument("--to", dest="new_run", default=None, help="Later run ID or ISO date (default: latest run).")
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"Error: Results database not found: {args.db}")
+        return
+
+    with ResultsStore(args.db) as store:
+        if args.query == "runs":
+            result = store.runs()
+            columns = ["run", "started_at", "rsmetacheck_version", "repositories", "findings"]
+        elif args.query == "delta":
+            old_run, new_run = store.resolve_run(args.old_run), store.resolve_run(args.new_run)
+            if old_run is None or new_run is None:
+                print("Error: No stored run matches --from/--to.")
+                return
+            result = {"code": args.code, "from_run": old_run, "to_run": new_run, **store.delta(args.code, old_run, new_run)}
+        else:
+            run_id = store.resolve_run(args.run)
+            if run_id is None:
+                print("Error: No stored run matches --run.")
+                return
+            if args.query == "codes":
+                result = store.code_counts(run_id)
+                columns = ["code", "kind", "repositories", "percentage"]
+            else:
+                result = store.language_counts(run_id, args.code)
+                columns = ["language", "repositories", "with_findings"]
+
+    if args.json:
+        print(serialization.dumps(result))
+    elif args.query == "delta":
+        print(f"{args.code} from run {result['from_run']} to run {result['to_run']}:")
+        for key in ("fixed", "new", "unchanged"):
+            print(f"  {key}: {len(result[key])}")
+            for repository in result[key] if key != "unchanged" else []:
+                print(f"    {repository}")
+    else:
+        _print_rows(result, columns)
+
+
+SUBCOMMANDS = {
+    "export": export_cli,
+    "query": query_cli,
+    "shard": shard_cli,
+}
+
+
 def cli():
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        return SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description="Detect metadata pitfalls in software repositories using SoMEF."
     )
@@ -50,13 +379,44 @@ def cli():
     parser.add_argument(
         "--skip-somef",
         action="store_true",
-        help="Skip SoMEF execution and analyze existing SoMEF output files directly. --input should point to SoMEF JSON files.",
+        help="Skip SoMEF execution and analyze existing SoMEF output files directly. --input should point to SoMEF JSON files, "
+             "compressed JSON files (.json.gz, .json.zst) or archives of them (.tar, .tar.gz, .tar.zst, .zip).",
     )
     parser.add_argument(
         "--pitfalls-output",
         default=os.path.join(os.getcwd(), "pitfalls_outputs"),
         help="Directory to store pitfall JSON-LD files (default: ./pitfalls_outputs).",
     )
+    parser.add_argument(
+        "--pitfalls-stream",
+        default=None,
+        help="Write all JSON-LD assessments to this single JSON Lines file instead of one file per repository. "
+             "A .gz suffix enables gzip compression. Use 'rsmetacheck export' to recreate the individual files.",
+    )
+    parser.add_argument(
+        "--results-db",
+        default=None,
+        help="SQLite database the findings of this run are added to, for 'rsmetacheck query' "
+             "(default: None, no database is written).",
+    )
+    parser.add_argument(
+        "--stats-output",
+        default=None,
+        help="File path for corpus statistics: per-language rates, co-occurrence of codes and the metadata "
+             "files findings come from (default: None, not created unless specified).",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="File path for the detector profile: invocations, skips, errors and run time of each check "
+             "(default: None, not created unless specified).",
+    )
+    parser.add_argument(
+        "--detector-cache",
+        default=None,
+        help="SQLite database of detector results reused across runs: a check only runs again when the SoMEF "
+             "categories it reads, its parameters or its code changed (default: None, no cache).",
+    )
     parser.add_argument(
         "--somef-output",
         default=os.path.join(os.getcwd(), "somef_outputs"),
@@ -91,11 +451,88 @@ def cli():
         help="Generate codemeta files for each repository. Only used when running SoMEF.",
     )
 
+    parser.add_argument(
+        "--somef-backend",
+        choices=["cli", "in-process"],
+        default="cli",
+        help="How SoMEF is run: 'cli' starts one `somef describe` process per repository (default); "
+             "'in-process' imports SoMEF once in a long-lived worker process, falling back to the CLI if that fails.",
+    )
+    parser.add_argument(
+        "--somef-timeout",
+        type=float,
+        default=1800,
+        help="Maximum time in seconds for SoMEF on one repository before it is killed (default: 1800, 0 for no limit).",
+    )
+    parser.add_argument(
+        "--somef-retries",
+        type=int,
+        default=2,
+        help="How many times a repository is retried after a timeout, rate limit or unexpected SoMEF error (default: 2).",
+    )
+    parser.add_argument(
+        "--somef-retry-backoff",
+        type=float,
+        default=10.0,
+        help="Seconds to wait before the first retry; the wait doubles on every further retry (default: 10).",
+    )
+    parser.add_argument(
+        "--failed-output",
+        default=os.path.join(os.getcwd(), "failed_repositories.json"),
+        help="File listing the repositories SoMEF could not process, written only if there are failures "
+             "(default: ./failed_repositories.json). It can be passed back to --input to re-run them.",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Analyze each SoMEF output as soon as it is produced instead of waiting for all repositories. "
+             "Only the outputs produced in this run are analyzed. Ignored with --skip-somef.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="With --skip-somef and directories as --input, keep running and analyze SoMEF outputs as they are "
+             "added or modified, updating their JSON-LD files and the summary in place.",
+    )
+    parser.add_argument(
+        "--watch-debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f"Seconds a file must stay unchanged before it is analyzed in --watch mode (default: {DEFAULT_DEBOUNCE:.0f}).",
+    )
+    parser.add_argument(
+        "--github-token",
+        action="append",
+        default=[],
+        help="GitHub token used for SoMEF runs and GitHub API lookups. Repeat the option to rotate "
+             "across several tokens; tokens from GITHUB_TOKENS (comma separated) and GITHUB_TOKEN are added.",
+    )
+    parser.add_argument(
+        "--github-reserve",
+        type=int,
+        default=DEFAULT_RESERVE,
+        help=f"GitHub API requests to leave unused on every token before pausing (default: {DEFAULT_RESERVE}).",
+    )
+    parser.add_argument(
+        "--github-max-wait",
+        type=float,
+        default=DEFAULT_MAX_WAIT,
+        help="Longest pause in seconds for a GitHub rate limit reset; requests that would wait longer are "
+             f"skipped or retried later (default: {DEFAULT_MAX_WAIT:.0f}).",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Include both detected AND undetected pitfalls in the output JSON-LD.",
     )
+    parser.add_argument(
+        "--detector-timeout",
+        type=float,
+        default=0,
+        help="Default time budget in seconds for each check on one repository; checks still running after it "
+             "are stopped and reported as incomplete. Overrides 'default' in the [timeouts] config table "
+             "(default: 0, no limit unless configured).",
+    )
     parser.add_argument(
         "--config",
         default=None,
@@ -109,6 +546,10 @@ def cli():
 
     args = parser.parse_args()
 
+    token_pool = configure_token_pool(args.github_token, args.github_reserve, args.github_max_wait)
+    if token_pool.has_tokens:
+        print(f"Using {len(token_pool.budgets)} GitHub token(s) for SoMEF and GitHub API requests.")
+
     try:
         analysis_config = load_analysis_config(
             config_path=args.config,
@@ -117,18 +558,24 @@ def cli():
     except (FileNotFoundError, ValueError, OSError, Exception) as exc:
         print(f"Error loading config: {exc}")
         return
+    _apply_detector_timeout(analysis_config, args.detector_timeout)
+
+    if args.watch:
+        _watch(args, analysis_config)
+        return
 
     if args.skip_somef:
         print(
             f"Skipping SoMEF execution. Analyzing {len(args.input)} existing SoMEF output files..."
         )
 
-        somef_json_paths = []
+        existing_paths = []
         for json_path in args.input:
             if not os.path.exists(json_path):
                 print(f"Warning: File not found, skipping: {json_path}")
                 continue
-            somef_json_paths.append(Path(json_path))
+            existing_paths.append(json_path)
+        somef_json_paths = expand_somef_inputs(existing_paths)
 
         if not somef_json_paths:
             print("Error: No valid SoMEF output files found.")
@@ -142,6 +589,11 @@ def cli():
             verbose=args.verbose,
             notes_output=args.notes_output,
             analysis_config=analysis_config,
+            pitfalls_stream=args.pitfalls_stream,
+            results_db=args.results_db,
+            stats_output=args.stats_output,
+            profile_output=args.profile_output,
+            detector_cache=args.detector_cache,
         )
 
         _exit_on_findings(args.analysis_output, analysis_config)
@@ -149,43 +601,40 @@ def cli():
     else:
         ensure_somef_configured()
 
-        threshold = args.threshold
-        somef_output_dir = args.somef_output
-        generate_codemeta = args.generate_codemeta
-
         print(f"Detected {len(args.input)} input(s):")
-        if generate_codemeta:
+        if args.generate_codemeta:
             print(
                 "Codemeta generation is ENABLED. Codemeta files will be created for each repository."
             )
 
-        any_somef_success = False
-
-        for input_item in args.input:
-            if input_item.startswith("http://") or input_item.startswith("https://"):
-                print(f"Processing repository URL: {input_item}")
-                success = run_somef_single(
-                    input_item,
-                    somef_output_dir,
-                    threshold,
-                    branch=args.branch,
-                    generate_codemeta=generate_codemeta,
-                )
-                any_somef_success = any_somef_success or bool(success)
-            elif os.path.exists(input_item):
-                print(f"Processing repositories from file: {input_item}")
-                success = run_somef_batch(
-                    input_item,
-                    somef_output_dir,
-                    threshold,
-                    branch=args.branch,
-                    generate_codemeta=generate_codemeta,
+        if args.somef_backend == "in-process":
+            worker_pool_context = SomefWorkerPool()
+        else:
+            worker_pool_context = contextlib.nullcontext()
+
+        failures = []
+        with worker_pool_context as worker_pool:
+            if args.pipeline:
+                any_somef_success = run_pipelined_analysis(
+                    lambda on_output: _run_somef_inputs(
+                        args, on_output=on_output, worker_pool=worker_pool, failures=failures
+                    ),
+                    args.pitfalls_output,
+                    args.analysis_output,
+                    verbose=args.verbose,
+                    notes_output=args.notes_output,
+                    analysis_config=analysis_config,
+                    pitfalls_stream=args.pitfalls_stream,
+                    results_db=args.results_db,
+                    stats_output=args.stats_output,
+                    profile_output=args.profile_output,
+                    detector_cache=args.detector_cache,
                 )
-                any_somef_success = any_somef_success or bool(success)
             else:
-                print(
-                    f"Warning: Skipping invalid input (not a URL or existing file): {input_item}"
-                )
+                any_somef_success = _run_somef_inputs(args, worker_pool=worker_pool, failures=failures)
+
+        if failures:
+            write_failed_repositories(failures, args.failed_output)
 
         if not any_somef_success:
             print(
@@ -196,15 +645,21 @@ def cli():
             )
             return
 
-        print(f"\nRunning analysis on outputs in {somef_output_dir}...")
-        run_analysis(
-            somef_output_dir,
-            args.pitfalls_output,
-            args.analysis_output,
-            verbose=args.verbose,
-            notes_output=args.notes_output,
-            analysis_config=analysis_config,
-        )
+        if not args.pipeline:
+            print(f"\nRunning analysis on outputs in {args.somef_output}...")
+            run_analysis(
+                args.somef_output,
+                args.pitfalls_output,
+                args.analysis_output,
+                verbose=args.verbose,
+                notes_output=args.notes_output,
+                analysis_config=analysis_config,
+                pitfalls_stream=args.pitfalls_stream,
+                results_db=args.results_db,
+                stats_output=args.stats_output,
+                profile_output=args.profile_output,
+                detector_cache=args.detector_cache,
+            )
 
         _exit_on_findings(args.analysis_output, analysis_config)
 
@@ -9,12 +9,16 @@ import tomllib
 
 DEFAULT_CONFIG_FILENAMES = (".rsmetacheck.toml", "rsmetacheck.toml")
 
+# Key of the [timeouts] table that applies to every check without an entry of its own.
+DEFAULT_TIMEOUT_KEY = "DEFAULT"
+
 
 @dataclass
 class AnalysisConfig:
     ignored_checks: Set[str] = field(default_factory=set)
     exclude_files: list[str] = field(default_factory=list)
     check_parameters: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    detector_timeouts: Dict[str, float] = field(default_factory=dict)
     fail_on_pitfalls: bool = True
     fail_on_warnings: bool = True
     profile: Optional[str] = None
@@ -30,6 +34,15 @@ class AnalysisConfig:
     def get_parameters(self, check_code: str) -> Dict[str, Any]:
         return self.check_parameters.get(_normalize_check_code(check_code), {})
 
+    def get_timeout(self, check_code: str) -> Optional[float]:
+        """
+        Time budget of a check in seconds: its own entry in [timeouts], else the "default"
+        entry. None (no limit) when neither is set or the budget is 0.
+        """
+        code = _normalize_check_code(check_code)
+        timeout = self.detector_timeouts.get(code, self.detector_timeouts.get(DEFAULT_TIMEOUT_KEY))
+        return timeout if timeout and timeout > 0 else None
+
 
 def _normalize_check_code(value: str) -> str:
     return str(value).strip().upper()
@@ -65,6 +78,16 @@ def _normalize_parameters(parameters: Any) -> Dict[str, Dict[str, Any]]:
     return normalized
 
 
+def _normalize_timeouts(timeouts: Any) -> Dict[str, float]:
+    if not isinstance(timeouts, dict):
+        return {}
+    return {
+        _normalize_check_code(check_code): float(seconds)
+        for check_code, seconds in timeouts.items()
+        if isinstance(check_code, str) and isinstance(seconds, (int, float)) and not isinstance(seconds, bool)
+    }
+
+
 def _merge_parameters(
     base: Dict[str, Dict[str, Any]],
     override: Dict[str, Dict[str, Any]],
@@ -111,6 +134,10 @@ def load_analysis_config(
     [parameters.P001]
     ahead_significant_diff = 2
 
+    [timeouts]
+    default = 30
+    P008 = 120
+
     [profiles.unstable]
     ignore = ["W002"]
     exclude_files = ["**/README.md"]
@@ -130,6 +157,7 @@ def load_analysis_config(
     base_ignore = _normalize_check_codes(raw.get("ignore", []))
     base_exclude_files = _normalize_exclude_files(raw.get("exclude_files", []))
     base_parameters = _normalize_parameters(raw.get("parameters", {}))
+    timeouts = _normalize_timeouts(raw.get("timeouts", {}))
 
     fail_on_pitfalls = raw.get("fail_on_pitfalls", True)
     fail_on_warnings = raw.get("fail_on_warnings", True)
@@ -150,6 +178,7 @@ def load_analysis_config(
         profile_ignore = _normalize_check_codes(selected.get("ignore", []))
         profile_exclude_files = _normalize_exclude_files(selected.get("exclude_files", []))
         profile_parameters = _normalize_parameters(selected.get("parameters", {}))
+        timeouts.update(_normalize_timeouts(selected.get("timeouts", {})))
 
         if "fail_on_pitfalls" in selected:
             fail_on_pitfalls = selected["fail_on_pitfalls"]
@@ -162,6 +191,7 @@ def load_analysis_config(
         ignored_checks=base_ignore | profile_ignore,
         exclude_files=base_exclude_files + profile_exclude_files,
         check_parameters=merged_parameters,
+        detector_timeouts=timeouts,
         fail_on_pitfalls=fail_on_pitfalls,
         fail_on_warnings=fail_on_warnings,
         profile=selected_profile,
@@ -3,12 +3,21 @@ import copy
 import fnmatch
 import inspect
 from pathlib import Path
-from typing import Iterable, Union
-from rsmetacheck.run_somef import CODEMETA_DEFAULT_NAME
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
 from rsmetacheck.config import AnalysisConfig
-from rsmetacheck.utils.pitfall_utils import extract_programming_languages
+from rsmetacheck.utils.pitfall_utils import extract_programming_languages, shared_category_views
 from rsmetacheck.utils.json_ld_utils import create_pitfall_jsonld, save_individual_pitfall_jsonld
+from rsmetacheck.utils.jsonld_stream import PitfallStreamWriter
+from rsmetacheck.utils.results_store import KIND_NOTE, KIND_PITFALL, KIND_WARNING, ResultsStore
+from rsmetacheck.utils.serialization import write_json
+from rsmetacheck.utils.somef_inputs import SomefInput, collect_somef_inputs, load_somef_output
 from rsmetacheck.utils.somef_compat import normalize_somef_data
+from rsmetacheck.utils.commit_resolver import CommitResolver
+from rsmetacheck.utils.corpus_stats import PITFALL, WARNING, CorpusStats
+from rsmetacheck.utils.detector_result import DetectorResult
+from rsmetacheck.utils.detector_plan import NO_RESULT_WHEN_SKIPPED, DetectorProfile, detector_plan
+from rsmetacheck.utils.detector_cache import DetectorCache
+from rsmetacheck.detector_worker import DetectorOutcome, DetectorWorker, run_detectors_in_process
 
 # Pitfalls
 from rsmetacheck.scripts.pitfalls.p001 import detect_version_mismatch
@@ -119,39 +128,25 @@ def _run_detector_with_parameters(detector_func, somef_data, file_name: str, par
     return detector_func(somef_data, file_name)
 
 
-def detect_all_pitfalls(
-    json_files: Iterable[Path],
-    pitfalls_output_dir: Union[str, Path],
-    output_file: Union[str, Path],
-    verbose: bool = False,
-    notes_output: Union[str, Path] = None,
-    analysis_config: AnalysisConfig = None,
-):
-    """
-    Detect all software repository pitfalls in SoMEF output files using modular detectors.
-    Now also generates individual JSON-LD files for each repository.
-    """
-
-    pitfalls_output_dir = Path(pitfalls_output_dir)
-    pitfalls_output_dir.mkdir(exist_ok=True, parents=True)
-    json_files = list(json_files)
-    config = analysis_config or AnalysisConfig.empty()
-
-    if not json_files:
-        print("No JSON files found for analysis.")
-        return
+def _new_file_record(file_name: str) -> Dict:
+    """Contribution of one SoMEF file to the summary, filled in by AnalysisSession.process_file."""
+    return {
+        "file_name": file_name,
+        "languages": [],
+        "issues": [],
+        "notes": [],
+        "sources": {},
+        "jsonld_file": None,
+        "evaluated_repository": None,
+        "incomplete": [],
+    }
 
-    print(f"Analyzing {len(json_files)} SoMEF JSON files...")
-    if config.source_path:
-        print(f"Using config file: {config.source_path}")
-    if config.profile:
-        print(f"Using config profile: {config.profile}")
-    if config.ignored_checks:
-        print(f"Ignoring checks: {', '.join(sorted(config.ignored_checks))}")
-    if config.exclude_files:
-        print(f"Excluded source patterns: {config.exclude_files}")
 
-    results = {
+def _new_results():
+    """
+    Empty summary document, with one pitfall/warning entry per detector in PITFALL_DETECTORS order.
+    """
+    return {
         "summary": {
             "total_repositories_analyzed": 0,
             "repositories_with_target_languages": 0,
@@ -368,246 +363,629 @@ def detect_all_pitfalls(
         ]
     }
 
-    total_pitfalls = 0
-    total_warnings = 0
-    total_repos = 0
-    repos_with_target_languages = 0
-    jsonld_files_created = 0
-    pitfall_counts = [0] * 29
-    notes_list = []
-
-    pitfall_detectors = [
-        (detect_version_mismatch, "P001"),  # Index 0 -> P001
-        (detect_license_template_placeholders, "P002"),  # Index 1 -> P002  
-        (detect_multiple_authors_single_field_pitfall, "P003"),  # Index 2 -> P003
-        (detect_readme_homepage_pitfall, "P004"),  # Index 3 -> P004
-        (detect_reference_publication_archive_pitfall, "P005"),  # Index 4 -> P005
-        (detect_local_file_license_pitfall, "P006"),  # Index 5 -> P006
-        (detect_citation_missing_reference_publication_pitfall, "P007"),  # Index 6 -> P007
-        (detect_invalid_software_requirement_pitfall, "P008"),  # Index 7 -> P008
-        (detect_coderepository_homepage_pitfall, "P009"),  # Index 8 -> P009
-        (detect_copyright_only_license, "P010"),  # Index 9 -> P010
-        (detect_issue_tracker_format_pitfall, "P011"),  # Index 10 -> P011
-        (detect_outdated_download_url_pitfall, "P012"),  # Index 11 -> P012
-        (detect_license_no_version_pitfall, "P013"),  # Index 12 -> P013
-        (detect_bare_doi_pitfall, "P014"),  # Index 13 -> P014
-        (detect_ci_404_pitfall, "P015"),  # Index 14 -> P015
-        (detect_different_repository_pitfall, "P016"),  # Index 15 -> P016
-        (detect_codemeta_version_mismatch_pitfall, "P017"),  # Index 16 -> P017
-        (detect_raw_swhid_pitfall, "P018"),  # Index 17 -> P018
-        (detect_inconsistent_author_count, "P019"),  # Index 18 -> P019
-        (detect_unversioned_requirements, "W001"),  # Index 19 -> W001
-        (detect_outdated_datemodified, "W002"),  # Index 20 -> W002
-        (detect_dual_license_missing_codemeta_pitfall, "W003"),
-        (detect_programming_language_no_version_pitfall, "W004"),  # Index 21 -> W004
-        (detect_multiple_requirements_string_warning, "W005"),  # Index 22 -> W005
-        (detect_identifier_name_warning, "W006"),  # Index 23 -> W006
-        (detect_empty_identifier_warning, "W007"),  # Index 24 -> W007
-        (detect_author_name_list_warning, "W008"),  # Index 25 -> W008
-        (detect_development_status_url_pitfall, "W009"),  # Index 26 -> W009
-        (detect_git_remote_shorthand_pitfall, "W010"),  # Index 27 -> W010
+
+PITFALL_DETECTORS = [
+    (detect_version_mismatch, "P001"),  # Index 0 -> P001
+    (detect_license_template_placeholders, "P002"),  # Index 1 -> P002  
+    (detect_multiple_authors_single_field_pitfall, "P003"),  # Index 2 -> P003
+    (detect_readme_homepage_pitfall, "P004"),  # Index 3 -> P004
+    (detect_reference_publication_archive_pitfall, "P005"),  # Index 4 -> P005
+    (detect_local_file_license_pitfall, "P006"),  # Index 5 -> P006
+    (detect_citation_missing_reference_publication_pitfall, "P007"),  # Index 6 -> P007
+    (detect_invalid_software_requirement_pitfall, "P008"),  # Index 7 -> P008
+    (detect_coderepository_homepage_pitfall, "P009"),  # Index 8 -> P009
+    (detect_copyright_only_license, "P010"),  # Index 9 -> P010
+    (detect_issue_tracker_format_pitfall, "P011"),  # Index 10 -> P011
+    (detect_outdated_download_url_pitfall, "P012"),  # Index 11 -> P012
+    (detect_license_no_version_pitfall, "P013"),  # Index 12 -> P013
+    (detect_bare_doi_pitfall, "P014"),  # Index 13 -> P014
+    (detect_ci_404_pitfall, "P015"),  # Index 14 -> P015
+    (detect_different_repository_pitfall, "P016"),  # Index 15 -> P016
+    (detect_codemeta_version_mismatch_pitfall, "P017"),  # Index 16 -> P017
+    (detect_raw_swhid_pitfall, "P018"),  # Index 17 -> P018
+    (detect_inconsistent_author_count, "P019"),  # Index 18 -> P019
+    (detect_unversioned_requirements, "W001"),  # Index 19 -> W001
+    (detect_outdated_datemodified, "W002"),  # Index 20 -> W002
+    (detect_dual_license_missing_codemeta_pitfall, "W003"),
+    (detect_programming_language_no_version_pitfall, "W004"),  # Index 21 -> W004
+    (detect_multiple_requirements_string_warning, "W005"),  # Index 22 -> W005
+    (detect_identifier_name_warning, "W006"),  # Index 23 -> W006
+    (detect_empty_identifier_warning, "W007"),  # Index 24 -> W007
+    (detect_author_name_list_warning, "W008"),  # Index 25 -> W008
+    (detect_development_status_url_pitfall, "W009"),  # Index 26 -> W009
+    (detect_git_remote_shorthand_pitfall, "W010"),  # Index 27 -> W010
+]
+
+# Position of each check in PITFALL_DETECTORS and in the summary's "pitfalls & warnings" list.
+DETECTOR_INDEX = {code: idx for idx, (_, code) in enumerate(PITFALL_DETECTORS)}
+
+
+def _repo_name(somef_data, default: str) -> str:
+    if "full_name" in somef_data and somef_data["full_name"]:
+        for item in somef_data["full_name"]:
+            if "result" in item and "value" in item["result"]:
+                return item["result"]["value"]
+    return default
+
+
+def _repo_url(somef_data) -> str:
+    if "code_repository" in somef_data and somef_data["code_repository"]:
+        for item in somef_data["code_repository"]:
+            if "result" in item and "value" in item["result"]:
+                return item["result"]["value"]
+    return "Unknown"
+
+
+def _finding_sources(result: DetectorResult) -> list:
+    """Metadata files a finding came from, as named in its evidence."""
+    evidence = result.evidence
+    if evidence.get("metadata_source_files"):
+        return list(dict.fromkeys(evidence["metadata_source_files"]))
+    for key in ("metadata_source_file", "metadata_source", "source"):
+        source = evidence.get(key)
+        if isinstance(source, str) and source:
+            return [source.split("/")[-1].split("\\")[-1]]
+    return []
+
+
+def _stored_findings(results, checks, verbose: bool):
+    """
+    (code, kind, evidence, suggestion) of every issue and note of one repository, for the
+    results store. checks are the JSON-LD checks built from results, in the same order.
+    """
+    findings = []
+    shown = [result for result in results if result.has_issue or result.incomplete or verbose]
+    for result, check in zip(shown, checks):
+        if result.has_issue:
+            kind = KIND_PITFALL if result.has_pitfall else KIND_WARNING
+            findings.append((result.code, kind, check["evidence"], check["suggestion"]))
+    for result in results:
+        if result.has_note:
+            findings.extend((result.code, KIND_NOTE, note_text, None) for note_text in result.note_texts())
+    return findings
+
+
+def prepare_somef_data(somef_data: Dict, config: AnalysisConfig) -> Dict:
+    """
+    Copy of a SoMEF output as the detectors read it: in the pre-0.10 format, without the
+    entries of the files excluded by the configuration. somef_data is not modified.
+    """
+    somef_data = normalize_somef_data(somef_data)
+    if config.exclude_files:
+        somef_data = _filter_somef_data_by_excluded_files(
+            copy.deepcopy(somef_data),
+            config.exclude_files,
+        )
+        if somef_data is None:
+            somef_data = {}
+    return somef_data
+
+
+def has_timeouts(config: AnalysisConfig) -> bool:
+    """Whether any check has a time budget, so that the detectors must run in a worker process."""
+    return any(seconds > 0 for seconds in config.detector_timeouts.values())
+
+
+def detector_calls(plan, config: AnalysisConfig) -> list:
+    """(detector function, code, parameters, time budget) of the planned detectors that run."""
+    return [
+        (detector_func, code, config.get_parameters(code), config.get_timeout(code))
+        for detector_func, code, run in plan
+        if run
     ]
 
-    for json_file in json_files:
-        total_repos += 1
 
+class CheckEvaluation(NamedTuple):
+    """
+    One planned check on one repository. outcome is None for a skipped check; error is set
+    when the detector failed or returned something that is not a result.
+    """
+    code: str
+    results: List[DetectorResult]
+    outcome: Optional[DetectorOutcome] = None
+    error: Optional[str] = None
+
+
+def evaluate_checks(plan, outcomes: Iterator[DetectorOutcome], file_name: str, config: AnalysisConfig) -> Iterator[CheckEvaluation]:
+    """
+    The checks of a detector plan with their results, in order. outcomes are those of the
+    detectors that run (see detector_calls). Skipped checks get a negative result, as their
+    categories are missing, and timed-out checks an incomplete one.
+    """
+    for _, code, run in plan:
+        if not run:
+            results = [] if code in NO_RESULT_WHEN_SKIPPED else [DetectorResult(code, file_name)]
+            yield CheckEvaluation(code, results)
+            continue
+
+        outcome = next(outcomes)
+        if outcome.timed_out:
+            yield CheckEvaluation(code, [DetectorResult.timed_out(code, file_name, config.get_timeout(code))], outcome)
+            continue
+        if outcome.error is not None:
+            yield CheckEvaluation(code, [], outcome, outcome.error)
+            continue
+
+        raw_results = outcome.results if isinstance(outcome.results, list) else [outcome.results]
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                somef_data = json.load(f)
-
-            somef_data = normalize_somef_data(somef_data)
-            if config.exclude_files:
-                somef_data = _filter_somef_data_by_excluded_files(
-                    copy.deepcopy(somef_data),
-                    config.exclude_files,
-                )
-                if somef_data is None:
-                    somef_data = {}
+            results = [DetectorResult.from_dict(code, raw_result, file_name) for raw_result in raw_results]
+        except Exception as e:
+            yield CheckEvaluation(code, [], outcome, str(e))
+            continue
+        yield CheckEvaluation(code, results, outcome)
 
-            languages = extract_programming_languages(somef_data)
 
-            if languages:
-                repos_with_target_languages += 1
+def _print_config(config: AnalysisConfig):
+    if config.source_path:
+        print(f"Using config file: {config.source_path}")
+    if config.profile:
+        print(f"Using config profile: {config.profile}")
+    if config.ignored_checks:
+        print(f"Ignoring checks: {', '.join(sorted(config.ignored_checks))}")
+    if config.exclude_files:
+        print(f"Excluded source patterns: {config.exclude_files}")
+
+
+class _AnalyzedFile(NamedTuple):
+    """A file whose detectors have run, waiting for its JSON-LD assessment to be written."""
+    json_file: Union[Path, SomefInput]
+    record: Dict
+    somef_data: Optional[Dict]  # None if the file could not be analyzed
+    results: List[DetectorResult]
+
+
+class AnalysisSession:
+    """
+    Analysis of a batch of SoMEF output files, fed one file at a time.
+
+    process_file writes the JSON-LD assessment of each repository as soon as it is analyzed,
+    process_files once the commit IDs of its batch of repositories are resolved; finalize
+    writes the summary and notes once every file has been processed.
+    The active configuration is printed when the session is created.
+    """
+
+    def __init__(
+        self,
+        pitfalls_output_dir: Union[str, Path],
+        output_file: Union[str, Path],
+        verbose: bool = False,
+        notes_output: Union[str, Path] = None,
+        analysis_config: AnalysisConfig = None,
+        pitfalls_stream: Union[str, Path] = None,
+        commit_resolver: CommitResolver = None,
+        results_db: Union[str, Path] = None,
+        stats_output: Union[str, Path] = None,
+        profile_output: Union[str, Path] = None,
+        detector_cache: Union[str, Path] = None,
+    ):
+        self.pitfalls_output_dir = Path(pitfalls_output_dir)
+        if not pitfalls_stream:
+            self.pitfalls_output_dir.mkdir(exist_ok=True, parents=True)
+        self.output_file = output_file
+        self.verbose = verbose
+        self.notes_output = notes_output
+        self.stats_output = stats_output
+        self.profile_output = profile_output
+        self.profile = DetectorProfile(code for _, code in PITFALL_DETECTORS)
+        self.config = analysis_config or AnalysisConfig.empty()
+        _print_config(self.config)
+        self.stream_writer = PitfallStreamWriter(pitfalls_stream) if pitfalls_stream else None
+        self.detector_worker = DetectorWorker() if has_timeouts(self.config) else None
+        self.detector_cache = DetectorCache(detector_cache) if detector_cache else None
+        self.commit_resolver = commit_resolver or CommitResolver()
+        self.results_store = None
+        if results_db:
+            self.results_store = ResultsStore(results_db)
+            self.results_store.start_run()
+
+        self.reset_summary()
+
+    def process_files(self, json_files: Iterable[Union[str, Path, SomefInput]]):
+        """
+        Process json_files like process_file, one batch of repositories at a time: the files
+        of a batch are analyzed, then the commit IDs of their repositories are resolved
+        together (see CommitResolver) and their JSON-LD assessments written. Each file is
+        read once.
+        """
+        batch = []
+        for json_file in json_files:
+            with shared_category_views():
+                batch.append(self._analyze_file(json_file))
+            if len(batch) >= self.commit_resolver.github_batch_size:
+                self._finish_batch(batch)
+                batch = []
+        if batch:
+            self._finish_batch(batch)
+
+    def _finish_batch(self, batch: List[_AnalyzedFile]):
+        repo_urls = []
+        for analyzed in batch:
+            if analyzed.somef_data is not None:
+                try:
+                    repo_urls.append(_repo_url(analyzed.somef_data))
+                except Exception:
+                    continue  # Reported when the file is finished
+        self.commit_resolver.prefetch(url for url in repo_urls if isinstance(url, str))
+        for analyzed in batch:
+            self._finish_file(analyzed)
+
+    def process_file(self, json_file: Union[str, Path, SomefInput]) -> Dict:
+        """
+        Run every detector on one SoMEF output file (or a SomefInput read from a compressed
+        file or an archive) and write its JSON-LD assessment.
+        Errors are reported and never interrupt the batch.
+        Returns the file's contribution to the summary (see add_record).
+        """
+        # The detectors of a repository share their parsed views of its categories.
+        with shared_category_views():
+            return self._finish_file(self._analyze_file(json_file))
+
+    def _analyze_file(self, json_file: Union[str, Path, SomefInput]) -> _AnalyzedFile:
+        """Run the detectors on one file and fill in its record, up to the JSON-LD assessment."""
+        if not isinstance(json_file, SomefInput):
+            json_file = Path(json_file)
+        record = _new_file_record(json_file.name)
+
+        try:
+            somef_data = prepare_somef_data(load_somef_output(json_file), self.config)
+
+            languages = extract_programming_languages(somef_data)
+            record["languages"] = languages
 
             repo_pitfall_results = []
 
-            for idx, (detector_func, pitfall_code) in enumerate(pitfall_detectors):
-                if config.is_ignored(pitfall_code):
+            self.profile.add_file()
+            plan = detector_plan(PITFALL_DETECTORS, somef_data, self.config.is_ignored)
+            outcomes = self._run_detectors(plan, somef_data, json_file.name)
+            for check in evaluate_checks(plan, outcomes, json_file.name, self.config):
+                pitfall_code = check.code
+                repo_pitfall_results.extend(check.results)
+                outcome = check.outcome
+                if outcome is None:
+                    self.profile.add_skip(pitfall_code)
                     continue
 
-                try:
-                    detector_results = _run_detector_with_parameters(
-                        detector_func,
-                        somef_data,
-                        json_file.name,
-                        config.get_parameters(pitfall_code),
+                if outcome.cached:
+                    self.profile.add_cache_hit(pitfall_code)
+                else:
+                    self.profile.add_invocation(
+                        pitfall_code, outcome.seconds, failed=outcome.error is not None, timed_out=outcome.timed_out
                     )
-                    if not isinstance(detector_results, list):
-                        detector_results = [detector_results]
+                if outcome.timed_out:
+                    timeout = self.config.get_timeout(pitfall_code)
+                    record["incomplete"].append(pitfall_code)
+                    print(f"{pitfall_code} - Check did not finish within {timeout:g}s on {json_file.name}, reported as incomplete")
+                    continue
+                if check.error is not None:
+                    print(f"Error running {pitfall_code} detector on {json_file.name}: {check.error}")
+                    continue
 
+                try:
                     detector_had_pitfall = False
                     detector_had_warning = False
 
-                    for pitfall_result in detector_results:
-
-                        pitfall_result["pitfall_code"] = pitfall_code
-                        repo_pitfall_results.append(pitfall_result)
-
-                        has_pitfall = pitfall_result.get("has_pitfall", False)
-                        has_warning = pitfall_result.get("has_warning", False)
-                        has_issue = has_pitfall or has_warning
-
-                        if has_issue:
-                            if has_pitfall:
+                    for pitfall_result in check.results:
+                        if pitfall_result.has_issue:
+                            for source in _finding_sources(pitfall_result):
+                                code_sources = record["sources"].setdefault(pitfall_code, [])
+                                if source not in code_sources:
+                                    code_sources.append(source)
+                            if pitfall_result.has_pitfall:
                                 detector_had_pitfall = True
-                            if has_warning:
+                            if pitfall_result.has_warning:
                                 detector_had_warning = True
 
-                            issue_type = "Pitfall" if pitfall_result.get("has_pitfall", False) else "Warning"
-                            print(f"{pitfall_code} - {issue_type} found in {json_file.name}")
+                            print(f"{pitfall_code} - {pitfall_result.issue_type} found in {json_file.name}")
 
-                        if pitfall_result.get("has_note", False):
-                            repo_name = json_file.name
-                            if "full_name" in somef_data and somef_data["full_name"]:
-                                for item in somef_data["full_name"]:
-                                    if "result" in item and "value" in item["result"]:
-                                        repo_name = item["result"]["value"]
-                                        break
+                        if pitfall_result.has_note:
+                            repo_name = _repo_name(somef_data, json_file.name)
                             w3id_code = f"https://softwareunderstanding.github.io/RsMetaCheck/#{pitfall_code}"
-                            notes = pitfall_result.get("notes", [])
-                            if notes:
-                                for note_entry in notes:
-                                    notes_list.append({
-                                        "repository": repo_name,
-                                        "somef_file": json_file.name,
-                                        "code": w3id_code,
-                                        "note": note_entry.get("note_text", "")
-                                    })
-                            else:
-                                note_text = pitfall_result.get("note_text", "")
-                                if note_text:
-                                    notes_list.append({
-                                        "repository": repo_name,
-                                        "somef_file": json_file.name,
-                                        "code": w3id_code,
-                                        "note": note_text
-                                    })
+                            for note_text in pitfall_result.note_texts():
+                                record["notes"].append({
+                                    "repository": repo_name,
+                                    "somef_file": json_file.name,
+                                    "code": w3id_code,
+                                    "note": note_text
+                                })
                             print(f"{pitfall_code} - Note added for {json_file.name}")
 
                     if detector_had_pitfall or detector_had_warning:
-                        pitfall_counts[idx] += 1
-
-                        if detector_had_pitfall:
-                            total_pitfalls += 1
-                        if detector_had_warning:
-                            total_warnings += 1
-
-                        if languages:
-                            for lang in languages:
-                                if lang in results["pitfalls & warnings"][idx]["languages"]:
-                                    results["pitfalls & warnings"][idx]["languages"][lang] += 1
-                                else:
-                                    results["pitfalls & warnings"][idx]["languages"][lang] = 1
+                        record["issues"].append([pitfall_code, detector_had_pitfall, detector_had_warning])
 
                 except Exception as e:
                     print(f"Error running {pitfall_code} detector on {json_file.name}: {e}")
                     continue
 
+            return _AnalyzedFile(json_file, record, somef_data, repo_pitfall_results)
+
+        except json.JSONDecodeError as e:
+            print(f"Error parsing JSON file {json_file}: {e}")
+        except Exception as e:
+            print(f"Error processing file {json_file}: {e}")
+
+        return _AnalyzedFile(json_file, record, None, [])
+
+    def _finish_file(self, analyzed: _AnalyzedFile) -> Dict:
+        """Write the JSON-LD assessment of an analyzed file and add its record to the summary."""
+        json_file, record, somef_data, repo_pitfall_results = analyzed
+        if somef_data is not None:
             try:
-                has_any_issue = any(
-                    result.get("has_pitfall", False) or result.get("has_warning", False) or result.get("has_note", False)
-                    for result in repo_pitfall_results
+                self._write_assessment(json_file, record, somef_data, repo_pitfall_results)
+            except Exception as e:
+                print(f"Error processing file {json_file}: {e}")
+
+        self.add_record(record)
+        return record
+
+    def _write_assessment(self, json_file, record: Dict, somef_data: Dict, repo_pitfall_results: List[DetectorResult]):
+        findings = []
+        try:
+            has_any_issue = any(
+                result.has_issue or result.has_note or result.incomplete
+                for result in repo_pitfall_results
+            )
+
+            if has_any_issue or self.verbose:
+                commit_id = self.commit_resolver.commit_id(_repo_url(somef_data))
+                jsonld_data = create_pitfall_jsonld(
+                    somef_data, repo_pitfall_results, json_file.name, verbose=self.verbose, commit_id=commit_id
                 )
 
-                if has_any_issue or verbose:
-                    jsonld_data = create_pitfall_jsonld(somef_data, repo_pitfall_results, json_file.name, verbose=verbose)
-                    saved_file = save_individual_pitfall_jsonld(jsonld_data, pitfalls_output_dir, json_file.name)
+                if self.results_store:
+                    findings = _stored_findings(repo_pitfall_results, jsonld_data["checks"], self.verbose)
+
+                if self.stream_writer:
+                    self.stream_writer.write(jsonld_data, json_file.name)
+                else:
+                    saved_file = save_individual_pitfall_jsonld(jsonld_data, self.pitfalls_output_dir, json_file.name)
 
                     if saved_file:
-                        jsonld_files_created += 1
+                        record["jsonld_file"] = Path(saved_file).name
                         print(f"Created JSON-LD file: {saved_file}")
 
+        except Exception as e:
+            print(f"Error creating JSON-LD for {json_file.name}: {e}")
+
+        try:
+            repo_name = _repo_name(somef_data, json_file.name)
+
+            repo_url = _repo_url(somef_data)
+            commit_id = self.commit_resolver.commit_id(repo_url)
+            record["evaluated_repository"] = [repo_name, {
+                "url": repo_url,
+                "commit_id": commit_id
+            }]
+        except Exception as e:
+            print(f"Error extracting commit ID for summary for {json_file.name}: {e}")
+
+        if self.results_store and record["evaluated_repository"]:
+            repo_name, repo_info = record["evaluated_repository"]
+            self.results_store.add_repository(
+                json_file.name, repo_name, repo_info["url"], repo_info["commit_id"], record["languages"], findings
+            )
+
+    def _run_detectors(self, plan, somef_data, file_name: str):
+        """
+        Outcomes of the planned detectors that run, in order. Results found in the detector
+        cache are reused; the other detectors run in the session's worker process when time
+        budgets are configured, otherwise directly in this one.
+        """
+        calls = detector_calls(plan, self.config)
+        if self.detector_cache:
+            return self._run_cached_detectors(calls, somef_data, file_name)
+        return self._execute_detectors(calls, somef_data, file_name)
+
+    def _execute_detectors(self, calls, somef_data, file_name: str):
+        if self.detector_worker:
+            return self.detector_worker.run(calls, somef_data, file_name)
+        return run_detectors_in_process(calls, somef_data, file_name)
+
+    def _run_cached_detectors(self, calls, somef_data, file_name: str):
+        keys = self.detector_cache.keys(calls, somef_data, file_name)
+        cached = self.detector_cache.get_many(keys.values())
+        outcomes = self._execute_detectors(
+            [call for call in calls if keys[call[1]] not in cached], somef_data, file_name
+        )
+        for _, code, _, _ in calls:
+            key = keys[code]
+            if key in cached:
+                yield DetectorOutcome(code, cached[key], cached=True)
+                continue
+            outcome = next(outcomes)
+            if key and outcome.error is None and not outcome.timed_out:
+                self.detector_cache.put(key, code, outcome.results)
+            yield outcome
+
+    def add_record(self, record: Dict):
+        """
+        Add the contribution of one analyzed file to the summary and notes. process_file calls
+        this for every file; it is also used to rebuild a summary from stored records, which
+        gives the same result as analyzing the files in record order.
+        """
+        self.stats.add(record.get("issues", []), record.get("languages") or [], record.get("sources"))
+        self.notes_list.extend(record.get("notes", []))
+        for code in record.get("incomplete", []):
+            self.incomplete_counts[code] = self.incomplete_counts.get(code, 0) + 1
+        if record.get("jsonld_file"):
+            self.jsonld_files_created += 1
+        if record.get("evaluated_repository"):
+            repo_name, repo_info = record["evaluated_repository"]
+            self.results["summary"]["evaluated_repositories"][repo_name] = repo_info
+
+    def reset_summary(self):
+        """Forget every file added so far, e.g. to rebuild the summary from stored records."""
+        self.results = _new_results()
+        self.stats = CorpusStats([code for _, code in PITFALL_DETECTORS])
+        self.jsonld_files_created = 0
+        self.notes_list = []
+        self.incomplete_counts = {}
+
+    def finalize(self):
+        """
+        Write the summary (and notes, if requested) for all the files processed so far.
+        """
+        if self.detector_worker:
+            self.detector_worker.shutdown()
+        if self.detector_cache:
+            self.detector_cache.close()
+            self.detector_cache = None
+        if self.stream_writer:
+            self.stream_writer.close()
+        if self.results_store:
+            try:
+                self.results_store.finish_run()
+                self.results_store.close()
+                print(f"Findings stored in {self.results_store.path} (run {self.results_store.run_id})")
             except Exception as e:
-                print(f"Error creating JSON-LD for {json_file.name}: {e}")
+                print(f"Error writing results database: {e}")
+
+        self.write_summary()
+
+    def write_summary(self, report: bool = True):
+        """
+        Write the summary, statistics and notes files for the files added so far.
+        With report=False the files are written without printing the detection report.
+        """
+        total_repos = self.stats.repositories
+        repos_with_target_languages = self.stats.repositories_with_languages()
+        pitfall_counts = self.stats.counts()
+        self.results["summary"]["total_repositories_analyzed"] = total_repos
+        self.results["summary"]["repositories_with_target_languages"] = repos_with_target_languages
+        self.results["summary"]["individual_jsonld_files_created"] = self.jsonld_files_created
+        if self.stream_writer:
+            self.results["summary"]["jsonld_assessments_streamed"] = self.stream_writer.records_written
+        self.results["summary"]["total_pitfalls_detected"] = self.stats.total(PITFALL)
+        self.results["summary"]["total_warnings_detected"] = self.stats.total(WARNING)
+        if self.incomplete_counts:
+            self.results["summary"]["incomplete_checks"] = {
+                code: self.incomplete_counts[code] for _, code in PITFALL_DETECTORS if code in self.incomplete_counts
+            }
+
+        for i, (count, percentage, languages) in enumerate(
+            zip(pitfall_counts, self.stats.percentages(), self.stats.language_counts())
+        ):
+            pitfall_code_str = PITFALL_DETECTORS[i][1]
+            self.results["pitfalls & warnings"][i]["pitfall"] = f"https://w3id.org/rsmetacheck/catalog/#{pitfall_code_str}"
+            self.results["pitfalls & warnings"][i]["count"] = count
+            self.results["pitfalls & warnings"][i]["percentage"] = percentage
+            self.results["pitfalls & warnings"][i]["languages"] = languages
 
+        if self.stats_output:
             try:
-                repo_name = json_file.name
-                if "full_name" in somef_data and somef_data["full_name"]:
-                    for item in somef_data["full_name"]:
-                        if "result" in item and "value" in item["result"]:
-                            repo_name = item["result"]["value"]
-                            break
-                            
-                repo_url = "Unknown"
-                if "code_repository" in somef_data and somef_data["code_repository"]:
-                    for item in somef_data["code_repository"]:
-                        if "result" in item and "value" in item["result"]:
-                            repo_url = item["result"]["value"]
-                            break
-                
-                from rsmetacheck.utils.json_ld_utils import fetch_latest_commit_id
-                commit_id = fetch_latest_commit_id(repo_url)
-                results["summary"]["evaluated_repositories"][repo_name] = {
-                    "url": repo_url,
-                    "commit_id": commit_id
-                }
+                write_json(self.stats.report(), self.stats_output)
+                if report:
+                    print(f"Corpus statistics saved to: {self.stats_output}")
             except Exception as e:
-                print(f"Error extracting commit ID for summary for {json_file.name}: {e}")
+                print(f"Error writing statistics file: {e}")
 
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON file {json_file}: {e}")
-            continue
-        except Exception as e:
-            print(f"Error processing file {json_file}: {e}")
-            continue
+        if self.detector_cache:
+            try:
+                self.detector_cache.flush()
+            except Exception as e:
+                print(f"Error writing detector cache: {e}")
 
-    results["summary"]["total_repositories_analyzed"] = total_repos
-    results["summary"]["repositories_with_target_languages"] = repos_with_target_languages
-    results["summary"]["individual_jsonld_files_created"] = jsonld_files_created
-    results["summary"]["total_pitfalls_detected"] = total_pitfalls
-    results["summary"]["total_warnings_detected"] = total_warnings
+        if self.profile_output:
+            try:
+                write_json(self.profile.report(), self.profile_output)
+                if report:
+                    print(f"Detector profile saved to: {self.profile_output}")
+            except Exception as e:
+                print(f"Error writing detector profile: {e}")
 
-    for i, count in enumerate(pitfall_counts):
-        pitfall_code_str = pitfall_detectors[i][1]
-        results["pitfalls & warnings"][i]["pitfall"] = f"https://w3id.org/rsmetacheck/catalog/#{pitfall_code_str}"
-        results["pitfalls & warnings"][i]["count"] = count
-        if total_repos > 0:
-            results["pitfalls & warnings"][i]["percentage"] = round((count / total_repos) * 100, 2)
+        try:
+            write_json(self.results, self.output_file)
+
+            if report:
+                print(f"\n=== PITFALL/WARNING DETECTION COMPLETE ===")
+                print(f"Total repositories analyzed: {total_repos}")
+                print(f"Repositories with target languages: {repos_with_target_languages}")
+                if self.stream_writer:
+                    print(f"JSON-LD assessments written: {self.stream_writer.records_written}")
+                    print(f"JSON-LD stream saved to: {self.stream_writer.path}")
+                else:
+                    print(f"Individual JSON-LD files created: {self.jsonld_files_created}")
+                    print(f"JSON-LD files saved to: {self.pitfalls_output_dir}")
 
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+                for i, (_, pitfall_code) in enumerate(PITFALL_DETECTORS):
+                    print(f"{pitfall_code}: {pitfall_counts[i]} ({self.results['pitfalls & warnings'][i]['percentage']}%)")
 
-        print(f"\n=== PITFALL/WARNING DETECTION COMPLETE ===")
-        print(f"Total repositories analyzed: {total_repos}")
-        print(f"Repositories with target languages: {repos_with_target_languages}")
-        print(f"Individual JSON-LD files created: {jsonld_files_created}")
-        print(f"JSON-LD files saved to: {pitfalls_output_dir}")
+                for pitfall_code, count in self.results["summary"].get("incomplete_checks", {}).items():
+                    print(f"{pitfall_code}: incomplete (timed out) in {count} repositories")
 
-        for i, (_, pitfall_code) in enumerate(pitfall_detectors):
-            print(f"{pitfall_code}: {pitfall_counts[i]} ({results['pitfalls & warnings'][i]['percentage']}%)")
+                print(f"Summary results saved to: {self.output_file}")
 
-        print(f"Summary results saved to: {output_file}")
+            if self.notes_list and self.notes_output:
+                try:
+                    notes_path = Path(self.notes_output)
+                    notes_data = {
+                        "total_notes": len(self.notes_list),
+                        "notes": self.notes_list
+                    }
+                    write_json(notes_data, notes_path)
+                    if report:
+                        print(f"\nNotes ({len(self.notes_list)}) saved to: {notes_path}")
+                except Exception as e:
+                    print(f"Error writing notes file: {e}")
+            elif report and self.notes_list:
+                print(f"\n{len(self.notes_list)} note(s) were found but no --notes-output path was provided. Skipping notes file.")
+            elif report:
+                print("\nNo notes generated.")
 
-        if notes_list and notes_output:
-            try:
-                notes_path = Path(notes_output)
-                notes_data = {
-                    "total_notes": len(notes_list),
-                    "notes": notes_list
-                }
-                with open(notes_path, 'w', encoding='utf-8') as f:
-                    json.dump(notes_data, f, indent=2, ensure_ascii=False)
-                print(f"\nNotes ({len(notes_list)}) saved to: {notes_path}")
-            except Exception as e:
-                print(f"Error writing notes file: {e}")
-        elif notes_list:
-            print(f"\n{len(notes_list)} note(s) were found but no --notes-output path was provided. Skipping notes file.")
-        else:
-            print("\nNo notes generated.")
+        except Exception as e:
+            print(f"Error writing output file: {e}")
+
+def detect_all_pitfalls(
+    json_files: Iterable[Path],
+    pitfalls_output_dir: Union[str, Path],
+    output_file: Union[str, Path],
+    verbose: bool = False,
+    notes_output: Union[str, Path] = None,
+    analysis_config: AnalysisConfig = None,
+    pitfalls_stream: Union[str, Path] = None,
+    results_db: Union[str, Path] = None,
+    stats_output: Union[str, Path] = None,
+    profile_output: Union[str, Path] = None,
+    detector_cache: Union[str, Path] = None,
+):
+    """
+    Detect all software repository pitfalls in SoMEF output files using modular detectors.
+    Now also generates individual JSON-LD files for each repository.
+    When pitfalls_stream is given, all JSON-LD assessments are written to that single
+    JSON Lines file (gzip-compressed if it ends in .gz) instead of one file per repository.
+    When results_db is given, the findings are also added as a new run to that SQLite database.
+    When stats_output is given, corpus statistics (per-language rates, co-occurrence of codes,
+    source files) are written to that JSON file.
+    When profile_output is given, the invocations, skips, errors and run time of each
+    check are written to that JSON file.
+    When detector_cache is given, detector results are looked up in and added to that SQLite
+    database, and only the checks whose inputs, parameters or code changed are run.
+    """
+
+    pitfalls_output_dir = Path(pitfalls_output_dir)
+    if not pitfalls_stream:
+        pitfalls_output_dir.mkdir(exist_ok=True, parents=True)
+    json_files = list(json_files)
+    config = analysis_config or AnalysisConfig.empty()
 
-    except Exception as e:
-        print(f"Error writing output file: {e}")
+    if not json_files:
+        print("No JSON files found for analysis.")
+        return
+
+    print(f"Analyzing {len(json_files)} SoMEF JSON files...")
+    session = AnalysisSession(
+        pitfalls_output_dir,
+        output_file,
+        verbose=verbose,
+        notes_output=notes_output,
+        analysis_config=config,
+        pitfalls_stream=pitfalls_stream,
+        results_db=results_db,
+        stats_output=stats_output,
+        profile_output=profile_output,
+        detector_cache=detector_cache,
+    )
+    session.process_files(json_files)
+    session.finalize()
 
 
 def main(
@@ -618,17 +996,29 @@ def main(
     verbose=False,
     notes_output=None,
     analysis_config: AnalysisConfig = None,
+    pitfalls_stream=None,
+    results_db=None,
+    stats_output=None,
+    profile_output=None,
+    detector_cache=None,
 ):
     """
     Main function to run all pitfall detections.
 
     Args:
-        input_dir (str|Path, optional): Directory containing SoMEF outputs.
-        somef_json_paths (Iterable[Path], optional): Explicit list of SoMEF output JSON files.
+        input_dir (str|Path, optional): Directory containing SoMEF outputs (JSON files, compressed
+            JSON files or archives of them).
+        somef_json_paths (Iterable[Path|SomefInput], optional): Explicit list of SoMEF output JSON files.
         pitfalls_dir (str|Path, optional): Directory to save pitfall JSON-LD files.
         analysis_output (str|Path, optional): Path to save summary results JSON.
         verbose (bool, optional): Include both detected AND undetected pitfalls in JSON-LD.
         notes_output (str|Path, optional): Path to save notes JSON file.
+        pitfalls_stream (str|Path, optional): Single JSON Lines (.jsonl or .jsonl.gz) file to write
+            all JSON-LD assessments to, instead of one file per repository.
+        results_db (str|Path, optional): SQLite database the findings are added to as a new run.
+        stats_output (str|Path, optional): Path to save the corpus statistics JSON file.
+        profile_output (str|Path, optional): Path to save the per-check profile JSON file.
+        detector_cache (str|Path, optional): SQLite database of detector results reused across runs.
 
     Note: Provide either input_dir OR somef_json_paths, not both.
           If both are provided, somef_json_paths takes precedence.
@@ -639,17 +1029,14 @@ def main(
     output_file = Path(analysis_output) if analysis_output else project_root / "analysis_results.json"
 
     if somef_json_paths:
-        json_files = [Path(p) for p in somef_json_paths]
+        json_files = [p if isinstance(p, SomefInput) else Path(p) for p in somef_json_paths]
         print(f"Using {len(json_files)} explicitly provided JSON files")
     elif input_dir:
         input_dir = Path(input_dir)
         if not input_dir.exists():
             print(f"Error: Directory not found: {input_dir}")
             return
-        json_files = [
-            f for f in input_dir.glob("*.json")
-            if not f.stem.endswith(CODEMETA_DEFAULT_NAME)
-        ]
+        json_files = collect_somef_inputs(input_dir)
         print(f"Found {len(json_files)} JSON files in {input_dir}")
     else:
         print("Error: No input directory or JSON file list provided.")
@@ -666,6 +1053,11 @@ def main(
         verbose,
         notes_output,
         analysis_config=analysis_config,
+        pitfalls_stream=pitfalls_stream,
+        results_db=results_db,
+        stats_output=stats_output,
+        profile_output=profile_output,
+        detector_cache=detector_cache,
     )
 
 if __name__ == "__main__":
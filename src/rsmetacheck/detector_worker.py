@@ -0,0 +1,135 @@
+import multiprocessing
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# (detector function, check code, parameters, time budget in seconds or None)
+DetectorCall = Tuple[Callable, str, Dict[str, Any], Optional[float]]
+
+
+class DetectorOutcome(NamedTuple):
+    """What one detector call produced: its results, or an error message, or a timeout."""
+    code: str
+    results: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    seconds: float = 0.0
+    cached: bool = False  # results taken from the detector cache, the detector did not run
+
+
+def run_detectors_in_process(
+    calls: Iterable[DetectorCall], somef_data, file_name: str
+) -> Iterator[DetectorOutcome]:
+    """Run the detectors one after the other in this process, without time budgets."""
+    from rsmetacheck.detect_pitfalls_main import _run_detector_with_parameters
+
+    for detector_func, code, parameters, _ in calls:
+        started = time.perf_counter()
+        try:
+            results = _run_detector_with_parameters(detector_func, somef_data, file_name, parameters)
+        except Exception as e:
+            yield DetectorOutcome(code, error=str(e), seconds=time.perf_counter() - started)
+            continue
+        yield DetectorOutcome(code, results, seconds=time.perf_counter() - started)
+
+
+def _serve(conn):
+    """Worker process: run the detectors of each request and send back one message per detector."""
+    from rsmetacheck.detect_pitfalls_main import _run_detector_with_parameters
+    from rsmetacheck.utils.pitfall_utils import shared_category_views
+
+    conn.send("ready")
+    while True:
+        try:
+            request_id, somef_data, file_name, calls = conn.recv()
+        except (EOFError, OSError):
+            return
+        with shared_category_views():
+            for detector_func, code, parameters in calls:
+                try:
+                    results = _run_detector_with_parameters(detector_func, somef_data, file_name, parameters)
+                    conn.send((request_id, code, results, None))
+                except Exception as e:  # Raised by the detector or while pickling its results
+                    conn.send((request_id, code, None, str(e)))
+
+
+class DetectorWorker:
+    """
+    Long-lived worker process running the detectors of one repository at a time, so that
+    each call can be given a time budget.
+
+    A detector that exceeds its budget cannot be interrupted, so the worker is killed and
+    a new one started for the remaining detectors. The run goes on at full speed: only the
+    timed-out check is lost, and the repository's other checks still run.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._conn = None
+        self._request_id = 0
+
+    def _start(self):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child_conn,), name="rsmetacheck-detectors", daemon=True)
+        self._process.start()
+        child_conn.close()
+        # Importing the detectors is not charged to the first check's budget.
+        self._conn.recv()
+
+    def _kill(self):
+        process, self._process = self._process, None
+        if process is not None:
+            process.kill()
+            process.join()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def run(self, calls: Iterable[DetectorCall], somef_data, file_name: str) -> Iterator[DetectorOutcome]:
+        """
+        Run the detectors on one repository in the worker process and yield their outcomes in
+        order, as they arrive. A call still running after its budget is reported as timed out.
+        """
+        pending: List[DetectorCall] = list(calls)
+        while pending:
+            if self._process is None:
+                self._start()
+            self._request_id += 1
+            request_id = self._request_id
+            self._conn.send((request_id, somef_data, file_name, [call[:3] for call in pending]))
+
+            while pending:
+                _, code, _, timeout = pending[0]
+                started = time.perf_counter()
+                try:
+                    if not self._conn.poll(timeout):
+                        self._kill()
+                        pending.pop(0)
+                        yield DetectorOutcome(code, timed_out=True, seconds=time.perf_counter() - started)
+                        break
+                    message = self._conn.recv()
+                except (EOFError, OSError):
+                    self._kill()
+                    pending.pop(0)
+                    yield DetectorOutcome(code, error="detector worker process died", seconds=time.perf_counter() - started)
+                    break
+                if message[0] != request_id:
+                    continue  # Left over from a repository whose outcomes were not all read
+                pending.pop(0)
+                _, _, results, error = message
+                yield DetectorOutcome(code, results, error, seconds=time.perf_counter() - started)
+
+    def shutdown(self):
+        if self._process is not None:
+            self._conn.close()
+            self._conn = None
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.kill()
+            self._process = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
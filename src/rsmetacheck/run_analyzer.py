@@ -1,8 +1,12 @@
+import queue
+import threading
 from pathlib import Path
-from typing import Union, Iterable
-from rsmetacheck.detect_pitfalls_main import main
+from typing import Callable, Union, Iterable
+from rsmetacheck.detect_pitfalls_main import AnalysisSession, main
 from rsmetacheck.config import AnalysisConfig
 
+_EXTRACTION_DONE = object()
+
 
 def run_analysis(
     somef_input: Union[str, Path, Iterable[Path]],
@@ -11,6 +15,11 @@ def run_analysis(
     verbose: bool = False,
     notes_output: Union[str, Path] = None,
     analysis_config: AnalysisConfig = None,
+    pitfalls_stream: Union[str, Path] = None,
+    results_db: Union[str, Path] = None,
+    stats_output: Union[str, Path] = None,
+    profile_output: Union[str, Path] = None,
+    detector_cache: Union[str, Path] = None,
 ):
     """
     Run metadata analysis using existing code.
@@ -22,6 +31,12 @@ def run_analysis(
         analysis_file: Path to save summary results JSON
         verbose: bool indicating if both detected and undetected checks should be logged.
         notes_output: Path to save notes JSON file.
+        pitfalls_stream: Optional JSON Lines file receiving all JSON-LD assessments
+                         instead of individual files in pitfalls_dir.
+        results_db: Optional SQLite database the findings are added to as a new run.
+        stats_output: Optional JSON file receiving the corpus statistics (see CorpusStats.report).
+        profile_output: Optional JSON file receiving the detector profile (see DetectorProfile.report).
+        detector_cache: Optional SQLite database of detector results reused across runs.
     """
     print(f"\nRunning analysis...")
 
@@ -36,6 +51,11 @@ def run_analysis(
                 verbose=verbose,
                 notes_output=notes_output,
                 analysis_config=analysis_config,
+                pitfalls_stream=pitfalls_stream,
+                results_db=results_db,
+                stats_output=stats_output,
+                profile_output=profile_output,
+                detector_cache=detector_cache,
             )
         else:
             print(f"Error: {somef_input} is not a valid directory")
@@ -49,4 +69,87 @@ def run_analysis(
             verbose=verbose,
             notes_output=notes_output,
             analysis_config=analysis_config,
-        )
\ No newline at end of file
+            pitfalls_stream=pitfalls_stream,
+            results_db=results_db,
+            stats_output=stats_output,
+            profile_output=profile_output,
+            detector_cache=detector_cache,
+        )
+
+
+def run_pipelined_analysis(
+    extract: Callable[[Callable[[str], None]], None],
+    pitfalls_dir: Union[str, Path],
+    analysis_file: Union[str, Path],
+    verbose: bool = False,
+    notes_output: Union[str, Path] = None,
+    analysis_config: AnalysisConfig = None,
+    pitfalls_stream: Union[str, Path] = None,
+    results_db: Union[str, Path] = None,
+    stats_output: Union[str, Path] = None,
+    profile_output: Union[str, Path] = None,
+    detector_cache: Union[str, Path] = None,
+) -> bool:
+    """
+    Analyze SoMEF outputs while extraction is still running.
+
+    Args:
+        extract: Runs SoMEF in a background thread. It receives a callback that must be called
+                 with the path of each SoMEF output file as soon as that file is written.
+        pitfalls_dir: Directory to save pitfall JSON-LD files
+        analysis_file: Path to save summary results JSON
+        verbose: bool indicating if both detected and undetected checks should be logged.
+        notes_output: Path to save notes JSON file.
+        pitfalls_stream: Optional JSON Lines file receiving all JSON-LD assessments
+                         instead of individual files in pitfalls_dir.
+        results_db: Optional SQLite database the findings are added to as a new run.
+        stats_output: Optional JSON file receiving the corpus statistics (see CorpusStats.report).
+        profile_output: Optional JSON file receiving the detector profile (see DetectorProfile.report).
+        detector_cache: Optional SQLite database of detector results reused across runs.
+
+    Each output is analyzed in the calling thread right after it is produced, so JSON-LD
+    files appear incrementally. The summary is written once extraction has finished and
+    every output has been analyzed. Returns False if extraction produced no output.
+    """
+    outputs = queue.Queue()
+
+    def producer():
+        try:
+            extract(outputs.put)
+        except Exception as e:
+            print(f"Error during SoMEF extraction: {e}")
+        finally:
+            outputs.put(_EXTRACTION_DONE)
+
+    extraction = threading.Thread(target=producer, name="somef-extraction", daemon=True)
+    extraction.start()
+
+    session = None
+    while True:
+        output_file = outputs.get()
+        if output_file is _EXTRACTION_DONE:
+            break
+        if session is None:
+            print(f"\nRunning analysis on SoMEF outputs as they are produced...")
+            session = AnalysisSession(
+                pitfalls_dir,
+                analysis_file,
+                verbose=verbose,
+                notes_output=notes_output,
+                analysis_config=analysis_config,
+                pitfalls_stream=pitfalls_stream,
+                results_db=results_db,
+                stats_output=stats_output,
+                profile_output=profile_output,
+                detector_cache=detector_cache,
+            )
+        session.process_file(Path(output_file))
+
+    extraction.join()
+
+    if session is None:
+        return False
+
+    session.finalize()
+    return True
+
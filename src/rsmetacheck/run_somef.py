@@ -1,7 +1,17 @@
-import json
+import heapq
 import os
+import re
+import signal
 import subprocess
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+from rsmetacheck.somef_worker import SomefBackendUnavailable, somef_config_with_token
+from rsmetacheck.utils.github_rate_limit import RateLimitExhausted, get_token_pool
+from rsmetacheck.utils.serialization import read_json, write_json
 
 CODEMETA_DEFAULT_NAME = "somef_generated_codemeta"
 
@@ -21,32 +31,295 @@ def ensure_somef_configured():
     return True
 
 
-def run_somef(repo_url, output_file, threshold, branch=None, codemeta_file=None):
-    """Run SoMEF on a given repository and save results."""
+FAILURE_AUTH = "auth"
+FAILURE_RATE_LIMIT = "rate_limit"
+FAILURE_NOT_FOUND = "not_found"
+FAILURE_TIMEOUT = "timeout"
+FAILURE_OTHER = "error"
+
+# Failures that may go away on their own and are worth retrying later.
+RETRIABLE_FAILURES = {FAILURE_RATE_LIMIT, FAILURE_TIMEOUT, FAILURE_OTHER}
+
+_FAILURE_PATTERNS = (
+    (FAILURE_RATE_LIMIT, ("api rate limit exceeded", "secondary rate limit", "too many requests", "http 429")),
+    (FAILURE_AUTH, (
+        "lacks required permissions",
+        "invalid github token",
+        "bad credentials",
+        "access denied",
+        "authentication",
+        "unauthorized",
+    )),
+    (FAILURE_NOT_FOUND, (
+        "not found",
+        "repository name is incorrect",
+        "not a valid repository url",
+        "http 404",
+    )),
+)
+
+# Logged by SoMEF after every GitHub API request; the reset time is local time.
+_SOMEF_RATE_LIMIT_LOG = re.compile(
+    r"Remaining GitHub API requests: (\d+) ### Next rate limit reset at: (\S+ \S+)"
+)
+
+# SoMEF logs every request at INFO level (including "rate limit reset" lines), so only the
+# end of its output, where the final error is, is used for classification.
+_CLASSIFIED_TAIL_LINES = 5
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How long a single SoMEF run may take (timeout in seconds, None for no limit) and how many
+    times a repository that failed for a retriable reason is tried again. The n-th retry waits
+    backoff * 2 ** (n - 1) seconds.
+    """
+    timeout: Optional[float] = 1800
+    max_retries: int = 2
+    backoff: float = 10.0
+
+    def delay(self, attempts: int) -> float:
+        return self.backoff * 2 ** (attempts - 1)
+
+
+@dataclass
+class _SomefJob:
+    repo_url: str
+    output_file: str
+    codemeta_file: Optional[str]
+    attempts: int = 0
+    reason: Optional[str] = None
+    error: Optional[str] = None
+
+
+def classify_somef_failure(output: str) -> str:
+    """
+    Classify a failed SoMEF run from the last lines of its error output:
+    auth, rate_limit, not_found or error. Timeouts are detected by the caller.
+    """
+    lowered = _tail(output).lower()
+    for reason, patterns in _FAILURE_PATTERNS:
+        if any(pattern in lowered for pattern in patterns):
+            return reason
+    return FAILURE_OTHER
+
+
+def _tail(output: str) -> str:
+    lines = [line for line in (output or "").splitlines() if line.strip()]
+    return "\n".join(lines[-_CLASSIFIED_TAIL_LINES:])
+
+
+def _report_somef_failure(repo_url, error, output=""):
+    if "GitHub token lacks required permissions or scopes" in output:
+        print(
+            "SoMEF failed due to an invalid/insufficient GitHub token configured in SoMEF."
+        )
+        print(
+            "Run `somef configure` and set a token with appropriate scopes, or remove the token from ~/.somef/config.json."
+        )
+
+    print(f"Error running SoMEF for {repo_url}: {error}")
+
+
+def _record_somef_budget(token, output):
+    """Feed the last rate limit SoMEF logged for token back into the shared token pool."""
+    matches = _SOMEF_RATE_LIMIT_LOG.findall(output or "")
+    if not matches:
+        return
+    remaining, reset_at = matches[-1]
+    try:
+        reset = datetime.fromisoformat(reset_at).timestamp()
+    except ValueError:
+        reset = None
+    get_token_pool().record_remaining(token, int(remaining), reset)
+
+
+def _budget_suffix():
+    summary = get_token_pool().budget_summary()
+    return f" ({summary})" if summary else ""
+
+
+def _kill_process_group(process):
+    """Kill SoMEF together with everything it started (git, downloads...)."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _run_somef_command(cmd, timeout, env=None):
+    """
+    Run a somef command in its own process group.
+    Returns (returncode, stdout, stderr); on timeout the whole group is killed and
+    subprocess.TimeoutExpired is raised.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+        env=env,
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(process)
+        process.communicate()
+        raise
+    return process.returncode, stdout, stderr
+
+
+def run_somef_attempt(repo_url, output_file, threshold, branch=None, codemeta_file=None, worker_pool=None, timeout=None):
+    """
+    Run SoMEF once on a repository, without retrying.
+    Returns None on success, or a (reason, message) tuple describing the failure; the caller
+    decides whether to try again (the reason is in RETRIABLE_FAILURES for transient ones).
+    When GitHub tokens are configured, SoMEF runs with the token that has the most budget left.
+    """
+    token_pool = get_token_pool()
+    token = None
+    if token_pool.has_tokens:
+        try:
+            token = token_pool.acquire()
+        except RateLimitExhausted as e:
+            print(f"Postponing SoMEF for {repo_url}: {e}")
+            return FAILURE_RATE_LIMIT, str(e)
+
+    failure = _run_somef_with_token(repo_url, output_file, threshold, branch, codemeta_file, worker_pool, timeout, token)
+    if token is not None and failure is not None and failure[0] == FAILURE_RATE_LIMIT:
+        token_pool.record_remaining(token, 0)
+    return failure
+
+
+def _run_somef_with_token(repo_url, output_file, threshold, branch, codemeta_file, worker_pool, timeout, token):
+    if worker_pool is not None:
+        try:
+            error = worker_pool.describe(
+                repo_url, output_file, threshold, branch, codemeta_file, timeout=timeout, token=token
+            )
+        except TimeoutError:
+            print(f"SoMEF timed out after {timeout}s for: {repo_url}")
+            return FAILURE_TIMEOUT, f"timed out after {timeout}s"
+        except SomefBackendUnavailable as e:
+            print(f"In-process SoMEF unavailable ({e}), falling back to the somef CLI.")
+        else:
+            if error is None:
+                print(f"SoMEF finished for: {repo_url}")
+                return None
+            _report_somef_failure(repo_url, error, error)
+            return classify_somef_failure(error), _tail(error)
+
     cmd = ["somef", "describe", "-r", repo_url, "-o", output_file, "-t", str(threshold)]
     if branch:
         cmd.extend(["-b", branch])
     if codemeta_file:
         cmd.extend(["-c", codemeta_file])
+    env = None
+    if token:
+        config_file = somef_config_with_token(token)
+        env = dict(os.environ, SOMEF_CONFIGURATION_FILE=config_file)
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        returncode, stdout, stderr = _run_somef_command(cmd, timeout, env)
+    except subprocess.TimeoutExpired:
+        print(f"SoMEF timed out after {timeout}s for: {repo_url}")
+        return FAILURE_TIMEOUT, f"timed out after {timeout}s"
+    finally:
+        if env is not None:
+            os.remove(config_file)
+
+    if token:
+        _record_somef_budget(token, "\n".join(part for part in [stderr, stdout] if part))
+
+    if returncode == 0:
         print(f"SoMEF finished for: {repo_url}")
-        return True
-    except subprocess.CalledProcessError as e:
-        stderr = (e.stderr or "").strip()
-        stdout = (e.stdout or "").strip()
-        combined_output = "\n".join(part for part in [stderr, stdout] if part)
-
-        if "GitHub token lacks required permissions or scopes" in combined_output:
-            print(
-                "SoMEF failed due to an invalid/insufficient GitHub token configured in SoMEF."
-            )
-            print(
-                "Run `somef configure` and set a token with appropriate scopes, or remove the token from ~/.somef/config.json."
-            )
+        return None
+
+    e = subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+    stderr = (stderr or "").strip()
+    stdout = (stdout or "").strip()
+    combined_output = "\n".join(part for part in [stderr, stdout] if part)
+    _report_somef_failure(repo_url, e, combined_output)
+    return classify_somef_failure(stderr or stdout), _tail(stderr or stdout) or str(e)
+
+
+def run_somef(repo_url, output_file, threshold, branch=None, codemeta_file=None, worker_pool=None, timeout=None):
+    """
+    Run SoMEF on a given repository and save results.
+    With a SomefWorkerPool, SoMEF runs in-process in a worker; the somef CLI is used otherwise,
+    or when the in-process backend is unavailable. A run taking longer than timeout seconds
+    is killed and counts as a failure.
+    """
+    return run_somef_attempt(
+        repo_url, output_file, threshold, branch, codemeta_file, worker_pool, timeout
+    ) is None
 
-        print(f"Error running SoMEF for {repo_url}: {e}")
-        return False
+
+def _run_somef_jobs(jobs, threshold, branch, worker_pool, retry_policy, on_output, failures, labels=None):
+    """
+    Run SoMEF on every job, then go through a retry queue for the retriable failures,
+    waiting with exponential backoff. Returns the number of successful runs; failures
+    that remain after the last retry are appended to the failures list if given.
+    """
+    policy = retry_policy or RetryPolicy()
+    success_count = 0
+    retry_queue = []
+
+    def attempt(job):
+        nonlocal success_count
+        job.attempts += 1
+        failure = run_somef_attempt(
+            job.repo_url, job.output_file, threshold, branch, job.codemeta_file, worker_pool, policy.timeout
+        )
+        if failure is None:
+            success_count += 1
+            if on_output:
+                on_output(job.output_file)
+            return
+        job.reason, job.error = failure
+        if job.reason in RETRIABLE_FAILURES and job.attempts <= policy.max_retries:
+            due = time.monotonic() + policy.delay(job.attempts)
+            heapq.heappush(retry_queue, (due, id(job), job))
+        elif failures is not None:
+            failures.append({
+                "repository": job.repo_url,
+                "reason": job.reason,
+                "attempts": job.attempts,
+                "error": job.error,
+            })
+
+    for index, job in enumerate(jobs):
+        if labels:
+            print(labels[index] + _budget_suffix())
+        attempt(job)
+
+    while retry_queue:
+        due, _, job = heapq.heappop(retry_queue)
+        wait = due - time.monotonic()
+        print(f"Retrying {job.repo_url} ({job.reason}, attempt {job.attempts + 1}/{policy.max_retries + 1})"
+              + (f" in {wait:.0f}s..." if wait > 0 else "..."))
+        if wait > 0:
+            time.sleep(wait)
+        attempt(job)
+
+    return success_count
+
+
+def write_failed_repositories(failures, output_file):
+    """
+    Write the repositories SoMEF could not process. The file can be passed back to --input
+    to re-run exactly those repositories.
+    """
+    data = {
+        "repositories": [failure["repository"] for failure in failures],
+        "failures": failures,
+    }
+    write_json(data, output_file)
+    print(f"{len(failures)} failed repositories saved to: {output_file}")
 
 
 def run_somef_single(
@@ -55,22 +328,27 @@ def run_somef_single(
     threshold=0.8,
     branch=None,
     generate_codemeta=False,
+    on_output=None,
+    worker_pool=None,
+    retry_policy=None,
+    failures=None,
 ):
-    """Run SoMEF for a single repository."""
+    """
+    Run SoMEF for a single repository.
+    If given, on_output is called with the SoMEF output file path once it has been written.
+    Timeouts and retries follow retry_policy; a final failure is appended to failures.
+    """
     os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, "output_1.json")
     codemeta_file = os.path.join(output_dir, CODEMETA_DEFAULT_NAME + ".json")
 
     print(f"Running SoMEF for {repo_url}...")
 
-    success = run_somef(
-        repo_url,
-        output_file,
-        threshold,
-        branch,
-        codemeta_file=codemeta_file if generate_codemeta else None,
+    job = _SomefJob(repo_url, output_file, codemeta_file if generate_codemeta else None)
+    success_count = _run_somef_jobs(
+        [job], threshold, branch, worker_pool, retry_policy, on_output, failures
     )
-    return bool(success)
+    return success_count > 0
 
 
 def run_somef_batch(
@@ -79,12 +357,20 @@ def run_somef_batch(
     threshold=0.8,
     branch=None,
     generate_codemeta=False,
+    on_output=None,
+    worker_pool=None,
+    retry_policy=None,
+    failures=None,
 ):
-    """Run SoMEF for all repositories listed in a JSON file."""
+    """
+    Run SoMEF for all repositories listed in a JSON file.
+    If given, on_output is called with each SoMEF output file path as soon as it has been written.
+    Repositories that fail for a retriable reason are queued and retried after the first pass,
+    following retry_policy; final failures are appended to failures.
+    """
     os.makedirs(output_dir, exist_ok=True)
 
-    with open(json_file, "r") as f:
-        data = json.load(f)
+    data = read_json(json_file)
 
     repos = data.get("repositories", [])
     if not repos:
@@ -94,22 +380,19 @@ def run_somef_batch(
     base_name = os.path.splitext(os.path.basename(json_file))[0]
     print(f"Running SoMEF for {len(repos)} repositories in {base_name}...")
 
-    success_count = 0
-
+    jobs = []
+    labels = []
     for idx, repo_url in enumerate(repos, start=1):
         output_file = os.path.join(output_dir, f"{base_name}_output_{idx}.json")
         codemeta_file = os.path.join(
             output_dir, f"{base_name}_{CODEMETA_DEFAULT_NAME}_{idx}.json"
         )
-        print(f"[{idx}/{len(repos)}] {repo_url}")
-        if run_somef(
-            repo_url,
-            output_file,
-            threshold,
-            branch,
-            codemeta_file=codemeta_file if generate_codemeta else None,
-        ):
-            success_count += 1
+        jobs.append(_SomefJob(repo_url, output_file, codemeta_file if generate_codemeta else None))
+        labels.append(f"[{idx}/{len(repos)}] {repo_url}")
+
+    success_count = _run_somef_jobs(
+        jobs, threshold, branch, worker_pool, retry_policy, on_output, failures, labels=labels
+    )
 
     print(f"Completed SoMEF for {base_name}. Results in {output_dir}")
     return success_count > 0
@@ -1,31 +1,6 @@
-import re
 from typing import Dict, Optional, List
-from rsmetacheck.utils.pitfall_utils import normalize_version
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
-
-
-def _parse_version_components(version_str: str) -> tuple:
-    cleaned = re.sub(r"[-_.]?(dev|alpha|beta|rc|pre|post|a|b)\d*.*", "", version_str, flags=re.IGNORECASE)
-    parts = re.findall(r"\d+", cleaned)
-    components = [int(p) for p in parts[:3]]
-    while len(components) < 3:
-        components.append(0)
-    return tuple(components)
-
-
-def _version_diff_significant(v1: str, v2: str, threshold: int = 2) -> bool:
-    c1 = _parse_version_components(v1)
-    c2 = _parse_version_components(v2)
-    for a, b in zip(c1, c2):
-        if abs(a - b) >= threshold:
-            return True
-    return False
-
-
-def _metadata_ahead_of_release(metadata_version: str, release_version: str) -> bool:
-    mc = _parse_version_components(metadata_version)
-    rc = _parse_version_components(release_version)
-    return mc > rc
+from rsmetacheck.utils.version_analysis import differs_significantly, is_ahead, normalize_version
 
 
 def extract_version_from_metadata(somef_data: Dict) -> list:
@@ -134,8 +109,8 @@ def detect_version_mismatch(
             "metadata_version": metadata_version,
         })
 
-        if _metadata_ahead_of_release(metadata_version, normalized_release_version):
-            if _version_diff_significant(
+        if is_ahead(metadata_version, normalized_release_version):
+            if differs_significantly(
                 metadata_version,
                 normalized_release_version,
                 threshold=ahead_significant_diff,
@@ -159,7 +134,7 @@ def detect_version_mismatch(
     note_text = None
     for m in all_mismatches:
         m_version = m["metadata_version"]
-        if _metadata_ahead_of_release(m_version, normalized_release_version) and not _version_diff_significant(m_version, normalized_release_version):
+        if is_ahead(m_version, normalized_release_version) and not differs_significantly(m_version, normalized_release_version):
             text = f"Version discrepancy: {m['source_file']} version '{m_version}' is ahead of release version '{normalized_release_version}'"
             notes.append({
                 "metadata_source_file": m["source_file"],
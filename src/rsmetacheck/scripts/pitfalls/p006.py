@@ -1,4 +1,5 @@
 from typing import Dict
+from rsmetacheck.utils.license_analysis import license_view
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
 
 def is_local_file_license(license_value: str) -> bool:
@@ -52,28 +53,20 @@ def detect_local_file_license_pitfall(somef_data: Dict, file_name: str) -> Dict:
         "is_local_file": False
     }
 
-    if "license" not in somef_data:
+    view = license_view(somef_data)
+    if view is None:
         return result
 
-    license_entries = somef_data["license"]
-    if not isinstance(license_entries, list):
-        return result
-
-    metadata_sources = ["codemeta.json", "description", "composer.json", "package.json", "pom.xml", "pyproject.toml", "requirements.txt", "setup.py"]
-
-    for entry in license_entries:
-        technique = entry.get("technique", "")
-        source = entry.get("source", "")
-
-        if technique == "code_parser" or any(src in source.lower() for src in metadata_sources):
-            if "result" in entry and "value" in entry["result"]:
-                license_value = entry["result"]["value"]
+    for entry in view.entries:
+        if entry.is_code_parser or entry.is_metadata_file:
+            if entry.has_value:
+                license_value = entry.value
 
                 if is_local_file_license(license_value):
-                    source_filename = extract_metadata_source_filename(source)
+                    source_filename = extract_metadata_source_filename(entry.source)
                     if result["license_value"] is None:
                         result["license_value"] = license_value
-                        result["source"] = source if source else f"technique: {technique}"
+                        result["source"] = entry.source if entry.source else f"technique: {entry.technique}"
                         result["metadata_source_file"] = source_filename
                     result["metadata_source_files"].append(source_filename)
                     result["has_pitfall"] = True
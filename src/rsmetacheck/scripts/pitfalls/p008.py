@@ -1,28 +1,13 @@
 from typing import Dict
 import requests
-import re
-from urllib.parse import urlparse
+from rsmetacheck.utils.github_rate_limit import get_token_pool, is_github_url
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
-
-
-def is_valid_url_format(url: str) -> bool:
-    """
-    Check if URL has a valid format.
-    """
-    if url is None:
-        raise ValueError("URL cannot be None")
-
-    if not url or not isinstance(url, str):
-        return False
-
-    if url.startswith(('git+', 'git://', 'svn+', 'hg+', 'bzr+')):
-        return True
-
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except:
-        return False
+from rsmetacheck.utils.requirements_analysis import (
+    VCS_URL_PREFIXES,
+    extract_urls,
+    is_valid_url_format,
+    requirements_view,
+)
 
 
 def check_url_status(url: str, timeout: int = 10) -> Dict:
@@ -39,7 +24,7 @@ def check_url_status(url: str, timeout: int = 10) -> Dict:
         result["error"] = "Invalid URL format"
         return result
 
-    if url.startswith(('git+', 'git://', 'svn+', 'hg+', 'bzr+')):
+    if url.startswith(VCS_URL_PREFIXES):
         result["is_accessible"] = True
         result["status_code"] = 200
         return result
@@ -49,7 +34,13 @@ def check_url_status(url: str, timeout: int = 10) -> Dict:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
+        # github.com shares its rate limit with SoMEF and the commit ID lookups.
+        github = is_github_url(url)
+        if github:
+            get_token_pool().wait_if_paused()
         response = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
+        if github:
+            get_token_pool().update(None, response.headers, response.status_code)
         result["status_code"] = response.status_code
 
         if (200 <= response.status_code < 300) or response.status_code == 301:
@@ -67,26 +58,7 @@ def extract_urls_from_requirements(requirement_text: str) -> list:
     """
     Extract URLs from software requirement text.
     """
-    if not requirement_text:
-        return []
-
-    url_patterns = [
-        r'https?://[^\s<>"\']+',  # HTTP/HTTPS URLs
-        r'www\.[^\s<>"\']+',  # URLs starting with www
-    ]
-
-    urls = []
-    for pattern in url_patterns:
-        matches = re.findall(pattern, requirement_text, re.IGNORECASE)
-        urls.extend(matches)
-
-    cleaned_urls = []
-    for url in urls:
-        url = re.sub(r'[,;.!?)]$', '', url)
-        if url:
-            cleaned_urls.append(url)
-
-    return cleaned_urls
+    return extract_urls(requirement_text)
 
 
 def detect_invalid_software_requirement_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -104,80 +76,52 @@ def detect_invalid_software_requirement_pitfall(somef_data: Dict, file_name: str
         "requirement_text": None
     }
 
-    if "requirements" not in somef_data:
-        return result
-
-    req_entries = somef_data["requirements"]
-    if not isinstance(req_entries, list):
+    view = requirements_view(somef_data)
+    if view is None:
         return result
 
-    metadata_sources = ["codemeta.json", "description", "composer.json", "package.json", "pom.xml", "pyproject.toml",
-                        "requirements.txt", "setup.py"]
-
-    for entry in req_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        is_metadata_source = (
-                technique == "code_parser" and
-                any(src in source.lower() for src in metadata_sources)
-        )
-
-        if is_metadata_source:
-            if "result" in entry and "value" in entry["result"]:
-                req_value = entry["result"]["value"]
-
-                if isinstance(req_value, str) and is_valid_url_format(req_value):
-                    url_status = check_url_status(req_value)
-
-                    if not url_status["is_accessible"]:
-                        source_filename = extract_metadata_source_filename(source)
-                        if result["source"] is None:
-                            result["source"] = source
-                            result["metadata_source_file"] = source_filename
-                            result["requirement_text"] = req_value
-                        result["invalid_urls"].append({
-                            "url": req_value,
-                            "status_code": url_status["status_code"],
-                            "error": url_status["error"]
-                        })
-                        result["metadata_source_files"].append(source_filename)
-                        result["has_pitfall"] = True
-                else:
-                    requirement_text = ""
-                    if isinstance(req_value, str):
-                        requirement_text = req_value
-                    elif isinstance(req_value, list):
-                        requirement_text = " ".join(str(item) for item in req_value)
-                    elif isinstance(req_value, dict):
-                        for key in ["name", "value", "description", "text"]:
-                            if key in req_value:
-                                requirement_text += str(req_value[key]) + " "
-
-                    if requirement_text:
-                        urls = extract_urls_from_requirements(requirement_text)
-
-                        if urls:
-                            invalid_urls = []
-
-                            for url in urls:
-                                url_status = check_url_status(url)
-
-                                if not url_status["is_accessible"]:
-                                    invalid_urls.append({
-                                        "url": url,
-                                        "status_code": url_status["status_code"],
-                                        "error": url_status["error"]
-                                    })
-
-                            if invalid_urls:
-                                source_filename = extract_metadata_source_filename(source)
-                                if result["source"] is None:
-                                    result["source"] = source
-                                    result["metadata_source_file"] = source_filename
-                                    result["requirement_text"] = requirement_text
-                                result["invalid_urls"].extend(invalid_urls)
-                                result["metadata_source_files"].append(source_filename)
-                                result["has_pitfall"] = True
+    for entry in view.metadata_entries():
+        if not entry.has_value:
+            continue
+        source = entry.source
+
+        if entry.is_url:
+            url_status = check_url_status(entry.value)
+
+            if not url_status["is_accessible"]:
+                source_filename = extract_metadata_source_filename(source)
+                if result["source"] is None:
+                    result["source"] = source
+                    result["metadata_source_file"] = source_filename
+                    result["requirement_text"] = entry.value
+                result["invalid_urls"].append({
+                    "url": entry.value,
+                    "status_code": url_status["status_code"],
+                    "error": url_status["error"]
+                })
+                result["metadata_source_files"].append(source_filename)
+                result["has_pitfall"] = True
+        else:
+            invalid_urls = []
+
+            for url in entry.urls():
+                url_status = check_url_status(url)
+
+                if not url_status["is_accessible"]:
+                    invalid_urls.append({
+                        "url": url,
+                        "status_code": url_status["status_code"],
+                        "error": url_status["error"]
+                    })
+
+            if invalid_urls:
+                source_filename = extract_metadata_source_filename(source)
+                if result["source"] is None:
+                    result["source"] = source
+                    result["metadata_source_file"] = source_filename
+                    result["requirement_text"] = entry.text()
+                result["invalid_urls"].extend(invalid_urls)
+                result["metadata_source_files"].append(source_filename)
+                result["has_pitfall"] = True
 
     return result
\ No newline at end of file
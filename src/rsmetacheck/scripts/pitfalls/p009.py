@@ -1,68 +1,25 @@
 
 from typing import Dict
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
+from rsmetacheck.utils.url_analysis import classify_url, url_view
 
 
 def is_repository_url(url: str) -> bool:
     """
     Check if URL appears to be a code repository rather than homepage.
     """
-    if not url:
+    if not url or not isinstance(url, str):
         return False
-
-    url_lower = url.lower()
-
-    if 'github.io' in url_lower:
-        return False
-
-    repo_indicators = [
-        'github.com/',
-        'github.org/',
-        'gitlab.com/',
-        'gitlab.org/',
-        'bitbucket.org/',
-        'bitbucket.net/',
-        'sourceforge.net/projects/',
-        'git.',
-        '.git'
-    ]
-
-    for indicator in repo_indicators:
-        if indicator in url_lower:
-            return True
-
-    return False
+    return classify_url(url).is_repository
 
 
 def is_homepage_url_repo(url: str) -> bool:
     """
     Check if URL appears to be a homepage rather than code repository.
     """
-    if not url:
-        return False
-
-    url_lower = url.lower()
-
-    if is_repository_url(url):
+    if not url or not isinstance(url, str):
         return False
-
-    homepage_indicators = [
-        '.org/',
-        '.com/',
-        '.net/',
-        '.io/',
-        'www.',
-        'docs.',
-        'documentation',
-        'readthedocs',
-        'github.io'
-    ]
-
-    for indicator in homepage_indicators:
-        if indicator in url_lower:
-            return True
-
-    return False
+    return classify_url(url).is_homepage
 
 
 def detect_coderepository_homepage_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -80,38 +37,22 @@ def detect_coderepository_homepage_pitfall(somef_data: Dict, file_name: str) ->
         "is_homepage": False
     }
 
-    if "code_repository" not in somef_data:
-        return result
-
-    repo_entries = somef_data["code_repository"]
-    if not isinstance(repo_entries, list):
+    view = url_view(somef_data, "code_repository")
+    if view is None:
         return result
 
-    metadata_sources = ["codemeta.json", "DESCRIPTION", "composer.json", "package.json",
-                        "pom.xml", "pyproject.toml", "requirements.txt", "setup.py"]
-
-    for entry in repo_entries:
-        technique = entry.get("technique", "")
-        source = entry.get("source", "")
-
-        is_metadata_source = (
-            technique == "code_parser" or
-            technique in metadata_sources or
-            any(src in source.lower() for src in metadata_sources)
-        )
-
-        if is_metadata_source:
-            if "result" in entry and "value" in entry["result"]:
-                repo_url = entry["result"]["value"]
-
-                if is_homepage_url_repo(repo_url):
-                    source_filename = extract_metadata_source_filename(source)
-                    if result["repository_url"] is None:
-                        result["repository_url"] = repo_url
-                        result["source"] = source if source else f"technique: {technique}"
-                        result["metadata_source_file"] = source_filename
-                    result["metadata_source_files"].append(source_filename)
-                    result["has_pitfall"] = True
-                    result["is_homepage"] = True
+    for entry in view.metadata_entries():
+        repo_url = entry.value
+
+        if is_homepage_url_repo(repo_url):
+            source = entry.source
+            source_filename = extract_metadata_source_filename(source)
+            if result["repository_url"] is None:
+                result["repository_url"] = repo_url
+                result["source"] = source if source else f"technique: {entry.technique}"
+                result["metadata_source_file"] = source_filename
+            result["metadata_source_files"].append(source_filename)
+            result["has_pitfall"] = True
+            result["is_homepage"] = True
 
     return result
\ No newline at end of file
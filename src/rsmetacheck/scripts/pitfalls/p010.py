@@ -1,29 +1,21 @@
-import re
 from typing import Dict, Optional
 
+from rsmetacheck.utils.license_analysis import is_copyright_only, license_view
+
 
 def extract_license_from_file(somef_data: Dict) -> Optional[Dict[str, str]]:
     """
     Extract license content from LICENSE file in SoMEF output.
     Returns a dict with source and content, or None if not found.
     """
-    if "license" not in somef_data:
-        return None
-
-    license_entries = somef_data["license"]
-    if not isinstance(license_entries, list):
+    view = license_view(somef_data)
+    if view is None or view.license_file is None:
         return None
 
-    for entry in license_entries:
-        if "source" in entry:
-            source = entry["source"]
-            if "LICENSE" in source.upper() and "result" in entry and "value" in entry["result"]:
-                return {
-                    "source": source,
-                    "content": entry["result"]["value"]
-                }
-
-    return None
+    return {
+        "source": view.license_file.source,
+        "content": view.license_file.value
+    }
 
 
 def check_copyright_only_license(license_content: str) -> bool:
@@ -33,73 +25,7 @@ def check_copyright_only_license(license_content: str) -> bool:
     YEAR: 2017
     COPYRIGHT HOLDER: Adam H. Sparks
     """
-    if not license_content:
-        return False
-
-    content_lower = license_content.lower().strip()
-    content_lines = [line.strip() for line in license_content.strip().split('\n') if line.strip()]
-
-    copyright_only_patterns = [
-        r'year\s*:\s*\d{4}',  # YEAR: 2017
-        r'copyright\s+holder\s*:\s*[a-zA-Z]',  # COPYRIGHT HOLDER: Someone
-        r'author\s*:\s*[a-zA-Z]',  # AUTHOR: Someone
-        r'copyright\s*©?\s*\d{4}',  # Copyright 2017 or Copyright © 2017
-        r'\(c\)\s*\d{4}',  # (C) 2017
-    ]
-
-    license_term_patterns = [
-        r'permission\s+is\s+hereby\s+granted',
-        r'subject\s+to\s+the\s+following\s+conditions',
-        r'redistribution\s+and\s+use',
-        r'without\s+restriction',
-        r'without\s+warranty',
-        r'liability',
-        r'terms\s+and\s+conditions',
-        r'licensed\s+under',
-        r'mit\s+license',
-        r'apache\s+license',
-        r'gnu\s+general\s+public\s+license',
-        r'bsd\s+license',
-        r'creative\s+commons',
-    ]
-
-    has_copyright_info = any(re.search(pattern, content_lower) for pattern in copyright_only_patterns)
-    has_license_terms = any(re.search(pattern, content_lower) for pattern in license_term_patterns)
-
-    if has_license_terms:
-        return False
-
-    # This will check if it has copyright info but no license terms and is short, it's likely copyright-only
-    if has_copyright_info and not has_license_terms and len(content_lines) <= 10:
-        return True
-
-    # Check for the exact format "YEAR: xxxx" and "COPYRIGHT HOLDER: xxxx"
-    year_pattern_found = bool(re.search(r'year\s*:\s*\d{4}', content_lower))
-    copyright_holder_pattern_found = bool(re.search(r'copyright\s+holder\s*:', content_lower))
-
-    if year_pattern_found and copyright_holder_pattern_found:
-        if has_license_terms:
-            return False
-        return True
-
-    if len(content_lines) <= 5:
-        meaningful_lines = []
-
-        for line in content_lines:
-            line_lower = line.lower()
-
-            if not any(re.search(pattern, line_lower) for pattern in copyright_only_patterns):
-
-                if (len(line.strip()) > 0 and
-                    not line.strip().startswith('#') and
-                    not line.strip().startswith('//') and
-                    line.strip() not in ['', '-', '=', '*']):
-                    meaningful_lines.append(line)
-
-        if len(meaningful_lines) <= 1 and has_copyright_info:
-            return True
-
-    return False
+    return is_copyright_only(license_content)
 
 
 def detect_copyright_only_license(somef_data: Dict, file_name: str) -> Dict:
@@ -1,5 +1,6 @@
 from typing import Dict
-from urllib.parse import urlparse
+
+from rsmetacheck.utils.url_analysis import classify_url, url_view
 
 
 def is_valid_issue_tracker_format(url: str) -> bool:
@@ -8,31 +9,9 @@ def is_valid_issue_tracker_format(url: str) -> bool:
     Validates that the URL has a proper scheme, hostname, and
     a path ending in a recognized issue tracker pattern (/issues, /tickets).
     """
-    if not url:
-        return False
-
-    try:
-        parsed = urlparse(url.strip())
-    except Exception:
-        return False
-
-    if parsed.scheme not in ('http', 'https'):
-        return False
-
-    if not parsed.netloc:
+    if not url or not isinstance(url, str):
         return False
-
-    path = parsed.path
-    if not path or path == '/':
-        return False
-
-    path_lower = path.lower()
-    valid_patterns = ['/issues', '/tickets']
-    for pattern in valid_patterns:
-        if path_lower.endswith(pattern) or (pattern + '/') in path_lower:
-            return True
-
-    return False
+    return classify_url(url).is_issue_tracker
 
 
 def detect_issue_tracker_format_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -48,26 +27,18 @@ def detect_issue_tracker_format_pitfall(somef_data: Dict, file_name: str) -> Dic
         "format_violation": None
     }
 
-    if "issue_tracker" not in somef_data:
+    view = url_view(somef_data, "issue_tracker")
+    if view is None:
         return result
 
-    issues_entries = somef_data["issue_tracker"]
-    if not isinstance(issues_entries, list):
-        return result
-
-    for entry in issues_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        if "codemeta.json" in source or (technique == "code_parser" and "codemeta" in source.lower()):
-            if "result" in entry and "value" in entry["result"]:
-                issue_url = entry["result"]["value"]
+    for entry in view.codemeta_entries():
+        issue_url = entry.value
 
-                if not is_valid_issue_tracker_format(issue_url):
-                    result["has_pitfall"] = True
-                    result["issue_url"] = issue_url
-                    result["source"] = source
-                    result["format_violation"] = "URL does not match recognized issue tracker format"
-                    break
+        if not is_valid_issue_tracker_format(issue_url):
+            result["has_pitfall"] = True
+            result["issue_url"] = issue_url
+            result["source"] = entry.source
+            result["format_violation"] = "URL does not match recognized issue tracker format"
+            break
 
     return result
\ No newline at end of file
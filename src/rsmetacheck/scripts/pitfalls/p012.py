@@ -1,6 +1,19 @@
 from typing import Dict
 import re
 
+from rsmetacheck.utils.version_analysis import canonical_version
+
+# Common version patterns in download URLs
+_DOWNLOAD_URL_VERSION_PATTERNS = [
+    re.compile(r'/archive/(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)\.'),  # /archive/3.8.0. or /archive/v1.2.3.
+    re.compile(r'/archive/(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)$'),
+    # /archive/3.8.0 or /archive/v1.2.3 (end of string)
+    re.compile(r'[-_](?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)\.'),  # -3.8.0.tar.gz or _v1.2.3.zip
+    re.compile(r'/(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)/[^/]*$'),  # /3.8.0/something
+]
+_ARCHIVE_EXTENSION = re.compile(r'\.(tar|gz|zip|bz2|xz|tgz).*$')
+_RELEASE_NAME_VERSION = re.compile(r'(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)')
+
 
 def extract_version_from_download_url(url: str) -> str:
     """
@@ -9,22 +22,13 @@ def extract_version_from_download_url(url: str) -> str:
     if not url:
         return None
 
-    # Common version patterns in download URLs
-    version_patterns = [
-        r'/archive/(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)\.',  # /archive/3.8.0. or /archive/v1.2.3.
-        r'/archive/(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)$',
-        # /archive/3.8.0 or /archive/v1.2.3 (end of string)
-        r'[-_](?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)\.',  # -3.8.0.tar.gz or _v1.2.3.zip
-        r'/(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)/[^/]*$',  # /3.8.0/something
-    ]
-
-    for pattern in version_patterns:
-        match = re.search(pattern, url)
+    for pattern in _DOWNLOAD_URL_VERSION_PATTERNS:
+        match = pattern.search(url)
         if match:
             version = match.group(1)
             # Remove any trailing file extension artifacts
             # This handles cases where .tar, .zip etc might be captured
-            version = re.sub(r'\.(tar|gz|zip|bz2|xz|tgz).*$', '', version)
+            version = _ARCHIVE_EXTENSION.sub('', version)
             return version
 
     return None
@@ -34,19 +38,7 @@ def normalize_version(version: str) -> str:
     """
     Normalize version string for comparison by removing 'v' prefix and standardizing format.
     """
-    if not version:
-        return None
-
-    normalized = version.strip()
-
-    if not normalized:
-        return None
-
-    normalized = normalized.lower()
-    if normalized.startswith('v'):
-        normalized = normalized[1:]
-
-    return normalized if normalized else None
+    return canonical_version(version)
 
 
 def get_latest_release_version(somef_data: Dict) -> str:
@@ -71,7 +63,7 @@ def get_latest_release_version(somef_data: Dict) -> str:
 
         if "name" in result and result["name"]:
             name = result["name"]
-            version_match = re.search(r'(?:v)?(\d+\.\d+(?:\.\d+)?(?:[a-zA-Z0-9\-\.]*)?)', name)
+            version_match = _RELEASE_NAME_VERSION.search(name)
             if version_match:
                 return normalize_version(version_match.group(1))
 
@@ -1,5 +1,5 @@
 from typing import Dict
-import re
+from rsmetacheck.utils.license_analysis import license_view
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
 
 
@@ -17,56 +17,19 @@ def detect_license_no_version_pitfall(somef_data: Dict, file_name: str) -> Dict:
         "source": None
     }
 
-    if "license" not in somef_data:
+    view = license_view(somef_data)
+    if view is None:
         return result
 
-    license_entries = somef_data["license"]
-    if not isinstance(license_entries, list):
-        return result
-
-    metadata_sources = ["codemeta.json", "DESCRIPTION", "composer.json", "package.json", "pom.xml", "pyproject.toml",
-                        "requirements.txt", "setup.py"]
-
-    versioned_patterns = {
-        "GPL": r"\bGPL[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?",
-        "LGPL": r"\bLGPL[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?",
-        "AGPL": r"\bAGPL[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?",
-        "Apache": r"\bApache[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?",
-        "CC": r"\bCC[- ]BY[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?",
-        "BSD": r"\bBSD[-\s]\d+[-\s]Clause"
-    }
-
-    for entry in license_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        is_metadata_source = (
-                technique == "code_parser" and
-                any(src in source for src in metadata_sources)
-        )
-
-        if is_metadata_source:
-            if "result" in entry and "value" in entry["result"]:
-                license_value = entry["result"]["value"]
-
-                if isinstance(license_value, str):
-                    license_upper = license_value.upper()
-
-                    if "0BSD" in license_value:
-                        continue
-
-                    if "LICENSEREF-" in license_upper:
-                        continue
-
-                    for license_name, version_pattern in versioned_patterns.items():
-                        if re.search(rf"\b{license_name}\b", license_upper):
-                            if not re.search(version_pattern, license_upper, re.IGNORECASE):
-                                source_filename = extract_metadata_source_filename(source)
-                                if result["license_value"] is None:
-                                    result["license_value"] = license_value
-                                    result["source"] = source
-                                    result["metadata_source_file"] = source_filename
-                                result["metadata_source_files"].append(source_filename)
-                                result["has_pitfall"] = True
+    for entry in view.metadata_entries():
+        # One finding per license family named without a version.
+        for _ in entry.unversioned_families():
+            source_filename = extract_metadata_source_filename(entry.source)
+            if result["license_value"] is None:
+                result["license_value"] = entry.value
+                result["source"] = entry.source
+                result["metadata_source_file"] = source_filename
+            result["metadata_source_files"].append(source_filename)
+            result["has_pitfall"] = True
 
     return result
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Dict
-import re
+
+from rsmetacheck.utils.url_analysis import classify_url, url_view
 
 
 def is_bare_doi(identifier: str) -> bool:
@@ -8,24 +9,7 @@ def is_bare_doi(identifier: str) -> bool:
     """
     if not identifier or not isinstance(identifier, str):
         return False
-
-    identifier = identifier.strip()
-
-    # If it already starts with https://doi.org/, it's not bare
-    if identifier.startswith('https://doi.org/'):
-        return False
-
-    # Check if it's a bare DOI pattern
-    bare_doi_patterns = [
-        r'^doi:10\.\d+/',  # doi:10.1234/example
-        r'^10\.\d+/',  # 10.1234/example
-    ]
-
-    for pattern in bare_doi_patterns:
-        if re.match(pattern, identifier):
-            return True
-
-    return False
+    return classify_url(identifier).doi_kind == "bare"
 
 
 def detect_bare_doi_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -40,26 +24,18 @@ def detect_bare_doi_pitfall(somef_data: Dict, file_name: str) -> Dict:
         "is_bare_doi": False
     }
 
-    if "identifier" not in somef_data:
+    view = url_view(somef_data, "identifier")
+    if view is None:
         return result
 
-    identifier_entries = somef_data["identifier"]
-    if not isinstance(identifier_entries, list):
-        return result
-
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        if "codemeta.json" in source or (technique == "code_parser" and "codemeta" in source.lower()):
-            if "result" in entry and "value" in entry["result"]:
-                identifier_value = entry["result"]["value"]
+    for entry in view.codemeta_entries():
+        identifier_value = entry.value
 
-                if is_bare_doi(identifier_value):
-                    result["has_pitfall"] = True
-                    result["identifier_value"] = identifier_value
-                    result["source"] = source
-                    result["is_bare_doi"] = True
-                    break
+        if is_bare_doi(identifier_value):
+            result["has_pitfall"] = True
+            result["identifier_value"] = identifier_value
+            result["source"] = entry.source
+            result["is_bare_doi"] = True
+            break
 
     return result
\ No newline at end of file
@@ -2,6 +2,8 @@ from typing import Dict
 import requests
 from urllib.parse import urlparse
 
+from rsmetacheck.utils.github_rate_limit import get_token_pool, is_github_url
+
 
 def is_valid_url_format(url: str) -> bool:
     """
@@ -33,7 +35,13 @@ def check_ci_url_status(url: str, timeout: int = 10) -> Dict:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
+        # github.com shares its rate limit with SoMEF and the commit ID lookups.
+        github = is_github_url(url)
+        if github:
+            get_token_pool().wait_if_paused()
         response = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
+        if github:
+            get_token_pool().update(None, response.headers, response.status_code)
         result["status_code"] = response.status_code
 
         # Consider 200-302 (except 300) as successful
@@ -1,27 +1,15 @@
 from typing import Dict
-import re
+
+from rsmetacheck.utils.url_analysis import classify_url, url_view
+
 
 def normalize_repository_url(url: str) -> str:
     """
     Normalize repository URL for comparison.
     """
-    if not url:
+    if not url or not isinstance(url, str):
         return ""
-
-    url = url.lower().strip()
-
-    url = re.sub(r'^git\+', '', url)  # Remove git+ prefix
-    url = re.sub(r'^http://', 'https://', url)  # Normalize http to https
-    url = url.replace('www.github.com', 'github.com')
-
-    url = re.sub(r'/$', '', url)  # Remove trailing slash
-    url = re.sub(r'\.git$', '', url)  # Remove .git suffix
-    url = re.sub(r'/$', '', url)  # Remove trailing slash again if it was .git/
-
-    if url.startswith('git@'):
-        url = re.sub(r'^git@([^:]+):', r'https://\1/', url)
-
-    return url
+    return classify_url(url).normalized
 
 
 def detect_different_repository_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -37,31 +25,26 @@ def detect_different_repository_pitfall(somef_data: Dict, file_name: str) -> Dic
         "metadata_source_files": []
     }
 
-    if "code_repository" not in somef_data:
-        return result
-
-    repo_entries = somef_data["code_repository"]
-    if not isinstance(repo_entries, list):
+    view = url_view(somef_data, "code_repository")
+    if view is None:
         return result
 
     github_api_url = None
     metadata_urls = []
 
-    for entry in repo_entries:
-        technique = entry.get("technique", "")
-        source = entry.get("source", "")
-
-        if "result" in entry and "value" in entry["result"]:
-            repo_url = entry["result"]["value"]
-
-            if technique == "GitHub_API":
-                github_api_url = repo_url
-            elif any(src in source.lower() for src in ["codemeta.json"]):
-                metadata_urls.append({
-                    "url": repo_url,
-                    "source": source,
-                    "technique": technique
-                })
+    for entry in view.entries:
+        # codeRepository lists (e.g. from a codemeta.json) are not compared.
+        if not entry.has_value or not isinstance(entry.value, str):
+            continue
+
+        if entry.technique == "GitHub_API":
+            github_api_url = entry.value
+        elif entry.is_codemeta:
+            metadata_urls.append({
+                "url": entry.value,
+                "source": entry.source,
+                "technique": entry.technique
+            })
 
     if not github_api_url or not metadata_urls:
         return result
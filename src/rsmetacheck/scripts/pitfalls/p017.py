@@ -1,5 +1,6 @@
 from typing import Dict
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
+from rsmetacheck.utils.version_analysis import version_text
 
 
 def get_codemeta_version(somef_data: Dict) -> str:
@@ -85,7 +86,7 @@ def detect_codemeta_version_mismatch_pitfall(somef_data: Dict, file_name: str) -
     for other_version_entry in other_versions:
         other_version = other_version_entry["version"]
 
-        if codemeta_version.strip() != other_version.strip():
+        if version_text(codemeta_version) != version_text(other_version):
             mismatched_versions.append(other_version_entry)
             mismatched_source_files.append(
                 extract_metadata_source_filename(other_version_entry.get("source", ""))
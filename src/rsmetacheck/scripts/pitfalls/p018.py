@@ -1,5 +1,6 @@
 from typing import Dict
-import re
+
+from rsmetacheck.utils.url_analysis import classify_url, url_view
 
 
 def is_raw_swhid(identifier: str) -> bool:
@@ -8,20 +9,7 @@ def is_raw_swhid(identifier: str) -> bool:
     """
     if not identifier or not isinstance(identifier, str):
         return False
-
-    identifier = identifier.strip()
-
-    # If it already has a URL scheme, it's not raw
-    if identifier.startswith(('http://', 'https://')):
-        return False
-
-    # Check if it's a raw SWHID pattern
-    swhid_pattern = r'^swh:1:[a-z]+:[a-f0-9]{40}$'
-
-    if re.match(swhid_pattern, identifier):
-        return True
-
-    return False
+    return classify_url(identifier).is_raw_swhid
 
 
 def detect_raw_swhid_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -36,26 +24,18 @@ def detect_raw_swhid_pitfall(somef_data: Dict, file_name: str) -> Dict:
         "is_raw_swhid": False
     }
 
-    if "identifier" not in somef_data:
+    view = url_view(somef_data, "identifier")
+    if view is None:
         return result
 
-    identifier_entries = somef_data["identifier"]
-    if not isinstance(identifier_entries, list):
-        return result
-
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        if "codemeta.json" in source or (technique == "code_parser" and "codemeta" in source.lower()):
-            if "result" in entry and "value" in entry["result"]:
-                identifier_value = entry["result"]["value"]
+    for entry in view.codemeta_entries():
+        identifier_value = entry.value
 
-                if is_raw_swhid(identifier_value):
-                    result["has_pitfall"] = True
-                    result["identifier_value"] = identifier_value
-                    result["source"] = source
-                    result["is_raw_swhid"] = True
-                    break
+        if is_raw_swhid(identifier_value):
+            result["has_pitfall"] = True
+            result["identifier_value"] = identifier_value
+            result["source"] = entry.source
+            result["is_raw_swhid"] = True
+            break
 
     return result
\ No newline at end of file
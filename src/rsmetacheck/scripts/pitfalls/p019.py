@@ -66,50 +66,94 @@ def get_author_identifier(author: any) -> str:
         return str(author)
 
 
-def find_author_count_inconsistencies(author_sources: List[Dict]) -> Tuple[bool, List[Dict]]:
+def group_sources_by_author_count(author_sources: List[Dict]) -> List[Dict]:
     """
-    Check if there are inconsistencies in author counts across different sources.
-    Returns (has_inconsistency, inconsistency_details).
+    Group author sources by their author count.
+    Returns one entry per distinct count, sorted by count, listing the sources in that group.
     """
-    if len(author_sources) < 2:
-        return False, []
-
-    counts = {}
+    groups: Dict[int, Dict] = {}
     for source_info in author_sources:
         count = source_info["author_count"]
-        if count not in counts:
-            counts[count] = []
-        counts[count].append(source_info)
+        group = groups.get(count)
+        if group is None:
+            group = groups[count] = {"author_count": count, "source_files": [], "sources": []}
+        group["source_files"].append(source_info["source_file"])
+        group["sources"].append(source_info["source"])
+
+    return [groups[count] for count in sorted(groups)]
 
-    if len(counts) <= 1:
-        return False, []
 
-    inconsistencies = []
-    sorted_counts = sorted(counts.keys())
-
-    for i in range(len(sorted_counts)):
-        lower_count = sorted_counts[i]
-        for j in range(i + 1, len(sorted_counts)):
-            higher_count = sorted_counts[j]
-
-            for lower_source in counts[lower_count]:
-                for higher_source in counts[higher_count]:
-                    inconsistencies.append({
-                        "source_with_fewer": lower_source["source_file"],
-                        "source_with_fewer_full": lower_source["source"],
-                        "fewer_count": lower_count,
-                        "fewer_authors": lower_source["authors"],
-                        "source_with_more": higher_source["source_file"],
-                        "source_with_more_full": higher_source["source"],
-                        "more_count": higher_count,
-                        "more_authors": higher_source["authors"],
-                        "difference": higher_count - lower_count
+def expand_inconsistency_pairs(count_groups: List[Dict]) -> List[Dict]:
+    """
+    Expand count groups into one compact record per (fewer, more) pair of sources.
+    The output is quadratic in the number of sources, so it is only built on request.
+    """
+    pairs = []
+    for i, lower in enumerate(count_groups):
+        for higher in count_groups[i + 1:]:
+            for fewer_file, fewer_full in zip(lower["source_files"], lower["sources"]):
+                for more_file, more_full in zip(higher["source_files"], higher["sources"]):
+                    pairs.append({
+                        "source_with_fewer": fewer_file,
+                        "source_with_fewer_full": fewer_full,
+                        "fewer_count": lower["author_count"],
+                        "source_with_more": more_file,
+                        "source_with_more_full": more_full,
+                        "more_count": higher["author_count"],
+                        "difference": higher["author_count"] - lower["author_count"]
                     })
+    return pairs
+
+
+def _inconsistencies_from_groups(count_groups: List[Dict], expand_pairs: bool) -> List[Dict]:
+    if len(count_groups) <= 1:
+        return []
+
+    if expand_pairs:
+        return expand_inconsistency_pairs(count_groups)
+
+    fewest = count_groups[0]
+    most = count_groups[-1]
+    return [{
+        "source_with_fewer": fewest["source_files"][0],
+        "source_with_fewer_full": fewest["sources"][0],
+        "fewer_count": fewest["author_count"],
+        "sources_with_fewer": fewest["source_files"],
+        "source_with_more": most["source_files"][0],
+        "source_with_more_full": most["sources"][0],
+        "more_count": most["author_count"],
+        "sources_with_more": most["source_files"],
+        "difference": most["author_count"] - fewest["author_count"]
+    }]
+
+
+def find_author_count_inconsistencies(
+    author_sources: List[Dict],
+    expand_pairs: bool = False,
+) -> Tuple[bool, List[Dict]]:
+    """
+    Check if there are inconsistencies in author counts across different sources.
+    Returns (has_inconsistency, inconsistency_details).
+
+    By default a single record compares the sources with the fewest authors against
+    the sources with the most authors. With expand_pairs, one compact record is
+    returned per pair of sources with different counts.
+    """
+    if len(author_sources) < 2:
+        return False, []
 
+    inconsistencies = _inconsistencies_from_groups(
+        group_sources_by_author_count(author_sources),
+        expand_pairs,
+    )
     return len(inconsistencies) > 0, inconsistencies
 
 
-def detect_inconsistent_author_count(somef_data: Dict, file_name: str) -> Dict:
+def detect_inconsistent_author_count(
+    somef_data: Dict,
+    file_name: str,
+    expand_pairs: bool = False,
+) -> Dict:
     """
     Detect inconsistent author counts across different metadata files.
     Returns detection result with warning info.
@@ -118,6 +162,7 @@ def detect_inconsistent_author_count(somef_data: Dict, file_name: str) -> Dict:
         "has_warning": False,
         "file_name": file_name,
         "author_sources": [],
+        "author_count_groups": [],
         "inconsistencies": [],
         "total_sources": 0,
         "min_author_count": 0,
@@ -132,14 +177,15 @@ def detect_inconsistent_author_count(somef_data: Dict, file_name: str) -> Dict:
     result["author_sources"] = author_sources
     result["total_sources"] = len(author_sources)
 
-    counts = [src["author_count"] for src in author_sources]
-    result["min_author_count"] = min(counts)
-    result["max_author_count"] = max(counts)
+    count_groups = group_sources_by_author_count(author_sources)
+    result["author_count_groups"] = count_groups
+    result["min_author_count"] = count_groups[0]["author_count"]
+    result["max_author_count"] = count_groups[-1]["author_count"]
 
-    has_inconsistency, inconsistencies = find_author_count_inconsistencies(author_sources)
+    inconsistencies = _inconsistencies_from_groups(count_groups, expand_pairs)
 
-    if has_inconsistency:
+    if inconsistencies:
         result["has_warning"] = True
         result["inconsistencies"] = inconsistencies
 
-    return result
\ No newline at end of file
+    return result
@@ -1,6 +1,7 @@
 from typing import Dict, Optional, Tuple
 from datetime import datetime
-import re
+
+from rsmetacheck.utils.date_analysis import parse_date
 
 
 def extract_github_api_date_updated(somef_data: Dict) -> Optional[str]:
@@ -63,33 +64,7 @@ def normalize_date_for_comparison(date_string: str) -> Optional[datetime]:
     - "2023-11-17"
     - "2022-03-11T19:01:51.720Z"
     """
-    if not date_string:
-        return None
-
-    date_string = date_string.strip()
-
-    date_formats = [
-        "%Y-%m-%dT%H:%M:%SZ",  # "2025-02-05T18:00:24Z"
-        "%Y-%m-%dT%H:%M:%S.%fZ",  # "2022-03-11T19:01:51.720Z"
-        "%Y-%m-%d",  # "2023-11-17"
-        "%Y-%m-%dT%H:%M:%S",  # Without Z
-        "%Y-%m-%dT%H:%M:%S.%f",  # With microseconds, no Z
-    ]
-
-    for fmt in date_formats:
-        try:
-            return datetime.strptime(date_string, fmt)
-        except ValueError:
-            continue
-
-    date_match = re.match(r'^(\d{4}-\d{2}-\d{2})', date_string)
-    if date_match:
-        try:
-            return datetime.strptime(date_match.group(1), "%Y-%m-%d")
-        except ValueError:
-            pass
-
-    return None
+    return parse_date(date_string)
 
 
 def calculate_date_difference_days(date1: datetime, date2: datetime) -> int:
@@ -1,6 +1,7 @@
-import re
 from typing import Dict
 
+from rsmetacheck.utils.license_analysis import license_view
+
 
 def detect_dual_license_missing_codemeta_pitfall(somef_data: Dict, file_name: str) -> Dict:
     """
@@ -14,52 +15,18 @@ def detect_dual_license_missing_codemeta_pitfall(somef_data: Dict, file_name: st
         "dual_license_source": None
     }
 
-    if "license" not in somef_data:
-        return result
-
-    license_entries = somef_data["license"]
-    if not isinstance(license_entries, list):
+    view = license_view(somef_data)
+    if view is None:
         return result
 
-    dual_license_patterns = [
-        r"dual[\s-]?licen[cs]ed?",
-        r"dually[\s-]?licen[cs]ed?",
-        r"multiple[\s-]?licen[cs]es?",
-        r"(?:is|are)\s+licen[cs]ed?\s+under.*\b(?:and|or)\b.*licen[cs]e", 
-        r"choose.*\b(?:between|from|your)\b.*licen[cs]e",  
-        r"\beither\b.*\bor\b.*licen[cs]e",  
-        r"\d+\..*licen[cs]e.*\n.*\d+\..*licen[cs]e",
-        r"licen[cs]e.*options?",
-        r"available\s+under.*\b(?:two|multiple|either)\b.*licen[cs]es?",
-        r"licen[cs]ed?\s+under.*\b(?:and|or)\b"
-    ]
-
-    has_dual_license_indicator = False
-    dual_license_source = None
-    codemeta_license_count = 0
-
-    for entry in license_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        if technique == "code_parser" and "codemeta.json" in source:
-            codemeta_license_count += 1
-        else:
-            if not has_dual_license_indicator and "result" in entry and "value" in entry["result"]:
-                license_text = entry["result"]["value"]
-                if isinstance(license_text, str):
-                    license_text_lower = license_text.lower()
-                    for pattern in dual_license_patterns:
-                        if re.search(pattern, license_text_lower):
-                            has_dual_license_indicator = True
-                            dual_license_source = source
-                            break
+    dual_license_entry = view.dual_license_entry()
+    codemeta_license_count = view.codemeta_license_count()
 
-    result["has_dual_license_indicator"] = has_dual_license_indicator
+    result["has_dual_license_indicator"] = dual_license_entry is not None
     result["codemeta_license_count"] = codemeta_license_count
-    result["dual_license_source"] = dual_license_source
+    result["dual_license_source"] = dual_license_entry.source if dual_license_entry else None
 
-    if has_dual_license_indicator and codemeta_license_count <= 1:
+    if dual_license_entry and codemeta_license_count <= 1:
         result["has_warning"] = True
 
     return result
\ No newline at end of file
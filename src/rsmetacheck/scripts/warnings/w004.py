@@ -1,6 +1,8 @@
 import re
 from typing import Dict
 
+from rsmetacheck.utils.requirements_analysis import requirements_view
+
 
 def _name_contains_version(name: str) -> bool:
     return bool(re.search(r"\d", name))
@@ -56,21 +58,15 @@ def detect_programming_language_no_version_pitfall(somef_data: Dict, file_name:
                             result["source"] = source
                             result["has_warning"] = True
 
-    if "requirements" in somef_data:
-        requirements_entries = somef_data["requirements"]
-        if isinstance(requirements_entries, list):
-            for entry in requirements_entries:
-                source = entry.get("source", "")
-                technique = entry.get("technique", "")
+    view = requirements_view(somef_data)
+    if view is not None:
+        for entry in view.codemeta_entries():
+            result_data = entry.result
 
-                if technique == "code_parser" and "codemeta.json" in source:
-                    if "result" in entry:
-                        result_data = entry["result"]
-
-                        if "version" not in result_data or result_data.get("version") is None:
-                            req_name = result_data.get("value", result_data.get("name", "Unknown"))
-                            result["requirements_without_version"].append(req_name)
-                            result["source"] = source
-                            result["has_warning"] = True
+            if "version" not in result_data or result_data.get("version") is None:
+                req_name = result_data.get("value", result_data.get("name", "Unknown"))
+                result["requirements_without_version"].append(req_name)
+                result["source"] = entry.source
+                result["has_warning"] = True
 
     return result
\ No newline at end of file
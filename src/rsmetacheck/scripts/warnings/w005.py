@@ -1,6 +1,6 @@
 from typing import Dict, List
-import re
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
+from rsmetacheck.utils.requirements_analysis import requirements_view, split_requirements
 
 
 def detect_multiple_requirements_in_string(requirement_string: str) -> List[str]:
@@ -8,36 +8,7 @@ def detect_multiple_requirements_in_string(requirement_string: str) -> List[str]
     Detect if a requirement string contains multiple requirements.
     Returns list of detected requirements or empty list if just one.
     """
-    if not requirement_string or not isinstance(requirement_string, str):
-        return []
-
-    # Clean the string
-    req_str = requirement_string.strip()
-
-    # Patterns that might indicate multiple requirements
-    if bool(re.search(r'\b(npm|bash|cd|pip|install)\b', req_str.lower())):
-        return []
-
-    detected_requirements = []
-
-    if re.search(r',\s*', req_str):
-        parts = re.split(r',\s*', req_str)
-        if len(parts) > 1:
-            detected_requirements = [part.strip() for part in parts if part.strip()]
-    elif re.search(r';\s*', req_str):
-        parts = re.split(r';\s*', req_str)
-        if len(parts) > 1:
-            detected_requirements = [part.strip() for part in parts if part.strip()]
-    elif re.match(r'^([A-Z][a-zA-Z0-9]*(\s+|$)){2,}$', req_str):
-        parts = re.split(r'\s+', req_str)
-        if len(parts) > 1:
-            detected_requirements = [part.strip() for part in parts if part.strip()]
-    elif re.search(r'\s{2,}', req_str):
-        parts = re.split(r'\s{2,}', req_str)
-        if len(parts) > 1:
-            detected_requirements = [part.strip() for part in parts if part.strip()]
-
-    return detected_requirements if len(detected_requirements) > 1 else []
+    return split_requirements(requirement_string)
 
 
 def detect_multiple_requirements_string_warning(somef_data: Dict, file_name: str) -> Dict:
@@ -56,52 +27,22 @@ def detect_multiple_requirements_string_warning(somef_data: Dict, file_name: str
         "count_detected": 0
     }
 
-    if "requirements" not in somef_data:
-        return result
-
-    requirements_entries = somef_data["requirements"]
-    if not isinstance(requirements_entries, list):
+    view = requirements_view(somef_data)
+    if view is None:
         return result
 
-    metadata_sources = ["codemeta.json", "DESCRIPTION", "composer.json", "package.json", "pom.xml", "pyproject.toml", "requirements.txt", "setup.py"]
-
-    for entry in requirements_entries:
-        technique = entry.get("technique", "")
-        source = entry.get("source", "")
-
-        if technique in metadata_sources or any(
-                src in source.lower() for src in ["codemeta.json", "setup.py", "pom.xml"]):
-            if "result" in entry and "value" in entry["result"]:
-                requirement_value = entry["result"]["value"]
-
-                if isinstance(requirement_value, str):
-                    detected_reqs = detect_multiple_requirements_in_string(requirement_value)
-
-                    if detected_reqs:
-                        if result["requirement_string"] is None:
-                            result["requirement_string"] = requirement_value
-                            result["detected_requirements"] = detected_reqs
-                            result["source"] = source if source else f"technique: {technique}"
-                            result["metadata_source_file"] = extract_metadata_source_filename(source)
-                            result["count_detected"] = len(detected_reqs)
-                        source_filename = extract_metadata_source_filename(source)
-                        result["metadata_source_files"].append(source_filename)
-                        result["has_warning"] = True
-
-                elif isinstance(requirement_value, list) and len(requirement_value) == 1:
-                    single_req = requirement_value[0]
-                    if isinstance(single_req, str):
-                        detected_reqs = detect_multiple_requirements_in_string(single_req)
-
-                        if detected_reqs:
-                            if result["requirement_string"] is None:
-                                result["requirement_string"] = single_req
-                                result["detected_requirements"] = detected_reqs
-                                result["source"] = source if source else f"technique: {technique}"
-                                result["metadata_source_file"] = extract_metadata_source_filename(source)
-                                result["count_detected"] = len(detected_reqs)
-                            source_filename = extract_metadata_source_filename(source)
-                            result["metadata_source_files"].append(source_filename)
-                            result["has_warning"] = True
+    for entry in view.split_source_entries():
+        requirement_string, detected_reqs = entry.split()
+
+        if detected_reqs:
+            source_filename = extract_metadata_source_filename(entry.source)
+            if result["requirement_string"] is None:
+                result["requirement_string"] = requirement_string
+                result["detected_requirements"] = detected_reqs
+                result["source"] = entry.source if entry.source else f"technique: {entry.technique}"
+                result["metadata_source_file"] = source_filename
+                result["count_detected"] = len(detected_reqs)
+            result["metadata_source_files"].append(source_filename)
+            result["has_warning"] = True
 
     return result
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import Dict, List
-import re
 
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
+from rsmetacheck.utils.url_analysis import UrlEntry, classify_url, url_view
 
 
 def is_valid_identifier(identifier: str) -> bool:
@@ -10,64 +10,19 @@ def is_valid_identifier(identifier: str) -> bool:
     """
     if not identifier or not isinstance(identifier, str):
         return False
-
-    identifier = identifier.strip()
-
-    if not identifier:
-        return False
-
-    # Check for DOI patterns
-    doi_patterns = [
-        r'^doi:10\.\d+/.+',  # doi:10.xxxx/yyyy format
-        r'^10\.\d+/.+'  # 10.xxxx/yyyy format (bare DOI)
-    ]
-
-    for pattern in doi_patterns:
-        if re.match(pattern, identifier, re.IGNORECASE):
-            return True
-
-    if identifier.lower() in ['doi:', '10.']:
-        return False
-
-    url_pattern = r'^https?://.+'
-    if re.match(url_pattern, identifier, re.IGNORECASE):
-        return True
-
-    if identifier.lower().startswith('ftp://'):
-        return False
-
-    if ' ' in identifier and not any(char in identifier for char in ['/', ':', '.']):
-        return False
-
-    if identifier.replace(' ', '').replace('-', '').replace('_', '').isalpha():
-        return False
-
-    return True
+    return classify_url(identifier).is_valid_identifier
 
 
 def has_doi_in_other_sources(identifier_entries: List[Dict]) -> bool:
     """
     Check if there's a valid DOI in non-codemeta sources.
     """
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-
-        if "codemeta.json" in source.lower():
+    for entry in map(UrlEntry, identifier_entries):
+        if entry.is_codemeta:
             continue
 
-        if "result" in entry and "value" in entry["result"]:
-            identifier_value = entry["result"]["value"]
-
-            if isinstance(identifier_value, str):
-                # Check for DOI patterns
-                doi_patterns = [
-                    r'^doi:10\.\d+/.+',  # doi:10.xxxx/yyyy format
-                    r'^10\.\d+/.+'  # 10.xxxx/yyyy format (bare DOI)
-                ]
-
-                for pattern in doi_patterns:
-                    if re.match(pattern, identifier_value, re.IGNORECASE):
-                        return True
+        if entry.has_value and isinstance(entry.value, str) and classify_url(entry.value).is_doi:
+            return True
 
     return False
 
@@ -88,11 +43,8 @@ def detect_identifier_name_warning(somef_data: Dict, file_name: str) -> Dict:
         "other_identifiers": []
     }
 
-    if "identifier" not in somef_data:
-        return result
-
-    identifier_entries = somef_data["identifier"]
-    if not isinstance(identifier_entries, list):
+    view = url_view(somef_data, "identifier")
+    if view is None:
         return result
 
     codemeta_identifier = None
@@ -102,54 +54,31 @@ def detect_identifier_name_warning(somef_data: Dict, file_name: str) -> Dict:
     other_source = None
     other_identifiers = []
 
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        is_codemeta = (
-                "codemeta.json" in source.lower() or
-                (technique == "code_parser" and "codemeta" in source.lower())
-        )
-
-        if is_codemeta:
-            if "result" in entry and "value" in entry["result"]:
-                if codemeta_identifier is None:
-                    raw_value = entry["result"]["value"]
-                    codemeta_source = source
-                    if isinstance(raw_value, list):
-                        codemeta_has_valid_id = any(
-                            isinstance(item, str) and is_valid_identifier(item)
-                            for item in raw_value
-                        )
-                        codemeta_identifier = ", ".join(str(item) for item in raw_value) if raw_value else None
-                    else:
-                        codemeta_identifier = raw_value
-                    break
-
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        is_codemeta = (
-                "codemeta.json" in source.lower() or
-                (technique == "code_parser" and "codemeta" in source.lower())
-        )
-
-        if is_codemeta:
-            continue
-
-        if "result" in entry and "value" in entry["result"]:
-            identifier_value = entry["result"]["value"]
-
-            if is_valid_identifier(identifier_value):
-                other_identifiers.append({
-                    "value": identifier_value,
-                    "source": source
-                })
-
-                if other_identifier is None:
-                    other_identifier = identifier_value
-                    other_source = source
+    codemeta_entries = view.codemeta_entries()
+    if codemeta_entries:
+        raw_value = codemeta_entries[0].value
+        codemeta_source = codemeta_entries[0].source
+        if isinstance(raw_value, list):
+            codemeta_has_valid_id = any(
+                isinstance(item, str) and is_valid_identifier(item)
+                for item in raw_value
+            )
+            codemeta_identifier = ", ".join(str(item) for item in raw_value) if raw_value else None
+        else:
+            codemeta_identifier = raw_value
+
+    for entry in view.other_entries():
+        identifier_value = entry.value
+
+        if is_valid_identifier(identifier_value):
+            other_identifiers.append({
+                "value": identifier_value,
+                "source": entry.source
+            })
+
+            if other_identifier is None:
+                other_identifier = identifier_value
+                other_source = entry.source
 
     result["codemeta_identifier"] = codemeta_identifier
     result["codemeta_source"] = codemeta_source
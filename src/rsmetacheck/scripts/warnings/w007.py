@@ -1,5 +1,7 @@
 from typing import Dict
 
+from rsmetacheck.utils.url_analysis import url_view
+
 
 def detect_empty_identifier_warning(somef_data: Dict, file_name: str) -> Dict:
     """
@@ -12,25 +14,17 @@ def detect_empty_identifier_warning(somef_data: Dict, file_name: str) -> Dict:
         "source": None
     }
 
-    if "identifier" not in somef_data:
-        return result
-
-    identifier_entries = somef_data["identifier"]
-    if not isinstance(identifier_entries, list):
+    view = url_view(somef_data, "identifier")
+    if view is None:
         return result
 
-    for entry in identifier_entries:
-        source = entry.get("source", "")
-        technique = entry.get("technique", "")
-
-        if "codemeta.json" in source or (technique == "code_parser" and "codemeta" in source.lower()):
-            if "result" in entry and "value" in entry["result"]:
-                identifier_value = entry["result"]["value"]
+    for entry in view.codemeta_entries():
+        identifier_value = entry.value
 
-                if not identifier_value or (isinstance(identifier_value, str) and not identifier_value.strip()):
-                    result["has_warning"] = True
-                    result["identifier_value"] = identifier_value
-                    result["source"] = source
-                    break
+        if not identifier_value or (isinstance(identifier_value, str) and not identifier_value.strip()):
+            result["has_warning"] = True
+            result["identifier_value"] = identifier_value
+            result["source"] = entry.source
+            break
 
     return result
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing import Dict
-import re
 from rsmetacheck.utils.pitfall_utils import extract_metadata_source_filename
+from rsmetacheck.utils.url_analysis import classify_url, url_view
 
 def is_git_remote_shorthand(url: str) -> bool:
     """
@@ -8,23 +8,7 @@ def is_git_remote_shorthand(url: str) -> bool:
     """
     if not url or not isinstance(url, str):
         return False
-
-    # Git remote shorthand patterns
-    shorthand_patterns = [
-        r'^[a-zA-Z0-9.-]+:[a-zA-Z0-9._/-]+\.git$',  # github.com:user/repo.git
-        r'^[a-zA-Z0-9.-]+:[a-zA-Z0-9._/-]+$',  # github.com:user/repo
-    ]
-
-    url = url.strip()
-
-    if url.startswith(('http://', 'https://')):
-        return False
-
-    for pattern in shorthand_patterns:
-        if re.match(pattern, url):
-            return True
-
-    return False
+    return classify_url(url).is_shorthand
 
 
 def detect_git_remote_shorthand_pitfall(somef_data: Dict, file_name: str) -> Dict:
@@ -42,37 +26,22 @@ def detect_git_remote_shorthand_pitfall(somef_data: Dict, file_name: str) -> Dic
         "is_shorthand": False
     }
 
-    if "code_repository" not in somef_data:
+    view = url_view(somef_data, "code_repository")
+    if view is None:
         return result
 
-    repo_entries = somef_data["code_repository"]
-    if not isinstance(repo_entries, list):
-        return result
-
-    metadata_techniques = ["code_parser"]
-    metadata_sources = ["codemeta.json", "DESCRIPTION", "composer.json", "package.json", "pom.xml", "pyproject.toml", "requirements.txt", "setup.py"]
-
-    for entry in repo_entries:
-        technique = entry.get("technique", "")
-        source = entry.get("source", "")
-
-        is_metadata_source = (
-                technique in metadata_techniques or
-                any(src in source.lower() for src in metadata_sources)
-        )
-
-        if is_metadata_source:
-            if "result" in entry and "value" in entry["result"]:
-                repo_url = entry["result"]["value"]
-
-                if is_git_remote_shorthand(repo_url):
-                    source_filename = extract_metadata_source_filename(source)
-                    if result["repository_url"] is None:
-                        result["repository_url"] = repo_url
-                        result["source"] = source if source else f"technique: {technique}"
-                        result["metadata_source_file"] = source_filename
-                    result["metadata_source_files"].append(source_filename)
-                    result["has_warning"] = True
-                    result["is_shorthand"] = True
+    for entry in view.metadata_entries():
+        repo_url = entry.value
+
+        if is_git_remote_shorthand(repo_url):
+            source = entry.source
+            source_filename = extract_metadata_source_filename(source)
+            if result["repository_url"] is None:
+                result["repository_url"] = repo_url
+                result["source"] = source if source else f"technique: {entry.technique}"
+                result["metadata_source_file"] = source_filename
+            result["metadata_source_files"].append(source_filename)
+            result["has_warning"] = True
+            result["is_shorthand"] = True
 
     return result
\ No newline at end of file
@@ -0,0 +1,401 @@
+"""
+Split a corpus run across several machines.
+
+``rsmetacheck shard init`` loads the repositories (or existing SoMEF outputs) to process into a
+SQLite work queue on a shared filesystem. Every node then runs ``rsmetacheck shard work``: it
+claims one item at a time under a lease, runs SoMEF and the analysis on it, and writes its
+outputs to its own shard directory, together with one summary record per analyzed file.
+Items whose lease expires (the node died or hung) are handed out again.
+
+``rsmetacheck shard merge`` combines the shard directories into one ``analysis_results.json``,
+notes file and JSON-LD set. Records are applied in queue order and duplicates are dropped,
+so the merged summary is the same whatever the number of nodes and the order they finished in.
+"""
+import csv
+import os
+import shutil
+import socket
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from rsmetacheck.config import AnalysisConfig
+from rsmetacheck.detect_pitfalls_main import AnalysisSession
+from rsmetacheck.run_somef import (
+    RETRIABLE_FAILURES,
+    RetryPolicy,
+    run_somef_attempt,
+    ensure_somef_configured,
+)
+from rsmetacheck.utils import serialization
+from rsmetacheck.utils.serialization import read_json
+from rsmetacheck.utils.somef_inputs import (
+    SomefInput,
+    collect_somef_inputs,
+    expand_somef_input,
+    is_somef_container,
+)
+
+ITEM_REPOSITORY = "repository"
+ITEM_SOMEF_OUTPUT = "somef_output"
+
+STATUS_PENDING = "pending"
+STATUS_CLAIMED = "claimed"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+DEFAULT_LEASE = 3600.0
+RECORDS_FILE = "records.jsonl"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    UNIQUE (kind, value)
+)
+"""
+
+
+@dataclass
+class WorkItem:
+    id: int
+    kind: str
+    value: str
+    name: str
+    attempts: int
+
+
+class WorkQueue:
+    """
+    Work items stored in a SQLite database shared by all nodes.
+
+    Claims run in an immediate transaction, so two nodes never get the same item while its
+    lease is valid. Completing or failing an item is only recorded for the node holding the
+    lease; a node that lost its lease keeps its outputs, and merge drops the duplicate.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 60.0, clock=time.time):
+        self.path = Path(path)
+        self._clock = clock
+        self._connection = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self._connection.execute(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add_items(self, items: Iterable[tuple]) -> int:
+        """
+        Add (kind, value, name) items; items already in the queue are ignored. Returns how many
+        were added. Names become output file names, so a name already used by another item
+        raises ValueError and nothing is added.
+        """
+        items = list(items)
+        before = self._connection.total_changes
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            names = dict(self._connection.execute("SELECT name, kind || ' ' || value FROM items"))
+            for kind, value, name in items:
+                if names.setdefault(name, f"{kind} {value}") != f"{kind} {value}":
+                    raise ValueError(f"Work item name {name} is used by both {names[name]} and {kind} {value}")
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO items (kind, value, name) VALUES (?, ?, ?)", items
+            )
+        return self._connection.total_changes - before
+
+    def claim(self, node: str, lease: float = DEFAULT_LEASE) -> Optional[WorkItem]:
+        """Lease the next pending (or abandoned) item to node, or return None when none is left."""
+        now = self._clock()
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            row = self._connection.execute(
+                "SELECT id, kind, value, name, attempts FROM items "
+                "WHERE status = ? OR (status = ? AND lease_until < ?) ORDER BY id LIMIT 1",
+                (STATUS_PENDING, STATUS_CLAIMED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE items SET status = ?, owner = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                (STATUS_CLAIMED, node, now + lease, row[0]),
+            )
+        item_id, kind, value, name, attempts = row
+        return WorkItem(item_id, kind, value, name, attempts + 1)
+
+    def _finish(self, node: str, item_id: int, status: str, error: Optional[str] = None) -> bool:
+        with self._connection:
+            cursor = self._connection.execute(
+                "UPDATE items SET status = ?, error = ?, lease_until = NULL "
+                "WHERE id = ? AND owner = ? AND status = ?",
+                (status, error, item_id, node, STATUS_CLAIMED),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, node: str, item_id: int) -> bool:
+        """Mark an item done. Returns False if node no longer holds its lease."""
+        return self._finish(node, item_id, STATUS_DONE)
+
+    def fail(self, node: str, item_id: int, error: str, retry: bool = False) -> bool:
+        """Mark an item failed, or put it back in the queue when retry is set."""
+        return self._finish(node, item_id, STATUS_PENDING if retry else STATUS_FAILED, error)
+
+    def counts(self) -> dict:
+        """Number of items per status."""
+        rows = self._connection.execute("SELECT status, COUNT(*) FROM items GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def failed_items(self) -> List[tuple]:
+        """(value, error) of every failed item, in queue order."""
+        return self._connection.execute(
+            "SELECT value, error FROM items WHERE status = ? ORDER BY id", (STATUS_FAILED,)
+        ).fetchall()
+
+
+def _urls_from_csv(csv_file: Path) -> List[str]:
+    with open(csv_file, newline="", encoding="utf-8") as f:
+        return [
+            row[0].strip() for row in csv.reader(f)
+            if row and row[0].strip().startswith(("http://", "https://"))
+        ]
+
+
+def _somef_output_item(source: Union[Path, SomefInput]) -> tuple:
+    if isinstance(source, SomefInput):
+        return ITEM_SOMEF_OUTPUT, source.location, source.name
+    return ITEM_SOMEF_OUTPUT, str(source.resolve()), source.name
+
+
+def _unique_item_names(items: List[tuple]) -> List[tuple]:
+    """Number the items whose name is already used by an earlier item (output_1.json, output_1_2.json)."""
+    taken = set()
+    unique = []
+    for kind, value, name in items:
+        stem, suffix = name[:-len(".json")], ".json"
+        counter = 2
+        while name in taken:
+            name = f"{stem}_{counter}{suffix}"
+            counter += 1
+        taken.add(name)
+        unique.append((kind, value, name))
+    return unique
+
+
+def collect_work_items(inputs: Iterable[Union[str, Path]]) -> List[tuple]:
+    """
+    Turn --input values into (kind, value, name) work items.
+
+    Repository URLs, JSON files with a "repositories" list and CSV files (first column) give
+    repository items, named like the SoMEF outputs of a normal batch run. Directories, other
+    JSON files, compressed outputs and archives of outputs are existing SoMEF outputs (see
+    somef_inputs). Names are made unique, as they become the names of the output files.
+    """
+    items = []
+    direct_urls = 0
+    for input_item in inputs:
+        input_item = str(input_item)
+        if input_item.startswith(("http://", "https://")):
+            direct_urls += 1
+            items.append((ITEM_REPOSITORY, input_item, f"output_{direct_urls}.json"))
+            continue
+
+        path = Path(input_item)
+        if path.is_dir():
+            items.extend(_somef_output_item(source) for source in collect_somef_inputs(path.resolve()))
+        elif is_somef_container(path):
+            items.extend(_somef_output_item(source) for source in expand_somef_input(path.resolve()))
+        elif path.suffix == ".csv":
+            for idx, repo_url in enumerate(_urls_from_csv(path), start=1):
+                items.append((ITEM_REPOSITORY, repo_url, f"{path.stem}_output_{idx}.json"))
+        elif path.suffix == ".json":
+            data = read_json(path)
+            if isinstance(data, dict) and "repositories" in data:
+                for idx, repo_url in enumerate(data["repositories"], start=1):
+                    items.append((ITEM_REPOSITORY, repo_url, f"{path.stem}_output_{idx}.json"))
+            else:
+                items.append(_somef_output_item(path))
+        else:
+            print(f"Warning: Unsupported input, skipping: {input_item}")
+    return _unique_item_names(items)
+
+
+class _SomefSources:
+    """
+    SoMEF outputs named by the values of somef_output items: a plain file, or the location
+    (``<container>:<member>``) of an output held by a compressed file or an archive. Each
+    container is expanded once per node.
+    """
+
+    def __init__(self):
+        self._containers = {}
+
+    def get(self, value: str, name: str) -> Union[Path, SomefInput]:
+        path = Path(value)
+        if path.is_file() and not is_somef_container(path):
+            if path.name == name:
+                return path
+            return SomefInput(name, value, path.read_bytes)
+        container = self._container(value)
+        if container not in self._containers:
+            self._containers[container] = {source.location: source for source in expand_somef_input(container)}
+        source = self._containers[container].get(value)
+        if source is None:
+            raise FileNotFoundError(f"SoMEF output not found: {value}")
+        source.name = name
+        return source
+
+    @staticmethod
+    def _container(value: str) -> str:
+        """Compressed file or archive holding the output (its path may itself contain ':')."""
+        if Path(value).is_file():
+            return value
+        separator = value.find(":")
+        while separator != -1:
+            if Path(value[:separator]).is_file():
+                return value[:separator]
+            separator = value.find(":", separator + 1)
+        raise FileNotFoundError(f"SoMEF output not found: {value}")
+
+
+def default_node_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def run_shard_worker(
+    queue_path: Union[str, Path],
+    shard_output: Union[str, Path],
+    node: Optional[str] = None,
+    lease: float = DEFAULT_LEASE,
+    verbose: bool = False,
+    analysis_config: AnalysisConfig = None,
+    threshold: float = 0.8,
+    branch: Optional[str] = None,
+    worker_pool=None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> int:
+    """
+    Process queue items until none is left, writing to shard_output/<node>.
+    Returns the number of items analyzed by this node.
+    """
+    node = node or default_node_name()
+    shard_dir = Path(shard_output) / node
+    somef_dir = shard_dir / "somef_outputs"
+    somef_dir.mkdir(parents=True, exist_ok=True)
+    policy = retry_policy or RetryPolicy()
+
+    session = AnalysisSession(
+        shard_dir / "pitfalls_outputs",
+        shard_dir / "analysis_results.json",
+        verbose=verbose,
+        notes_output=shard_dir / "notes.json",
+        analysis_config=analysis_config,
+    )
+    somef_sources = _SomefSources()
+    somef_configured = False
+    processed = 0
+
+    with WorkQueue(queue_path) as queue, open(shard_dir / RECORDS_FILE, "a", encoding="utf-8") as records:
+        while True:
+            item = queue.claim(node, lease)
+            if item is None:
+                break
+            print(f"[{node}] item {item.id}: {item.value}")
+
+            if item.kind == ITEM_REPOSITORY:
+                if not somef_configured:
+                    somef_configured = ensure_somef_configured()
+                somef_file = somef_dir / item.name
+                failure = run_somef_attempt(
+                    item.value, str(somef_file), threshold, branch, None, worker_pool, policy.timeout
+                )
+                if failure is not None:
+                    reason, error = failure
+                    retry = reason in RETRIABLE_FAILURES and item.attempts <= policy.max_retries
+                    queue.fail(node, item.id, f"{reason}: {error}", retry=retry)
+                    continue
+            else:
+                try:
+                    somef_file = somef_sources.get(item.value, item.name)
+                except OSError as e:
+                    queue.fail(node, item.id, f"missing: {e}")
+                    continue
+
+            record = session.process_file(somef_file)
+            record["item_id"] = item.id
+            records.write(serialization.dumps(record, compact=True) + "\n")
+            records.flush()
+            if not queue.complete(node, item.id):
+                print(f"[{node}] lease on item {item.id} expired, another node may have processed it too")
+            processed += 1
+
+    session.finalize()
+    return processed
+
+
+def _record_files(shard_dirs: Iterable[Union[str, Path]]) -> List[Path]:
+    """records.jsonl of every shard, accepting shard directories or the directory holding them."""
+    found = set()
+    for shard_dir in shard_dirs:
+        shard_dir = Path(shard_dir)
+        if (shard_dir / RECORDS_FILE).exists():
+            found.add(shard_dir / RECORDS_FILE)
+        else:
+            found.update(shard_dir.glob(f"*/{RECORDS_FILE}"))
+    return sorted(found)
+
+
+def merge_shards(
+    shard_dirs: Iterable[Union[str, Path]],
+    pitfalls_output: Union[str, Path],
+    analysis_output: Union[str, Path],
+    notes_output: Union[str, Path] = None,
+) -> int:
+    """
+    Combine shard outputs into one summary, notes file and JSON-LD directory.
+    When an item was processed by several nodes, the record of the first shard in name order
+    is kept. Returns the number of items merged.
+    """
+    records = {}
+    record_files = _record_files(shard_dirs)
+    for records_file in record_files:
+        with open(records_file, "rb") as f:
+            for line in f:
+                if line.strip():
+                    record = serialization.loads(line)
+                    records.setdefault(record["item_id"], (records_file.parent, record))
+
+    if not records:
+        print("No shard records found to merge.")
+        return 0
+
+    session = AnalysisSession(pitfalls_output, analysis_output, notes_output=notes_output)
+    copied = set()
+    for item_id in sorted(records):
+        shard_dir, record = records[item_id]
+        if record.get("jsonld_file"):
+            source = shard_dir / "pitfalls_outputs" / record["jsonld_file"]
+            if record["jsonld_file"] in copied:
+                print(f"Warning: JSON-LD file name used by several items, keeping the first: {record['jsonld_file']}")
+            elif source.exists():
+                copied.add(record["jsonld_file"])
+                shutil.copyfile(source, session.pitfalls_output_dir / record["jsonld_file"])
+            else:
+                print(f"Warning: JSON-LD file missing from shard {shard_dir.name}: {record['jsonld_file']}")
+        session.add_record(record)
+
+    print(f"\nMerged {len(records)} items from {len(record_files)} shard(s).")
+    session.finalize()
+    return len(records)
@@ -0,0 +1,162 @@
+import concurrent.futures
+import importlib.util
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from rsmetacheck.utils.serialization import read_json, write_json
+
+SOMEF_CONFIGURATION_VARIABLE = "SOMEF_CONFIGURATION_FILE"
+
+
+class SomefBackendUnavailable(Exception):
+    """Raised when SoMEF cannot be run in-process and the somef CLI must be used instead."""
+
+
+def _import_somef():
+    """Worker initializer: pay SoMEF's heavy imports once per worker process."""
+    from somef import somef_cli  # noqa: F401
+
+
+def somef_config_with_token(token: str) -> str:
+    """
+    Write a copy of the SoMEF configuration that uses token, for SoMEF to pick up through
+    SOMEF_CONFIGURATION_FILE. The caller removes the file.
+    """
+    config_path = os.path.expanduser(
+        os.environ.get(SOMEF_CONFIGURATION_VARIABLE, os.path.join("~", ".somef", "config.json"))
+    )
+    try:
+        config = read_json(config_path)
+    except (OSError, ValueError):
+        config = {}
+    config["Authorization"] = f"token {token}"
+
+    fd, path = tempfile.mkstemp(prefix="somef_config_", suffix=".json")
+    os.close(fd)  # mkstemp already created the file readable by the owner only
+    write_json(config, path)
+    return path
+
+
+def run_cli_arguments(repo_url, output_file, threshold, branch, codemeta_file) -> Dict[str, Any]:
+    """Keyword arguments of somef_cli.run_cli with the same defaults as the `somef describe` command line."""
+    return {
+        "threshold": threshold,
+        "repo_url": repo_url,
+        "output": output_file,
+        "codemeta_out": codemeta_file,
+        "branch": branch,
+        "requirements_mode": "all",
+    }
+
+
+def _describe_in_worker(repo_url, output_file, threshold, branch, codemeta_file, token=None) -> Optional[str]:
+    """
+    Equivalent of `somef describe -r repo_url -o output_file -t threshold [-b branch] [-c codemeta_file]`.
+    With token, SoMEF reads a copy of its configuration that uses this GitHub token, as the
+    somef CLI does. Returns None on success, or the error message when SoMEF fails.
+    """
+    from somef import somef_cli
+
+    previous_config = os.environ.get(SOMEF_CONFIGURATION_VARIABLE)
+    config_file = somef_config_with_token(token) if token else None
+    if config_file:
+        os.environ[SOMEF_CONFIGURATION_VARIABLE] = config_file
+    try:
+        somef_cli.run_cli(**run_cli_arguments(repo_url, output_file, threshold, branch, codemeta_file))
+    except BaseException as e:  # SoMEF calls sys.exit() on some input errors
+        return str(e) or type(e).__name__
+    finally:
+        if config_file:
+            if previous_config is None:
+                os.environ.pop(SOMEF_CONFIGURATION_VARIABLE, None)
+            else:
+                os.environ[SOMEF_CONFIGURATION_VARIABLE] = previous_config
+            os.remove(config_file)
+    return None
+
+
+class SomefWorkerPool:
+    """
+    Long-lived worker processes that import SoMEF once and run its describe API in-process,
+    instead of starting a `somef describe` interpreter for every repository.
+
+    Workers are separate processes so SoMEF's global logging setup and memory stay out of
+    RsMetaCheck. If a worker dies, the pool is restarted for the next repository; if the
+    first worker cannot even start, the pool is disabled.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max_workers
+        self.available = importlib.util.find_spec("somef") is not None
+        self._executor = None
+        self._has_succeeded = False
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_import_somef,
+            )
+        return self._executor
+
+    def describe(
+        self, repo_url, output_file, threshold, branch=None, codemeta_file=None, timeout=None, token=None
+    ) -> Optional[str]:
+        """
+        Run SoMEF on one repository in a worker process, optionally with another GitHub token.
+        Returns None on success or the SoMEF error message on failure.
+        Raises TimeoutError if the run takes longer than timeout seconds (the workers are
+        killed and restarted), and SomefBackendUnavailable when SoMEF cannot run in-process.
+        """
+        if not self.available:
+            raise SomefBackendUnavailable("the somef package is not importable")
+
+        try:
+            future = self._get_executor().submit(
+                _describe_in_worker, repo_url, output_file, threshold, branch, codemeta_file, token
+            )
+            error = future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self._kill_workers()
+            raise TimeoutError(f"SoMEF did not finish within {timeout}s")
+        except BrokenProcessPool as e:
+            self.shutdown()
+            if not self._has_succeeded:
+                # The very first worker could not start, most likely SoMEF fails to import.
+                self.available = False
+            raise SomefBackendUnavailable(f"SoMEF worker process died: {e}") from e
+        self._has_succeeded = True
+        return error
+
+    def _kill_workers(self):
+        # ProcessPoolExecutor cannot cancel a running call, so the stuck worker is killed.
+        # The executor does not expose its processes: _processes is a CPython implementation
+        # detail. Should it disappear, the stuck worker is only abandoned, it exits when SoMEF
+        # returns, and the next repositories get a new pool either way.
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        processes = getattr(executor, "_processes", None)
+        if isinstance(processes, dict):
+            for process in list(processes.values()):
+                try:
+                    process.kill()
+                except (AttributeError, OSError):
+                    pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
@@ -0,0 +1,218 @@
+"""
+Batched resolution of the latest commit ID of many repositories.
+
+fetch_latest_commit_id costs one REST request per repository. A CommitResolver collects the
+repository URLs of a whole run first and resolves them with a few GraphQL queries instead:
+
+- GitHub repositories, ~100 aliased ``repository { defaultBranchRef }`` lookups per query
+  (GitHub only serves GraphQL to authenticated clients, so this needs a token from the
+  shared GitHubTokenPool);
+- GitLab projects on the same host, ~20 aliased ``project { repository { tree } }`` lookups
+  per query (GitLab's complexity limit allows fewer per query).
+
+Repositories a batch could not resolve fall back to fetch_latest_commit_id when their
+commit ID is requested, and every result is cached so each repository is looked up once.
+"""
+import json
+import re
+import urllib.parse
+import urllib.request
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+
+from rsmetacheck.utils import json_ld_utils
+from rsmetacheck.utils.github_rate_limit import GitHubTokenPool, RateLimitExhausted, get_token_pool
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_BATCH_SIZE = 100
+GITLAB_BATCH_SIZE = 20
+UNKNOWN = "Unknown"
+
+# Names GraphQL can look up as-is; anything else goes through the REST fallback.
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+_PROJECT_PATH_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+(/[A-Za-z0-9_.-]+)+$")
+
+
+def _repository_key(repo_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Return ("github", "owner/repo") or (gitlab host, "group/project") for a repository URL,
+    following the same rules as fetch_latest_commit_id, or None if it cannot be batched.
+    """
+    if not repo_url or repo_url == UNKNOWN:
+        return None
+
+    if "github.com" in repo_url:
+        match = re.search(r'github\.com/([^/]+)/([^/]+)', repo_url)
+        if not match:
+            return None
+        owner, repo = match.groups()
+        if repo.endswith(".git"):
+            repo = repo[:-4]
+        if _NAME_PATTERN.match(owner) and _NAME_PATTERN.match(repo):
+            return "github", f"{owner}/{repo}"
+        return None
+
+    if repo_url.startswith("https://"):
+        parsed = urllib.parse.urlparse(repo_url)
+        project_path = parsed.path.strip("/")
+        if project_path.endswith(".git"):
+            project_path = project_path[:-4]
+        if _PROJECT_PATH_PATTERN.match(project_path) and not parsed.query and not parsed.fragment:
+            return f"{parsed.scheme}://{parsed.netloc}", project_path
+    return None
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _post_graphql(url: str, query: str, headers: Dict):
+    """
+    POST a GraphQL query.
+    Returns (decoded response or None on failure, response headers, HTTP status).
+    """
+    request = urllib.request.Request(
+        url,
+        data=json.dumps({"query": query}).encode("utf-8"),
+        headers={"User-Agent": "Mozilla/5.0", "Content-Type": "application/json", **headers},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read().decode("utf-8")), response.headers, response.status
+    except HTTPError as e:
+        return None, e.headers, e.code
+    except (URLError, json.JSONDecodeError, OSError):
+        return None, None, None
+
+
+def _github_query(names: List[str]) -> str:
+    lookups = []
+    for index, name in enumerate(names):
+        owner, repo = name.split("/")
+        lookups.append(
+            f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) "
+            "{ defaultBranchRef { target { oid } } }"
+        )
+    return "query { " + " ".join(lookups) + " }"
+
+
+def _gitlab_query(paths: List[str]) -> str:
+    lookups = [
+        f"p{index}: project(fullPath: {json.dumps(path)}) {{ repository {{ tree {{ lastCommit {{ sha }} }} }} }}"
+        for index, path in enumerate(paths)
+    ]
+    return "query { " + " ".join(lookups) + " }"
+
+
+def _not_found_aliases(errors: List[Dict]) -> set:
+    return {
+        error["path"][0]
+        for error in errors or []
+        if error.get("type") == "NOT_FOUND" and error.get("path")
+    }
+
+
+class CommitResolver:
+    """
+    Cache of repository URL -> latest commit ID for one analysis run.
+    Call prefetch with every repository URL of the run, then commit_id for each repository.
+    """
+
+    def __init__(
+        self,
+        token_pool: Optional[GitHubTokenPool] = None,
+        github_batch_size: int = GITHUB_BATCH_SIZE,
+        gitlab_batch_size: int = GITLAB_BATCH_SIZE,
+    ):
+        self.token_pool = token_pool
+        self.github_batch_size = github_batch_size
+        self.gitlab_batch_size = gitlab_batch_size
+        self._commit_ids: Dict[str, str] = {}
+
+    def commit_id(self, repo_url: str) -> str:
+        """Latest commit ID of repo_url, from the batch results or a single REST lookup."""
+        if not isinstance(repo_url, str):
+            return json_ld_utils.fetch_latest_commit_id(repo_url)
+        if repo_url not in self._commit_ids:
+            self._commit_ids[repo_url] = json_ld_utils.fetch_latest_commit_id(repo_url)
+        return self._commit_ids[repo_url]
+
+    def prefetch(self, repo_urls: Iterable[str]) -> int:
+        """
+        Resolve the commit IDs of repo_urls in GraphQL batches.
+        Returns how many repositories were resolved (including ones found not to exist).
+        """
+        groups: Dict[str, Dict[str, List[str]]] = {}
+        for repo_url in dict.fromkeys(repo_urls):
+            if repo_url in self._commit_ids:
+                continue
+            key = _repository_key(repo_url)
+            if key is not None:
+                host, name = key
+                groups.setdefault(host, {}).setdefault(name, []).append(repo_url)
+
+        resolved = 0
+        for host, names in groups.items():
+            if host == "github":
+                resolved += self._prefetch_github(names)
+            elif len(names) > 1:
+                # A single project gains nothing over the REST lookup.
+                resolved += self._prefetch_gitlab(host, names)
+        return resolved
+
+    def _store(self, urls: List[str], commit_id: str) -> int:
+        for url in urls:
+            self._commit_ids[url] = commit_id
+        return len(urls)
+
+    def _prefetch_github(self, names: Dict[str, List[str]]) -> int:
+        pool = self.token_pool or get_token_pool()
+        if not pool.has_tokens:
+            return 0
+
+        resolved = 0
+        for batch in _chunks(list(names), self.github_batch_size):
+            try:
+                token = pool.acquire()
+            except RateLimitExhausted:
+                break
+            data, headers, status = _post_graphql(
+                GITHUB_GRAPHQL_URL, _github_query(batch), {"Authorization": f"bearer {token}"}
+            )
+            pool.update(token, headers, status)
+            if not data or not isinstance(data.get("data"), dict):
+                continue
+
+            not_found = _not_found_aliases(data.get("errors"))
+            for index, name in enumerate(batch):
+                alias = f"r{index}"
+                repository = data["data"].get(alias)
+                if repository:
+                    target = (repository.get("defaultBranchRef") or {}).get("target") or {}
+                    resolved += self._store(names[name], target.get("oid") or UNKNOWN)
+                elif alias in not_found:
+                    resolved += self._store(names[name], UNKNOWN)
+        return resolved
+
+    def _prefetch_gitlab(self, host: str, paths: Dict[str, List[str]]) -> int:
+        resolved = 0
+        for batch in _chunks(list(paths), self.gitlab_batch_size):
+            data, _, _ = _post_graphql(f"{host}/api/graphql", _gitlab_query(batch), {})
+            if not data or not isinstance(data.get("data"), dict):
+                # Not a GitLab instance or the query was rejected: keep the REST lookups.
+                break
+            if data.get("errors"):
+                continue
+
+            for index, path in enumerate(batch):
+                project = data["data"].get(f"p{index}")
+                if project is None:
+                    # Missing or private project, the REST API would not find it either.
+                    resolved += self._store(paths[path], UNKNOWN)
+                    continue
+                tree = (project.get("repository") or {}).get("tree") or {}
+                sha = (tree.get("lastCommit") or {}).get("sha")
+                if sha:
+                    resolved += self._store(paths[path], sha)
+        return resolved
@@ -0,0 +1,245 @@
+"""
+Corpus statistics over the findings of a batch of repositories.
+
+CorpusStats keeps one compact row per analyzed repository: a byte per check (whether it
+was reported as a pitfall and/or a warning), the repository's languages and the metadata
+source files each finding came from. Counts, percentages, per-language breakdowns, code
+co-occurrence and source-file distributions are all derived from these rows, so new cuts
+do not require re-running the detectors.
+
+When NumPy is installed the rows are viewed as a repository x check matrix and every
+statistic is computed with array operations, which keeps corpora of hundreds of thousands
+of repositories fast. Without NumPy the same results are computed in plain Python.
+"""
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bits of a check's byte in a repository row.
+ISSUE = 1
+PITFALL = 2
+WARNING = 4
+
+
+def _count_product(left, right):
+    """
+    left.T @ right for 0/1 matrices. Float matrices go through BLAS, which integer
+    matrices do not; counts stay exact well beyond any corpus size.
+    """
+    return (left.T.astype(np.float64) @ right.astype(np.float64)).astype(np.int64)
+
+
+def _percentage(count: int, total: int) -> float:
+    return round((count / total) * 100, 2) if total else 0.0
+
+
+class CorpusStats:
+    """
+    Repository x check findings of a batch, filled one repository at a time with add.
+    codes fixes the check order used by every list-valued statistic.
+    """
+
+    def __init__(self, codes: Sequence[str], use_numpy: Optional[bool] = None):
+        self.codes = list(codes)
+        self._code_index = {code: idx for idx, code in enumerate(self.codes)}
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self.repositories = 0
+        self.languages: List[str] = []
+        self._language_index: Dict[str, int] = {}
+        self.sources: List[str] = []
+        self._source_index: Dict[str, int] = {}
+
+        self._flags = bytearray()
+        # Languages as (repository, language) entries, in repository then listing order.
+        self._language_rows = array("I")
+        self._language_ids = array("I")
+        # Source files as (repository, check, source) entries.
+        self._source_rows = array("I")
+        self._source_codes = array("I")
+        self._source_ids = array("I")
+
+    @staticmethod
+    def _intern(names: List[str], index: Dict[str, int], name: str) -> int:
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+        return index[name]
+
+    def add(self, issues: Iterable, languages: Iterable[str] = (), sources: Optional[Dict] = None) -> int:
+        """
+        Add one repository. issues are [code, had_pitfall, had_warning] entries as in the
+        analysis records, sources maps codes to the metadata files the finding came from.
+        Returns the repository's row number.
+        """
+        row = self.repositories
+        flags = bytearray(len(self.codes))
+        for code, had_pitfall, had_warning in issues:
+            flags[self._code_index[code]] |= ISSUE | (PITFALL if had_pitfall else 0) | (WARNING if had_warning else 0)
+        self._flags += flags
+
+        for language in languages:
+            self._language_rows.append(row)
+            self._language_ids.append(self._intern(self.languages, self._language_index, language))
+
+        for code, files in (sources or {}).items():
+            for source in files:
+                self._source_rows.append(row)
+                self._source_codes.append(self._code_index[code])
+                self._source_ids.append(self._intern(self.sources, self._source_index, source))
+
+        self.repositories += 1
+        return row
+
+    # NumPy views
+
+    def _matrix(self):
+        """repositories x checks uint8 matrix of ISSUE/PITFALL/WARNING bits."""
+        return np.frombuffer(bytes(self._flags), dtype=np.uint8).reshape(self.repositories, len(self.codes))
+
+    def _language_entries(self):
+        return np.frombuffer(self._language_rows, dtype=np.uint32), np.frombuffer(self._language_ids, dtype=np.uint32)
+
+    def _language_matrix(self):
+        """repositories x languages boolean matrix."""
+        matrix = np.zeros((self.repositories, len(self.languages)), dtype=bool)
+        rows, ids = self._language_entries()
+        matrix[rows, ids] = True
+        return matrix
+
+    # Statistics
+
+    def counts(self) -> List[int]:
+        """Number of repositories with each check reported."""
+        if self.use_numpy:
+            return [int(n) for n in ((self._matrix() & ISSUE) > 0).sum(axis=0)]
+        counts = [0] * len(self.codes)
+        for start in range(0, len(self._flags), len(self.codes)):
+            for idx, flags in enumerate(self._flags[start:start + len(self.codes)]):
+                if flags & ISSUE:
+                    counts[idx] += 1
+        return counts
+
+    def percentages(self) -> List[float]:
+        return [_percentage(count, self.repositories) for count in self.counts()]
+
+    def total(self, kind: int) -> int:
+        """Number of (repository, check) findings of kind PITFALL or WARNING."""
+        if self.use_numpy:
+            return int(((self._matrix() & kind) > 0).sum())
+        return sum(1 for flags in self._flags if flags & kind)
+
+    def repositories_with_languages(self) -> int:
+        return len(set(self._language_rows))
+
+    def language_counts(self) -> List[Dict[str, int]]:
+        """
+        For each check, the number of repositories per language that have it. Languages are
+        listed in the order they were first seen with that check.
+        """
+        if not self.use_numpy:
+            per_code = [{} for _ in self.codes]
+            for row, language_id in zip(self._language_rows, self._language_ids):
+                offset = row * len(self.codes)
+                language = self.languages[language_id]
+                for idx, flags in enumerate(self._flags[offset:offset + len(self.codes)]):
+                    if flags & ISSUE:
+                        per_code[idx][language] = per_code[idx].get(language, 0) + 1
+            return per_code
+
+        issues = (self._matrix() & ISSUE) > 0
+        rows, ids = self._language_entries()
+        counts = _count_product(issues, self._language_matrix())
+        entry_issues = issues[rows]
+        per_code = []
+        for idx in range(len(self.codes)):
+            present, first_entry = np.unique(ids[entry_issues[:, idx]], return_index=True)
+            order = present[np.argsort(first_entry)]
+            per_code.append({self.languages[i]: int(counts[idx, i]) for i in order})
+        return per_code
+
+    def language_totals(self) -> Dict[str, int]:
+        """Number of repositories per language."""
+        if self.use_numpy:
+            counts = np.bincount(self._language_entries()[1], minlength=len(self.languages))
+            return {language: int(n) for language, n in zip(self.languages, counts)}
+        totals = dict.fromkeys(self.languages, 0)
+        for language_id in self._language_ids:
+            totals[self.languages[language_id]] += 1
+        return totals
+
+    def language_rates(self) -> Dict[str, Dict[str, float]]:
+        """Percentage of the repositories of each language that have each check."""
+        totals = self.language_totals()
+        rates = {language: dict.fromkeys(self.codes, 0.0) for language in self.languages}
+        for code, counts in zip(self.codes, self.language_counts()):
+            for language, count in counts.items():
+                rates[language][code] = _percentage(count, totals[language])
+        return rates
+
+    def cooccurrence(self) -> List[List[int]]:
+        """
+        checks x checks matrix: number of repositories that have both checks; the diagonal
+        holds the count of each check.
+        """
+        if self.use_numpy:
+            issues = (self._matrix() & ISSUE) > 0
+            return _count_product(issues, issues).tolist()
+        size = len(self.codes)
+        matrix = [[0] * size for _ in range(size)]
+        for start in range(0, len(self._flags), size):
+            present = [idx for idx, flags in enumerate(self._flags[start:start + size]) if flags & ISSUE]
+            for i in present:
+                for j in present:
+                    matrix[i][j] += 1
+        return matrix
+
+    def source_counts(self) -> Dict[str, Dict[str, int]]:
+        """For each check, the number of repositories whose finding came from each source file."""
+        if self.use_numpy and len(self._source_ids):
+            # One integer key per (check, source, repository), then per (check, source).
+            pair = (
+                np.frombuffer(self._source_codes, dtype=np.uint32).astype(np.int64) * len(self.sources)
+                + np.frombuffer(self._source_ids, dtype=np.uint32)
+            )
+            entries = np.unique(pair * self.repositories + np.frombuffer(self._source_rows, dtype=np.uint32))
+            pairs, counts = np.unique(entries // self.repositories, return_counts=True)
+            distinct = [
+                (int(key) // len(self.sources), int(key) % len(self.sources), int(n)) for key, n in zip(pairs, counts)
+            ]
+        else:
+            seen = {}
+            for row, code, source in set(zip(self._source_rows, self._source_codes, self._source_ids)):
+                seen[(code, source)] = seen.get((code, source), 0) + 1
+            distinct = sorted((code, source, n) for (code, source), n in seen.items())
+
+        result = {}
+        for code, source, n in distinct:
+            result.setdefault(self.codes[code], {})[self.sources[source]] = n
+        return result
+
+    def report(self) -> Dict:
+        """All statistics as one JSON-serializable document."""
+        counts = self.counts()
+        cooccurrence = self.cooccurrence()
+        rates = self.language_rates()
+        reported = [idx for idx, count in enumerate(counts) if count]
+        return {
+            "total_repositories_analyzed": self.repositories,
+            "checks": {
+                code: {"count": count, "percentage": _percentage(count, self.repositories)}
+                for code, count in zip(self.codes, counts)
+            },
+            "languages": {
+                language: {"repositories": total, "rates": rates[language]}
+                for language, total in self.language_totals().items()
+            },
+            "co_occurrence": {
+                self.codes[i]: {self.codes[j]: cooccurrence[i][j] for j in reported if j != i and cooccurrence[i][j]}
+                for i in reported
+            },
+            "source_files": self.source_counts(),
+        }
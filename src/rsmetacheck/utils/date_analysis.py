@@ -0,0 +1,63 @@
+"""
+Shared parsing of the dates found in SoMEF outputs.
+
+SoMEF reports dates as ISO 8601 strings: "2025-02-05T18:00:24Z" from the GitHub API,
+"2023-11-17" or "2022-03-11T19:01:51.720Z" from metadata files. parse_date recognizes
+those forms with one precompiled pattern and parses them with datetime.fromisoformat;
+anything else goes through the slower strptime formats. Results are memoized, as the same
+dates come back across repositories.
+"""
+import functools
+import re
+from datetime import datetime
+from typing import Optional
+
+# YYYY-MM-DD, optionally followed by THH:MM:SS, a fraction of a second and a Z.
+_ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?Z?)?$')
+_DATE_PREFIX = re.compile(r'^(\d{4}-\d{2}-\d{2})')
+
+_DATE_FORMATS = [
+    "%Y-%m-%dT%H:%M:%SZ",  # "2025-02-05T18:00:24Z"
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # "2022-03-11T19:01:51.720Z"
+    "%Y-%m-%d",  # "2023-11-17"
+    "%Y-%m-%dT%H:%M:%S",  # Without Z
+    "%Y-%m-%dT%H:%M:%S.%f",  # With microseconds, no Z
+]
+
+
+def _parse_with_formats(date_string: str) -> Optional[datetime]:
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+
+    # A date followed by something else (a time zone offset, a space-separated time...)
+    date_match = _DATE_PREFIX.match(date_string)
+    if date_match:
+        try:
+            return datetime.strptime(date_match.group(1), "%Y-%m-%d")
+        except ValueError:
+            pass
+
+    return None
+
+
+@functools.lru_cache(maxsize=16384)
+def parse_date(date_string: str) -> Optional[datetime]:
+    """
+    Naive datetime of a SoMEF date string, or None if it is not a date. Only the date is
+    kept for values that start with one but are not in a known format.
+    """
+    if not date_string:
+        return None
+
+    date_string = date_string.strip()
+
+    if _ISO_DATE.match(date_string):
+        try:
+            return datetime.fromisoformat(date_string.rstrip("Z"))
+        except ValueError:
+            pass  # Out-of-range fields (2023-02-30, 25:00:00): the formats decide
+
+    return _parse_with_formats(date_string)
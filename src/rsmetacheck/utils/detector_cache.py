@@ -0,0 +1,194 @@
+"""
+Cache of detector results, keyed per check rather than per file.
+
+A check's result only depends on the SoMEF categories it reads, its parameters and its
+implementation, so the key of a cached result is the SHA-256 of:
+
+* the check code;
+* the detector's version: a digest of the source of its module and of every RsMetaCheck
+  module that module uses, directly or not, so that editing a detector or a helper it
+  relies on invalidates its results and only its results;
+* its parameters from the configuration;
+* the SoMEF file name, which detectors copy into their results;
+* the content of the SoMEF categories the check reads (DETECTOR_INPUTS, derived from the
+  prerequisites of the detector plan).
+
+Changing ``[parameters.P001]`` or upgrading P001 re-runs P001 on the corpus and takes the
+28 other checks from the cache. Results are stored as JSON in a SQLite database.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import sqlite3
+import sys
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from rsmetacheck.utils import serialization
+from rsmetacheck.utils.detector_plan import DETECTOR_PREREQUISITES
+from rsmetacheck.utils.serialization import COMPACT_SEPARATORS, json_default
+
+DEFAULT_BATCH_SIZE = 500
+
+# SoMEF categories a check reads besides those it needs to run at all: P007 compares the
+# CITATION.cff of a repository with its other metadata.
+ADDITIONAL_INPUTS: Dict[str, tuple] = {
+    "P007": ("authors", "title", "description", "version", "license"),
+}
+
+
+def _detector_inputs() -> Dict[str, tuple]:
+    return {
+        code: tuple(dict.fromkeys(
+            [category for group in groups for category in group] + list(ADDITIONAL_INPUTS.get(code, ()))
+        ))
+        for code, groups in DETECTOR_PREREQUISITES.items()
+    }
+
+
+# SoMEF categories each check reads: its prerequisites in the detector plan plus its
+# ADDITIONAL_INPUTS. Checks that are not listed are keyed on the whole SoMEF output.
+DETECTOR_INPUTS: Dict[str, tuple] = _detector_inputs()
+
+# Checks whose results depend on remote URLs answering at run time: never cached.
+UNCACHED_CHECKS = frozenset({"P008", "P015"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS detector_results (
+    cache_key TEXT PRIMARY KEY,
+    code TEXT NOT NULL,
+    results TEXT NOT NULL
+);
+"""
+
+_WHOLE_OUTPUT = None
+
+
+def _digest(*fields: str) -> str:
+    """SHA-256 of length-prefixed UTF-8 fields, as for the JSON-LD check identifiers."""
+    digest = hashlib.sha256()
+    for value in fields:
+        encoded = value.encode("utf-8")
+        digest.update(b"%d:" % len(encoded))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=COMPACT_SEPARATORS, default=json_default)
+
+
+def _package_modules(module: types.ModuleType) -> List[types.ModuleType]:
+    """module and every RsMetaCheck module it uses, directly or through other modules."""
+    seen = {module.__name__: module}
+    queue = [module]
+    while queue:
+        for value in vars(queue.pop()).values():
+            used = value if isinstance(value, types.ModuleType) else sys.modules.get(getattr(value, "__module__", None) or "")
+            name = getattr(used, "__name__", "")
+            if used is not None and name.startswith("rsmetacheck") and name not in seen:
+                seen[name] = used
+                queue.append(used)
+    return [seen[name] for name in sorted(seen)]
+
+
+@functools.lru_cache(maxsize=None)
+def detector_version(detector_func: Callable) -> str:
+    """Digest of the source code a detector runs (see the module docstring)."""
+    module = inspect.getmodule(detector_func)
+    if module is None:
+        return _digest(getattr(detector_func, "__qualname__", repr(detector_func)))
+    sources = []
+    for used in _package_modules(module):
+        try:
+            sources.append(inspect.getsource(used))
+        except (OSError, TypeError):
+            sources.append(used.__name__)
+    return _digest(detector_func.__qualname__, *sources)
+
+
+class DetectorCache:
+    """
+    Detector results database shared across runs.
+
+    keys gives the cache key of each detector call on one repository, get_many looks up
+    results by key and put buffers new results, inserted every batch_size results and on
+    flush and close.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+        self._connection = sqlite3.connect(str(self.path), timeout=60, isolation_level=None)
+        self._connection.executescript(_SCHEMA)
+
+    def keys(self, calls: Iterable[tuple], somef_data: Dict, file_name: str) -> Dict[str, Optional[str]]:
+        """
+        Cache key of each (detector function, code, parameters, ...) call, by code; None for
+        the checks that are not cached.
+        """
+        category_digests = {}
+
+        def inputs_digest(categories) -> str:
+            if categories not in category_digests:
+                data = somef_data if categories is _WHOLE_OUTPUT else {
+                    category: somef_data.get(category) for category in categories
+                }
+                category_digests[categories] = _digest(_canonical_json(data))
+            return category_digests[categories]
+
+        keys = {}
+        for detector_func, code, parameters, *_ in calls:
+            if code in UNCACHED_CHECKS:
+                keys[code] = None
+                continue
+            keys[code] = _digest(
+                code,
+                detector_version(detector_func),
+                _canonical_json(parameters),
+                file_name,
+                inputs_digest(DETECTOR_INPUTS.get(code, _WHOLE_OUTPUT)),
+            )
+        return keys
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Cached results of the given keys, for those that are in the cache."""
+        keys = [key for key in keys if key]
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        rows = self._connection.execute(
+            f"SELECT cache_key, results FROM detector_results WHERE cache_key IN ({placeholders})", keys
+        )
+        return {key: serialization.loads(results) for key, results in rows}
+
+    def put(self, key: str, code: str, results: Any):
+        self._pending.append((key, code, serialization.dumps(results, compact=True)))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Insert the buffered results in one transaction."""
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO detector_results (cache_key, code, results) VALUES (?, ?, ?)",
+                self._pending,
+            )
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,138 @@
+"""
+Per-repository execution plan of the detectors.
+
+Most checks read one or two SoMEF categories and find nothing when those are missing, and
+many repositories have no ``identifier``, ``continuous_integration`` or ``requirements``.
+detector_plan looks at the categories a SoMEF output actually has and marks the checks
+whose prerequisites are missing, so that they are skipped instead of being called only to
+return a negative result. DetectorProfile counts, per check, how often it ran, was
+skipped, taken from the detector cache, failed or timed out, and how long it took
+(``--profile-output``).
+"""
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+# SoMEF categories each check reads, as groups: a check runs only if, for every group, the
+# repository has at least one of its categories as a non-empty list. Checks that are not
+# listed always run.
+DETECTOR_PREREQUISITES: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "P001": (("version",), ("releases",)),
+    "P002": (("license",),),
+    "P003": (("authors",),),
+    "P004": (("readme_url",),),
+    "P005": (("reference_publication",),),
+    "P006": (("license",),),
+    "P007": (("reference_publication",),),
+    "P008": (("requirements",),),
+    "P009": (("code_repository",),),
+    "P010": (("license",),),
+    "P011": (("issue_tracker",),),
+    "P012": (("download_url",), ("releases",)),
+    "P013": (("license",),),
+    "P014": (("identifier",),),
+    "P015": (("continuous_integration",),),
+    "P016": (("code_repository",),),
+    "P017": (("version",),),
+    "P018": (("identifier",),),
+    "P019": (("author",),),
+    "W001": (("requirements",),),
+    "W002": (("date_updated",),),
+    "W003": (("license",),),
+    "W004": (("programming_languages", "requirements"),),
+    "W005": (("requirements",),),
+    "W006": (("identifier",),),
+    "W007": (("identifier",),),
+    "W008": (("authors",),),
+    "W009": (("development_status",),),
+    "W010": (("code_repository",),),
+}
+
+# Checks that report no result at all, rather than a negative one, when their data is missing.
+NO_RESULT_WHEN_SKIPPED = frozenset({"P001"})
+
+
+class PlannedDetector(NamedTuple):
+    func: Callable
+    code: str
+    run: bool
+
+
+def present_categories(somef_data: Dict) -> frozenset:
+    """SoMEF categories of a repository that hold at least one entry."""
+    return frozenset(
+        category for category, entries in somef_data.items()
+        if isinstance(entries, list) and entries
+    )
+
+
+def prerequisites_met(code: str, categories: frozenset) -> bool:
+    return all(
+        any(category in categories for category in group)
+        for group in DETECTOR_PREREQUISITES.get(code, ())
+    )
+
+
+def detector_plan(
+    detectors: Iterable[Tuple[Callable, str]],
+    somef_data: Dict,
+    is_ignored: Callable[[str], bool] = lambda code: False,
+) -> List[PlannedDetector]:
+    """
+    The detectors to consider for one repository, in order, without the ignored checks.
+    run is False for the checks whose prerequisite categories the repository lacks.
+    """
+    categories = present_categories(somef_data) if isinstance(somef_data, dict) else frozenset()
+    return [
+        PlannedDetector(func, code, prerequisites_met(code, categories))
+        for func, code in detectors
+        if not is_ignored(code)
+    ]
+
+
+def _new_counters() -> Dict:
+    return {"invocations": 0, "skipped": 0, "cached": 0, "errors": 0, "timeouts": 0, "seconds": 0.0}
+
+
+class DetectorProfile:
+    """Invocations, skips, cache hits, errors, timeouts and run time of each check over a run."""
+
+    def __init__(self, codes: Iterable[str]):
+        self.files = 0
+        self.checks = {code: _new_counters() for code in codes}
+
+    def _check(self, code: str) -> Dict:
+        return self.checks.setdefault(code, _new_counters())
+
+    def add_file(self):
+        self.files += 1
+
+    def add_skip(self, code: str):
+        self._check(code)["skipped"] += 1
+
+    def add_cache_hit(self, code: str):
+        self._check(code)["cached"] += 1
+
+    def add_invocation(self, code: str, seconds: float, failed: bool = False, timed_out: bool = False):
+        check = self._check(code)
+        check["invocations"] += 1
+        check["seconds"] += seconds
+        if failed:
+            check["errors"] += 1
+        if timed_out:
+            check["timeouts"] += 1
+
+    @property
+    def skipped_invocations(self) -> int:
+        return sum(check["skipped"] for check in self.checks.values())
+
+    def report(self) -> Dict:
+        return {
+            "files_analyzed": self.files,
+            "detector_invocations": sum(check["invocations"] for check in self.checks.values()),
+            "skipped_invocations": self.skipped_invocations,
+            "cached_results": sum(check["cached"] for check in self.checks.values()),
+            "checks": {
+                code: dict(check, seconds=round(check["seconds"], 6))
+                for code, check in self.checks.items()
+            },
+        }
+
@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+_FLAG_KEYS = ("has_pitfall", "has_warning", "has_note")
+_ENVELOPE_KEYS = frozenset(_FLAG_KEYS + ("file_name", "pitfall_code"))
+
+
+def _is_informative(value: Any) -> bool:
+    """
+    Decide whether a detector field is worth keeping in the evidence payload.
+    None, False and empty containers carry no information for the JSON-LD rendering,
+    which always reads optional fields with ``dict.get``.
+    """
+    if value is None or value is False:
+        return False
+    if isinstance(value, (list, dict, set, tuple)) and not value:
+        return False
+    return True
+
+
+@dataclass(slots=True)
+class DetectorResult:
+    """
+    Outcome of one detector invocation on one repository.
+
+    The issue flags are typed attributes; everything else the detector reported
+    (values, sources, notes...) lives in the compact ``evidence`` mapping.
+    """
+    code: str
+    file_name: str
+    has_pitfall: bool = False
+    has_warning: bool = False
+    has_note: bool = False
+    evidence: Dict[str, Any] = field(default_factory=dict)
+    # The detector did not finish within its time budget: whether the check applies is unknown.
+    incomplete: bool = False
+
+    @classmethod
+    def from_dict(cls, code: str, raw: Dict[str, Any], file_name: Optional[str] = None) -> "DetectorResult":
+        """
+        Build a result from the dict returned by a detector function.
+        The detector dict is not modified.
+        """
+        return cls(
+            code=code,
+            file_name=file_name if file_name is not None else raw.get("file_name", ""),
+            has_pitfall=bool(raw.get("has_pitfall", False)),
+            has_warning=bool(raw.get("has_warning", False)),
+            has_note=bool(raw.get("has_note", False)),
+            evidence={
+                key: value for key, value in raw.items()
+                if key not in _ENVELOPE_KEYS and _is_informative(value)
+            },
+        )
+
+    @property
+    def has_issue(self) -> bool:
+        return self.has_pitfall or self.has_warning
+
+    @property
+    def issue_type(self) -> Optional[str]:
+        if self.has_pitfall:
+            return "Pitfall"
+        if self.has_warning:
+            return "Warning"
+        return None
+
+    @classmethod
+    def timed_out(cls, code: str, file_name: str, timeout: float) -> "DetectorResult":
+        """Result of a check whose detector was stopped after timeout seconds."""
+        return cls(code=code, file_name=file_name, evidence={"timeout": timeout}, incomplete=True)
+
+    def note_texts(self) -> List[str]:
+        """
+        Return the note texts attached to this result, preferring the per-source
+        ``notes`` list over the single ``note_text`` field.
+        """
+        notes = self.evidence.get("notes")
+        if notes:
+            return [note.get("note_text", "") for note in notes]
+        note_text = self.evidence.get("note_text")
+        return [note_text] if note_text else []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert back to the dict form consumed by the JSON-LD helpers.
+        """
+        data = {
+            "has_pitfall": self.has_pitfall,
+            "has_warning": self.has_warning,
+            "has_note": self.has_note,
+            "file_name": self.file_name,
+        }
+        data.update(self.evidence)
+        data["pitfall_code"] = self.code
+        return data
@@ -0,0 +1,230 @@
+"""
+Shared GitHub API budget for everything RsMetaCheck sends to GitHub: SoMEF runs, commit ID
+lookups and the P008/P015 URL checks.
+
+A GitHubTokenPool holds one budget per configured token (or a single anonymous budget when no
+token is configured). Budgets are updated from the ``X-RateLimit-Remaining`` /
+``X-RateLimit-Reset`` headers of every response, requests are sent with the token that has
+the most requests left, and when every token is down to its reserve the caller is paused
+until the earliest reset instead of sending requests that would fail.
+
+Tokens come from ``--github-token`` or the ``GITHUB_TOKENS`` (comma separated) and
+``GITHUB_TOKEN`` environment variables.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+DEFAULT_RESERVE = 10
+DEFAULT_MAX_WAIT = 900.0
+# Used when every token is exhausted but GitHub did not say when the limit resets.
+_UNKNOWN_RESET_WAIT = 60.0
+
+
+class RateLimitExhausted(Exception):
+    """Raised when no token has budget left and the next reset is further away than max_wait."""
+
+
+@dataclass
+class TokenBudget:
+    """Rate limit state of one token (token None is the anonymous budget)."""
+    token: Optional[str]
+    remaining: Optional[int] = None
+    limit: Optional[int] = None
+    reset: Optional[float] = None
+
+
+def is_github_url(url: str) -> bool:
+    """True for github.com and its subdomains such as api.github.com."""
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except (TypeError, ValueError):
+        return False
+    return host == "github.com" or host.endswith(".github.com")
+
+
+def _header_number(headers, name: str) -> Optional[float]:
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def tokens_from_environment() -> list:
+    """Tokens listed in GITHUB_TOKENS (comma separated) followed by GITHUB_TOKEN."""
+    tokens = [t.strip() for t in os.environ.get("GITHUB_TOKENS", "").split(",")]
+    tokens.append(os.environ.get("GITHUB_TOKEN", "").strip())
+    return [t for t in tokens if t]
+
+
+class GitHubTokenPool:
+    """
+    Rotate GitHub requests across a pool of tokens according to their remaining budget.
+
+    reserve requests are kept on every token (SoMEF runs started elsewhere share the same
+    budget); max_wait bounds how long acquire pauses for a reset before giving up with
+    RateLimitExhausted. The pool is thread-safe.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str] = (),
+        reserve: int = DEFAULT_RESERVE,
+        max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        unique_tokens = list(dict.fromkeys(t for t in tokens if t))
+        self.budgets = [TokenBudget(t) for t in unique_tokens] or [TokenBudget(None)]
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def has_tokens(self) -> bool:
+        return self.budgets[0].token is not None
+
+    def _budget(self, token: Optional[str]) -> Optional[TokenBudget]:
+        for budget in self.budgets:
+            if budget.token == token:
+                return budget
+        return None
+
+    def _next_token(self, now: float):
+        """Return (budget, 0) for the token to use, or (None, seconds to wait)."""
+        if self._paused_until > now:
+            return None, self._paused_until - now
+
+        for budget in self.budgets:
+            if budget.reset is not None and budget.reset <= now:
+                budget.remaining, budget.reset = None, None
+
+        usable = [b for b in self.budgets if b.remaining is None or b.remaining > self.reserve]
+        if usable:
+            # Unknown budgets first so every token gets probed, then the fullest one.
+            return max(usable, key=lambda b: float("inf") if b.remaining is None else b.remaining), 0.0
+
+        resets = [b.reset for b in self.budgets if b.reset is not None]
+        return None, (min(resets) - now) if resets else _UNKNOWN_RESET_WAIT
+
+    def acquire(self) -> Optional[str]:
+        """
+        Return the token to use for the next GitHub API request (None when anonymous),
+        pausing while every token is rate limited.
+        Raises RateLimitExhausted if the pause would be longer than max_wait.
+        """
+        while True:
+            with self._lock:
+                budget, wait = self._next_token(self._clock())
+                if budget is not None:
+                    if budget.remaining is not None:
+                        budget.remaining -= 1
+                    return budget.token
+
+            if self.max_wait is not None and wait > self.max_wait:
+                raise RateLimitExhausted(
+                    f"GitHub API rate limit exhausted, next reset in {wait:.0f}s"
+                )
+            print(f"GitHub API rate limit reached, pausing {wait:.0f}s until it resets...")
+            self._sleep(max(wait, 1.0))
+
+    def wait_if_paused(self) -> None:
+        """Sleep through a pause requested by GitHub (Retry-After) before a non-API request."""
+        with self._lock:
+            wait = self._paused_until - self._clock()
+        if wait > 0:
+            self._sleep(wait)
+
+    def update(self, token: Optional[str], headers, status: Optional[int] = None) -> None:
+        """
+        Record the rate limit headers of a GitHub response sent with token.
+        Only the REST ("core") budget is tracked; GraphQL and search have budgets of their own.
+        """
+        try:
+            resource = headers.get("X-RateLimit-Resource")
+        except AttributeError:
+            resource = None
+        if isinstance(resource, str) and resource != "core":
+            headers = {"Retry-After": headers.get("Retry-After")}
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        retry_after = _header_number(headers, "Retry-After")
+
+        with self._lock:
+            budget = self._budget(token)
+            if budget is not None and remaining is not None:
+                budget.remaining = int(remaining)
+                if limit is not None:
+                    budget.limit = int(limit)
+                if reset is not None:
+                    budget.reset = reset
+            if status in (403, 429) and retry_after is not None:
+                # Secondary rate limits apply to the client, whatever the token.
+                self._paused_until = max(self._paused_until, self._clock() + retry_after)
+
+    def record_remaining(self, token: Optional[str], remaining: int, reset: Optional[float] = None) -> None:
+        """
+        Record a budget reported outside of HTTP headers (e.g. parsed from SoMEF's log).
+        Without a reset time the token is probed again after a minute.
+        """
+        with self._lock:
+            budget = self._budget(token)
+            if budget is not None:
+                budget.remaining = remaining
+                budget.reset = reset if reset is not None else self._clock() + _UNKNOWN_RESET_WAIT
+
+    def budget_summary(self) -> Optional[str]:
+        """Human-readable budget for progress output, None until a response has been seen."""
+        with self._lock:
+            known = [b for b in self.budgets if b.remaining is not None]
+            if not known:
+                return None
+            remaining = sum(b.remaining for b in known)
+            limits = [b.limit for b in known if b.limit is not None]
+            resets = [b.reset for b in known if b.reset is not None]
+            now = self._clock()
+
+        summary = f"GitHub API budget: {remaining}"
+        if len(limits) == len(known):
+            summary += f"/{sum(limits)}"
+        summary += " requests left"
+        if len(self.budgets) > 1:
+            summary += f" across {len(self.budgets)} tokens"
+        if resets:
+            summary += f", next reset in {max(min(resets) - now, 0) / 60:.0f}m"
+        return summary
+
+
+_pool: Optional[GitHubTokenPool] = None
+
+
+def get_token_pool() -> GitHubTokenPool:
+    """The pool shared by the whole run, built from the environment on first use."""
+    global _pool
+    if _pool is None:
+        _pool = GitHubTokenPool(tokens_from_environment())
+    return _pool
+
+
+def configure_token_pool(
+    tokens: Iterable[str] = (),
+    reserve: int = DEFAULT_RESERVE,
+    max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+) -> GitHubTokenPool:
+    """Replace the shared pool; tokens are used before the ones from the environment."""
+    global _pool
+    _pool = GitHubTokenPool(list(tokens) + tokens_from_environment(), reserve, max_wait)
+    return _pool
@@ -1,13 +1,22 @@
+import functools
+import hashlib
 import json
 import re
 import urllib.parse
 import urllib.request
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 
 from rsmetacheck import __version__ as rsmetacheck_version
+from rsmetacheck.utils.detector_result import DetectorResult
+from rsmetacheck.utils.github_rate_limit import RateLimitExhausted, get_token_pool
+from rsmetacheck.utils.serialization import write_json
+
+_AUTHOR_SEPARATOR = re.compile(r'\s+and\s+|,')
+_DOI_PREFIX = re.compile(r'^doi:', re.IGNORECASE)
+_BRACKETED_LIST = re.compile(r"\[(.*?)\]")
 
 
 def _fetch_gitlab_commit_id(host: str, project_path: str) -> str:
@@ -31,6 +40,36 @@ def _fetch_gitlab_commit_id(host: str, project_path: str) -> str:
     return "Unknown"
 
 
+def _fetch_github_commit_id(api_url: str) -> str:
+    """
+    Fetch a commit ID from the GitHub REST API with a token from the shared pool.
+    A response rejected by the rate limit is tried once more with the next token.
+    Returns the commit ID string or 'Unknown'.
+    """
+    pool = get_token_pool()
+    for _ in range(2):
+        try:
+            token = pool.acquire()
+        except RateLimitExhausted:
+            return "Unknown"
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        if token:
+            headers['Authorization'] = f"token {token}"
+        try:
+            req = urllib.request.Request(api_url, headers=headers)
+            with urllib.request.urlopen(req, timeout=10) as response:
+                pool.update(token, response.headers, response.status)
+                data = json.loads(response.read().decode('utf-8'))
+                return data.get('sha', 'Unknown')
+        except HTTPError as e:
+            pool.update(token, e.headers, e.code)
+            if e.code not in (403, 429):
+                break
+        except (URLError, json.JSONDecodeError):
+            break
+    return "Unknown"
+
+
 def fetch_latest_commit_id(repo_url: str) -> str:
     """
     Attempts to fetch the latest commit ID for a given repository URL.
@@ -48,16 +87,7 @@ def fetch_latest_commit_id(repo_url: str) -> str:
                 repo = repo[:-4]
             
             api_url = f"https://api.github.com/repos/{owner}/{repo}/commits/HEAD"
-            try:
-                req = urllib.request.Request(
-                    api_url, 
-                    headers={'User-Agent': 'Mozilla/5.0'}
-                )
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    data = json.loads(response.read().decode('utf-8'))
-                    return data.get('sha', 'Unknown')
-            except (URLError, HTTPError, json.JSONDecodeError):
-                pass
+            return _fetch_github_commit_id(api_url)
 
     elif repo_url.startswith("https://"):
         # Handles gitlab.com and any self-hosted GitLab instance.
@@ -73,9 +103,10 @@ def fetch_latest_commit_id(repo_url: str) -> str:
     return "Unknown"
 
 
-def extract_software_info_from_somef(somef_data: Dict) -> Dict:
+def extract_software_info_from_somef(somef_data: Dict, commit_id: str = None) -> Dict:
     """
     Extract software information from SoMEF data for the assessedSoftware section.
+    The commit ID is fetched unless it has already been resolved (see CommitResolver).
     """
     software_info = {
         "@type": "schema:SoftwareApplication",
@@ -121,7 +152,9 @@ def extract_software_info_from_somef(somef_data: Dict) -> Dict:
                 break
 
     # Add commit ID
-    software_info["commit_id"] = fetch_latest_commit_id(software_info.get("url", "Unknown"))
+    if commit_id is None:
+        commit_id = fetch_latest_commit_id(software_info.get("url", "Unknown"))
+    software_info["commit_id"] = commit_id
 
     return software_info
 
@@ -258,239 +291,224 @@ def extract_metadata_source_filename(source_path: str) -> str:
     return "metadata files"
 
 
-def format_evidence_text(pitfall_code: str, pitfall_result: Dict) -> str:
-    """
-    Format evidence text based on pitfall type and result data for ALL pitfalls and warnings.
-    """
-    evidence_base = f"{pitfall_code} detected: "
+# Evidence templates, by check code. A template is called with the "<code> detected: "
+# prefix and the detector result when the result has the fields the template requires;
+# it returns None to fall back to the generic evidence.
+_EVIDENCE_TEMPLATES: Dict[str, Tuple[Tuple[str, ...], Callable[[str, Dict], Optional[str]]]] = {}
 
-    # Pitfalls
-    if pitfall_code == "P001":
-        mismatched_sources = pitfall_result.get("mismatched_sources", [])
-        if mismatched_sources:
-            release_version = pitfall_result.get('release_version') or 'unknown'
-            parts = []
-            for m in mismatched_sources:
-                version = m.get('metadata_version') or 'unknown'
-                source = m.get('source_file') or 'unknown'
-                parts.append(f"{source} version '{version}'")
-            source_detail = ", ".join(parts[:-1]) + (" and " + parts[-1] if len(parts) > 1 else parts[0])
-            return f"{evidence_base}{source_detail} does not match release version '{release_version}'"
-        if "metadata_version" in pitfall_result and "release_version" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            metadata_version = pitfall_result.get('metadata_version') or 'unknown'
-            release_version = pitfall_result.get('release_version') or 'unknown'
-            return f"{evidence_base}{metadata_source} version '{metadata_version}' does not match release version '{release_version}'"
 
-    elif pitfall_code == "P002":
-        if pitfall_result.get("placeholders_found"):
-            return f"{evidence_base}LICENSE file contains unreplaced template placeholders"
-        return f"{evidence_base}LICENSE file contains template placeholders that were not replaced"
+def _evidence(*codes: str, requires: Tuple[str, ...] = ()):
+    """Register an evidence template for the given codes."""
+    def register(render):
+        for code in codes:
+            _EVIDENCE_TEMPLATES[code] = (requires, render)
+        return render
+    return register
 
-    elif pitfall_code == "P003":
-        if "author_value" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            author_value = pitfall_result.get('author_value') or 'unknown'
-            return f"{evidence_base}{metadata_source} Multiple authors found in single field: '{author_value}'"
 
-    elif pitfall_code == "P004":
-        if "readme_url" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            readme_url = pitfall_result.get('readme_url') or 'unknown URL'
-            return f"{evidence_base}{metadata_source} README property points to homepage/wiki instead of README file: {readme_url}"
+def _field_evidence(field: str, default: str, template: str):
+    """Template '<metadata sources> <text>' quoting one field of the result."""
+    def render(evidence_base: str, pitfall_result: Dict) -> str:
+        metadata_source = get_metadata_sources(pitfall_result)
+        value = pitfall_result.get(field) or default
+        return evidence_base + template.format(source=metadata_source, value=value)
+    return render
+
+
+for _code, _field, _default, _template in [
+    ("P003", "author_value", "unknown", "{source} Multiple authors found in single field: '{value}'"),
+    ("P004", "readme_url", "unknown URL", "{source} README property points to homepage/wiki instead of README file: {value}"),
+    ("P005", "reference_url", "unknown URL", "{source} Reference publication points to software archive instead of paper: {value}"),
+    ("P006", "license_value", "unknown", "{source} License points to local file instead of license name: '{value}'"),
+    ("P009", "repository_url", "unknown URL", "{source} codeRepository points to homepage instead of repository: {value}"),
+    ("P011", "issue_url", "unknown URL", "{source} IssueTracker URL does not match recognized issue tracker patterns: {value}"),
+    ("P012", "download_url", "unknown URL", "{source} downloadURL is outdated or invalid: {value}"),
+    ("P013", "license_value", "unknown", "{source} License does not specify version: '{value}'"),
+    ("P014", "identifier_value", "unknown", "{source} Identifier uses bare DOI instead of full URL: '{value}'"),
+    ("P018", "identifier_value", "unknown", "{source} Identifier uses raw SWHID without resolvable URL: '{value}'"),
+    ("W005", "requirement_string", "unknown", "{source} Multiple requirements written as single string: '{value}'"),
+    ("W006", "codemeta_identifier", "unknown", "{source} Identifier is a name instead of valid unique identifier: '{value}'"),
+    ("W008", "author_value", "unknown", "{source} GivenName is a list instead of string: {value}"),
+    ("W009", "development_status", "unknown", "{source} developmentStatus is a URL instead of status string: {value}"),
+    ("W010", "repository_url", "unknown URL", "{source} codeRepository uses Git shorthand instead of full URL: '{value}'"),
+]:
+    _evidence(_code, requires=(_field,))(_field_evidence(_field, _default, _template))
+
+
+@_evidence("P001")
+def _version_mismatch_evidence(evidence_base: str, pitfall_result: Dict) -> Optional[str]:
+    mismatched_sources = pitfall_result.get("mismatched_sources", [])
+    if mismatched_sources:
+        release_version = pitfall_result.get('release_version') or 'unknown'
+        parts = []
+        for m in mismatched_sources:
+            version = m.get('metadata_version') or 'unknown'
+            source = m.get('source_file') or 'unknown'
+            parts.append(f"{source} version '{version}'")
+        source_detail = ", ".join(parts[:-1]) + (" and " + parts[-1] if len(parts) > 1 else parts[0])
+        return f"{evidence_base}{source_detail} does not match release version '{release_version}'"
+    if "metadata_version" in pitfall_result and "release_version" in pitfall_result:
+        metadata_source = get_metadata_sources(pitfall_result)
+        metadata_version = pitfall_result.get('metadata_version') or 'unknown'
+        release_version = pitfall_result.get('release_version') or 'unknown'
+        return f"{evidence_base}{metadata_source} version '{metadata_version}' does not match release version '{release_version}'"
+    return None
 
-    elif pitfall_code == "P005":
-        if "reference_url" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            reference_url = pitfall_result.get('reference_url') or 'unknown URL'
-            return f"{evidence_base}{metadata_source} Reference publication points to software archive instead of paper: {reference_url}"
 
-    elif pitfall_code == "P006":
-        if "license_value" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            license_value = pitfall_result.get('license_value') or 'unknown'
-            return f"{evidence_base}{metadata_source} License points to local file instead of license name: '{license_value}'"
+@_evidence("P002")
+def _license_placeholders_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    if pitfall_result.get("placeholders_found"):
+        return f"{evidence_base}LICENSE file contains unreplaced template placeholders"
+    return f"{evidence_base}LICENSE file contains template placeholders that were not replaced"
 
-    elif pitfall_code == "P007":
-        metadata_source = get_metadata_sources(pitfall_result)
-        return f"{evidence_base}{metadata_source} exists but does not contain referencePublication while codemeta.json references it"
-
-    elif pitfall_code == "P008":
-        if "invalid_urls" in pitfall_result:
-            invalid_urls = pitfall_result["invalid_urls"]
-            if isinstance(invalid_urls, list) and len(invalid_urls) > 0:
-                urls = []
-                for url_info in invalid_urls:
-                    if isinstance(url_info, dict) and "url" in url_info and url_info["url"]:
-                        urls.append(str(url_info["url"]))
-                    elif isinstance(url_info, str) and url_info:
-                        urls.append(url_info)
-
-                if urls:
-                    metadata_source = get_metadata_sources(pitfall_result)
-                    url_list = ', '.join(urls[:3])
-                    return f"{evidence_base}{metadata_source} Software requirements contain invalid URLs: {url_list}{'...' if len(urls) > 3 else ''}"
-        return f"{evidence_base}Software requirements contain invalid URLs"
-
-    elif pitfall_code == "P009":
-        if "repository_url" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            repository_url = pitfall_result.get('repository_url') or 'unknown URL'
-            return f"{evidence_base}{metadata_source} codeRepository points to homepage instead of repository: {repository_url}"
 
-    elif pitfall_code == "P010":
-        metadata_source = get_metadata_sources(pitfall_result)
-        if metadata_source == "metadata files":
-            metadata_source = "LICENSE file"
-        return f"{evidence_base}{metadata_source} only contains copyright information without actual license terms"
+@_evidence("P007")
+def _citation_reference_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    metadata_source = get_metadata_sources(pitfall_result)
+    return f"{evidence_base}{metadata_source} exists but does not contain referencePublication while codemeta.json references it"
 
-    elif pitfall_code == "P011":
-        if "issue_url" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            issue_url = pitfall_result.get('issue_url') or 'unknown URL'
-            return f"{evidence_base}{metadata_source} IssueTracker URL does not match recognized issue tracker patterns: {issue_url}"
 
-    elif pitfall_code == "P012":
-        if "download_url" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            download_url = pitfall_result.get('download_url') or 'unknown URL'
-            return f"{evidence_base}{metadata_source} downloadURL is outdated or invalid: {download_url}"
+@_evidence("P008")
+def _invalid_requirement_urls_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    invalid_urls = pitfall_result.get("invalid_urls")
+    if isinstance(invalid_urls, list) and len(invalid_urls) > 0:
+        urls = []
+        for url_info in invalid_urls:
+            if isinstance(url_info, dict) and "url" in url_info and url_info["url"]:
+                urls.append(str(url_info["url"]))
+            elif isinstance(url_info, str) and url_info:
+                urls.append(url_info)
 
-    elif pitfall_code == "P013":
-        if "license_value" in pitfall_result:
+        if urls:
             metadata_source = get_metadata_sources(pitfall_result)
-            license_value = pitfall_result.get('license_value') or 'unknown'
-            return f"{evidence_base}{metadata_source} License does not specify version: '{license_value}'"
+            url_list = ', '.join(urls[:3])
+            return f"{evidence_base}{metadata_source} Software requirements contain invalid URLs: {url_list}{'...' if len(urls) > 3 else ''}"
+    return f"{evidence_base}Software requirements contain invalid URLs"
 
-    elif pitfall_code == "P014":
-        if "identifier_value" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            identifier_value = pitfall_result.get('identifier_value') or 'unknown'
-            return f"{evidence_base}{metadata_source} Identifier uses bare DOI instead of full URL: '{identifier_value}'"
 
-    elif pitfall_code == "P015":
-        if "ci_url" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            status = pitfall_result.get("status_code") or "unknown"
-            ci_url = pitfall_result.get('ci_url') or 'unknown URL'
-            return f"{evidence_base}{metadata_source} Continuous integration URL returns {status}: {ci_url}"
-
-    elif pitfall_code == "P016":
-        if "github_api_url" in pitfall_result:
-            github_api_url = pitfall_result.get('github_api_url') or 'unknown URL'
-            different_urls = pitfall_result.get("different_urls", [])
-            if different_urls and isinstance(different_urls, list) and len(different_urls) > 0:
-                metadata_source = get_metadata_sources(pitfall_result)
-                mismatched_sources = []
-                for du in different_urls:
-                    mismatched_sources.append(f"{extract_metadata_source_filename(du.get('source', ''))}: {du.get('url', 'unknown URL')}")
-                source_detail = "; ".join(mismatched_sources)
-                return f"{evidence_base}the correct URL is {github_api_url}, and the ones found in {metadata_source} are mismatched: {source_detail}"
-            return f"{evidence_base}the correct URL is {github_api_url}, and the one found in metadata files is unknown"
-
-    elif pitfall_code == "P017":
-        if "codemeta_version" in pitfall_result:
-            codemeta_version = pitfall_result.get('codemeta_version') or 'unknown'
-            metadata_source = get_metadata_sources(pitfall_result)
+@_evidence("P010")
+def _copyright_only_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    metadata_source = get_metadata_sources(pitfall_result)
+    if metadata_source == "metadata files":
+        metadata_source = "LICENSE file"
+    return f"{evidence_base}{metadata_source} only contains copyright information without actual license terms"
 
-            mismatches = pitfall_result.get("mismatched_versions", [])
-            if mismatches and isinstance(mismatches, list) and len(mismatches) > 0:
-                mismatch_details = []
-                for m in mismatches:
-                    src = extract_metadata_source_filename(m.get("source", ""))
-                    ver = m.get("version", "unknown")
-                    mismatch_details.append(f"{src} version '{ver}'")
-                other_source = ", ".join(mismatch_details)
-                return f"{evidence_base}{metadata_source} version '{codemeta_version}' does not match {other_source}"
 
-            return f"{evidence_base}{metadata_source} version '{codemeta_version}' does not match package version"
+@_evidence("P015", requires=("ci_url",))
+def _ci_url_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    metadata_source = get_metadata_sources(pitfall_result)
+    status = pitfall_result.get("status_code") or "unknown"
+    ci_url = pitfall_result.get('ci_url') or 'unknown URL'
+    return f"{evidence_base}{metadata_source} Continuous integration URL returns {status}: {ci_url}"
 
-    elif pitfall_code == "P018":
-        if "identifier_value" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            identifier_value = pitfall_result.get('identifier_value') or 'unknown'
-            return f"{evidence_base}{metadata_source} Identifier uses raw SWHID without resolvable URL: '{identifier_value}'"
-
-    elif pitfall_code == "P019":
-        if "inconsistencies" in pitfall_result:
-            inconsistency = pitfall_result["inconsistencies"][0]
-            source_fewer = inconsistency.get('source_with_fewer', 'unknown')
-            count_fewer = inconsistency.get('fewer_count', 0)
-            source_more = inconsistency.get('source_with_more', 'unknown')
-            count_more = inconsistency.get('more_count', 0)
-            return f"{evidence_base}Author count mismatch: {source_fewer} has {count_fewer} while {source_more} has {count_more}"
-        return f"{evidence_base}Inconsistent author counts found across metadata files"
 
-    # Warnings
-    elif pitfall_code == "W001":
-        if "unversioned_requirements" in pitfall_result:
-            reqs = pitfall_result["unversioned_requirements"]
-            metadata_source = get_metadata_sources(pitfall_result)
-            if isinstance(reqs, list) and len(reqs) > 0:
-                clean_reqs = [str(req) for req in reqs if req is not None]
-                if clean_reqs:
-                    req_list = ', '.join(clean_reqs)
-                    return f"{evidence_base}{metadata_source} contains software requirements without versions: {req_list}"
-        return f"{evidence_base}Software requirements found without version specifications"
-
-    elif pitfall_code == "W002":
-        if "codemeta_date_parsed" in pitfall_result and "github_api_date_parsed" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            codemeta_date = pitfall_result.get('codemeta_date_parsed') or 'unknown'
-            github_date = pitfall_result.get('github_api_date_parsed') or 'unknown'
-            return f"{evidence_base}{metadata_source} dateModified '{codemeta_date}' is outdated compared to repository date '{github_date}'"
-        return f"{evidence_base}dateModified in metadata is outdated compared to actual repository last update"
+@_evidence("P016", requires=("github_api_url",))
+def _different_repository_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    github_api_url = pitfall_result.get('github_api_url') or 'unknown URL'
+    different_urls = pitfall_result.get("different_urls", [])
+    if different_urls and isinstance(different_urls, list) and len(different_urls) > 0:
+        metadata_source = get_metadata_sources(pitfall_result)
+        mismatched_sources = []
+        for du in different_urls:
+            mismatched_sources.append(f"{extract_metadata_source_filename(du.get('source', ''))}: {du.get('url', 'unknown URL')}")
+        source_detail = "; ".join(mismatched_sources)
+        return f"{evidence_base}the correct URL is {github_api_url}, and the ones found in {metadata_source} are mismatched: {source_detail}"
+    return f"{evidence_base}the correct URL is {github_api_url}, and the one found in metadata files is unknown"
+
+
+@_evidence("P017", requires=("codemeta_version",))
+def _package_version_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    codemeta_version = pitfall_result.get('codemeta_version') or 'unknown'
+    metadata_source = get_metadata_sources(pitfall_result)
+
+    mismatches = pitfall_result.get("mismatched_versions", [])
+    if mismatches and isinstance(mismatches, list) and len(mismatches) > 0:
+        mismatch_details = []
+        for m in mismatches:
+            src = extract_metadata_source_filename(m.get("source", ""))
+            ver = m.get("version", "unknown")
+            mismatch_details.append(f"{src} version '{ver}'")
+        other_source = ", ".join(mismatch_details)
+        return f"{evidence_base}{metadata_source} version '{codemeta_version}' does not match {other_source}"
+
+    return f"{evidence_base}{metadata_source} version '{codemeta_version}' does not match package version"
+
+
+@_evidence("P019")
+def _author_count_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    if "inconsistencies" in pitfall_result:
+        inconsistency = pitfall_result["inconsistencies"][0]
+        source_fewer = format_source_list(inconsistency.get('sources_with_fewer')) if inconsistency.get('sources_with_fewer') else inconsistency.get('source_with_fewer', 'unknown')
+        count_fewer = inconsistency.get('fewer_count', 0)
+        source_more = format_source_list(inconsistency.get('sources_with_more')) if inconsistency.get('sources_with_more') else inconsistency.get('source_with_more', 'unknown')
+        count_more = inconsistency.get('more_count', 0)
+        return f"{evidence_base}Author count mismatch: {source_fewer} has {count_fewer} while {source_more} has {count_more}"
+    return f"{evidence_base}Inconsistent author counts found across metadata files"
+
+
+@_evidence("W001")
+def _unversioned_requirements_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    if "unversioned_requirements" in pitfall_result:
+        reqs = pitfall_result["unversioned_requirements"]
+        metadata_source = get_metadata_sources(pitfall_result)
+        if isinstance(reqs, list) and len(reqs) > 0:
+            clean_reqs = [str(req) for req in reqs if req is not None]
+            if clean_reqs:
+                req_list = ', '.join(clean_reqs)
+                return f"{evidence_base}{metadata_source} contains software requirements without versions: {req_list}"
+    return f"{evidence_base}Software requirements found without version specifications"
 
-    elif pitfall_code == "W003":
-        if "dual_license_source" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            dual_license_source = pitfall_result.get('dual_license_source') or 'unknown'
-            return f"{evidence_base}Repository has multiple licenses but {metadata_source} only lists one. Found in: {dual_license_source}"
-        return f"{evidence_base}Repository has multiple licenses but metadata only has one listed"
 
-    elif pitfall_code == "W004":
-        if "programming_languages_without_version" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            langs = pitfall_result["programming_languages_without_version"]
-            if isinstance(langs, list) and len(langs) > 0:
-                clean_langs = [str(lang) for lang in langs if lang is not None]
-                if clean_langs:
-                    return f"{evidence_base}{metadata_source} Programming languages without versions: {', '.join(clean_langs)}"
-        return f"{evidence_base}Programming languages in metadata do not have version specifications"
-
-    elif pitfall_code == "W005":
-        if "requirement_string" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            requirements_string = pitfall_result.get('requirement_string') or 'unknown'
-            return f"{evidence_base}{metadata_source} Multiple requirements written as single string: '{requirements_string}'"
+@_evidence("W002")
+def _outdated_date_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    if "codemeta_date_parsed" in pitfall_result and "github_api_date_parsed" in pitfall_result:
+        metadata_source = get_metadata_sources(pitfall_result)
+        codemeta_date = pitfall_result.get('codemeta_date_parsed') or 'unknown'
+        github_date = pitfall_result.get('github_api_date_parsed') or 'unknown'
+        return f"{evidence_base}{metadata_source} dateModified '{codemeta_date}' is outdated compared to repository date '{github_date}'"
+    return f"{evidence_base}dateModified in metadata is outdated compared to actual repository last update"
 
-    elif pitfall_code == "W006":
-        if "codemeta_identifier" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            identifier = pitfall_result.get('codemeta_identifier') or 'unknown'
-            return f"{evidence_base}{metadata_source} Identifier is a name instead of valid unique identifier: '{identifier}'"
 
-    elif pitfall_code == "W007":
+@_evidence("W003")
+def _dual_license_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    if "dual_license_source" in pitfall_result:
         metadata_source = get_metadata_sources(pitfall_result)
-        return f"{evidence_base}{metadata_source} identifier field is empty or missing"
+        dual_license_source = pitfall_result.get('dual_license_source') or 'unknown'
+        return f"{evidence_base}Repository has multiple licenses but {metadata_source} only lists one. Found in: {dual_license_source}"
+    return f"{evidence_base}Repository has multiple licenses but metadata only has one listed"
 
-    elif pitfall_code == "W008":
-        if "author_value" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            author_value = pitfall_result.get('author_value') or 'unknown'
-            return f"{evidence_base}{metadata_source} GivenName is a list instead of string: {author_value}"
 
-    elif pitfall_code == "W009":
-        if "development_status" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            development_status = pitfall_result.get('development_status') or 'unknown'
-            return f"{evidence_base}{metadata_source} developmentStatus is a URL instead of status string: {development_status}"
+@_evidence("W004")
+def _language_version_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    if "programming_languages_without_version" in pitfall_result:
+        metadata_source = get_metadata_sources(pitfall_result)
+        langs = pitfall_result["programming_languages_without_version"]
+        if isinstance(langs, list) and len(langs) > 0:
+            clean_langs = [str(lang) for lang in langs if lang is not None]
+            if clean_langs:
+                return f"{evidence_base}{metadata_source} Programming languages without versions: {', '.join(clean_langs)}"
+    return f"{evidence_base}Programming languages in metadata do not have version specifications"
 
-    elif pitfall_code == "W010":
-        if "repository_url" in pitfall_result:
-            metadata_source = get_metadata_sources(pitfall_result)
-            repository_url = pitfall_result.get('repository_url') or 'unknown URL'
-            return f"{evidence_base}{metadata_source} codeRepository uses Git shorthand instead of full URL: '{repository_url}'"
+
+@_evidence("W007")
+def _empty_identifier_evidence(evidence_base: str, pitfall_result: Dict) -> str:
+    metadata_source = get_metadata_sources(pitfall_result)
+    return f"{evidence_base}{metadata_source} identifier field is empty or missing"
+
+
+def format_evidence_text(pitfall_code: str, pitfall_result: Dict) -> str:
+    """
+    Format evidence text based on pitfall type and result data for ALL pitfalls and warnings.
+    """
+    evidence_base = f"{pitfall_code} detected: "
+
+    template = _EVIDENCE_TEMPLATES.get(pitfall_code)
+    if template is not None:
+        requires, render = template
+        if all(field in pitfall_result for field in requires):
+            evidence = render(evidence_base, pitfall_result)
+            if evidence is not None:
+                return evidence
 
     # Default fallback evidence
     file_name = pitfall_result.get('file_name') or 'unknown file'
@@ -540,192 +558,294 @@ def get_pitfall_category(pitfall_code: str) -> str:
     return categories.get(pitfall_code, "metadatafile")
 
 
-def get_suggestion_text(pitfall_code: str, pitfall_result: Dict = None, somef_data: Dict = None) -> str:
+class RepositoryLookups:
     """
-    Adds the suggestions depending on the Pitfall/Warning, dynamically populated if data is provided.
+    Repository-level values quoted by the suggestion templates. Each is looked up in the
+    SoMEF data the first time a template needs it, then shared by the checks of the repository.
     """
-    if pitfall_result is None:
-        pitfall_result = {}
-    if somef_data is None:
-        somef_data = {}
 
-    github_api_repo = None
-    if "code_repository" in somef_data:
-        for entry in somef_data["code_repository"]:
+    def __init__(self, somef_data: Dict = None):
+        self.somef_data = somef_data if somef_data is not None else {}
+
+    @functools.cached_property
+    def github_api_repo(self) -> Optional[str]:
+        """Repository URL reported by the GitHub API."""
+        for entry in self.somef_data.get("code_repository", []):
             if entry.get("technique") == "GitHub_API" and "result" in entry and "value" in entry["result"]:
-                github_api_repo = entry["result"]["value"]
-                break
+                return entry["result"]["value"]
+        return None
+
+    @functools.cached_property
+    def readme_file_url(self) -> Optional[str]:
+        """First README URL that points to the file itself rather than a homepage."""
+        for entry in self.somef_data.get("readme_url", []):
+            val = entry.get("result", {}).get("value", "")
+            if val and ("blob" in val.lower() or "readme.md" in val.lower() or "raw" in val.lower()):
+                return val
+        return None
+
+    @functools.cached_property
+    def codemeta_reference_publication(self) -> Optional[str]:
+        """referencePublication declared in codemeta.json."""
+        for entry in self.somef_data.get("reference_publication", []):
+            if "codemeta.json" in entry.get("source", ""):
+                return entry.get("result", {}).get("value", "")
+        return None
+
+    @functools.cached_property
+    def repository_license(self) -> Optional[str]:
+        """License found in the repository files (SPDX id, name or short text)."""
+        for entry in self.somef_data.get("license", []):
+            src = entry.get("source", "")
+            if isinstance(src, list):
+                src = src[0] if src else ""
+            src_str = str(src).lower()
+            tech = entry.get("technique", "")
+            is_file_search = ("license" in src_str or tech == "file_exploration")
+            if is_file_search:
+                val = entry.get("result", {}).get("value")
+                spdx = entry.get("result", {}).get("spdx_id")
+                name = entry.get("result", {}).get("name")
+                found_license = spdx or name or (val if val and len(str(val)) < 50 else None)
+                if found_license:
+                    return found_license
+        return None
+
+    @functools.cached_property
+    def versioned_languages(self) -> List[str]:
+        """'name (version)' of the programming languages found with a version."""
+        valid_langs = []
+        for entry in self.somef_data.get("programming_languages", []):
+            res = entry.get("result", {})
+            name = res.get("name")
+            ver = res.get("version")
+            if name and ver:
+                valid_langs.append(f"{name} ({ver})")
+        return valid_langs
+
+
+# Suggestion templates, by check code. A template is called with the detector result and,
+# as keyword arguments, the RepositoryLookups values it needs; it returns None to fall back
+# to the generic suggestion of the check.
+_SUGGESTION_TEMPLATES: Dict[str, Tuple[Tuple[str, ...], Callable[..., Optional[str]]]] = {}
+
+
+def _suggestion(code: str, needs: Tuple[str, ...] = ()):
+    """Register a suggestion template for a code."""
+    def register(render):
+        _SUGGESTION_TEMPLATES[code] = (needs, render)
+        return render
+    return register
+
+
+@_suggestion("P001")
+def _release_version_suggestion(pitfall_result: Dict) -> Optional[str]:
+    latest = pitfall_result.get("release_version")
+    if latest:
+        return f"Ensure the version in your metadata matches the latest official release ({latest}). Keeping these synchronized avoids confusion for users and improves reproducibility."
+    return None
+
+
+@_suggestion("P003")
+def _author_list_suggestion(pitfall_result: Dict) -> Optional[str]:
+    author_val = pitfall_result.get("author_value")
+    if author_val and isinstance(author_val, str) and ("and" in author_val or "," in author_val):
+        parts = [p.strip() for p in _AUTHOR_SEPARATOR.split(author_val) if p.strip()]
+        if len(parts) > 1:
+            return f'You should separate multiple authors into a structured list. For example: {parts}'
+    return None
+
+
+@_suggestion("P004", needs=("readme_file_url",))
+def _readme_suggestion(pitfall_result: Dict, readme_file_url: Optional[str]) -> Optional[str]:
+    if readme_file_url:
+        return f"Update the README property so it points directly to your actual README file ({readme_file_url}) instead of your homepage."
+    return None
+
+
+@_suggestion("P007", needs=("codemeta_reference_publication",))
+def _citation_reference_suggestion(pitfall_result: Dict, codemeta_reference_publication: Optional[str]) -> Optional[str]:
+    if codemeta_reference_publication:
+        return f"Add a referencePublication field with the related DOI or citation entry ({codemeta_reference_publication}) to your CITATION.cff."
+    return None
+
+
+@_suggestion("P009", needs=("github_api_repo",))
+def _homepage_repository_suggestion(pitfall_result: Dict, github_api_repo: Optional[str]) -> Optional[str]:
+    if github_api_repo:
+        return f"You need to update the codeRepository field to point directly to your repository's source code ({github_api_repo}) instead of a homepage."
+    return None
+
+
+@_suggestion("P011")
+def _issue_tracker_suggestion(pitfall_result: Dict) -> Optional[str]:
+    issue_url = pitfall_result.get("issue_url")
+    if issue_url:
+        return f"You need to correct the issue tracker URL ({issue_url}) so it follows a valid format (e.g., https://github.com/user/repo/issues or https://gitlab.com/namespace/project/-/issues)."
+    return None
+
+
+@_suggestion("P012")
+def _download_url_suggestion(pitfall_result: Dict) -> Optional[str]:
+    download_url = pitfall_result.get("download_url")
+    if download_url:
+        return f"You need to update the downloadURL field ({download_url}) to point to your latest release or current distribution source."
+    return None
+
+
+@_suggestion("P014")
+def _bare_doi_suggestion(pitfall_result: Dict) -> Optional[str]:
+    identifier = pitfall_result.get("identifier_value", "")
+    if identifier and isinstance(identifier, str):
+        cleaned_id = _DOI_PREFIX.sub('', identifier).replace('https://doi.org/', '')
+        if cleaned_id.startswith('10.'):
+            return f"You should include the full DOI URL form in your metadata (e.g., https://doi.org/{cleaned_id})"
+    return None
+
+
+@_suggestion("P016", needs=("github_api_repo",))
+def _different_repository_suggestion(pitfall_result: Dict, github_api_repo: Optional[str]) -> Optional[str]:
+    if github_api_repo:
+        return f"Make sure that the codeRepository URL in your metadata exactly matches the repository hosting your source code ({github_api_repo})."
+    return None
+
+
+@_suggestion("P017", needs=("github_api_repo",))
+def _package_version_suggestion(pitfall_result: Dict, github_api_repo: Optional[str]) -> Optional[str]:
+    if github_api_repo:
+        return f"You need to synchronize all version references across metadata and build configuration files. (Repository matches github API: {github_api_repo})"
+    return None
+
+
+@_suggestion("P018")
+def _raw_swhid_suggestion(pitfall_result: Dict) -> Optional[str]:
+    identifier = pitfall_result.get("identifier_value", "")
+    if identifier and isinstance(identifier, str) and identifier.startswith("swh:"):
+        return f"Always use the full resolvable SWHID URL (e.g., https://archive.softwareheritage.org/{identifier})."
+    return None
+
+
+@_suggestion("W002")
+def _outdated_date_suggestion(pitfall_result: Dict) -> Optional[str]:
+    github_date = pitfall_result.get("github_api_date_parsed")
+    if github_date:
+        return f"The data in the metadata file should be updated to be aligned with the date of the latest release ({github_date})."
+    return None
+
+
+@_suggestion("W003", needs=("repository_license",))
+def _dual_license_suggestion(pitfall_result: Dict, repository_license: Optional[str]) -> Optional[str]:
+    if repository_license:
+        return f"Use the LICENSE that is stated in your repository ({repository_license}) instead."
+    return None
+
+
+@_suggestion("W004", needs=("versioned_languages",))
+def _language_version_suggestion(pitfall_result: Dict, versioned_languages: List[str]) -> Optional[str]:
+    if versioned_languages:
+        langs_str = ", ".join(versioned_languages)
+        return f"Specify version numbers for your programming languages like found in other sources: {langs_str}."
+    return None
+
+
+@_suggestion("W005")
+def _requirements_list_suggestion(pitfall_result: Dict) -> Optional[str]:
+    reqs = pitfall_result.get("requirement_string", "")
+    if reqs and isinstance(reqs, str):
+        proper = "', '".join([r.strip() for r in reqs.replace(';', ',').split(',') if r.strip()])
+        if proper:
+            return f"Rewrite your dependencies as a proper list (e.g., ['{proper}']), with each item separated and preferably with their versions."
+    return None
 
-    if pitfall_code == "P001":
-        latest = pitfall_result.get("release_version")
-        if latest:
-            return f"Ensure the version in your metadata matches the latest official release ({latest}). Keeping these synchronized avoids confusion for users and improves reproducibility."
-    elif pitfall_code == "P003":
-        author_val = pitfall_result.get("author_value")
-        if author_val and isinstance(author_val, str) and ("and" in author_val or "," in author_val):
-            import re
-            parts = [p.strip() for p in re.split(r'\s+and\s+|,', author_val) if p.strip()]
-            if len(parts) > 1:
-                return f'You should separate multiple authors into a structured list. For example: {parts}'
-    
-    elif pitfall_code == "P004":
-        good_readme = None
-        if "readme_url" in somef_data:
-            for entry in somef_data["readme_url"]:
-                val = entry.get("result", {}).get("value", "")
-                if val and ("blob" in val.lower() or "readme.md" in val.lower() or "raw" in val.lower()):
-                    good_readme = val
-                    break
-        if good_readme:
-            return f"Update the README property so it points directly to your actual README file ({good_readme}) instead of your homepage."
-    
-    elif pitfall_code == "P007":
-        codemeta_link = None
-        if "reference_publication" in somef_data:
-            for entry in somef_data["reference_publication"]:
-                if "codemeta.json" in entry.get("source", ""):
-                    codemeta_link = entry.get("result", {}).get("value", "")
-                    break
-        if codemeta_link:
-            return f"Add a referencePublication field with the related DOI or citation entry ({codemeta_link}) to your CITATION.cff."
-
-    elif pitfall_code == "P009":
-        if github_api_repo:
-            return f"You need to update the codeRepository field to point directly to your repository's source code ({github_api_repo}) instead of a homepage."
-
-    elif pitfall_code == "P011":
-        issue_url = pitfall_result.get("issue_url")
-        if issue_url:
-            return f"You need to correct the issue tracker URL ({issue_url}) so it follows a valid format (e.g., https://github.com/user/repo/issues or https://gitlab.com/namespace/project/-/issues)."
-
-    elif pitfall_code == "P012":
-        download_url = pitfall_result.get("download_url")
-        if download_url:
-            return f"You need to update the downloadURL field ({download_url}) to point to your latest release or current distribution source."
-
-    elif pitfall_code == "P014":
-        identifier = pitfall_result.get("identifier_value", "")
-        if identifier and isinstance(identifier, str):
-            import re
-            cleaned_id = re.sub(r'^doi:', '', identifier, flags=re.IGNORECASE).replace('https://doi.org/', '')
-            if cleaned_id.startswith('10.'):
-                return f"You should include the full DOI URL form in your metadata (e.g., https://doi.org/{cleaned_id})"
-
-    elif pitfall_code == "P016":
-        if github_api_repo:
-            return f"Make sure that the codeRepository URL in your metadata exactly matches the repository hosting your source code ({github_api_repo})."
-
-    elif pitfall_code == "P017":
-        if github_api_repo:
-            return f"You need to synchronize all version references across metadata and build configuration files. (Repository matches github API: {github_api_repo})"
-
-    elif pitfall_code == "P018":
-        identifier = pitfall_result.get("identifier_value", "")
-        if identifier and isinstance(identifier, str) and identifier.startswith("swh:"):
-            return f"Always use the full resolvable SWHID URL (e.g., https://archive.softwareheritage.org/{identifier})."
-
-    elif pitfall_code == "W002":
-        github_date = pitfall_result.get("github_api_date_parsed")
-        if github_date:
-            return f"The data in the metadata file should be updated to be aligned with the date of the latest release ({github_date})."
-
-    elif pitfall_code == "W003":
-        found_license = None
-        if "license" in somef_data:
-            for entry in somef_data["license"]:
-                src = entry.get("source", "")
-                if isinstance(src, list):
-                    src = src[0] if src else ""
-                src_str = str(src).lower()
-                tech = entry.get("technique", "")
-                is_file_search = ("license" in src_str or tech == "file_exploration")
-                if is_file_search:
-                    val = entry.get("result", {}).get("value")
-                    spdx = entry.get("result", {}).get("spdx_id")
-                    name = entry.get("result", {}).get("name")
-                    found_license = spdx or name or (val if val and len(str(val)) < 50 else None)
-                    if found_license:
-                        break
-        if found_license:
-            return f"Use the LICENSE that is stated in your repository ({found_license}) instead."
-
-    elif pitfall_code == "W004":
-        if "programming_languages" in somef_data:
-            valid_langs = []
-            for entry in somef_data["programming_languages"]:
-                res = entry.get("result", {})
-                name = res.get("name")
-                ver = res.get("version")
-                if name and ver:
-                    valid_langs.append(f"{name} ({ver})")
-            if valid_langs:
-                langs_str = ", ".join(valid_langs)
-                return f"Specify version numbers for your programming languages like found in other sources: {langs_str}."
-
-    elif pitfall_code == "W005":
-        reqs = pitfall_result.get("requirement_string", "")
-        if reqs and isinstance(reqs, str):
-            proper = "', '".join([r.strip() for r in reqs.replace(';', ',').split(',') if r.strip()])
-            if proper:
-                return f"Rewrite your dependencies as a proper list (e.g., ['{proper}']), with each item separated and preferably with their versions."
-
-    elif pitfall_code == "W006":
-        other_id = pitfall_result.get("other_identifier")
-        if other_id:
-            return f"You should replace plain name in your identifier field with persistent identifiers such as {other_id} to improve discoverability."
-
-    elif pitfall_code == "W008":
-        author_val = pitfall_result.get("author_value", "")
-        if author_val:
-            import re
-            list_content = re.findall(r"\[(.*?)\]", str(author_val))
-            if list_content and len(list_content) > 0 and "," in list_content[0]:
-                parts = [p.strip().strip("'\"") for p in list_content[0].split(',')]
-                if parts:
-                    example = "{" + f'"@type": "Person", "givenName": "{parts[0]}", "familyName": "..."' + "}"
-                    return f"Ensure givenName is a single string per person. For example: {example}."
-
-    elif pitfall_code == "W010":
-        if github_api_repo:
-            return f"You should replace the remote-style syntax with a full web-accessible URL (e.g., {github_api_repo})."
-
-    suggestions = {
-        # This works as fallback in case the dynamic suggestions does not find the necessary metadata in SoMEF report
-        # Pitfalls
-        "P001": "Ensure the version in your metadata matches the latest official release. Keeping these synchronized avoids confusion for users and improves reproducibility.",
-        "P002": "Update the copyright section with accurate names, organizations, and the current year. Personalizing this section ensures clarity and legal accuracy.",
-        "P003": "You should separate multiple authors into a structured list. This allows tools and citation systems to correctly identify and credit each contributor.",
-        "P004": "Update the README property so it points directly to your actual README file instead of your homepage. This helps ensure users and automated tools can access your project documentation easily.",
-        "P005": "Ensure that the referencePublication field points to the scholarly paper describing the software, not to a software archive or repository entry.",
-        "P006": "You need to replace local file paths with recognized SPDX license identifiers, such as MIT or GPL-3.0-only in URL form. This ensures your license can be correctly detected by automated tools.",
-        "P007": "Add a referencePublication field with the related DOI or citation entry to your CITATION.cff. This will help link your work to its scholarly references.",
-        "P008": "Verify and update any dependency links to ensure they lead to valid and accessible pages.",
-        "P009": "You need to update the codeRepository field to point directly to your repository's source code instead of a homepage. Accurate links improve traceability and user access.",
-        "P010": "You need to include the complete text of a recognized license such as MIT, Apache 2.0, or GPL. A full license clarifies rights and usage conditions for others",
-        "P011": "You need to correct the issue tracker URL so it follows a valid format, such as https://github.com/user/repo/issues. Proper links help users engage with your development process.",
-        "P012": "You need to update the downloadURL field to point to your latest release or current distribution source. Outdated links can mislead users or cause failed installations.",
-        "P013": "You should declare the specific version of the license using a recognized SPDX identifier. For example, use 'GPL-3.0-only' or 'GPL-2.0-or-later' instead of simply 'GPL'",
-        "P014": "You should include the full DOI URL form in your metadata (e.g., https://doi.org/XX.XXXX/zenodo.XXXX)",
-        "P015": "You need to update the outdated URLs to point to the current CI platform, or remove the property if no active CI is in place. A good practice would be to periodically test all external links, especially those related to CI or build status.",
-        "P016": "Make sure that the codeRepository URL in your metadata exactly matches the repository hosting your source code.",
-        "P017": "You need to synchronize all version references across metadata and build configuration files.",
-        "P018": "Always use the full resolvable SWHID URL (e.g., https://archive.softwareheritage.org/swh:1:dir:abcd.../). This will ensure that both humans and machines can access the archived software snapshot directly",
-        "P019": "Ensure that the number of authors is consistent across all metadata files. Inconsistencies may signal that some contributors are missing in certain files.",
 
-        # Warnings
-        "W001": "Add version numbers to your dependencies. This provides stability for users and allows reproducibility across different environments.",
-        "W002": "The data in the metadata file should be updated to be aligned with the date of the latest release. Automating this synchronization as part of your release process is highly recommended.",
-        "W003": "Make sure you are using the correct licenses. This avoids confusion about terms of use and ensures full transparency.",
-        "W004": "Include version numbers for each programming language used. Defining these helps ensure reproducibility and compatibility across systems.",
-        "W005": "Rewrite your dependencies as a proper list, with each item separated and preferably with their versions. This makes them easier to parse for metadata systems.",
-        "W006": "You should replace plain name in your identifier field with persistent identifiers, such as DOIs or SWHIDs, to improve discoverability and interoperability.",
-        "W007": "Add a valid unique identifier to the identifier field in codemeta.json, such as a DOI or SWHID.",
-        "W008": "Ensure givenName is a single string per person. This ensures that every author is properly credited and can be extracted automatically",
-        "W009": "You need to replace URLs in the developmentStatus field with descriptive text values, such as 'active', 'beta', or 'stable'. This maintains schema compliance and clarity.",
-        "W010": "You should replace the remote-style syntax with a full web-accessible URL (e.g., https://github.com/user/repo).",
-    }
+@_suggestion("W006")
+def _identifier_name_suggestion(pitfall_result: Dict) -> Optional[str]:
+    other_id = pitfall_result.get("other_identifier")
+    if other_id:
+        return f"You should replace plain name in your identifier field with persistent identifiers such as {other_id} to improve discoverability."
+    return None
+
 
-    return suggestions.get(pitfall_code, f"Review and address the issue described for {pitfall_code}")
+@_suggestion("W008")
+def _given_name_suggestion(pitfall_result: Dict) -> Optional[str]:
+    author_val = pitfall_result.get("author_value", "")
+    if author_val:
+        list_content = _BRACKETED_LIST.findall(str(author_val))
+        if list_content and len(list_content) > 0 and "," in list_content[0]:
+            parts = [p.strip().strip("'\"") for p in list_content[0].split(',')]
+            if parts:
+                example = "{" + f'"@type": "Person", "givenName": "{parts[0]}", "familyName": "..."' + "}"
+                return f"Ensure givenName is a single string per person. For example: {example}."
+    return None
+
+
+@_suggestion("W010", needs=("github_api_repo",))
+def _git_shorthand_suggestion(pitfall_result: Dict, github_api_repo: Optional[str]) -> Optional[str]:
+    if github_api_repo:
+        return f"You should replace the remote-style syntax with a full web-accessible URL (e.g., {github_api_repo})."
+    return None
+
+
+# This works as fallback in case the dynamic suggestions does not find the necessary metadata in SoMEF report
+_DEFAULT_SUGGESTIONS = {
+    # Pitfalls
+    "P001": "Ensure the version in your metadata matches the latest official release. Keeping these synchronized avoids confusion for users and improves reproducibility.",
+    "P002": "Update the copyright section with accurate names, organizations, and the current year. Personalizing this section ensures clarity and legal accuracy.",
+    "P003": "You should separate multiple authors into a structured list. This allows tools and citation systems to correctly identify and credit each contributor.",
+    "P004": "Update the README property so it points directly to your actual README file instead of your homepage. This helps ensure users and automated tools can access your project documentation easily.",
+    "P005": "Ensure that the referencePublication field points to the scholarly paper describing the software, not to a software archive or repository entry.",
+    "P006": "You need to replace local file paths with recognized SPDX license identifiers, such as MIT or GPL-3.0-only in URL form. This ensures your license can be correctly detected by automated tools.",
+    "P007": "Add a referencePublication field with the related DOI or citation entry to your CITATION.cff. This will help link your work to its scholarly references.",
+    "P008": "Verify and update any dependency links to ensure they lead to valid and accessible pages.",
+    "P009": "You need to update the codeRepository field to point directly to your repository's source code instead of a homepage. Accurate links improve traceability and user access.",
+    "P010": "You need to include the complete text of a recognized license such as MIT, Apache 2.0, or GPL. A full license clarifies rights and usage conditions for others",
+    "P011": "You need to correct the issue tracker URL so it follows a valid format, such as https://github.com/user/repo/issues. Proper links help users engage with your development process.",
+    "P012": "You need to update the downloadURL field to point to your latest release or current distribution source. Outdated links can mislead users or cause failed installations.",
+    "P013": "You should declare the specific version of the license using a recognized SPDX identifier. For example, use 'GPL-3.0-only' or 'GPL-2.0-or-later' instead of simply 'GPL'",
+    "P014": "You should include the full DOI URL form in your metadata (e.g., https://doi.org/XX.XXXX/zenodo.XXXX)",
+    "P015": "You need to update the outdated URLs to point to the current CI platform, or remove the property if no active CI is in place. A good practice would be to periodically test all external links, especially those related to CI or build status.",
+    "P016": "Make sure that the codeRepository URL in your metadata exactly matches the repository hosting your source code.",
+    "P017": "You need to synchronize all version references across metadata and build configuration files.",
+    "P018": "Always use the full resolvable SWHID URL (e.g., https://archive.softwareheritage.org/swh:1:dir:abcd.../). This will ensure that both humans and machines can access the archived software snapshot directly",
+    "P019": "Ensure that the number of authors is consistent across all metadata files. Inconsistencies may signal that some contributors are missing in certain files.",
+
+    # Warnings
+    "W001": "Add version numbers to your dependencies. This provides stability for users and allows reproducibility across different environments.",
+    "W002": "The data in the metadata file should be updated to be aligned with the date of the latest release. Automating this synchronization as part of your release process is highly recommended.",
+    "W003": "Make sure you are using the correct licenses. This avoids confusion about terms of use and ensures full transparency.",
+    "W004": "Include version numbers for each programming language used. Defining these helps ensure reproducibility and compatibility across systems.",
+    "W005": "Rewrite your dependencies as a proper list, with each item separated and preferably with their versions. This makes them easier to parse for metadata systems.",
+    "W006": "You should replace plain name in your identifier field with persistent identifiers, such as DOIs or SWHIDs, to improve discoverability and interoperability.",
+    "W007": "Add a valid unique identifier to the identifier field in codemeta.json, such as a DOI or SWHID.",
+    "W008": "Ensure givenName is a single string per person. This ensures that every author is properly credited and can be extracted automatically",
+    "W009": "You need to replace URLs in the developmentStatus field with descriptive text values, such as 'active', 'beta', or 'stable'. This maintains schema compliance and clarity.",
+    "W010": "You should replace the remote-style syntax with a full web-accessible URL (e.g., https://github.com/user/repo).",
+}
+
+
+def get_suggestion_text(
+    pitfall_code: str,
+    pitfall_result: Dict = None,
+    somef_data: Dict = None,
+    lookups: RepositoryLookups = None,
+) -> str:
+    """
+    Adds the suggestions depending on the Pitfall/Warning, dynamically populated if data is provided.
+    lookups, when given, shares the repository-level values across the checks of a repository.
+    """
+    if pitfall_result is None:
+        pitfall_result = {}
+    if lookups is None:
+        lookups = RepositoryLookups(somef_data)
+
+    template = _SUGGESTION_TEMPLATES.get(pitfall_code)
+    if template is not None:
+        needs, render = template
+        suggestion = render(pitfall_result, **{name: getattr(lookups, name) for name in needs})
+        if suggestion is not None:
+            return suggestion
+
+    return _DEFAULT_SUGGESTIONS.get(pitfall_code, f"Review and address the issue described for {pitfall_code}")
 
 
 def extract_description_info(somef_data: Dict) -> str:
@@ -754,12 +874,55 @@ def convert_sets_to_lists(obj):
         return obj
 
 
-def create_pitfall_jsonld(somef_data: Dict, pitfall_results: List[Dict], file_name: str, verbose: bool = False) -> Dict:
+def compute_check_id(pitfall_code: str, output: str, evidence: str, suggestion: str) -> str:
+    """
+    Compute the stable identifier of a check from (code, output, evidence, suggestion).
+
+    The identifier is the SHA-256 hex digest of the four fields, in that order, each encoded
+    in UTF-8 and prefixed with its byte length and a colon (e.g. ``4:P001``). The length
+    prefix keeps the encoding unambiguous whatever characters the texts contain, and the
+    same check always gets the same id across runs.
+    """
+    digest = hashlib.sha256()
+    for value in (pitfall_code, output, evidence, suggestion):
+        encoded = value.encode("utf-8")
+        digest.update(b"%d:" % len(encoded))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _incomplete_check(detector_result: DetectorResult) -> Dict:
+    """CheckResult of a check whose detector did not finish within its time budget."""
+    pitfall_code = detector_result.code
+    evidence_val = f"{pitfall_code} incomplete: the check did not finish within {detector_result.evidence['timeout']:g}s"
+    check_result = {
+        "@type": "CheckResult",
+        "assessesIndicator": {"@id": f"https://w3id.org/rsmetacheck/catalog/#{pitfall_code}"},
+        "process": get_pitfall_description(pitfall_code),
+        "status": {"@id": "schema:FailedActionStatus"},
+        "output": "incomplete",
+        "evidence": evidence_val,
+        "suggestion": "N/A"
+    }
+    check_result["checkId"] = compute_check_id(pitfall_code, "incomplete", evidence_val, "N/A")
+    return check_result
+
+
+def create_pitfall_jsonld(
+    somef_data: Dict,
+    pitfall_results: List[DetectorResult],
+    file_name: str,
+    verbose: bool = False,
+    commit_id: str = None,
+) -> Dict:
     """
     Create a JSON-LD structure for detected pitfalls following the sample format.
+    Detector results are converted to their dict form here, and only for the checks
+    that end up in the output. commit_id, when already resolved, saves a lookup.
+    Checks that timed out are always listed, with the output "incomplete".
     """
-    import hashlib
-    software_info = extract_software_info_from_somef(somef_data)
+    software_info = extract_software_info_from_somef(somef_data, commit_id)
+    lookups = RepositoryLookups(somef_data)
     description_info = extract_description_info(somef_data)
 
     jsonld_output = {
@@ -784,18 +947,27 @@ def create_pitfall_jsonld(somef_data: Dict, pitfall_results: List[Dict], file_na
         "checks": []
     }
 
-    for pitfall_result in pitfall_results:
-        has_pitfall = pitfall_result.get("has_pitfall", False)
-        has_warning = pitfall_result.get("has_warning", False)
-        has_issue = has_pitfall or has_warning
-        
+    for detector_result in pitfall_results:
+        if isinstance(detector_result, DetectorResult) and detector_result.incomplete:
+            jsonld_output["checks"].append(_incomplete_check(detector_result))
+            continue
+
+        if isinstance(detector_result, DetectorResult):
+            has_issue = detector_result.has_issue
+            pitfall_code = detector_result.code
+        else:
+            has_issue = detector_result.get("has_pitfall", False) or detector_result.get("has_warning", False)
+            pitfall_code = detector_result.get("pitfall_code", "Unknown")
+
         if has_issue or verbose:
-            pitfall_code = pitfall_result.get("pitfall_code", "Unknown")
-            category = get_pitfall_category(pitfall_code)
-            
+            if has_issue and isinstance(detector_result, DetectorResult):
+                pitfall_result = detector_result.to_dict()
+            else:
+                pitfall_result = detector_result
+
             output_val = "true" if has_issue else "false"
             evidence_val = format_evidence_text(pitfall_code, pitfall_result) if has_issue else f"{pitfall_code} not detected:"
-            suggestion_val = get_suggestion_text(pitfall_code, pitfall_result, somef_data) if has_issue else "N/A"
+            suggestion_val = get_suggestion_text(pitfall_code, pitfall_result, somef_data, lookups) if has_issue else "N/A"
 
             check_result = {
                 "@type": "CheckResult",
@@ -806,9 +978,7 @@ def create_pitfall_jsonld(somef_data: Dict, pitfall_results: List[Dict], file_na
                 "evidence": evidence_val,
                 "suggestion": suggestion_val
             }
-            
-            check_hash = hashlib.sha256(json.dumps(check_result, sort_keys=True).encode("utf-8")).hexdigest()
-            check_result["checkId"] = check_hash
+            check_result["checkId"] = compute_check_id(pitfall_code, output_val, evidence_val, suggestion_val)
 
             jsonld_output["checks"].append(check_result)
 
@@ -825,10 +995,7 @@ def save_individual_pitfall_jsonld(jsonld_data: Dict, output_dir: Path, file_nam
     output_file = output_dir / f"{base_name}_pitfalls.jsonld"
 
     try:
-        serializable_data = convert_sets_to_lists(jsonld_data)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(serializable_data, f, indent=2, ensure_ascii=False)
+        write_json(jsonld_data, output_file)
 
         return str(output_file)
     except Exception as e:
@@ -0,0 +1,77 @@
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Iterator, Tuple, Union
+
+from rsmetacheck.utils import serialization
+from rsmetacheck.utils.json_ld_utils import save_individual_pitfall_jsonld
+from rsmetacheck.utils.serialization import json_default
+
+
+def _open_stream(path: Path, mode: str):
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class PitfallStreamWriter:
+    """
+    Write the JSON-LD assessments of a whole batch into a single JSON Lines file.
+
+    Each line is a record ``{"file_name": ..., "assessment": {...}}`` so the per-repository
+    files can be recreated later with export_pitfall_stream. A ``.gz`` suffix writes
+    gzip-compressed NDJSON.
+    """
+
+    def __init__(self, path: Union[str, Path], compact: bool = True):
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.compact = compact
+        self.records_written = 0
+        self._handle = _open_stream(self.path, "wb")
+
+    def write(self, jsonld_data: Dict, file_name: str) -> None:
+        record = {"file_name": file_name, "assessment": jsonld_data}
+        if self.compact:
+            line = serialization.dumps(record, compact=True)
+        else:
+            line = json.dumps(record, ensure_ascii=False, default=json_default)
+        self._handle.write(line.encode("utf-8") + b"\n")
+        self.records_written += 1
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_pitfall_stream(path: Union[str, Path]) -> Iterator[Tuple[str, Dict]]:
+    """
+    Yield (file_name, assessment) pairs from a JSON Lines stream written by PitfallStreamWriter.
+    Blank lines are ignored.
+    """
+    with _open_stream(Path(path), "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = serialization.loads(line)
+            yield record["file_name"], record["assessment"]
+
+
+def export_pitfall_stream(stream_path: Union[str, Path], output_dir: Union[str, Path]) -> int:
+    """
+    Recreate the per-repository ``<name>_pitfalls.jsonld`` files from a JSON Lines stream.
+    Returns the number of files written.
+    """
+    output_dir = Path(output_dir)
+    files_created = 0
+    for file_name, assessment in read_pitfall_stream(stream_path):
+        if save_individual_pitfall_jsonld(assessment, output_dir, file_name):
+            files_created += 1
+    return files_created
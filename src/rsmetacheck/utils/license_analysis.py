@@ -0,0 +1,199 @@
+"""
+Shared analysis of the ``license`` entries of a SoMEF output.
+
+P002, P006, P010, P013 and W003 all look at the same license entries. LicenseView walks
+them once per repository and classifies each entry (LICENSE file or metadata file, code
+parser or not, license family and version presence), so every detector uses the same
+matching rules. The view is cached (see cached_category_view), which lets the detectors
+keep their (somef_data, file_name) signature and still share one pass.
+"""
+import re
+from typing import Dict, List, Optional
+
+from rsmetacheck.utils.pitfall_utils import CategoryEntry, cached_category_view
+
+_PLACEHOLDER_PATTERN = re.compile("|".join([
+    r'<program>',
+    r'<year>',
+    r'<name of author>',
+    r'<name>',
+    r'<copyright holders?>',
+    r'<owner>',
+    r'<author>',
+    r'\[year\]',
+    r'\[fullname\]',
+    r'\[name\]',
+    r'\[copyright holder\]',
+    r'<yyyy>',
+    r'<name of copyright owner>',
+    r'\[yyyy\]',
+    r'\[name of copyright owner\]',
+]))
+
+_COPYRIGHT_PATTERNS = [
+    re.compile(r'year\s*:\s*\d{4}'),  # YEAR: 2017
+    re.compile(r'copyright\s+holder\s*:\s*[a-zA-Z]'),  # COPYRIGHT HOLDER: Someone
+    re.compile(r'author\s*:\s*[a-zA-Z]'),  # AUTHOR: Someone
+    re.compile(r'copyright\s*©?\s*\d{4}'),  # Copyright 2017 or Copyright © 2017
+    re.compile(r'\(c\)\s*\d{4}'),  # (C) 2017
+]
+_ANY_COPYRIGHT = re.compile("|".join(pattern.pattern for pattern in _COPYRIGHT_PATTERNS))
+
+_LICENSE_TERMS = re.compile("|".join([
+    r'permission\s+is\s+hereby\s+granted',
+    r'subject\s+to\s+the\s+following\s+conditions',
+    r'redistribution\s+and\s+use',
+    r'without\s+restriction',
+    r'without\s+warranty',
+    r'liability',
+    r'terms\s+and\s+conditions',
+    r'licensed\s+under',
+    r'mit\s+license',
+    r'apache\s+license',
+    r'gnu\s+general\s+public\s+license',
+    r'bsd\s+license',
+    r'creative\s+commons',
+]))
+
+_YEAR_FIELD = re.compile(r'year\s*:\s*\d{4}')
+_COPYRIGHT_HOLDER_FIELD = re.compile(r'copyright\s+holder\s*:')
+
+# License families that should carry a version, with the pattern of a versioned mention.
+_VERSIONED_FAMILIES = [
+    (name, re.compile(rf"\b{name}\b"), re.compile(version_pattern, re.IGNORECASE))
+    for name, version_pattern in [
+        ("GPL", r"\bGPL[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?"),
+        ("LGPL", r"\bLGPL[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?"),
+        ("AGPL", r"\bAGPL[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?"),
+        ("Apache", r"\bApache[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?"),
+        ("CC", r"\bCC[- ]BY[-\s]?\(?\s*(?:>=?|<=?|>|<|=)?\s*\d+(\.\d+)?\)?"),
+        ("BSD", r"\bBSD[-\s]\d+[-\s]Clause"),
+    ]
+]
+
+_DUAL_LICENSE_PATTERN = re.compile("|".join([
+    r"dual[\s-]?licen[cs]ed?",
+    r"dually[\s-]?licen[cs]ed?",
+    r"multiple[\s-]?licen[cs]es?",
+    r"(?:is|are)\s+licen[cs]ed?\s+under.*\b(?:and|or)\b.*licen[cs]e",
+    r"choose.*\b(?:between|from|your)\b.*licen[cs]e",
+    r"\beither\b.*\bor\b.*licen[cs]e",
+    r"\d+\..*licen[cs]e.*\n.*\d+\..*licen[cs]e",
+    r"licen[cs]e.*options?",
+    r"available\s+under.*\b(?:two|multiple|either)\b.*licen[cs]es?",
+    r"licen[cs]ed?\s+under.*\b(?:and|or)\b",
+]))
+
+
+def has_template_placeholders(license_content) -> bool:
+    """True if license content contains template placeholders like <program>, <year>, <name of author>."""
+    if not license_content:
+        return False
+    return _PLACEHOLDER_PATTERN.search(license_content.lower()) is not None
+
+
+def is_copyright_only(license_content) -> bool:
+    """
+    True if license content only contains copyright information without license terms, e.g.
+    YEAR: 2017
+    COPYRIGHT HOLDER: Adam H. Sparks
+    """
+    if not license_content:
+        return False
+
+    content_lower = license_content.lower().strip()
+    if _LICENSE_TERMS.search(content_lower):
+        return False
+
+    content_lines = [line.strip() for line in license_content.strip().split('\n') if line.strip()]
+    has_copyright_info = _ANY_COPYRIGHT.search(content_lower) is not None
+
+    # Copyright info, no license terms and short: likely copyright-only
+    if has_copyright_info and len(content_lines) <= 10:
+        return True
+
+    # The exact format "YEAR: xxxx" and "COPYRIGHT HOLDER: xxxx"
+    if _YEAR_FIELD.search(content_lower) and _COPYRIGHT_HOLDER_FIELD.search(content_lower):
+        return True
+
+    if len(content_lines) <= 5:
+        meaningful_lines = [
+            line for line in content_lines
+            if not _ANY_COPYRIGHT.search(line.lower())
+            and not line.startswith('#')
+            and not line.startswith('//')
+            and line not in ['-', '=', '*']
+        ]
+        if len(meaningful_lines) <= 1 and has_copyright_info:
+            return True
+
+    return False
+
+
+def unversioned_families(license_value: str) -> List[str]:
+    """
+    Families (GPL, LGPL, AGPL, Apache, CC, BSD) named in a license value without a version.
+    0BSD and LicenseRef- identifiers are never reported.
+    """
+    if "0BSD" in license_value:
+        return []
+    license_upper = license_value.upper()
+    if "LICENSEREF-" in license_upper:
+        return []
+    return [
+        name for name, name_pattern, version_pattern in _VERSIONED_FAMILIES
+        if name_pattern.search(license_upper) and not version_pattern.search(license_upper)
+    ]
+
+
+class LicenseEntry(CategoryEntry):
+    """One license entry of a SoMEF output, classified once."""
+
+    __slots__ = ("is_license_file", "_families")
+
+    def __init__(self, entry: Dict):
+        super().__init__(entry)
+        # A LICENSE/COPYING-style file found in the repository, read as text.
+        self.is_license_file = self.has_source and "license" in self.source_lower
+        self._families = None
+
+    def unversioned_families(self) -> List[str]:
+        if self._families is None:
+            self._families = unversioned_families(self.value) if isinstance(self.value, str) else []
+        return self._families
+
+
+class LicenseView:
+    """The license entries of one SoMEF output with the signals the license checks share."""
+
+    def __init__(self, entries: List):
+        self.entries = [LicenseEntry(entry) for entry in entries if isinstance(entry, dict)]
+        self.license_file = next(
+            (entry for entry in self.entries if entry.is_license_file and entry.has_value), None
+        )
+        self._dual_license_entry = False
+
+    def metadata_entries(self) -> List[LicenseEntry]:
+        return [entry for entry in self.entries if entry.is_metadata]
+
+    def codemeta_license_count(self) -> int:
+        return sum(1 for entry in self.entries if entry.is_code_parser and entry.is_codemeta)
+
+    def dual_license_entry(self) -> Optional[LicenseEntry]:
+        """First entry outside codemeta.json whose text says the software has several licenses."""
+        if self._dual_license_entry is False:
+            self._dual_license_entry = next(
+                (
+                    entry for entry in self.entries
+                    if not (entry.is_code_parser and entry.is_codemeta)
+                    and isinstance(entry.value, str)
+                    and _DUAL_LICENSE_PATTERN.search(entry.value.lower())
+                ),
+                None,
+            )
+        return self._dual_license_entry
+
+
+def license_view(somef_data: Dict) -> Optional[LicenseView]:
+    """LicenseView of somef_data["license"] (shared by the detectors of a repository), or None."""
+    return cached_category_view(somef_data, "license", LicenseView)
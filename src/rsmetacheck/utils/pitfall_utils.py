@@ -1,6 +1,26 @@
-import re
+import contextlib
 import os
-from typing import Dict, List
+import threading
+from typing import Callable, Dict, List, Optional
+
+from rsmetacheck.utils.version_analysis import normalize_version  # noqa: F401
+
+# Metadata files SoMEF parses, lowercased.
+METADATA_SOURCES = (
+    "codemeta.json", "description", "composer.json", "package.json", "pom.xml", "pyproject.toml",
+    "requirements.txt", "setup.py",
+)
+_METADATA_FILE_NAMES = frozenset(METADATA_SOURCES)
+
+
+def is_metadata_file_source(source: str) -> bool:
+    """
+    Whether a SoMEF source (path or URL) names a metadata file SoMEF parses. Only the file
+    name is compared, so a repository or directory named after one ("text-description-tool")
+    does not count.
+    """
+    filename = source.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+    return filename.lower() in _METADATA_FILE_NAMES
 
 
 def extract_programming_languages(somef_data: Dict) -> List[str]:
@@ -61,16 +81,6 @@ def normalize_language_name(lang_name: str) -> str:
     return target_map.get(lang_name.lower(), lang_name)
 
 
-def normalize_version(version: str) -> str:
-    """
-    Normalize version string for comparison by removing common prefixes like 'v'.
-    """
-    if not version:
-        return ""
-
-    normalized = re.sub(r'^v', '', version, flags=re.IGNORECASE)
-    return normalized.strip()
-
 def extract_metadata_source_filename(source_path: str) -> str:
     """
     Extract the specific metadata file name from a source path.
@@ -92,4 +102,87 @@ def extract_metadata_source_filename(source_path: str) -> str:
     if not filename:
         return "metadata files"
         
-    return filename
\ No newline at end of file
+    return filename
+
+
+class CategoryEntry:
+    """
+    One entry of a SoMEF category with where it comes from, classified once for the
+    detectors that share the category.
+    """
+
+    __slots__ = (
+        "source", "technique", "has_source", "has_result", "result", "has_value", "value",
+        "source_lower", "is_code_parser", "is_metadata_file", "is_codemeta",
+    )
+
+    def __init__(self, entry: Dict):
+        source = entry.get("source", "")
+        self.source = source
+        self.has_source = "source" in entry
+        self.technique = entry.get("technique", "")
+        self.has_result = "result" in entry
+        self.result = entry.get("result")
+        self.has_value = isinstance(self.result, dict) and "value" in self.result
+        self.value = self.result["value"] if self.has_value else None
+
+        self.source_lower = source.lower() if isinstance(source, str) else ""
+        self.is_code_parser = self.technique == "code_parser"
+        self.is_metadata_file = isinstance(source, str) and is_metadata_file_source(source)
+        self.is_codemeta = "codemeta.json" in self.source_lower
+
+    @property
+    def is_metadata(self) -> bool:
+        """Declared by a metadata file parsed by SoMEF (codemeta.json, DESCRIPTION, pom.xml...)."""
+        return self.is_code_parser and self.is_metadata_file
+
+    @property
+    def technique_is_metadata_file(self) -> bool:
+        """Some SoMEF versions name the metadata file as the technique."""
+        return isinstance(self.technique, str) and self.technique.lower() in METADATA_SOURCES
+
+    @property
+    def is_codemeta_entry(self) -> bool:
+        """Read from codemeta.json (by name, or parsed from a codemeta file)."""
+        return self.is_codemeta or (self.is_code_parser and "codemeta" in self.source_lower)
+
+
+_category_views = threading.local()
+
+
+@contextlib.contextmanager
+def shared_category_views():
+    """
+    Within the block, the detectors share the views they build of a SoMEF category
+    (see cached_category_view). Used around the detectors of one repository, whose SoMEF
+    data must not change meanwhile.
+    """
+    previous = getattr(_category_views, "views", None)
+    _category_views.views = {}
+    try:
+        yield
+    finally:
+        _category_views.views = previous
+
+
+def cached_category_view(somef_data: Dict, category: str, build: Callable[[list], object]) -> Optional[object]:
+    """
+    build(somef_data[category]), or None when the category is not a list.
+
+    Inside shared_category_views the view is built once per category list and reused by
+    the following detectors; elsewhere it is built on every call.
+    """
+    entries = somef_data.get(category) if isinstance(somef_data, dict) else None
+    if not isinstance(entries, list):
+        return None
+
+    views = getattr(_category_views, "views", None)
+    if views is None:
+        return build(entries)
+
+    cached = views.get(category)
+    if cached is not None and cached[0] is entries:
+        return cached[1]
+    view = build(entries)
+    views[category] = (entries, view)
+    return view
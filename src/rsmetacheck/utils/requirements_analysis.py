@@ -0,0 +1,222 @@
+"""
+Shared parsing of the ``requirements`` entries of a SoMEF output.
+
+P008, W001, W004 and W005 all read the requirements, which can be one of the largest
+categories of an output. RequirementsView classifies each entry once (source file,
+technique, codemeta.json or another metadata file) and parses it on first use into the
+forms the checks need: the URLs it mentions, its version-annotated parts and its split
+into several requirements. The view is cached (see cached_category_view), so the
+requirements of a repository are parsed once, not once per check.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from rsmetacheck.utils.pitfall_utils import CategoryEntry, cached_category_view
+
+VCS_URL_PREFIXES = ('git+', 'git://', 'svn+', 'hg+', 'bzr+')
+
+_URL_PATTERNS = [
+    re.compile(r'https?://[^\s<>"\']+', re.IGNORECASE),  # HTTP/HTTPS URLs
+    re.compile(r'www\.[^\s<>"\']+', re.IGNORECASE),  # URLs starting with www
+]
+_URL_TRAILING_PUNCTUATION = re.compile(r'[,;.!?)]$')
+
+# Install commands rather than requirements (e.g. "pip install -r requirements.txt").
+_INSTALL_COMMAND = re.compile(r'\b(npm|bash|cd|pip|install)\b')
+_VERSION_OPERATORS = ["==", ">=", "<=", ">", "<", "~=", "!=", "^", "~"]
+_VERSION_NUMBER = re.compile(r'\bv?\d+(\.\d+)+\b')
+
+_COMMA = re.compile(r',\s*')
+_SEMICOLON = re.compile(r';\s*')
+_CAPITALIZED_WORDS = re.compile(r'^([A-Z][a-zA-Z0-9]*(\s+|$)){2,}$')
+_WHITESPACE = re.compile(r'\s+')
+_WIDE_GAP = re.compile(r'\s{2,}')
+
+# Sources whose free-text requirements W005 splits.
+_SPLIT_SOURCES = ("codemeta.json", "setup.py", "pom.xml")
+
+
+def is_valid_url_format(url: str) -> bool:
+    """
+    Check if URL has a valid format.
+    """
+    if url is None:
+        raise ValueError("URL cannot be None")
+
+    if not url or not isinstance(url, str):
+        return False
+
+    if url.startswith(VCS_URL_PREFIXES):
+        return True
+
+    try:
+        result = urlparse(url)
+        return all([result.scheme, result.netloc])
+    except:
+        return False
+
+
+def extract_urls(requirement_text: str) -> List[str]:
+    """URLs mentioned in a requirement text, without trailing punctuation."""
+    if not requirement_text:
+        return []
+
+    urls = []
+    for pattern in _URL_PATTERNS:
+        for url in pattern.findall(requirement_text):
+            url = _URL_TRAILING_PUNCTUATION.sub('', url)
+            if url:
+                urls.append(url)
+    return urls
+
+
+def has_version_spec(requirement: str) -> bool:
+    """True if a requirement string carries a version operator or a version number."""
+    return any(op in requirement for op in _VERSION_OPERATORS) or _VERSION_NUMBER.search(requirement) is not None
+
+
+def split_requirements(requirement_string: str) -> List[str]:
+    """
+    The requirements of a string that lists several of them (comma, semicolon, capitalized
+    words or wide-gap separated), or an empty list if it holds just one.
+    """
+    if not requirement_string or not isinstance(requirement_string, str):
+        return []
+
+    req_str = requirement_string.strip()
+    if _INSTALL_COMMAND.search(req_str.lower()):
+        return []
+
+    if _COMMA.search(req_str):
+        parts = _COMMA.split(req_str)
+    elif _SEMICOLON.search(req_str):
+        parts = _SEMICOLON.split(req_str)
+    elif _CAPITALIZED_WORDS.match(req_str):
+        parts = _WHITESPACE.split(req_str)
+    elif _WIDE_GAP.search(req_str):
+        parts = _WIDE_GAP.split(req_str)
+    else:
+        return []
+
+    detected_requirements = [part.strip() for part in parts if part.strip()]
+    return detected_requirements if len(detected_requirements) > 1 else []
+
+
+def version_parts(requirement) -> List[Tuple[object, bool]]:
+    """
+    (name, has_version) for each dependency of a SoMEF requirement result (a dict or a list
+    of dicts). Comma-separated names count as several dependencies; install commands are
+    skipped.
+    """
+    if isinstance(requirement, dict):
+        requirements_list = [requirement]
+    elif isinstance(requirement, list):
+        requirements_list = requirement
+    else:
+        return []
+
+    parts = []
+    for req in requirements_list:
+        if not isinstance(req, dict):
+            continue
+        req_name = req.get("name", req.get("value", "unknown"))
+        if isinstance(req_name, str) and _INSTALL_COMMAND.search(req_name.lower()):
+            continue
+
+        names = [p.strip() for p in req_name.split(',')] if isinstance(req_name, str) and ',' in req_name else [req_name]
+        has_version_field = "version" in req and bool(req["version"])
+        for name in names:
+            if not name:
+                continue
+            parts.append((name, has_version_field or (isinstance(name, str) and has_version_spec(name))))
+    return parts
+
+
+def requirement_text(value) -> str:
+    """Text of a requirement value, in which URLs are looked for."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    text = ""
+    if isinstance(value, dict):
+        for key in ["name", "value", "description", "text"]:
+            if key in value:
+                text += str(value[key]) + " "
+    return text
+
+
+class RequirementEntry(CategoryEntry):
+    """One requirements entry of a SoMEF output, classified once and parsed on demand."""
+
+    __slots__ = ("is_split_source", "_text", "_urls", "_version_parts", "_split")
+
+    def __init__(self, entry: Dict):
+        super().__init__(entry)
+        self.is_split_source = self.technique_is_metadata_file or any(
+            name in self.source_lower for name in _SPLIT_SOURCES
+        )
+        self._text = self._urls = self._version_parts = self._split = None
+
+    @property
+    def is_url(self) -> bool:
+        """The whole requirement is a URL."""
+        return isinstance(self.value, str) and is_valid_url_format(self.value)
+
+    def text(self) -> str:
+        if self._text is None:
+            self._text = requirement_text(self.value)
+        return self._text
+
+    def urls(self) -> List[str]:
+        """URLs mentioned in the requirement text."""
+        if self._urls is None:
+            self._urls = extract_urls(self.text())
+        return self._urls
+
+    def version_parts(self) -> List[Tuple[object, bool]]:
+        """(name, has_version) of each dependency of the entry's result."""
+        if self._version_parts is None:
+            self._version_parts = version_parts(self.result)
+        return self._version_parts
+
+    def split(self) -> Tuple[Optional[str], List[str]]:
+        """
+        (string, requirements) when the value (or its only item) is a string listing several
+        requirements, (None, []) otherwise.
+        """
+        if self._split is None:
+            string = self.value
+            if isinstance(string, list) and len(string) == 1:
+                string = string[0]
+            detected = split_requirements(string) if isinstance(string, str) else []
+            self._split = (string, detected) if detected else (None, [])
+        return self._split
+
+
+class RequirementsView:
+    """The requirements entries of one SoMEF output."""
+
+    def __init__(self, entries: List):
+        self.entries = [RequirementEntry(entry) for entry in entries if isinstance(entry, dict)]
+
+    def metadata_entries(self) -> List[RequirementEntry]:
+        return [entry for entry in self.entries if entry.is_metadata]
+
+    def metadata_file_entries(self) -> List[RequirementEntry]:
+        """Entries with a result whose source names a metadata file, whatever the technique."""
+        return [entry for entry in self.entries if entry.has_source and entry.is_metadata_file and entry.has_result]
+
+    def split_source_entries(self) -> List[RequirementEntry]:
+        """Entries with a value from the files whose free-text requirements are split (W005)."""
+        return [entry for entry in self.entries if entry.is_split_source and entry.has_value]
+
+    def codemeta_entries(self) -> List[RequirementEntry]:
+        """Entries parsed from codemeta.json."""
+        return [entry for entry in self.entries if entry.is_code_parser and entry.is_codemeta and entry.has_result]
+
+
+def requirements_view(somef_data: Dict) -> Optional[RequirementsView]:
+    """RequirementsView of somef_data["requirements"] (shared by the detectors of a repository), or None."""
+    return cached_category_view(somef_data, "requirements", RequirementsView)
@@ -0,0 +1,230 @@
+"""
+SQLite store of the findings of every analysis run.
+
+Each run records, per analyzed repository, its commit ID, languages and every pitfall,
+warning and note with the evidence and suggestion written to the JSON-LD. Runs accumulate
+in the same database, so questions across runs ("which repositories had P015 last month
+but not now") are answered by the indexed queries below instead of re-reading old
+JSON-LD files and summaries.
+"""
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from rsmetacheck import __version__ as rsmetacheck_version
+
+KIND_PITFALL = "pitfall"
+KIND_WARNING = "warning"
+KIND_NOTE = "note"
+
+DEFAULT_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    rsmetacheck_version TEXT NOT NULL,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS repositories (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    file_name TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    url TEXT,
+    commit_id TEXT
+);
+CREATE TABLE IF NOT EXISTS repository_languages (
+    repository_id INTEGER NOT NULL REFERENCES repositories (id),
+    language TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    repository_id INTEGER NOT NULL REFERENCES repositories (id),
+    run_id INTEGER NOT NULL,
+    code TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    evidence TEXT,
+    suggestion TEXT
+);
+CREATE INDEX IF NOT EXISTS repositories_run ON repositories (run_id, repository);
+CREATE INDEX IF NOT EXISTS repository_languages_repository ON repository_languages (repository_id);
+CREATE INDEX IF NOT EXISTS findings_run_code ON findings (run_id, code);
+CREATE INDEX IF NOT EXISTS findings_repository ON findings (repository_id);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ResultsStore:
+    """
+    Results database, written by one analysis run at a time.
+
+    start_run opens a run; add_repository buffers one repository and its findings, and the
+    buffer is inserted in a single transaction every batch_size repositories and when the
+    run finishes. The query methods can be used on any database, including while a run is
+    being written.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.batch_size = batch_size
+        self.run_id: Optional[int] = None
+        self._pending: List[tuple] = []
+        self._connection = sqlite3.connect(str(self.path), timeout=60, isolation_level=None)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start_run(self, label: Optional[str] = None) -> int:
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started_at, rsmetacheck_version, label) VALUES (?, ?, ?)",
+                (_now(), rsmetacheck_version, label),
+            )
+        self.run_id = cursor.lastrowid
+        return self.run_id
+
+    def add_repository(
+        self,
+        file_name: str,
+        repository: str,
+        url: Optional[str],
+        commit_id: Optional[str],
+        languages: Iterable[str],
+        findings: Iterable[tuple],
+    ):
+        """Buffer one analyzed repository; findings are (code, kind, evidence, suggestion) tuples."""
+        if self.run_id is None:
+            raise RuntimeError("start_run must be called before adding repositories")
+        self._pending.append((file_name, repository, url, commit_id, list(languages), list(findings)))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Insert the buffered repositories in one transaction."""
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.execute("BEGIN")
+            for file_name, repository, url, commit_id, languages, findings in self._pending:
+                cursor = self._connection.execute(
+                    "INSERT INTO repositories (run_id, file_name, repository, url, commit_id) VALUES (?, ?, ?, ?, ?)",
+                    (self.run_id, file_name, repository, url, commit_id),
+                )
+                repository_id = cursor.lastrowid
+                self._connection.executemany(
+                    "INSERT INTO repository_languages (repository_id, language) VALUES (?, ?)",
+                    [(repository_id, language) for language in languages],
+                )
+                self._connection.executemany(
+                    "INSERT INTO findings (repository_id, run_id, code, kind, evidence, suggestion) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(repository_id, self.run_id, *finding) for finding in findings],
+                )
+        self._pending = []
+
+    def finish_run(self):
+        self.flush()
+        with self._connection:
+            self._connection.execute("UPDATE runs SET finished_at = ? WHERE id = ?", (_now(), self.run_id))
+
+    # Queries
+
+    def runs(self) -> List[Dict]:
+        """Every run with its number of repositories and findings, oldest first."""
+        rows = self._connection.execute(
+            "SELECT runs.id, runs.started_at, runs.finished_at, runs.rsmetacheck_version, runs.label, "
+            "(SELECT COUNT(*) FROM repositories WHERE run_id = runs.id), "
+            "(SELECT COUNT(*) FROM findings WHERE run_id = runs.id AND kind != ?) "
+            "FROM runs ORDER BY runs.id",
+            (KIND_NOTE,),
+        ).fetchall()
+        keys = ("run", "started_at", "finished_at", "rsmetacheck_version", "label", "repositories", "findings")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def resolve_run(self, run: Union[int, str, None] = None) -> Optional[int]:
+        """
+        Run ID for a run ID, an ISO date (the last run started on or before that day), or
+        None (the latest run). Returns None when no run matches.
+        """
+        if run is None:
+            row = self._connection.execute("SELECT MAX(id) FROM runs").fetchone()
+        elif str(run).isdigit():
+            row = self._connection.execute("SELECT id FROM runs WHERE id = ?", (int(run),)).fetchone()
+        else:
+            row = self._connection.execute(
+                "SELECT MAX(id) FROM runs WHERE substr(started_at, 1, ?) <= ?", (len(str(run)), str(run))
+            ).fetchone()
+        return row[0] if row else None
+
+    def code_counts(self, run_id: int) -> List[Dict]:
+        """Number of repositories with each code in a run, most frequent first."""
+        total = self._connection.execute(
+            "SELECT COUNT(*) FROM repositories WHERE run_id = ?", (run_id,)
+        ).fetchone()[0]
+        rows = self._connection.execute(
+            "SELECT code, kind, COUNT(DISTINCT repository_id) AS n FROM findings "
+            "WHERE run_id = ? AND kind != ? GROUP BY code, kind ORDER BY n DESC, code",
+            (run_id, KIND_NOTE),
+        ).fetchall()
+        return [
+            {"code": code, "kind": kind, "repositories": n, "percentage": round(n / total * 100, 2) if total else 0.0}
+            for code, kind, n in rows
+        ]
+
+    def language_counts(self, run_id: int, code: Optional[str] = None) -> List[Dict]:
+        """Repositories per language in a run, and how many of them have code (or any finding)."""
+        # Notes are not findings: a repository with only a note for code is not affected.
+        finding_filter = "AND f.code = ? AND f.kind != ?" if code else "AND f.kind != ?"
+        parameters = (code, KIND_NOTE) if code else (KIND_NOTE,)
+        rows = self._connection.execute(
+            "SELECT l.language, COUNT(DISTINCT r.id), COUNT(DISTINCT f.repository_id) "
+            "FROM repositories r JOIN repository_languages l ON l.repository_id = r.id "
+            f"LEFT JOIN findings f ON f.repository_id = r.id {finding_filter} "
+            "WHERE r.run_id = ? GROUP BY l.language ORDER BY l.language",
+            parameters + (run_id,),
+        ).fetchall()
+        return [
+            {"language": language, "repositories": total, "with_findings": affected}
+            for language, total, affected in rows
+        ]
+
+    def _repositories_with_code(self, run_id: int, code: str) -> set:
+        rows = self._connection.execute(
+            "SELECT DISTINCT r.repository FROM findings f JOIN repositories r ON r.id = f.repository_id "
+            "WHERE f.run_id = ? AND f.code = ? AND f.kind != ?",
+            (run_id, code, KIND_NOTE),
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def delta(self, code: str, old_run: int, new_run: int) -> Dict[str, List[str]]:
+        """
+        Compare code between two runs, over the repositories analyzed in both:
+        "fixed" had it in old_run but not in new_run, "new" the other way round.
+        """
+        analyzed = self._connection.execute(
+            "SELECT repository FROM repositories WHERE run_id = ? "
+            "INTERSECT SELECT repository FROM repositories WHERE run_id = ?",
+            (old_run, new_run),
+        ).fetchall()
+        in_both = {row[0] for row in analyzed}
+        old = self._repositories_with_code(old_run, code) & in_both
+        new = self._repositories_with_code(new_run, code) & in_both
+        return {
+            "fixed": sorted(old - new),
+            "new": sorted(new - old),
+            "unchanged": sorted(old & new),
+        }
@@ -0,0 +1,147 @@
+"""
+JSON encoding and decoding for RsMetaCheck.
+
+Reads and compact writes use the fastest backend available: ``orjson`` or ``msgspec`` when
+installed, the standard library ``json`` module otherwise. Set the environment variable
+``RSMETACHECK_JSON_BACKEND`` to ``orjson``, ``msgspec`` or ``json`` to force one; a backend
+that is unknown or not installed is reported and the fastest available one is used instead.
+
+Canonical writes (``indent=2``, ``ensure_ascii=False``) always go through the standard
+library so the JSON-LD, summary and notes files are byte-for-byte identical whatever
+backend is installed.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+AVAILABLE_BACKENDS = ("json",) + (("msgspec",) if msgspec else ()) + (("orjson",) if orjson else ())
+COMPACT_SEPARATORS = (",", ":")
+
+
+def json_default(obj):
+    """
+    Serialize the sets some detectors put in their results, so data can be dumped
+    directly without a convert_sets_to_lists pass.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def _stdlib_dumps_compact(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=COMPACT_SEPARATORS, default=json_default)
+
+
+def _orjson_loads(data: Union[bytes, str]) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson is stricter than the stdlib (NaN literals, integers beyond 64 bits...),
+        # let the stdlib decide whether the document is really invalid.
+        return json.loads(data)
+
+
+def _orjson_dumps_compact(obj: Any) -> str:
+    try:
+        return orjson.dumps(obj, default=json_default).decode("utf-8")
+    except TypeError:
+        return _stdlib_dumps_compact(obj)
+
+
+def _msgspec_loads(data: Union[bytes, str]) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError:
+        return json.loads(data)
+
+
+def _msgspec_dumps_compact(obj: Any) -> str:
+    try:
+        return msgspec.json.encode(obj, enc_hook=json_default).decode("utf-8")
+    except (TypeError, msgspec.EncodeError):
+        return _stdlib_dumps_compact(obj)
+
+
+_BACKENDS = {
+    "json": (_stdlib_loads, _stdlib_dumps_compact),
+    "orjson": (_orjson_loads, _orjson_dumps_compact),
+    "msgspec": (_msgspec_loads, _msgspec_dumps_compact),
+}
+
+backend = "json"
+_loads = _stdlib_loads
+_dumps_compact = _stdlib_dumps_compact
+
+
+def use_backend(name: str) -> None:
+    """
+    Select the backend used by loads, read_json and compact dumps.
+    Raises ValueError if the backend is unknown or not installed.
+    """
+    global backend, _loads, _dumps_compact
+    if name not in AVAILABLE_BACKENDS:
+        raise ValueError(
+            f"JSON backend '{name}' is not available (available: {', '.join(AVAILABLE_BACKENDS)})"
+        )
+    backend = name
+    _loads, _dumps_compact = _BACKENDS[name]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or text."""
+    return _loads(data)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Parse the JSON file at path."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def dumps(obj: Any, compact: bool = False) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    By default the canonical form is produced (stdlib, ``indent=2``, ``ensure_ascii=False``).
+    With compact=True the selected backend writes a single line without whitespace; number
+    formatting may then differ slightly between backends.
+    """
+    if compact:
+        return _dumps_compact(obj)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=json_default)
+
+
+def write_json(obj: Any, path: Union[str, Path], compact: bool = False) -> None:
+    """Serialize obj to the file at path, see dumps for the two output forms."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dumps(obj, compact=compact))
+
+
+def _default_backend() -> str:
+    """Backend requested by RSMETACHECK_JSON_BACKEND if it is available, else the fastest one."""
+    requested = os.environ.get("RSMETACHECK_JSON_BACKEND")
+    if requested and requested not in AVAILABLE_BACKENDS:
+        print(
+            f"Warning: JSON backend '{requested}' from RSMETACHECK_JSON_BACKEND is not available, "
+            f"using '{AVAILABLE_BACKENDS[-1]}' (available: {', '.join(AVAILABLE_BACKENDS)})"
+        )
+        return AVAILABLE_BACKENDS[-1]
+    return requested or AVAILABLE_BACKENDS[-1]
+
+
+use_backend(_default_backend())
@@ -0,0 +1,293 @@
+"""
+SoMEF outputs stored compressed or inside archives.
+
+Besides plain ``*.json`` files, the analysis reads:
+
+- single compressed outputs: ``*.json.gz`` and ``*.json.zst``;
+- archives of outputs: ``*.tar``, ``*.tar.gz``/``*.tgz``, ``*.tar.zst`` and ``*.zip``, whose
+  ``.json`` (or ``.json.gz``/``.json.zst``) members are read directly from the archive,
+  without extracting them to disk.
+
+Each such output is represented by a SomefInput, which the analysis uses like a path: it
+has a ``name`` (the output's file name, e.g. ``repo_output.json``) and is read with
+load_somef_output. Files ending in CODEMETA_DEFAULT_NAME are skipped everywhere.
+
+The assessments are named after the outputs, so names are kept unique among the inputs
+gathered together: an output whose name is taken is prefixed with its archive name and
+member directory (``batch_outputs_repo_output.json``), or numbered (``repo_output_2.json``).
+
+Zstandard needs the ``zstandard`` package (or Python 3.14's ``compression.zstd``).
+"""
+import gzip
+import io
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Callable, Iterable, List, Optional, Union
+
+from rsmetacheck.run_somef import CODEMETA_DEFAULT_NAME
+from rsmetacheck.utils.serialization import loads, read_json
+
+try:
+    from compression import zstd as _zstd_module
+
+    def _zstd_reader(fileobj):
+        return _zstd_module.ZstdFile(fileobj)
+except ImportError:
+    try:
+        import zstandard as _zstd_module
+
+        def _zstd_reader(fileobj):
+            return _zstd_module.ZstdDecompressor().stream_reader(fileobj)
+    except ImportError:
+        _zstd_module = None
+        _zstd_reader = None
+
+COMPRESSED_SUFFIXES = (".json.gz", ".json.zst")
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.zst", ".zip")
+
+
+class SomefInput:
+    """A SoMEF output read from a compressed file or an archive member."""
+
+    def __init__(self, name: str, location: str, read_bytes: Callable[[], bytes], qualified_name: str = None):
+        self.name = name
+        self.location = location
+        self.qualified_name = qualified_name
+        self._read_bytes = read_bytes
+
+    def read_bytes(self) -> bytes:
+        return self._read_bytes()
+
+    def __str__(self):
+        return self.location
+
+    def __repr__(self):
+        return f"SomefInput({self.location!r})"
+
+
+def _has_suffix(name: str, suffixes) -> bool:
+    return name.lower().endswith(suffixes)
+
+
+def _output_name(name: str) -> Optional[str]:
+    """Plain file name of a SoMEF output (compression suffix removed), or None if it is not one."""
+    base = PurePosixPath(name).name
+    for suffix in COMPRESSED_SUFFIXES:
+        if base.lower().endswith(suffix):
+            base = base[:-len(suffix) + len(".json")]
+            break
+    if not base.lower().endswith(".json") or base.startswith("."):
+        return None
+    if base[:-len(".json")].endswith(CODEMETA_DEFAULT_NAME):
+        return None
+    return base
+
+
+def _qualified_name(archive: Path, member_name: str, name: str) -> str:
+    """Output name prefixed with the archive name and the member's directories."""
+    stem = archive.name
+    for suffix in ARCHIVE_SUFFIXES:
+        if _has_suffix(stem, suffix):
+            stem = stem[:-len(suffix)]
+            break
+    parts = [stem, *PurePosixPath(member_name).parent.parts, name]
+    return "_".join(part for part in parts if part not in ("", ".", "/"))
+
+
+def _unique_names(inputs: List[Union[Path, SomefInput]]) -> List[Union[Path, SomefInput]]:
+    """Rename the SomefInputs whose name is already used by an earlier input (plain files keep theirs)."""
+    taken = {source.name for source in inputs if not isinstance(source, SomefInput)}
+    for source in inputs:
+        if not isinstance(source, SomefInput):
+            continue
+        name = source.name
+        if name in taken and source.qualified_name:
+            name = source.qualified_name
+        counter = 2
+        while name in taken:
+            name = f"{source.name[:-len('.json')]}_{counter}.json"
+            counter += 1
+        source.name = name
+        taken.add(name)
+    return inputs
+
+
+def _require_zstd(location):
+    if _zstd_reader is None:
+        raise RuntimeError(f"Reading {location} requires the 'zstandard' package (pip install zstandard)")
+
+
+def _decompress(data: bytes, name: str) -> bytes:
+    """Decompress the bytes of a .json.gz or .json.zst member; other members are returned as is."""
+    if _has_suffix(name, ".gz"):
+        return gzip.decompress(data)
+    if _has_suffix(name, ".zst"):
+        _require_zstd(name)
+        with _zstd_reader(io.BytesIO(data)) as reader:
+            return reader.read()
+    return data
+
+
+def _read_compressed_file(path: Path) -> bytes:
+    if _has_suffix(path.name, ".gz"):
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    _require_zstd(path)
+    with open(path, "rb") as raw, _zstd_reader(raw) as reader:
+        return reader.read()
+
+
+class _TarReader:
+    """
+    Sequential access to the members of a (possibly compressed) tar archive.
+
+    Compressed tars cannot seek, so members are read in archive order from one open
+    stream; asking for an earlier member reopens the archive. Analyzing the members in
+    order therefore decompresses the archive once per pass. The archive is closed once
+    every member listed in unread has been read, or when reading fails.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.unread = set()
+        self._raw = None
+        self._tar = None
+        self._position = -1
+
+    def _open(self):
+        self.close()
+        if _has_suffix(self.path.name, ".zst"):
+            _require_zstd(self.path)
+            self._raw = open(self.path, "rb")
+            self._tar = tarfile.open(fileobj=_zstd_reader(self._raw), mode="r|")
+        else:
+            self._tar = tarfile.open(self.path, mode="r|*")
+        self._members = iter(self._tar)
+        self._position = -1
+
+    def members(self) -> List[str]:
+        """Names of the regular files in the archive, in archive order."""
+        self._open()
+        names = [member.name if member.isfile() else None for member in self._members]
+        self.close()
+        return names
+
+    def read(self, index: int) -> bytes:
+        try:
+            data = self._read(index)
+        except BaseException:
+            self.close()
+            raise
+        self.unread.discard(index)
+        if not self.unread:
+            self.close()
+        return data
+
+    def _read(self, index: int) -> bytes:
+        if self._tar is None or index <= self._position:
+            self._open()
+        for member in self._members:
+            self._position += 1
+            if self._position == index:
+                return self._tar.extractfile(member).read()
+        raise KeyError(f"{self.path} has no member #{index}")
+
+    def close(self):
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+        if self._raw is not None:
+            self._raw.close()
+            self._raw = None
+
+
+def _tar_inputs(path: Path) -> List[SomefInput]:
+    reader = _TarReader(path)
+    inputs = []
+    for index, member_name in enumerate(reader.members()):
+        name = member_name and _output_name(member_name)
+        if name:
+            reader.unread.add(index)
+            inputs.append(SomefInput(
+                name,
+                f"{path}:{member_name}",
+                lambda index=index, member_name=member_name: _decompress(reader.read(index), member_name),
+                _qualified_name(path, member_name, name),
+            ))
+    return inputs
+
+
+def _zip_inputs(path: Path) -> List[SomefInput]:
+    def read_member(member_name):
+        with zipfile.ZipFile(path) as archive:
+            return _decompress(archive.read(member_name), member_name)
+
+    with zipfile.ZipFile(path) as archive:
+        member_names = [info.filename for info in archive.infolist() if not info.is_dir()]
+    return [
+        SomefInput(
+            name,
+            f"{path}:{member_name}",
+            lambda member_name=member_name: read_member(member_name),
+            _qualified_name(path, member_name, name),
+        )
+        for member_name in member_names
+        if (name := _output_name(member_name))
+    ]
+
+
+def is_somef_container(path: Union[str, Path]) -> bool:
+    """True for the compressed files and archives this module can read."""
+    return _has_suffix(str(path), COMPRESSED_SUFFIXES + ARCHIVE_SUFFIXES)
+
+
+def expand_somef_input(path: Union[str, Path]) -> List[Union[Path, SomefInput]]:
+    """
+    SoMEF outputs held by one input file: the file itself for a plain JSON file, a
+    SomefInput for a compressed output, one SomefInput per output member of an archive.
+    Unreadable archives are reported and give no outputs.
+    """
+    path = Path(path)
+    try:
+        if _has_suffix(path.name, COMPRESSED_SUFFIXES):
+            name = _output_name(path.name)
+            return [SomefInput(name, str(path), lambda: _read_compressed_file(path))] if name else []
+        if _has_suffix(path.name, ".zip"):
+            return _unique_names(_zip_inputs(path))
+        if _has_suffix(path.name, (".tar", ".tar.gz", ".tgz", ".tar.zst")):
+            return _unique_names(_tar_inputs(path))
+    except (OSError, tarfile.TarError, zipfile.BadZipFile, RuntimeError) as e:
+        print(f"Warning: Could not read archive {path}: {e}")
+        return []
+    return [path]
+
+
+def collect_somef_inputs(input_dir: Union[str, Path]) -> List[Union[Path, SomefInput]]:
+    """
+    SoMEF outputs of a directory: its ``*.json`` files, then the outputs held by its
+    compressed files and archives, in name order and with unique names.
+    """
+    input_dir = Path(input_dir)
+    inputs: List[Union[Path, SomefInput]] = [
+        f for f in sorted(input_dir.glob("*.json"))
+        if not f.stem.endswith(CODEMETA_DEFAULT_NAME)
+    ]
+    for container in sorted(f for f in input_dir.iterdir() if f.is_file() and is_somef_container(f)):
+        inputs.extend(expand_somef_input(container))
+    return _unique_names(inputs)
+
+
+def expand_somef_inputs(paths: Iterable[Union[str, Path]]) -> List[Union[Path, SomefInput]]:
+    """SoMEF outputs held by several input files, with unique names."""
+    inputs = []
+    for path in paths:
+        inputs.extend(expand_somef_input(path))
+    return _unique_names(inputs)
+
+
+def load_somef_output(source: Union[str, Path, SomefInput]):
+    """Parse a SoMEF output given as a path or a SomefInput."""
+    if isinstance(source, SomefInput):
+        return loads(source.read_bytes())
+    return read_json(source)
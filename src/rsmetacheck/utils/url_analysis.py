@@ -0,0 +1,253 @@
+"""
+Shared classification of repository URLs, issue tracker URLs and identifiers.
+
+P009, P016 and W010 read ``code_repository``, P011 reads ``issue_tracker`` and P014, P018,
+W006 and W007 read ``identifier``. classify_url parses a URL or identifier string once
+into a UrlRecord (host, provider, owner/repo, normalized form, repository or homepage,
+shorthand form, issues path, DOI/SWHID kind) and caches it, as the same strings come
+back across categories and repositories. url_view gives the detectors of a category its
+entries, classified once per repository (see cached_category_view).
+"""
+import functools
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from rsmetacheck.utils.pitfall_utils import CategoryEntry, cached_category_view
+
+# Hosts of the code forges RSMetaCheck knows, by provider name.
+PROVIDERS = {
+    "github.com": "github",
+    "gitlab.com": "gitlab",
+    "bitbucket.org": "bitbucket",
+    "sourceforge.net": "sourceforge",
+}
+
+_REPOSITORY_INDICATORS = [
+    'github.com/',
+    'github.org/',
+    'gitlab.com/',
+    'gitlab.org/',
+    'bitbucket.org/',
+    'bitbucket.net/',
+    'sourceforge.net/projects/',
+    'git.',
+    '.git'
+]
+_HOMEPAGE_INDICATORS = [
+    '.org/',
+    '.com/',
+    '.net/',
+    '.io/',
+    'www.',
+    'docs.',
+    'documentation',
+    'readthedocs',
+    'github.io'
+]
+
+_GIT_PLUS = re.compile(r'^git\+')
+_HTTP = re.compile(r'^http://')
+_TRAILING_SLASH = re.compile(r'/$')
+_GIT_SUFFIX = re.compile(r'\.git$')
+_SCP_LIKE = re.compile(r'^git@([^:]+):')
+
+# github.com:user/repo.git or github.com:user/repo
+_SHORTHAND = re.compile(r'^[a-zA-Z0-9.-]+:[a-zA-Z0-9._/-]+$')
+
+_BARE_DOI = re.compile(r'^(?:doi:)?10\.\d+/')
+_DOI = re.compile(r'^(?:doi:)?10\.\d+/.+', re.IGNORECASE)
+_URL = re.compile(r'^https?://.+', re.IGNORECASE)
+_RAW_SWHID = re.compile(r'^swh:1:[a-z]+:[a-f0-9]{40}$')
+
+_ISSUE_PATHS = ['/issues', '/tickets']
+
+
+class UrlRecord:
+    """
+    A URL or identifier string, parsed on first use. Every property keeps the rule of the
+    check it was written for.
+    """
+
+    def __init__(self, value: str):
+        self.value = value
+        self.stripped = value.strip()
+        self.lower = value.lower()
+
+    @functools.cached_property
+    def parts(self):
+        """urlparse of the stripped value, or None if it cannot be parsed."""
+        try:
+            return urlparse(self.stripped)
+        except Exception:
+            return None
+
+    @property
+    def host(self) -> str:
+        """Lowercase network location of a URL, empty for shorthands and identifiers."""
+        return self.parts.netloc.lower() if self.parts else ""
+
+    @functools.cached_property
+    def provider(self) -> Optional[str]:
+        """github, gitlab, bitbucket or sourceforge, for URLs and shorthands of those forges."""
+        normalized = self.normalized
+        if "://" in normalized:
+            host = normalized.split("://", 1)[1].split("/", 1)[0]
+        elif self.is_shorthand:
+            host = normalized.split(":", 1)[0]
+        else:
+            return None
+        return PROVIDERS.get(host[4:] if host.startswith("www.") else host)
+
+    @functools.cached_property
+    def owner_repo(self) -> Optional[str]:
+        """owner/repo of a forge repository URL, e.g. SoftwareUnderstanding/RsMetaCheck."""
+        if self.provider is None:
+            return None
+        normalized = self.normalized
+        if "://" in normalized:
+            path = normalized.split("://", 1)[1].partition("/")[2]
+        else:
+            path = normalized.split(":", 1)[1]
+        segments = [segment for segment in path.split("/") if segment]
+        if self.provider == "sourceforge" and segments[:1] == ["projects"]:
+            segments = segments[1:]
+        return "/".join(segments[:2]) if len(segments) >= 2 else None
+
+    @functools.cached_property
+    def normalized(self) -> str:
+        """Lowercase https form without git+, www., .git or a trailing slash (P016)."""
+        url = self.lower.strip()
+        url = _GIT_PLUS.sub('', url)  # Remove git+ prefix
+        url = _HTTP.sub('https://', url)  # Normalize http to https
+        url = url.replace('www.github.com', 'github.com')
+
+        url = _TRAILING_SLASH.sub('', url)  # Remove trailing slash
+        url = _GIT_SUFFIX.sub('', url)  # Remove .git suffix
+        url = _TRAILING_SLASH.sub('', url)  # Remove trailing slash again if it was .git/
+
+        if url.startswith('git@'):
+            url = _SCP_LIKE.sub(r'https://\1/', url)
+        return url
+
+    @functools.cached_property
+    def is_repository(self) -> bool:
+        """Looks like a code repository rather than a homepage (P009)."""
+        if 'github.io' in self.lower:
+            return False
+        return any(indicator in self.lower for indicator in _REPOSITORY_INDICATORS)
+
+    @functools.cached_property
+    def is_homepage(self) -> bool:
+        """Looks like a homepage rather than a code repository (P009)."""
+        if self.is_repository:
+            return False
+        return any(indicator in self.lower for indicator in _HOMEPAGE_INDICATORS)
+
+    @functools.cached_property
+    def is_shorthand(self) -> bool:
+        """Git remote shorthand such as github.com:user/repo.git instead of a full URL (W010)."""
+        if self.stripped.startswith(('http://', 'https://')):
+            return False
+        return _SHORTHAND.match(self.stripped) is not None
+
+    @functools.cached_property
+    def is_issue_tracker(self) -> bool:
+        """http(s) URL whose path ends in, or goes through, /issues or /tickets (P011)."""
+        parts = self.parts
+        if parts is None or parts.scheme not in ('http', 'https') or not parts.netloc:
+            return False
+        path = parts.path
+        if not path or path == '/':
+            return False
+        path_lower = path.lower()
+        return any(path_lower.endswith(pattern) or (pattern + '/') in path_lower for pattern in _ISSUE_PATHS)
+
+    @functools.cached_property
+    def doi_kind(self) -> Optional[str]:
+        """
+        "url" for https://doi.org/ DOIs, "bare" for doi:10.x/y or 10.x/y (P014), None otherwise.
+        """
+        if self.stripped.startswith('https://doi.org/'):
+            return "url"
+        if _BARE_DOI.match(self.stripped):
+            return "bare"
+        return None
+
+    @functools.cached_property
+    def is_doi(self) -> bool:
+        """A DOI, with or without the doi: prefix, in any case (W006)."""
+        return _DOI.match(self.value) is not None
+
+    @functools.cached_property
+    def is_raw_swhid(self) -> bool:
+        """A SWHID without a resolvable URL, e.g. swh:1:dir:<40 hex digits> (P018)."""
+        if self.stripped.startswith(('http://', 'https://')):
+            return False
+        return _RAW_SWHID.match(self.stripped) is not None
+
+    @functools.cached_property
+    def is_valid_identifier(self) -> bool:
+        """A unique identifier (DOI, URL...) rather than a name (W006)."""
+        identifier = self.stripped
+        if not identifier:
+            return False
+        if _DOI.match(identifier):
+            return True
+        if identifier.lower() in ['doi:', '10.']:
+            return False
+        if _URL.match(identifier):
+            return True
+        if identifier.lower().startswith('ftp://'):
+            return False
+        if ' ' in identifier and not any(char in identifier for char in ['/', ':', '.']):
+            return False
+        if identifier.replace(' ', '').replace('-', '').replace('_', '').isalpha():
+            return False
+        return True
+
+
+@functools.lru_cache(maxsize=65536)
+def classify_url(value: str) -> UrlRecord:
+    """The cached UrlRecord of a URL or identifier string."""
+    return UrlRecord(value)
+
+
+class UrlEntry(CategoryEntry):
+    """An entry of a URL or identifier category."""
+
+    __slots__ = ()
+
+    @property
+    def record(self) -> Optional[UrlRecord]:
+        """UrlRecord of the value, or None if the value is not a non-empty string."""
+        return classify_url(self.value) if isinstance(self.value, str) and self.value else None
+
+    @property
+    def from_metadata(self) -> bool:
+        """Parsed by SoMEF or read from a metadata file."""
+        return self.is_code_parser or self.technique_is_metadata_file or self.is_metadata_file
+
+
+class UrlView:
+    """The entries of one URL or identifier category of a SoMEF output."""
+
+    def __init__(self, entries: List):
+        self.entries = [UrlEntry(entry) for entry in entries if isinstance(entry, dict)]
+
+    def metadata_entries(self) -> List[UrlEntry]:
+        """Entries with a value parsed by SoMEF or read from a metadata file."""
+        return [entry for entry in self.entries if entry.from_metadata and entry.has_value]
+
+    def codemeta_entries(self) -> List[UrlEntry]:
+        """Entries with a value read from codemeta.json."""
+        return [entry for entry in self.entries if entry.is_codemeta_entry and entry.has_value]
+
+    def other_entries(self) -> List[UrlEntry]:
+        """Entries with a value read from anywhere but codemeta.json."""
+        return [entry for entry in self.entries if not entry.is_codemeta_entry and entry.has_value]
+
+
+def url_view(somef_data: Dict, category: str) -> Optional[UrlView]:
+    """UrlView of somef_data[category] (shared by the detectors of a repository), or None."""
+    return cached_category_view(somef_data, category, UrlView)
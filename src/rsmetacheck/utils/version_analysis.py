@@ -0,0 +1,78 @@
+"""
+Shared parsing and comparison of version strings.
+
+P001 compares metadata versions with the latest release, P012 the version of the download
+URL with the latest release and P017 the codemeta.json version with the other metadata
+files. The same version strings come back across sources, checks and repositories, so
+every function here is memoized: a distinct string is normalized and parsed once per run.
+"""
+import functools
+import re
+from typing import Optional, Tuple
+
+_V_PREFIX = re.compile(r'^v', re.IGNORECASE)
+
+# Pre-release, development and post-release suffixes (1.2.0rc1, 1.2.0-beta, 1.2.0.post3...),
+# dropped before reading the release numbers.
+_SUFFIX = re.compile(r"[-_.]?(dev|alpha|beta|rc|pre|post|a|b)\d*.*", re.IGNORECASE)
+_NUMBER = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=16384)
+def normalize_version(version: str) -> str:
+    """
+    Normalize version string for comparison by removing common prefixes like 'v'.
+    """
+    if not version:
+        return ""
+
+    normalized = _V_PREFIX.sub('', version)
+    return normalized.strip()
+
+
+@functools.lru_cache(maxsize=16384)
+def canonical_version(version: str) -> Optional[str]:
+    """
+    Trimmed, lowercase version without its 'v' prefix, or None if nothing is left (P012).
+    """
+    if not version:
+        return None
+
+    normalized = version.strip().lower()
+    if normalized.startswith('v'):
+        normalized = normalized[1:]
+
+    return normalized if normalized else None
+
+
+@functools.lru_cache(maxsize=16384)
+def version_text(version: str) -> str:
+    """Version as written, without surrounding whitespace (P017 compares these)."""
+    return version.strip()
+
+
+@functools.lru_cache(maxsize=16384)
+def version_components(version: str) -> Tuple[int, int, int]:
+    """
+    (major, minor, patch) of a PEP 440, semver or R-style version (1.2.3, 1.2.3-rc1,
+    v2.0.post1, 0.4-2), missing parts as 0. Suffixes after the release numbers are ignored,
+    so the tuples compare release numbers only.
+    """
+    cleaned = _SUFFIX.sub("", version)
+    components = [int(part) for part in _NUMBER.findall(cleaned)[:3]]
+    while len(components) < 3:
+        components.append(0)
+    return tuple(components)
+
+
+def is_ahead(version: str, reference: str) -> bool:
+    """True if the release numbers of version are greater than those of reference."""
+    return version_components(version) > version_components(reference)
+
+
+def differs_significantly(version: str, reference: str, threshold: int = 2) -> bool:
+    """True if any release number of the two versions differs by threshold or more."""
+    return any(
+        abs(a - b) >= threshold
+        for a, b in zip(version_components(version), version_components(reference))
+    )
@@ -0,0 +1,251 @@
+"""
+Watch directories of SoMEF outputs and analyze files as they are written.
+
+Another process (e.g. a scheduler running SoMEF) drops JSON files into the watched
+directories. Each new or modified file is analyzed once it has stopped changing for a
+debounce delay, its JSON-LD assessment is rewritten in place, and the summary is rebuilt
+from the stored per-file records, so ``analysis_results.json`` stays current without
+re-analyzing the other files. Deleted files are dropped from the summary.
+
+On Linux, changes are reported by inotify; elsewhere (or if inotify is unavailable) the
+directories are polled.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from rsmetacheck.detect_pitfalls_main import AnalysisSession
+from rsmetacheck.run_somef import CODEMETA_DEFAULT_NAME
+from rsmetacheck.utils.serialization import read_json
+
+DEFAULT_DEBOUNCE = 2.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_CHANGED = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_IN_REMOVED = _IN_MOVED_FROM | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _is_somef_output(path: Path) -> bool:
+    return path.suffix == ".json" and not path.stem.endswith(CODEMETA_DEFAULT_NAME)
+
+
+class PollingWatcher:
+    """Detect changes by comparing (mtime, size) snapshots of the directories."""
+
+    def __init__(self, directories: Iterable[Union[str, Path]], interval: float = DEFAULT_POLL_INTERVAL):
+        self.directories = [Path(d) for d in directories]
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for directory in self.directories:
+            for path in directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self, timeout: float) -> Tuple[Set[Path], Set[Path]]:
+        """Wait up to timeout seconds, then return the (changed, removed) paths."""
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._scan()
+        changed = {path for path, state in snapshot.items() if self._snapshot.get(path) != state}
+        removed = set(self._snapshot) - set(snapshot)
+        self._snapshot = snapshot
+        return changed, removed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Receive change events from the Linux kernel through inotify."""
+
+    def __init__(self, directories: Iterable[Union[str, Path]]):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories = {}
+        for directory in directories:
+            directory = Path(directory)
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_CHANGED | _IN_REMOVED)
+            if wd < 0:
+                self.close()
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self._directories[wd] = directory
+
+    def changes(self, timeout: float) -> Tuple[Set[Path], Set[Path]]:
+        """Wait up to timeout seconds for events, then return the (changed, removed) paths."""
+        changed, removed = set(), set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed, removed
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed, removed
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+            if wd not in self._directories or not name:
+                continue
+            path = self._directories[wd] / os.fsdecode(name)
+            if mask & _IN_REMOVED:
+                removed.add(path)
+                changed.discard(path)
+            elif mask & _IN_CHANGED:
+                changed.add(path)
+                removed.discard(path)
+        return changed, removed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(directories: List[Union[str, Path]], poll_interval: float = DEFAULT_POLL_INTERVAL):
+    """An InotifyWatcher when the platform supports it, a PollingWatcher otherwise."""
+    if hasattr(select, "select") and os.name == "posix":
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories, poll_interval)
+
+
+class DirectoryWatch:
+    """
+    Keep the outputs of an AnalysisSession in sync with the SoMEF outputs of some directories.
+
+    Files are analyzed debounce seconds after their last change; a file that is not valid
+    JSON yet is left for its next change. The summary is rebuilt from the per-file records
+    (in file name order) after every batch of changes.
+    """
+
+    def __init__(
+        self,
+        session: AnalysisSession,
+        directories: Iterable[Union[str, Path]],
+        debounce: float = DEFAULT_DEBOUNCE,
+        watcher=None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.session = session
+        self.directories = [Path(d) for d in directories]
+        self.debounce = debounce
+        self.watcher = watcher or create_watcher(self.directories)
+        self._clock = clock
+        self.records: Dict[Path, Dict] = {}
+        self._pending: Dict[Path, float] = {}
+
+        now = self._clock()
+        for directory in self.directories:
+            for path in sorted(directory.glob("*.json")):
+                if _is_somef_output(path):
+                    # Files already there when the watch starts are analyzed right away.
+                    self._pending[path] = now - debounce
+
+    def _remove_jsonld(self, record: Optional[Dict]):
+        if record and record.get("jsonld_file"):
+            jsonld_path = self.session.pitfalls_output_dir / record["jsonld_file"]
+            if jsonld_path.exists():
+                jsonld_path.unlink()
+
+    def _analyze(self, path: Path) -> bool:
+        try:
+            read_json(path)
+        except FileNotFoundError:
+            return False
+        except Exception:
+            print(f"Skipping {path.name} until it is written again: not valid JSON yet")
+            return False
+
+        record = self.session.process_file(path)
+        previous = self.records.get(path)
+        if previous and previous.get("jsonld_file") and not record.get("jsonld_file"):
+            # The file no longer has findings: drop its outdated assessment.
+            self._remove_jsonld(previous)
+        self.records[path] = record
+        return True
+
+    def _remove(self, path: Path) -> bool:
+        self._pending.pop(path, None)
+        record = self.records.pop(path, None)
+        if record is None:
+            return False
+        self._remove_jsonld(record)
+        print(f"Removed {path.name} from the analysis")
+        return True
+
+    def _write_summary(self):
+        self.session.reset_summary()
+        for path in sorted(self.records):
+            self.session.add_record(self.records[path])
+        self.session.write_summary(report=False)
+        print(f"Summary updated for {len(self.records)} files: {self.session.output_file}")
+
+    def step(self, timeout: float = DEFAULT_POLL_INTERVAL) -> int:
+        """
+        Wait up to timeout for changes, analyze the files that are due and update the summary.
+        Returns the number of files analyzed or removed.
+        """
+        changed, removed = self.watcher.changes(timeout)
+        now = self._clock()
+        for path in changed:
+            if _is_somef_output(path):
+                self._pending[path] = now
+
+        updated = sum(1 for path in removed if self._remove(path))
+        due = sorted(path for path, last_change in self._pending.items() if now - last_change >= self.debounce)
+        for path in due:
+            del self._pending[path]
+            if self._analyze(path):
+                updated += 1
+
+        if updated:
+            self._write_summary()
+        return updated
+
+    def _next_timeout(self) -> float:
+        """Time until the next pending file is due, at most DEFAULT_POLL_INTERVAL."""
+        if not self._pending:
+            return DEFAULT_POLL_INTERVAL
+        now = self._clock()
+        wait = min(last_change + self.debounce - now for last_change in self._pending.values())
+        return max(0.0, min(wait, DEFAULT_POLL_INTERVAL))
+
+    def run(self, stop: Optional[Callable[[], bool]] = None):
+        """Watch until stop() returns True or the process is interrupted."""
+        print(f"Watching {', '.join(str(d) for d in self.directories)} for SoMEF outputs (Ctrl+C to stop)...")
+        try:
+            self.step(0)
+            while not (stop and stop()):
+                self.step(self._next_timeout())
+        except KeyboardInterrupt:
+            print("\nStopping watch.")
+        finally:
+            self.watcher.close()
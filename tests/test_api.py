@@ -0,0 +1,117 @@
+import copy
+import json
+import os
+
+import pytest
+
+from rsmetacheck import Assessment, analyze, analyze_many
+from rsmetacheck.config import AnalysisConfig
+from rsmetacheck.detect_pitfalls_main import AnalysisSession
+
+SOMEF_DATA = {
+    "full_name": [{"result": {"value": "owner/repo"}}],
+    "version": [{"source": "repository/codemeta.json", "result": {"value": "3.0.0"}}],
+    "releases": [{"tag": "1.0.0"}],
+    "license": [{"source": "repository/LICENSE", "result": {"value": "Copyright (c) 2024 Someone"}}],
+}
+
+
+class TestAnalyze:
+    """Test suite for the analysis of one SoMEF output held in memory"""
+
+    def test_reports_the_issues_found(self):
+        assessment = analyze(SOMEF_DATA)
+
+        assert isinstance(assessment, Assessment)
+        assert assessment.name == "somef_output.json"
+        assert "P001" in assessment.codes
+        assert assessment.has_pitfalls
+        assert assessment.errors == {}
+        assert assessment.incomplete == []
+
+    def test_no_files_and_no_output(self, tmp_path, capsys, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        assessment = analyze(SOMEF_DATA)
+        assessment.to_jsonld(verbose=True)
+
+        assert os.listdir(tmp_path) == []
+        assert capsys.readouterr() == ("", "")
+
+    def test_input_is_not_modified(self):
+        somef_data = copy.deepcopy(SOMEF_DATA)
+
+        analyze(somef_data, AnalysisConfig(exclude_files=["repository/LICENSE"]))
+
+        assert somef_data == SOMEF_DATA
+
+    def test_ignored_checks_are_not_run(self):
+        assessment = analyze(SOMEF_DATA, AnalysisConfig(ignored_checks={"P001"}))
+
+        assert "P001" not in {result.code for result in assessment.results}
+
+    def test_parameters_are_applied(self):
+        assessment = analyze(SOMEF_DATA, AnalysisConfig(check_parameters={"P001": {"ahead_significant_diff": 10}}))
+
+        assert "P001" not in assessment.codes
+
+    def test_rejects_what_is_not_a_dict(self):
+        with pytest.raises(TypeError):
+            analyze(json.dumps(SOMEF_DATA))
+
+    def test_matches_the_command_line_assessment(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+        somef_file = tmp_path / "repo_output.json"
+        somef_file.write_text(json.dumps(SOMEF_DATA))
+        session = AnalysisSession(tmp_path / "pitfalls", tmp_path / "summary.json", verbose=True)
+        record = session.process_file(somef_file)
+        session.finalize()
+        written = json.loads((tmp_path / "pitfalls" / record["jsonld_file"]).read_text())
+
+        assessment = analyze(SOMEF_DATA, name="repo_output.json")
+
+        assert assessment.to_jsonld(verbose=True, commit_id="abc123")["checks"] == written["checks"]
+        assert assessment.codes == list(dict.fromkeys(code for code, _, _ in record["issues"]))
+
+
+class TestAnalyzeMany:
+    """Test suite for the lazy analysis of many SoMEF outputs"""
+
+    def test_names_and_order(self):
+        other = dict(SOMEF_DATA, version=[{"source": "repository/codemeta.json", "result": {"value": "1.0.0"}}])
+
+        assessments = list(analyze_many([SOMEF_DATA, ("other.json", other)]))
+
+        assert [assessment.name for assessment in assessments] == ["somef_output_0.json", "other.json"]
+        assert "P001" in assessments[0].codes
+        assert "P001" not in assessments[1].codes
+
+    def test_outputs_are_consumed_lazily(self):
+        consumed = []
+
+        def outputs():
+            for position in range(3):
+                consumed.append(position)
+                yield SOMEF_DATA
+
+        assessments = analyze_many(outputs())
+        assert consumed == []
+        next(assessments)
+        assert consumed == [0]
+
+    def test_detector_errors_are_collected(self, monkeypatch):
+        def fail(somef_data, file_name):
+            raise ValueError("broken license text")
+
+        monkeypatch.setattr("rsmetacheck.api.PITFALL_DETECTORS", [(fail, "P010")])
+
+        assessment = analyze(SOMEF_DATA)
+
+        assert assessment.errors == {"P010": "broken license text"}
+
+    def test_time_budgets_run_the_detectors_in_a_worker(self):
+        config = AnalysisConfig(detector_timeouts={"DEFAULT": 30})
+
+        isolated = [assessment.results for assessment in analyze_many([("a.json", SOMEF_DATA), ("b.json", SOMEF_DATA)], config)]
+
+        assert isolated == [analyze(SOMEF_DATA, name=name).results for name in ("a.json", "b.json")]
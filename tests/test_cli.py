@@ -7,19 +7,28 @@ from unittest.mock import MagicMock
 import pytest
 
 from rsmetacheck.config import AnalysisConfig
+from rsmetacheck.utils import github_rate_limit
 
 cli_module = importlib.import_module("rsmetacheck.cli")
 
 REPO_URL = "https://github.com/SoftwareUnderstanding/sw-metadata-bot"
 
 
+def _popen_mock(returncode=0, stdout="", stderr=""):
+    """Return a subprocess.Popen mock for a somef process exiting with returncode."""
+    popen_mock = MagicMock()
+    popen_mock.return_value.communicate.return_value = (stdout, stderr)
+    popen_mock.return_value.returncode = returncode
+    return popen_mock
+
+
 def test_cli_with_generate_codemeta_adds_codemeta_output(monkeypatch, tmp_path):
     """Ensure --generate-codemeta requests codemeta output in SoMEF command."""
     somef_output_dir = tmp_path / "somef_outputs"
     expected_codemeta = str(somef_output_dir / "somef_generated_codemeta.json")
 
     run_analysis_mock = MagicMock()
-    subprocess_run_mock = MagicMock()
+    subprocess_popen_mock = _popen_mock()
 
     monkeypatch.setattr(
         "sys.argv",
@@ -34,12 +43,12 @@ def test_cli_with_generate_codemeta_adds_codemeta_output(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
     monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
-    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.run", subprocess_run_mock)
+    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.Popen", subprocess_popen_mock)
 
     monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
     cli_module.cli()
 
-    command = subprocess_run_mock.call_args.args[0]
+    command = subprocess_popen_mock.call_args.args[0]
     assert command[0:2] == ["somef", "describe"]
     assert "-c" in command
     assert expected_codemeta in command
@@ -52,7 +61,7 @@ def test_cli_without_generate_codemeta_keeps_default_behavior(monkeypatch, tmp_p
     somef_output_dir = tmp_path / "somef_outputs"
 
     run_analysis_mock = MagicMock()
-    subprocess_run_mock = MagicMock()
+    subprocess_popen_mock = _popen_mock()
 
     monkeypatch.setattr(
         "sys.argv",
@@ -66,12 +75,12 @@ def test_cli_without_generate_codemeta_keeps_default_behavior(monkeypatch, tmp_p
     )
     monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
     monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
-    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.run", subprocess_run_mock)
+    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.Popen", subprocess_popen_mock)
 
     monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
     cli_module.cli()
 
-    command = subprocess_run_mock.call_args.args[0]
+    command = subprocess_popen_mock.call_args.args[0]
     assert command[0:2] == ["somef", "describe"]
     assert "-c" not in command
 
@@ -105,6 +114,27 @@ def test_cli_skip_somef_bypasses_somef_execution(monkeypatch, tmp_path):
     run_analysis_mock.assert_called_once()
 
 
+def test_cli_skip_somef_expands_archives(monkeypatch, tmp_path):
+    """--skip-somef should analyze the SoMEF outputs held by an archive."""
+    import zipfile
+
+    archive = tmp_path / "outputs.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a_output.json", "{}")
+        zf.writestr("b_output.json", "{}")
+        zf.writestr("a_output_somef_generated_codemeta.json", "{}")
+
+    run_analysis_mock = MagicMock()
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "--input", str(archive), "--skip-somef"])
+    monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    sources = run_analysis_mock.call_args.args[0]
+    assert [source.name for source in sources] == ["a_output.json", "b_output.json"]
+
+
 def test_cli_skip_somef_with_missing_file_skips_and_warns(monkeypatch, capsys):
     """--skip-somef with a missing file should print a warning and skip."""
     run_analysis_mock = MagicMock()
@@ -182,7 +212,7 @@ def test_cli_branch_passed_to_somef(monkeypatch, tmp_path):
     somef_output_dir = tmp_path / "somef_outputs"
 
     run_analysis_mock = MagicMock()
-    subprocess_run_mock = MagicMock()
+    subprocess_popen_mock = _popen_mock()
 
     monkeypatch.setattr(
         "sys.argv",
@@ -198,12 +228,12 @@ def test_cli_branch_passed_to_somef(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
     monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
-    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.run", subprocess_run_mock)
+    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.Popen", subprocess_popen_mock)
     monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
 
     cli_module.cli()
 
-    command = subprocess_run_mock.call_args.args[0]
+    command = subprocess_popen_mock.call_args.args[0]
     assert "-b" in command
     assert "develop" in command
 
@@ -213,7 +243,7 @@ def test_cli_threshold_passed_to_somef(monkeypatch, tmp_path):
     somef_output_dir = tmp_path / "somef_outputs"
 
     run_analysis_mock = MagicMock()
-    subprocess_run_mock = MagicMock()
+    subprocess_popen_mock = _popen_mock()
 
     monkeypatch.setattr(
         "sys.argv",
@@ -229,12 +259,12 @@ def test_cli_threshold_passed_to_somef(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
     monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
-    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.run", subprocess_run_mock)
+    monkeypatch.setattr("rsmetacheck.run_somef.subprocess.Popen", subprocess_popen_mock)
     monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
 
     cli_module.cli()
 
-    command = subprocess_run_mock.call_args.args[0]
+    command = subprocess_popen_mock.call_args.args[0]
     assert "-t" in command
     assert "0.5" in command
 
@@ -679,3 +709,330 @@ def test_exit_on_findings_missing_summary_fields_treated_as_zero(tmp_path):
 
     # Should not raise SystemExit
     cli_module._exit_on_findings(str(analysis_file), config)
+
+
+def test_cli_pitfalls_stream_passed_to_run_analysis(monkeypatch, tmp_path):
+    """--pitfalls-stream should be forwarded to run_analysis."""
+    somef_file = tmp_path / "somef_output.json"
+    somef_file.write_text("{}")
+    stream_file = str(tmp_path / "pitfalls.jsonl.gz")
+
+    run_analysis_mock = MagicMock()
+
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "rsmetacheck",
+            "--input",
+            str(somef_file),
+            "--skip-somef",
+            "--pitfalls-stream",
+            stream_file,
+        ],
+    )
+    monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    assert run_analysis_mock.call_args.kwargs.get("pitfalls_stream") == stream_file
+
+
+def test_cli_export_subcommand_writes_individual_files(monkeypatch, tmp_path, capsys):
+    """'rsmetacheck export' should recreate per-repository JSON-LD files from a stream."""
+    stream_file = tmp_path / "pitfalls.jsonl"
+    stream_file.write_text(
+        json.dumps({"file_name": "repo_1.json", "assessment": {"checks": []}}) + "\n"
+    )
+    output_dir = tmp_path / "pitfalls_outputs"
+
+    run_analysis_mock = MagicMock()
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "export", str(stream_file), "--pitfalls-output", str(output_dir)],
+    )
+    monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
+
+    cli_module.cli()
+
+    run_analysis_mock.assert_not_called()
+    assert (output_dir / "repo_1_pitfalls.jsonld").exists()
+    assert "Exported 1 JSON-LD files" in capsys.readouterr().out
+
+
+def test_cli_export_missing_stream_prints_error(monkeypatch, tmp_path, capsys):
+    """'rsmetacheck export' with a missing stream file should print an error."""
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "export", str(tmp_path / "missing.jsonl")],
+    )
+
+    cli_module.cli()
+
+    assert "Error: Stream file not found" in capsys.readouterr().out
+
+
+def test_cli_pipeline_analyzes_outputs_as_they_are_produced(monkeypatch, tmp_path):
+    """--pipeline should hand each SoMEF output to the pipelined analysis instead of run_analysis."""
+    somef_output_dir = tmp_path / "somef_outputs"
+    produced = []
+
+    def run_somef_single_mock(repo_url, output_dir, threshold, on_output=None, **kwargs):
+        on_output(str(somef_output_dir / "output_1.json"))
+        return True
+
+    def run_pipelined_analysis_mock(extract, *args, **kwargs):
+        extract(produced.append)
+        return bool(produced)
+
+    run_analysis_mock = MagicMock()
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "--input", REPO_URL, "--somef-output", str(somef_output_dir), "--pipeline"],
+    )
+    monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
+    monkeypatch.setattr(cli_module, "run_somef_single", run_somef_single_mock)
+    monkeypatch.setattr(cli_module, "run_pipelined_analysis", run_pipelined_analysis_mock)
+    monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    assert produced == [str(somef_output_dir / "output_1.json")]
+    run_analysis_mock.assert_not_called()
+
+
+def test_cli_pipeline_without_outputs_prints_error(monkeypatch, capsys):
+    """--pipeline should abort with the usual error when SoMEF produced nothing."""
+    exit_mock = MagicMock()
+
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "--input", REPO_URL, "--pipeline"])
+    monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
+    monkeypatch.setattr(cli_module, "run_somef_single", MagicMock(return_value=False))
+    monkeypatch.setattr(cli_module, "run_pipelined_analysis", lambda extract, *a, **k: extract(None) and False)
+    monkeypatch.setattr(cli_module, "_exit_on_findings", exit_mock)
+
+    cli_module.cli()
+
+    assert "SoMEF did not produce any outputs" in capsys.readouterr().out
+    exit_mock.assert_not_called()
+
+
+def test_run_somef_single_reports_output_to_callback(monkeypatch, tmp_path):
+    """run_somef_single should pass the output file to on_output only when SoMEF succeeds."""
+    from rsmetacheck import run_somef as run_somef_module
+
+    produced = []
+    no_retry = run_somef_module.RetryPolicy(max_retries=0)
+    monkeypatch.setattr(run_somef_module, "run_somef_attempt", lambda *a, **k: None)
+    assert run_somef_module.run_somef_single(REPO_URL, str(tmp_path), on_output=produced.append)
+    assert produced == [str(tmp_path / "output_1.json")]
+
+    monkeypatch.setattr(run_somef_module, "run_somef_attempt", lambda *a, **k: ("error", "boom"))
+    assert not run_somef_module.run_somef_single(
+        REPO_URL, str(tmp_path), on_output=produced.append, retry_policy=no_retry
+    )
+    assert len(produced) == 1
+
+
+
+def test_cli_in_process_backend_passes_worker_pool(monkeypatch):
+    """--somef-backend in-process should hand a SomefWorkerPool to the SoMEF runners."""
+    run_somef_single_mock = MagicMock(return_value=True)
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "--input", REPO_URL, "--somef-backend", "in-process"],
+    )
+    monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
+    monkeypatch.setattr(cli_module, "run_somef_single", run_somef_single_mock)
+    monkeypatch.setattr(cli_module, "run_analysis", MagicMock())
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    worker_pool = run_somef_single_mock.call_args.kwargs["worker_pool"]
+    assert isinstance(worker_pool, cli_module.SomefWorkerPool)
+
+
+def test_cli_default_backend_uses_somef_cli(monkeypatch):
+    """Without --somef-backend, SoMEF runs through its command line."""
+    run_somef_single_mock = MagicMock(return_value=True)
+
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "--input", REPO_URL])
+    monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
+    monkeypatch.setattr(cli_module, "run_somef_single", run_somef_single_mock)
+    monkeypatch.setattr(cli_module, "run_analysis", MagicMock())
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    assert run_somef_single_mock.call_args.kwargs["worker_pool"] is None
+
+
+def test_cli_writes_failed_repositories(monkeypatch, tmp_path):
+    """Repositories SoMEF could not process should be listed in --failed-output."""
+    failed_output = tmp_path / "failed_repositories.json"
+
+    def run_somef_single_mock(repo_url, *args, failures=None, **kwargs):
+        failures.append({"repository": repo_url, "reason": "auth", "attempts": 1, "error": "bad token"})
+        return False
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "--input", REPO_URL, "--failed-output", str(failed_output)],
+    )
+    monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
+    monkeypatch.setattr(cli_module, "run_somef_single", run_somef_single_mock)
+
+    cli_module.cli()
+
+    assert json.loads(failed_output.read_text())["repositories"] == [REPO_URL]
+
+
+def test_cli_retry_options_build_retry_policy(monkeypatch):
+    """--somef-timeout/--somef-retries/--somef-retry-backoff should reach the SoMEF runner."""
+    run_somef_single_mock = MagicMock(return_value=True)
+
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "rsmetacheck", "--input", REPO_URL,
+            "--somef-timeout", "0", "--somef-retries", "5", "--somef-retry-backoff", "1.5",
+        ],
+    )
+    monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
+    monkeypatch.setattr(cli_module, "run_somef_single", run_somef_single_mock)
+    monkeypatch.setattr(cli_module, "run_analysis", MagicMock())
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    policy = run_somef_single_mock.call_args.kwargs["retry_policy"]
+    assert policy == cli_module.RetryPolicy(timeout=None, max_retries=5, backoff=1.5)
+
+
+
+def test_cli_configures_github_token_pool(monkeypatch):
+    """--github-token should feed the token pool shared by SoMEF and GitHub API lookups."""
+    monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setattr(github_rate_limit, "_pool", None)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "--input", REPO_URL, "--github-token", "t1", "--github-token", "t2",
+         "--github-reserve", "50"],
+    )
+    monkeypatch.setattr(cli_module, "ensure_somef_configured", lambda: True)
+    monkeypatch.setattr(cli_module, "run_somef_single", MagicMock(return_value=True))
+    monkeypatch.setattr(cli_module, "run_analysis", MagicMock())
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    pool = github_rate_limit.get_token_pool()
+    assert [budget.token for budget in pool.budgets] == ["t1", "t2"]
+    assert pool.reserve == 50
+
+
+def test_cli_shard_subcommands_run_the_queue(monkeypatch, tmp_path, capsys):
+    """'rsmetacheck shard' should queue inputs, hand the worker its options and report the queue."""
+    queue_file = tmp_path / "queue.sqlite"
+    worker_mock = MagicMock(return_value=2)
+    monkeypatch.setattr(cli_module, "run_shard_worker", worker_mock)
+
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "shard", "init", "--queue", str(queue_file),
+                                     "--input", REPO_URL, REPO_URL + "-2"])
+    cli_module.cli()
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "shard", "work", "--queue", str(queue_file),
+                                     "--node", "n1", "--somef-timeout", "0", "--somef-retries", "4"])
+    cli_module.cli()
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "shard", "status", "--queue", str(queue_file)])
+    cli_module.cli()
+
+    assert worker_mock.call_args.kwargs["node"] == "n1"
+    assert worker_mock.call_args.kwargs["retry_policy"] == cli_module.RetryPolicy(timeout=None, max_retries=4)
+    out = capsys.readouterr().out
+    assert "Added 2 work item(s)" in out
+    assert "pending: 2" in out
+
+
+def test_cli_results_db_passed_to_run_analysis(monkeypatch, tmp_path):
+    """--results-db should be forwarded to run_analysis."""
+    somef_file = tmp_path / "somef.json"
+    somef_file.write_text("{}")
+    db = str(tmp_path / "results.sqlite")
+    run_analysis_mock = MagicMock()
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "--skip-somef", "--input", str(somef_file), "--results-db", db],
+    )
+    monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
+    monkeypatch.setattr(cli_module, "_exit_on_findings", lambda *a: None)
+
+    cli_module.cli()
+
+    assert run_analysis_mock.call_args.kwargs.get("results_db") == db
+
+
+def test_cli_query_subcommand_prints_aggregations(monkeypatch, tmp_path, capsys):
+    """'rsmetacheck query' should print code counts and deltas from the results database."""
+    db = tmp_path / "results.sqlite"
+    with cli_module.ResultsStore(db) as store:
+        for findings in ([("P015", "pitfall", "e", "s")], []):
+            store.start_run()
+            store.add_repository("a.json", "owner/a", None, None, ["Python"], findings)
+            store.finish_run()
+
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "query", "--db", str(db), "codes", "--run", "1"])
+    cli_module.cli()
+    assert "P015  pitfall  1" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "query", "--db", str(db), "--json",
+                                     "delta", "--code", "P015", "--from", "1"])
+    cli_module.cli()
+    assert json.loads(capsys.readouterr().out)["fixed"] == ["owner/a"]
+
+
+def test_cli_query_missing_database_prints_error(monkeypatch, tmp_path, capsys):
+    """'rsmetacheck query' should not create a database that does not exist."""
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "query", "--db", str(tmp_path / "none.sqlite"), "runs"])
+
+    cli_module.cli()
+
+    assert "Error: Results database not found" in capsys.readouterr().out
+    assert not (tmp_path / "none.sqlite").exists()
+
+
+def test_cli_watch_runs_directory_watch(monkeypatch, tmp_path):
+    """--watch with --skip-somef should watch the input directories instead of running a batch."""
+    watch_mock = MagicMock()
+    run_analysis_mock = MagicMock()
+    monkeypatch.setattr(
+        "sys.argv",
+        ["rsmetacheck", "--skip-somef", "--watch", "--input", str(tmp_path), "--watch-debounce", "5",
+         "--pitfalls-output", str(tmp_path / "pitfalls"), "--analysis-output", str(tmp_path / "summary.json")],
+    )
+    monkeypatch.setattr(cli_module, "DirectoryWatch", watch_mock)
+    monkeypatch.setattr(cli_module, "run_analysis", run_analysis_mock)
+
+    cli_module.cli()
+
+    run_analysis_mock.assert_not_called()
+    assert watch_mock.call_args.args[1] == [str(tmp_path)]
+    assert watch_mock.call_args.kwargs["debounce"] == 5.0
+    watch_mock.return_value.run.assert_called_once()
+
+
+def test_cli_watch_requires_skip_somef(monkeypatch, tmp_path, capsys):
+    """--watch only applies to existing SoMEF outputs."""
+    monkeypatch.setattr("sys.argv", ["rsmetacheck", "--watch", "--input", str(tmp_path)])
+    monkeypatch.setattr(cli_module, "DirectoryWatch", MagicMock())
+
+    cli_module.cli()
+
+    assert "Error: --watch requires --skip-somef." in capsys.readouterr().out
+    cli_module.DirectoryWatch.assert_not_called()
@@ -0,0 +1,174 @@
+import json
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
+
+import pytest
+
+from rsmetacheck.utils.commit_resolver import CommitResolver, _repository_key
+from rsmetacheck.utils.github_rate_limit import GitHubTokenPool
+
+URLOPEN = "rsmetacheck.utils.commit_resolver.urllib.request.urlopen"
+
+
+def _graphql_response(payload):
+    response = MagicMock()
+    response.read.return_value = json.dumps(payload).encode()
+    response.headers = {"X-RateLimit-Resource": "graphql", "X-RateLimit-Remaining": "4990"}
+    response.status = 200
+    cm = MagicMock()
+    cm.__enter__.return_value = response
+    return cm
+
+
+def _query(request):
+    return json.loads(request.data)["query"]
+
+
+@pytest.fixture
+def fetch_mock(monkeypatch):
+    """REST fallback used for the repositories a batch did not resolve."""
+    mock = MagicMock(side_effect=lambda url: f"rest-{url.rsplit('/', 1)[-1]}")
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", mock)
+    return mock
+
+
+@pytest.fixture
+def token_pool():
+    return GitHubTokenPool(["t1"], sleep=lambda seconds: None)
+
+
+class TestRepositoryKey:
+    @pytest.mark.parametrize("url, expected", [
+        ("https://github.com/owner/repo", ("github", "owner/repo")),
+        ("https://github.com/owner/repo.git", ("github", "owner/repo")),
+        ("https://github.com/owner/repo/tree/main", ("github", "owner/repo")),
+        ("https://github.com/owner/repo#readme", None),
+        ("https://gitlab.com/group/sub/project.git", ("https://gitlab.com", "group/sub/project")),
+        ("https://gitlab.com/group", None),
+        ("http://gitlab.com/group/project", None),
+        ("Unknown", None),
+        ("", None),
+    ])
+    def test_keys(self, url, expected):
+        assert _repository_key(url) == expected
+
+
+class TestGitHubBatches:
+    """Test suite for resolving GitHub repositories with aliased GraphQL queries"""
+
+    def test_repositories_are_resolved_in_batches(self, fetch_mock, token_pool):
+        urls = [f"https://github.com/owner/repo{i}" for i in range(3)]
+        responses = [
+            _graphql_response({"data": {
+                "r0": {"defaultBranchRef": {"target": {"oid": "sha0"}}},
+                "r1": {"defaultBranchRef": {"target": {"oid": "sha1"}}},
+            }}),
+            _graphql_response({"data": {"r0": {"defaultBranchRef": {"target": {"oid": "sha2"}}}}}),
+        ]
+        resolver = CommitResolver(token_pool, github_batch_size=2)
+
+        with patch(URLOPEN, side_effect=responses) as urlopen:
+            assert resolver.prefetch(urls + [urls[0]]) == 3
+
+        assert urlopen.call_count == 2
+        first_request = urlopen.call_args_list[0][0][0]
+        assert first_request.full_url == "https://api.github.com/graphql"
+        assert first_request.get_header("Authorization") == "bearer t1"
+        assert 'r1: repository(owner: "owner", name: "repo1")' in _query(first_request)
+        assert [resolver.commit_id(url) for url in urls] == ["sha0", "sha1", "sha2"]
+        fetch_mock.assert_not_called()
+
+    def test_missing_repository_is_unknown_and_errors_fall_back(self, fetch_mock, token_pool):
+        urls = ["https://github.com/owner/gone", "https://github.com/owner/flaky"]
+        response = _graphql_response({
+            "data": {"r0": None, "r1": None},
+            "errors": [
+                {"type": "NOT_FOUND", "path": ["r0"], "message": "Could not resolve"},
+                {"type": "FORBIDDEN", "path": ["r1"], "message": "Resource protected"},
+            ],
+        })
+        resolver = CommitResolver(token_pool)
+
+        with patch(URLOPEN, return_value=response):
+            assert resolver.prefetch(urls) == 1
+
+        assert resolver.commit_id(urls[0]) == "Unknown"
+        assert resolver.commit_id(urls[1]) == "rest-flaky"
+        fetch_mock.assert_called_once_with(urls[1])
+
+    def test_graphql_budget_does_not_replace_rest_budget(self, fetch_mock, token_pool):
+        response = _graphql_response({"data": {"r0": {"defaultBranchRef": {"target": {"oid": "sha"}}}}})
+
+        with patch(URLOPEN, return_value=response):
+            CommitResolver(token_pool).prefetch(["https://github.com/owner/repo"])
+
+        assert token_pool._budget("t1").remaining is None
+
+    def test_without_token_github_is_left_to_rest(self, fetch_mock):
+        resolver = CommitResolver(GitHubTokenPool())
+
+        with patch(URLOPEN) as urlopen:
+            assert resolver.prefetch(["https://github.com/owner/repo"]) == 0
+
+        urlopen.assert_not_called()
+        assert resolver.commit_id("https://github.com/owner/repo") == "rest-repo"
+
+    def test_failed_query_falls_back_to_rest(self, fetch_mock, token_pool):
+        error = HTTPError("https://api.github.com/graphql", 502, "Bad Gateway", {}, None)
+        resolver = CommitResolver(token_pool)
+
+        with patch(URLOPEN, side_effect=error):
+            assert resolver.prefetch(["https://github.com/owner/repo"]) == 0
+
+        assert resolver.commit_id("https://github.com/owner/repo") == "rest-repo"
+
+
+class TestGitLabBatches:
+    """Test suite for grouping GitLab projects per host"""
+
+    def test_projects_on_one_host_share_a_query(self, fetch_mock):
+        urls = ["https://gitlab.com/group/a", "https://gitlab.com/group/sub/b", "https://gitlab.com/group/c"]
+        response = _graphql_response({"data": {
+            "p0": {"repository": {"tree": {"lastCommit": {"sha": "sha-a"}}}},
+            "p1": {"repository": {"tree": {"lastCommit": {"sha": "sha-b"}}}},
+            "p2": None,
+        }})
+        resolver = CommitResolver(GitHubTokenPool())
+
+        with patch(URLOPEN, return_value=response) as urlopen:
+            assert resolver.prefetch(urls) == 3
+
+        request = urlopen.call_args[0][0]
+        assert request.full_url == "https://gitlab.com/api/graphql"
+        assert 'p1: project(fullPath: "group/sub/b")' in _query(request)
+        assert [resolver.commit_id(url) for url in urls] == ["sha-a", "sha-b", "Unknown"]
+        fetch_mock.assert_not_called()
+
+    def test_single_project_host_is_not_batched(self, fetch_mock):
+        resolver = CommitResolver(GitHubTokenPool())
+
+        with patch(URLOPEN) as urlopen:
+            assert resolver.prefetch(["https://gitlab.example.org/group/a"]) == 0
+
+        urlopen.assert_not_called()
+
+    def test_host_without_graphql_falls_back_to_rest(self, fetch_mock):
+        urls = ["https://git.example.org/group/a", "https://git.example.org/group/b"]
+        error = HTTPError("https://git.example.org/api/graphql", 404, "Not Found", {}, None)
+        resolver = CommitResolver(GitHubTokenPool())
+
+        with patch(URLOPEN, side_effect=error) as urlopen:
+            assert resolver.prefetch(urls) == 0
+
+        assert urlopen.call_count == 1
+        assert resolver.commit_id(urls[1]) == "rest-b"
+
+
+class TestCommitIdCache:
+    def test_each_repository_is_fetched_once(self, fetch_mock):
+        resolver = CommitResolver(GitHubTokenPool())
+
+        assert resolver.commit_id("https://github.com/owner/repo") == "rest-repo"
+        assert resolver.commit_id("https://github.com/owner/repo") == "rest-repo"
+
+        fetch_mock.assert_called_once()
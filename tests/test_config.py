@@ -113,3 +113,31 @@ fail_on_warnings = false
 
     assert config.fail_on_pitfalls is False
     assert config.fail_on_warnings is False
+
+
+def test_load_analysis_config_reads_timeouts(tmp_path):
+    config_file = tmp_path / ".rsmetacheck.toml"
+    config_file.write_text(
+        """
+[timeouts]
+default = 30
+p008 = 120
+W005 = 0
+
+[profiles.ci.timeouts]
+P008 = 20
+""".strip()
+    )
+
+    config = load_analysis_config(cwd=tmp_path)
+    ci_config = load_analysis_config(cwd=tmp_path, profile="ci")
+
+    assert config.get_timeout("P008") == 120
+    assert config.get_timeout("P010") == 30
+    assert config.get_timeout("w005") is None
+    assert ci_config.get_timeout("P008") == 20
+    assert ci_config.get_timeout("P010") == 30
+
+
+def test_analysis_config_has_no_timeouts_by_default():
+    assert AnalysisConfig.empty().get_timeout("P008") is None
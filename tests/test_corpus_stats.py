@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from rsmetacheck.detect_pitfalls_main import detect_all_pitfalls
+from rsmetacheck.utils import corpus_stats
+from rsmetacheck.utils.corpus_stats import PITFALL, WARNING, CorpusStats
+
+BACKENDS = [
+    pytest.param(False, id="python"),
+    pytest.param(
+        True, id="numpy",
+        marks=pytest.mark.skipif(corpus_stats.np is None, reason="NumPy is not installed"),
+    ),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def stats(request):
+    stats = CorpusStats(["P001", "P002", "W001"], use_numpy=request.param)
+    stats.add([["P001", True, False], ["W001", False, True]], ["R", "Python"], {"P001": ["codemeta.json"]})
+    stats.add([["P001", True, False]], ["Python"], {"P001": ["codemeta.json", "setup.py"]})
+    stats.add([], ["Java"])
+    stats.add([["W001", False, True]])
+    return stats
+
+
+class TestCorpusStats:
+    """Test suite for the statistics derived from the repository x check rows"""
+
+    def test_counts_and_totals(self, stats):
+        assert stats.repositories == 4
+        assert stats.counts() == [2, 0, 2]
+        assert stats.percentages() == [50.0, 0.0, 50.0]
+        assert stats.total(PITFALL) == 2
+        assert stats.total(WARNING) == 2
+        assert stats.repositories_with_languages() == 3
+
+    def test_language_counts_keep_first_seen_order(self, stats):
+        assert stats.language_counts() == [{"R": 1, "Python": 2}, {}, {"R": 1, "Python": 1}]
+        assert list(stats.language_counts()[0]) == ["R", "Python"]
+
+    def test_language_rates(self, stats):
+        rates = stats.language_rates()
+        assert rates["Python"] == {"P001": 100.0, "P002": 0.0, "W001": 50.0}
+        assert rates["Java"]["P001"] == 0.0
+
+    def test_cooccurrence(self, stats):
+        assert stats.cooccurrence() == [[2, 0, 1], [0, 0, 0], [1, 0, 2]]
+
+    def test_source_counts(self, stats):
+        assert stats.source_counts() == {"P001": {"codemeta.json": 2, "setup.py": 1}}
+
+    def test_report(self, stats):
+        report = stats.report()
+        assert report["checks"]["W001"] == {"count": 2, "percentage": 50.0}
+        assert report["co_occurrence"] == {"P001": {"W001": 1}, "W001": {"P001": 1}}
+        assert report["languages"]["Python"]["repositories"] == 2
+
+    def test_empty_corpus(self):
+        for use_numpy in (False, corpus_stats.np is not None):
+            empty = CorpusStats(["P001"], use_numpy=use_numpy)
+            assert empty.counts() == [0]
+            assert empty.percentages() == [0.0]
+            assert empty.language_counts() == [{}]
+            assert empty.source_counts() == {}
+
+
+def test_stats_output_written_by_analysis(tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+    somef_file = tmp_path / "repo_output.json"
+    somef_file.write_text(json.dumps({
+        "full_name": [{"result": {"value": "owner/repo"}}],
+        "version": [{"source": "repository/codemeta.json", "result": {"value": "3.0.0"}}],
+        "releases": [{"tag": "1.0.0"}],
+        "programming_languages": [{"result": {"value": "Python"}}],
+    }))
+    stats_file = tmp_path / "stats.json"
+
+    detect_all_pitfalls([somef_file], tmp_path / "pitfalls", tmp_path / "summary.json", stats_output=stats_file)
+
+    report = json.loads(stats_file.read_text())
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert report["total_repositories_analyzed"] == 1
+    assert report["checks"]["P001"]["count"] == summary["pitfalls & warnings"][0]["count"] == 1
+    assert report["languages"]["Python"]["rates"]["P001"] == 100.0
+    assert report["source_files"]["P001"] == {"codemeta.json": 1}
@@ -0,0 +1,40 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from rsmetacheck.utils import date_analysis
+from rsmetacheck.utils.date_analysis import parse_date
+
+
+class TestParseDate:
+    """Test suite for the shared SoMEF date parser"""
+
+    @pytest.mark.parametrize("date_string,expected", [
+        ("2025-02-05T18:00:24Z", datetime(2025, 2, 5, 18, 0, 24)),
+        ("2022-03-11T19:01:51.720Z", datetime(2022, 3, 11, 19, 1, 51, 720000)),
+        ("2022-03-11T19:01:51.72", datetime(2022, 3, 11, 19, 1, 51, 720000)),
+        (" 2023-11-17\n", datetime(2023, 11, 17)),
+        ("2023-11-17T10:00:00+02:00", datetime(2023, 11, 17)),
+        ("2023-11-17 10:00:00", datetime(2023, 11, 17)),
+        ("2023-11-17T25:00:00Z", datetime(2023, 11, 17)),
+        ("2023-1-5", datetime(2023, 1, 5)),
+        ("2023-02-30", None),
+        ("17/11/2023", None),
+        ("", None),
+        (None, None),
+    ])
+    def test_formats(self, date_string, expected):
+        assert parse_date(date_string) == expected
+
+    def test_known_formats_skip_strptime(self):
+        parse_date.cache_clear()
+        with patch.object(date_analysis, "_parse_with_formats") as slow_path:
+            parse_date("2025-02-05T18:00:24Z")
+            parse_date("2023-11-17")
+        slow_path.assert_not_called()
+
+    def test_results_are_memoized(self):
+        parse_date.cache_clear()
+        assert parse_date("2023-11-17") is parse_date("2023-11-17")
+        assert parse_date.cache_info().hits == 1
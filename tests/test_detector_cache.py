@@ -0,0 +1,124 @@
+import inspect
+import json
+
+from rsmetacheck.config import AnalysisConfig
+from rsmetacheck.detect_pitfalls_main import PITFALL_DETECTORS, detect_all_pitfalls
+from rsmetacheck.scripts.pitfalls.p001 import detect_version_mismatch
+from rsmetacheck.utils.detector_cache import (
+    ADDITIONAL_INPUTS,
+    DETECTOR_INPUTS,
+    DetectorCache,
+    _package_modules,
+    detector_version,
+)
+from rsmetacheck.utils.detector_plan import DETECTOR_PREREQUISITES
+
+SOMEF_DATA = {
+    "full_name": [{"result": {"value": "owner/repo"}}],
+    "version": [{"source": "repository/codemeta.json", "result": {"value": "3.0.0"}}],
+    "releases": [{"tag": "1.0.0"}],
+    "license": [{"source": "repository/LICENSE", "result": {"value": "Copyright (c) 2024 Someone"}}],
+}
+
+CALLS = [(func, code, {}, None) for func, code in PITFALL_DETECTORS]
+
+
+def _keys(tmp_path, somef_data=SOMEF_DATA, calls=CALLS, file_name="repo.json"):
+    with DetectorCache(tmp_path / "cache.sqlite") as cache:
+        return cache.keys(calls, somef_data, file_name)
+
+
+class TestCacheKeys:
+    """Test suite for the per-check cache keys"""
+
+    def test_keys_are_stable(self, tmp_path):
+        assert _keys(tmp_path) == _keys(tmp_path)
+
+    def test_only_checks_reading_a_changed_category_get_new_keys(self, tmp_path):
+        changed = dict(SOMEF_DATA, license=[{"source": "repository/LICENSE", "result": {"value": "MIT License"}}])
+
+        before, after = _keys(tmp_path), _keys(tmp_path, changed)
+
+        assert {code for code in before if before[code] != after[code]} == {
+            "P002", "P006", "P007", "P010", "P013", "W003"
+        }
+
+    def test_parameters_only_change_their_check(self, tmp_path):
+        calls = [(func, code, {"ahead_significant_diff": 10} if code == "P001" else {}, None) for func, code, _, _ in CALLS]
+
+        before, after = _keys(tmp_path), _keys(tmp_path, calls=calls)
+
+        assert {code for code in before if before[code] != after[code]} == {"P001"}
+
+    def test_file_name_is_part_of_the_key(self, tmp_path):
+        assert _keys(tmp_path)["P001"] != _keys(tmp_path, file_name="other.json")["P001"]
+
+    def test_network_checks_are_not_cached(self, tmp_path):
+        keys = _keys(tmp_path)
+        assert keys["P008"] is None
+        assert keys["P015"] is None
+
+
+class TestDetectorInputs:
+    """Test suite for the SoMEF categories each check is keyed on"""
+
+    def test_every_check_has_its_inputs(self):
+        assert set(DETECTOR_INPUTS) == {code for _, code in PITFALL_DETECTORS}
+
+    def test_inputs_cover_the_plan_prerequisites(self):
+        for code, groups in DETECTOR_PREREQUISITES.items():
+            assert {category for group in groups for category in group} <= set(DETECTOR_INPUTS[code])
+
+    def test_additional_inputs_are_included(self):
+        assert set(ADDITIONAL_INPUTS) <= set(DETECTOR_PREREQUISITES)
+        for code, categories in ADDITIONAL_INPUTS.items():
+            assert set(categories) <= set(DETECTOR_INPUTS[code])
+
+
+class TestDetectorVersion:
+    """Test suite for the digest of the code behind each detector"""
+
+    def test_covers_the_helpers_a_detector_uses(self):
+        modules = [module.__name__ for module in _package_modules(inspect.getmodule(detect_version_mismatch))]
+        assert "rsmetacheck.scripts.pitfalls.p001" in modules
+        assert "rsmetacheck.utils.version_analysis" in modules
+        assert "rsmetacheck.utils.license_analysis" not in modules
+
+    def test_differs_between_detectors(self):
+        versions = {detector_version(func) for func, _ in PITFALL_DETECTORS}
+        assert len(versions) == len(PITFALL_DETECTORS)
+
+
+def test_results_persist_across_instances(tmp_path):
+    with DetectorCache(tmp_path / "cache.sqlite") as cache:
+        cache.put("key", "P001", [{"has_pitfall": True, "notes": ["a"]}])
+
+    with DetectorCache(tmp_path / "cache.sqlite") as cache:
+        assert cache.get_many(["key", "missing", None]) == {"key": [{"has_pitfall": True, "notes": ["a"]}]}
+
+
+def test_parameter_change_reruns_only_that_check(tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+    somef_file = tmp_path / "repo_output.json"
+    somef_file.write_text(json.dumps(SOMEF_DATA))
+
+    def analyze(run, config=None):
+        detect_all_pitfalls(
+            [somef_file], tmp_path / run, tmp_path / f"{run}.json", verbose=True, analysis_config=config,
+            detector_cache=tmp_path / "cache.sqlite", profile_output=tmp_path / f"{run}_profile.json",
+        )
+        assessment = json.loads((tmp_path / run / "repo_output_pitfalls.jsonld").read_text())
+        profile = json.loads((tmp_path / f"{run}_profile.json").read_text())
+        ran = {code for code, check in profile["checks"].items() if check["invocations"]}
+        return [(check["output"], check["evidence"]) for check in assessment["checks"]], ran
+
+    first, first_ran = analyze("first")
+    second, second_ran = analyze("second")
+    third, third_ran = analyze("third", AnalysisConfig(check_parameters={"P001": {"ahead_significant_diff": 10}}))
+
+    assert first == second
+    assert third[0] == ("false", "P001 not detected:")  # 3.0.0 is no longer far enough ahead of 1.0.0
+    assert third[1:] == first[1:]
+    assert {"P001", "P002", "P010"} <= first_ran
+    assert second_ran == set()
+    assert third_ran == {"P001"}
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from rsmetacheck.detect_pitfalls_main import PITFALL_DETECTORS, AnalysisSession, detect_all_pitfalls
+from rsmetacheck.utils.detector_plan import (
+    DETECTOR_PREREQUISITES,
+    NO_RESULT_WHEN_SKIPPED,
+    DetectorProfile,
+    detector_plan,
+    present_categories,
+)
+
+SOMEF_DATA = {
+    "full_name": [{"result": {"value": "owner/repo"}}],
+    "version": [{"source": "repository/codemeta.json", "result": {"value": "3.0.0"}}],
+    "releases": [{"tag": "1.0.0"}],
+    "programming_languages": [{"result": {"value": "Python"}}],
+    "identifier": [],
+}
+
+
+class TestDetectorPlan:
+    """Test suite for the per-repository selection of the checks to run"""
+
+    def test_present_categories(self):
+        assert present_categories(SOMEF_DATA) == {"full_name", "version", "releases", "programming_languages"}
+
+    def test_checks_without_their_categories_are_skipped(self):
+        plan = {code: run for _, code, run in detector_plan(PITFALL_DETECTORS, SOMEF_DATA)}
+
+        assert plan["P001"] and plan["P017"] and plan["W004"]
+        assert not plan["P012"]  # download_url is missing
+        assert not plan["P014"]  # identifier is empty
+        assert len(plan) == len(PITFALL_DETECTORS)
+
+    def test_ignored_checks_are_left_out(self):
+        plan = detector_plan(PITFALL_DETECTORS, SOMEF_DATA, lambda code: code.startswith("W"))
+        assert [code for _, code, _ in plan] == [code for _, code in PITFALL_DETECTORS if code.startswith("P")]
+
+    def test_every_prerequisite_names_a_check(self):
+        assert set(DETECTOR_PREREQUISITES) <= {code for _, code in PITFALL_DETECTORS}
+
+    @pytest.mark.parametrize("detector_func,code", PITFALL_DETECTORS, ids=[code for _, code in PITFALL_DETECTORS])
+    def test_skipped_checks_would_find_nothing(self, detector_func, code):
+        somef_data = {"full_name": [{"result": {"value": "owner/repo"}}]}
+        if code in NO_RESULT_WHEN_SKIPPED:
+            assert detector_func(somef_data, "test.json") == []
+            return
+
+        result = detector_func(somef_data, "test.json")
+        assert not any(result.get(flag) for flag in ("has_pitfall", "has_warning", "has_note"))
+
+
+class TestDetectorProfile:
+    """Test suite for the per-check counters of a run"""
+
+    def test_report(self):
+        profile = DetectorProfile(["P001", "P002"])
+        profile.add_file()
+        profile.add_invocation("P001", 0.5)
+        profile.add_invocation("P001", 0.25, failed=True)
+        profile.add_skip("P002")
+
+        report = profile.report()
+
+        assert report["files_analyzed"] == 1
+        assert report["detector_invocations"] == 2
+        assert report["skipped_invocations"] == 1
+        assert report["checks"]["P001"] == {"invocations": 2, "skipped": 0, "cached": 0, "errors": 1, "timeouts": 0, "seconds": 0.75}
+        assert report["checks"]["P002"]["skipped"] == 1
+
+
+def _write_somef(tmp_path):
+    somef_file = tmp_path / "repo_output.json"
+    somef_file.write_text(json.dumps(SOMEF_DATA))
+    return somef_file
+
+
+def test_profile_output_written_by_analysis(tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+    profile_file = tmp_path / "profile.json"
+
+    detect_all_pitfalls(
+        [_write_somef(tmp_path)], tmp_path / "pitfalls", tmp_path / "summary.json", profile_output=profile_file
+    )
+
+    report = json.loads(profile_file.read_text())
+    assert report["files_analyzed"] == 1
+    assert report["checks"]["P001"]["invocations"] == 1
+    assert report["checks"]["P015"] == {"invocations": 0, "skipped": 1, "cached": 0, "errors": 0, "timeouts": 0, "seconds": 0.0}
+    assert report["detector_invocations"] + report["skipped_invocations"] == len(PITFALL_DETECTORS)
+
+
+def test_skipped_checks_reported_as_negative_in_verbose_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+    session = AnalysisSession(tmp_path / "pitfalls", tmp_path / "summary.json", verbose=True)
+
+    record = session.process_file(_write_somef(tmp_path))
+
+    assessment = json.loads((tmp_path / "pitfalls" / record["jsonld_file"]).read_text())
+    outputs = {
+        check["assessesIndicator"]["@id"].rsplit("#", 1)[-1]: check["output"] for check in assessment["checks"]
+    }
+    assert len(outputs) == len(PITFALL_DETECTORS)
+    assert outputs["P001"] == "true"
+    assert outputs["P014"] == outputs["P015"] == outputs["W009"] == "false"
+    assert record["issues"] == [["P001", True, False]]
@@ -0,0 +1,97 @@
+import pytest
+
+from rsmetacheck.utils.detector_result import DetectorResult
+from rsmetacheck.utils.json_ld_utils import create_pitfall_jsonld
+
+
+class TestFromDict:
+    """Test suite for building DetectorResult from detector dicts"""
+
+    def test_flags_and_code_are_typed_attributes(self):
+        raw = {"has_pitfall": True, "file_name": "repo.json", "license_value": "GPL"}
+        result = DetectorResult.from_dict("P013", raw)
+
+        assert result.code == "P013"
+        assert result.file_name == "repo.json"
+        assert result.has_pitfall is True
+        assert result.has_warning is False
+        assert result.has_issue is True
+        assert result.issue_type == "Pitfall"
+        assert result.evidence == {"license_value": "GPL"}
+
+    @pytest.mark.parametrize("empty_value", [None, False, [], {}])
+    def test_uninformative_fields_are_dropped(self, empty_value):
+        raw = {"has_warning": False, "file_name": "repo.json", "field": empty_value}
+        result = DetectorResult.from_dict("W001", raw)
+        assert "field" not in result.evidence
+
+    @pytest.mark.parametrize("kept_value", ["", 0, 0.0, ["a"]])
+    def test_falsy_but_meaningful_fields_are_kept(self, kept_value):
+        raw = {"has_warning": True, "field": kept_value}
+        result = DetectorResult.from_dict("W003", raw, "repo.json")
+        assert result.evidence["field"] == kept_value
+
+    def test_detector_dict_is_not_mutated(self):
+        raw = {"has_pitfall": True, "file_name": "repo.json", "source": None}
+        DetectorResult.from_dict("P001", raw)
+        assert raw == {"has_pitfall": True, "file_name": "repo.json", "source": None}
+
+    def test_result_is_slotted(self):
+        result = DetectorResult(code="P001", file_name="repo.json")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown_attribute = 1
+
+
+class TestNotes:
+    """Test suite for note extraction"""
+
+    def test_notes_list_takes_precedence(self):
+        raw = {
+            "has_note": True,
+            "note_text": "first",
+            "notes": [{"note_text": "first"}, {"note_text": "second"}],
+        }
+        result = DetectorResult.from_dict("P001", raw, "repo.json")
+        assert result.note_texts() == ["first", "second"]
+
+    def test_single_note_text(self):
+        result = DetectorResult.from_dict("P001", {"has_note": True, "note_text": "only"}, "repo.json")
+        assert result.note_texts() == ["only"]
+
+    def test_no_notes(self):
+        result = DetectorResult.from_dict("P001", {"has_note": True}, "repo.json")
+        assert result.note_texts() == []
+
+
+class TestToDict:
+    """Test suite for the JSON-LD boundary conversion"""
+
+    def test_round_trip_keeps_evidence_and_code(self):
+        raw = {"has_pitfall": True, "file_name": "repo.json", "readme_url": "https://example.org"}
+        data = DetectorResult.from_dict("P004", raw).to_dict()
+
+        assert data["pitfall_code"] == "P004"
+        assert data["has_pitfall"] is True
+        assert data["has_warning"] is False
+        assert data["file_name"] == "repo.json"
+        assert data["readme_url"] == "https://example.org"
+
+    def test_create_pitfall_jsonld_accepts_detector_results(self, monkeypatch):
+        monkeypatch.setattr(
+            "rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "Unknown"
+        )
+        results = [
+            DetectorResult.from_dict(
+                "P004",
+                {"has_pitfall": True, "readme_url": "https://example.org", "source": "codemeta.json"},
+                "repo.json",
+            ),
+            DetectorResult(code="P005", file_name="repo.json"),
+        ]
+
+        jsonld = create_pitfall_jsonld({}, results, "repo.json", verbose=True)
+
+        assert [check["output"] for check in jsonld["checks"]] == ["true", "false"]
+        assert "https://example.org" in jsonld["checks"][0]["evidence"]
+        assert jsonld["checks"][1]["evidence"] == "P005 not detected:"
@@ -0,0 +1,130 @@
+import importlib
+import json
+import sys
+import textwrap
+import time
+
+import pytest
+
+from rsmetacheck import detect_pitfalls_main
+from rsmetacheck.config import AnalysisConfig
+from rsmetacheck.detect_pitfalls_main import PITFALL_DETECTORS, AnalysisSession
+from rsmetacheck.detector_worker import DetectorWorker, run_detectors_in_process
+
+SOMEF_DATA = {
+    "full_name": [{"result": {"value": "owner/repo"}}],
+    "version": [{"source": "repository/codemeta.json", "result": {"value": "3.0.0"}}],
+    "releases": [{"tag": "1.0.0"}],
+    "license": [{"source": "repository/LICENSE", "result": {"value": "Copyright (c) 2024 Someone"}}],
+}
+
+FAKE_DETECTORS = textwrap.dedent(
+    """
+    import os
+    import time
+
+
+    def hang(somef_data, file_name):
+        time.sleep(60)
+
+
+    def fail(somef_data, file_name):
+        raise ValueError("broken license text")
+
+
+    def crash(somef_data, file_name):
+        os._exit(1)
+
+
+    def found(somef_data, file_name, **parameters):
+        return {"has_pitfall": True, "file_name": file_name, "parameters": parameters}
+    """
+)
+
+
+@pytest.fixture
+def fake_detectors(tmp_path, monkeypatch):
+    """Install a module of detectors that hang, fail or crash, importable by the worker process."""
+    site = tmp_path / "fake_site"
+    site.mkdir()
+    (site / "fake_detectors.py").write_text(FAKE_DETECTORS)
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.delitem(sys.modules, "fake_detectors", raising=False)
+    return importlib.import_module("fake_detectors")
+
+
+class TestDetectorWorker:
+    """Test suite for running the detectors in an isolated worker process"""
+
+    def test_outcomes_match_in_process_run(self):
+        calls = [(func, code, {}, 30) for func, code in PITFALL_DETECTORS if code not in ("P008", "P015")]
+
+        with DetectorWorker() as worker:
+            isolated = list(worker.run(calls, SOMEF_DATA, "repo.json"))
+        direct = list(run_detectors_in_process(calls, SOMEF_DATA, "repo.json"))
+
+        assert [outcome.code for outcome in isolated] == [code for _, code, _, _ in calls]
+        assert [outcome.results for outcome in isolated] == [outcome.results for outcome in direct]
+
+    def test_timed_out_detector_does_not_stop_the_others(self, fake_detectors):
+        calls = [
+            (fake_detectors.hang, "P010", {}, 1),
+            (fake_detectors.found, "P002", {"threshold": 2}, 30),
+        ]
+
+        started = time.perf_counter()
+        with DetectorWorker() as worker:
+            outcomes = list(worker.run(calls, SOMEF_DATA, "repo.json"))
+
+        assert time.perf_counter() - started < 30
+        assert outcomes[0].timed_out
+        assert outcomes[0].results is None
+        assert outcomes[1].results == {"has_pitfall": True, "file_name": "repo.json", "parameters": {"threshold": 2}}
+
+    def test_errors_are_reported(self, fake_detectors):
+        calls = [(fake_detectors.fail, "P010", {}, 30), (fake_detectors.found, "P002", {}, 30)]
+
+        with DetectorWorker() as worker:
+            outcomes = list(worker.run(calls, SOMEF_DATA, "repo.json"))
+
+        assert outcomes[0].error == "broken license text"
+        assert outcomes[1].results["has_pitfall"]
+
+    def test_worker_is_restarted_after_a_crash(self, fake_detectors):
+        calls = [(fake_detectors.crash, "P010", {}, 30), (fake_detectors.found, "P002", {}, 30)]
+
+        with DetectorWorker() as worker:
+            outcomes = list(worker.run(calls, SOMEF_DATA, "repo.json"))
+            again = list(worker.run(calls[1:], SOMEF_DATA, "other.json"))
+
+        assert outcomes[0].error == "detector worker process died"
+        assert outcomes[1].results["has_pitfall"]
+        assert again[0].results["file_name"] == "other.json"
+
+
+def test_timed_out_check_reported_as_incomplete(fake_detectors, tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+    detectors = [
+        (fake_detectors.hang, code) if code == "P010" else (func, code) for func, code in PITFALL_DETECTORS
+    ]
+    monkeypatch.setattr(detect_pitfalls_main, "PITFALL_DETECTORS", detectors)
+    somef_file = tmp_path / "repo_output.json"
+    somef_file.write_text(json.dumps(SOMEF_DATA))
+    config = AnalysisConfig(detector_timeouts={"DEFAULT": 30, "P010": 1})
+
+    session = AnalysisSession(
+        tmp_path / "pitfalls", tmp_path / "summary.json", analysis_config=config, profile_output=tmp_path / "profile.json"
+    )
+    record = session.process_file(somef_file)
+    session.finalize()
+
+    assert record["incomplete"] == ["P010"]
+    assessment = json.loads((tmp_path / "pitfalls" / record["jsonld_file"]).read_text())
+    checks = {check["assessesIndicator"]["@id"].rsplit("#", 1)[-1]: check for check in assessment["checks"]}
+    assert checks["P010"]["output"] == "incomplete"
+    assert checks["P010"]["status"] == {"@id": "schema:FailedActionStatus"}
+    assert checks["P001"]["output"] == "true"
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["summary"]["incomplete_checks"] == {"P010": 1}
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert profile["checks"]["P010"]["timeouts"] == 1
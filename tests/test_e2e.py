@@ -1,11 +1,16 @@
 """Integration tests verifying the full pipeline with mock SoMEF fixtures. We are using mock data from SoMEF to save time running the tests"""
 
 import json
+import time
 from pathlib import Path
 
 from rsmetacheck.config import AnalysisConfig
-from rsmetacheck.detect_pitfalls_main import detect_all_pitfalls
+from rsmetacheck.detect_pitfalls_main import AnalysisSession, detect_all_pitfalls
 from rsmetacheck.detect_pitfalls_main import main as detect_pitfalls_main
+from rsmetacheck.run_analyzer import run_pipelined_analysis
+from rsmetacheck.utils.commit_resolver import CommitResolver
+from rsmetacheck.utils.jsonld_stream import export_pitfall_stream, read_pitfall_stream
+from rsmetacheck.utils.somef_inputs import load_somef_output
 
 
 def _make_somef_data(version="1.0.0", release_tag="1.0.0", repo_name="owner/repo"):
@@ -456,3 +461,174 @@ class TestAnalysisConfiguration:
 
         summary = json.loads(summary_file.read_text())
         assert _find_issue_count(summary, "P001") == 0
+
+
+class TestPitfallStreamOutput:
+    """Tests for the single JSON Lines output mode."""
+
+    def test_stream_replaces_individual_files(self, tmp_path):
+        somef_dir = tmp_path / "somef_inputs"
+        somef_dir.mkdir()
+        pitfalls_dir = tmp_path / "pitfalls_outputs"
+        summary_file = tmp_path / "summary.json"
+        stream_file = tmp_path / "pitfalls.jsonl.gz"
+
+        _write_somef_file(somef_dir, "repo_1.json", _make_somef_data(version="2.0.0", release_tag="1.0.0"))
+        _write_somef_file(somef_dir, "repo_2.json", _make_somef_data(version="1.0.0", release_tag="1.0.0"))
+
+        detect_all_pitfalls(
+            sorted(somef_dir.glob("*.json")),
+            pitfalls_dir,
+            summary_file,
+            pitfalls_stream=stream_file,
+        )
+
+        assert not pitfalls_dir.exists()
+
+        records = list(read_pitfall_stream(stream_file))
+        assert [file_name for file_name, _ in records] == ["repo_1.json"]
+
+        summary = json.loads(summary_file.read_text())
+        assert summary["summary"]["individual_jsonld_files_created"] == 0
+        assert summary["summary"]["jsonld_assessments_streamed"] == 1
+
+        assert export_pitfall_stream(stream_file, pitfalls_dir) == 1
+        assert (pitfalls_dir / "repo_1_pitfalls.jsonld").exists()
+
+
+class TestPipelinedAnalysis:
+    """Tests for analyzing SoMEF outputs while extraction is still running."""
+
+    def test_outputs_are_analyzed_before_extraction_finishes(self, tmp_path):
+        somef_dir = tmp_path / "somef_outputs"
+        somef_dir.mkdir()
+        pitfalls_dir = tmp_path / "pitfalls_outputs"
+        summary_file = tmp_path / "summary.json"
+        seen_before_next_output = []
+
+        def extract(on_output):
+            first = _write_somef_file(somef_dir, "repo_1.json", _make_somef_data(version="2.0.0"))
+            on_output(str(first))
+
+            expected = pitfalls_dir / "repo_1_pitfalls.jsonld"
+            deadline = time.monotonic() + 10
+            while not expected.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            seen_before_next_output.append(expected.exists())
+            assert not summary_file.exists()
+
+            second = _write_somef_file(somef_dir, "repo_2.json", _make_somef_data(version="2.0.0"))
+            on_output(str(second))
+
+        assert run_pipelined_analysis(extract, pitfalls_dir, summary_file) is True
+
+        assert seen_before_next_output == [True]
+        assert len(list(pitfalls_dir.glob("*.jsonld"))) == 2
+
+        summary = json.loads(summary_file.read_text())
+        assert summary["summary"]["total_repositories_analyzed"] == 2
+
+    def test_no_outputs_returns_false_without_summary(self, tmp_path):
+        summary_file = tmp_path / "summary.json"
+
+        assert run_pipelined_analysis(lambda on_output: None, tmp_path / "pitfalls", summary_file) is False
+        assert not summary_file.exists()
+
+    def test_summary_written_when_extraction_fails_midway(self, tmp_path, capsys):
+        somef_dir = tmp_path / "somef_outputs"
+        somef_dir.mkdir()
+        summary_file = tmp_path / "summary.json"
+
+        def extract(on_output):
+            on_output(str(_write_somef_file(somef_dir, "repo_1.json", _make_somef_data())))
+            raise RuntimeError("SoMEF crashed")
+
+        assert run_pipelined_analysis(extract, tmp_path / "pitfalls", summary_file) is True
+        assert "Error during SoMEF extraction: SoMEF crashed" in capsys.readouterr().out
+
+        summary = json.loads(summary_file.read_text())
+        assert summary["summary"]["total_repositories_analyzed"] == 1
+
+
+
+class TestCommitIdResolution:
+    """Tests for resolving commit IDs once per repository and in batches."""
+
+    def test_commit_ids_are_prefetched_and_shared(self, tmp_path, monkeypatch):
+        somef_dir = tmp_path / "somef_inputs"
+        somef_dir.mkdir()
+        pitfalls_dir = tmp_path / "pitfalls_outputs"
+        summary_file = tmp_path / "summary.json"
+        for name in ("a/b", "c/d"):
+            _write_somef_file(
+                somef_dir, f"{name.replace('/', '_')}.json", _make_somef_data(version="2.0.0", repo_name=name)
+            )
+
+        prefetched = []
+
+        def prefetch(resolver, urls):
+            urls = list(urls)
+            prefetched.extend(urls)
+            resolver._commit_ids.update({url: f"sha-{url[-1]}" for url in urls})
+            return len(urls)
+
+        fetch_calls = []
+        monkeypatch.setattr("rsmetacheck.utils.commit_resolver.CommitResolver.prefetch", prefetch)
+        monkeypatch.setattr(
+            "rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: fetch_calls.append(url)
+        )
+
+        detect_all_pitfalls(sorted(somef_dir.glob("*.json")), pitfalls_dir, summary_file, verbose=True)
+
+        assert sorted(prefetched) == ["https://github.com/a/b", "https://github.com/c/d"]
+        assert fetch_calls == []
+        summary = json.loads(summary_file.read_text())
+        assert summary["summary"]["evaluated_repositories"]["a/b"]["commit_id"] == "sha-b"
+        assessment = json.loads((pitfalls_dir / "c_d_pitfalls.jsonld").read_text())
+        assert assessment["assessedSoftware"]["commit_id"] == "sha-d"
+
+    def test_each_file_is_read_once_and_prefetched_per_batch(self, tmp_path, monkeypatch):
+        somef_dir = tmp_path / "somef_inputs"
+        somef_dir.mkdir()
+        for name in ("a/b", "c/d", "e/f"):
+            _write_somef_file(somef_dir, f"{name.replace('/', '_')}.json", _make_somef_data(repo_name=name))
+
+        loaded = []
+        monkeypatch.setattr(
+            "rsmetacheck.detect_pitfalls_main.load_somef_output",
+            lambda path: loaded.append(path) or load_somef_output(path),
+        )
+        batches = []
+        monkeypatch.setattr(
+            "rsmetacheck.utils.commit_resolver.CommitResolver.prefetch", lambda resolver, urls: batches.append(list(urls))
+        )
+        monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "sha")
+
+        session = AnalysisSession(
+            tmp_path / "pitfalls", tmp_path / "summary.json", verbose=True,
+            commit_resolver=CommitResolver(github_batch_size=2),
+        )
+        session.process_files(sorted(somef_dir.glob("*.json")))
+        session.finalize()
+
+        assert len(loaded) == 3
+        assert batches == [
+            ["https://github.com/a/b", "https://github.com/c/d"], ["https://github.com/e/f"]
+        ]
+        assert len(list((tmp_path / "pitfalls").glob("*.jsonld"))) == 3
+
+    def test_commit_id_is_fetched_once_without_prefetch(self, tmp_path, monkeypatch):
+        somef_dir = tmp_path / "somef_outputs"
+        somef_dir.mkdir()
+        fetch_calls = []
+        monkeypatch.setattr(
+            "rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id",
+            lambda url: fetch_calls.append(url) or "sha",
+        )
+
+        def extract(on_output):
+            on_output(str(_write_somef_file(somef_dir, "repo_1.json", _make_somef_data(version="2.0.0"))))
+
+        assert run_pipelined_analysis(extract, tmp_path / "pitfalls", tmp_path / "summary.json", verbose=True)
+
+        assert fetch_calls == ["https://github.com/owner/repo"]
@@ -0,0 +1,168 @@
+import pytest
+
+from rsmetacheck.utils import github_rate_limit
+from rsmetacheck.utils.github_rate_limit import (
+    GitHubTokenPool,
+    RateLimitExhausted,
+    configure_token_pool,
+    is_github_url,
+    tokens_from_environment,
+)
+
+
+class FakeClock:
+    """Clock whose sleep advances time instead of blocking."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _pool(tokens=("a", "b"), reserve=10, max_wait=900, clock=None):
+    clock = clock or FakeClock()
+    return GitHubTokenPool(tokens, reserve=reserve, max_wait=max_wait, clock=clock, sleep=clock.sleep)
+
+
+def _headers(remaining, reset, limit=5000):
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Limit": str(limit),
+    }
+
+
+class TestTokenSelection:
+    """Test suite for choosing the token of the next request"""
+
+    def test_without_tokens_requests_are_anonymous(self):
+        pool = _pool(tokens=())
+        assert pool.has_tokens is False
+        assert pool.acquire() is None
+
+    def test_duplicate_and_empty_tokens_are_ignored(self):
+        pool = _pool(tokens=("a", "", "a", "b"))
+        assert [b.token for b in pool.budgets] == ["a", "b"]
+
+    def test_token_with_most_budget_is_used(self):
+        clock = FakeClock()
+        pool = _pool(clock=clock)
+        pool.update("a", _headers(100, clock.now + 600))
+        pool.update("b", _headers(4000, clock.now + 600))
+
+        assert pool.acquire() == "b"
+
+    def test_unknown_budget_is_probed_first(self):
+        clock = FakeClock()
+        pool = _pool(clock=clock)
+        pool.update("a", _headers(4000, clock.now + 600))
+
+        assert pool.acquire() == "b"
+
+    def test_exhausted_token_is_rotated_out(self):
+        clock = FakeClock()
+        pool = _pool(clock=clock)
+        pool.update("a", _headers(5, clock.now + 600))
+        pool.update("b", _headers(50, clock.now + 600))
+
+        assert [pool.acquire() for _ in range(3)] == ["b", "b", "b"]
+        assert pool._budget("b").remaining == 47
+
+
+class TestThrottling:
+    """Test suite for pausing instead of sending requests that would fail"""
+
+    def test_pauses_until_earliest_reset(self, capsys):
+        clock = FakeClock()
+        pool = _pool(clock=clock)
+        pool.update("a", _headers(0, clock.now + 300))
+        pool.update("b", _headers(3, clock.now + 120))
+
+        assert pool.acquire() == "b"
+        assert clock.sleeps == [120]
+        assert "pausing 120s" in capsys.readouterr().out
+
+    def test_gives_up_when_reset_is_too_far(self):
+        clock = FakeClock()
+        pool = _pool(tokens=("a",), max_wait=60, clock=clock)
+        pool.update("a", _headers(0, clock.now + 3000))
+
+        with pytest.raises(RateLimitExhausted):
+            pool.acquire()
+        assert clock.sleeps == []
+
+    def test_retry_after_pauses_every_request(self):
+        clock = FakeClock()
+        pool = _pool(clock=clock)
+        pool.update(None, {"Retry-After": "30"}, status=429)
+
+        pool.wait_if_paused()
+        assert clock.sleeps == [30]
+        assert pool.acquire() in ("a", "b")
+
+    def test_budget_reported_without_reset_is_probed_later(self):
+        clock = FakeClock()
+        pool = _pool(tokens=("a",), clock=clock)
+        pool.record_remaining("a", 0)
+
+        assert pool.acquire() == "a"
+        assert clock.sleeps == [60]
+
+    @pytest.mark.parametrize("headers", [None, {}, {"X-RateLimit-Remaining": "many"}, object()])
+    def test_unusable_headers_are_ignored(self, headers):
+        pool = _pool()
+        pool.update("a", headers, status=200)
+        assert pool._budget("a").remaining is None
+
+
+class TestBudgetSummary:
+    """Test suite for the budget shown in progress output"""
+
+    def test_no_summary_before_first_response(self):
+        assert _pool().budget_summary() is None
+
+    def test_summary_adds_up_tokens(self):
+        clock = FakeClock()
+        pool = _pool(clock=clock)
+        pool.update("a", _headers(1000, clock.now + 600))
+        pool.update("b", _headers(2500, clock.now + 1200))
+
+        assert pool.budget_summary() == (
+            "GitHub API budget: 3500/10000 requests left across 2 tokens, next reset in 10m"
+        )
+
+
+class TestConfiguration:
+    """Test suite for reading tokens and the shared pool"""
+
+    def test_tokens_from_environment(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKENS", "a, b,,")
+        monkeypatch.setenv("GITHUB_TOKEN", "c")
+        assert tokens_from_environment() == ["a", "b", "c"]
+
+    def test_configured_tokens_come_first(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+        monkeypatch.setenv("GITHUB_TOKEN", "env")
+        monkeypatch.setattr(github_rate_limit, "_pool", None)
+
+        pool = configure_token_pool(["cli"], reserve=0)
+
+        assert github_rate_limit.get_token_pool() is pool
+        assert [b.token for b in pool.budgets] == ["cli", "env"]
+        assert pool.reserve == 0
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://github.com/owner/repo", True),
+        ("https://api.github.com/repos/owner/repo", True),
+        ("https://gitlab.com/owner/repo", False),
+        ("https://notgithub.com/owner/repo", False),
+        ("not a url", False),
+    ])
+    def test_is_github_url(self, url, expected):
+        assert is_github_url(url) is expected
@@ -1,10 +1,21 @@
+import hashlib
 import json
 from unittest.mock import MagicMock, patch
 from urllib.error import HTTPError, URLError
 
 import pytest
 
-from rsmetacheck.utils.json_ld_utils import fetch_latest_commit_id
+from rsmetacheck.utils import github_rate_limit
+from rsmetacheck.utils.detector_result import DetectorResult
+from rsmetacheck.utils.github_rate_limit import GitHubTokenPool
+from rsmetacheck.utils.json_ld_utils import (
+    RepositoryLookups,
+    compute_check_id,
+    create_pitfall_jsonld,
+    fetch_latest_commit_id,
+    format_evidence_text,
+    get_suggestion_text,
+)
 
 
 def _mock_urlopen(payload: bytes) -> MagicMock:
@@ -72,6 +83,46 @@ class TestFetchLatestCommitIdGitHub:
         assert "/repo.git" not in called_url
 
 
+class TestFetchLatestCommitIdTokenPool:
+    """GitHub commit lookups draw on the shared token pool."""
+
+    @pytest.fixture
+    def token_pool(self, monkeypatch):
+        pool = GitHubTokenPool(["t1", "t2"], sleep=lambda seconds: None)
+        monkeypatch.setattr(github_rate_limit, "_pool", pool)
+        return pool
+
+    @patch("rsmetacheck.utils.json_ld_utils.urllib.request.urlopen")
+    def test_token_is_sent_and_budget_recorded(self, mock_urlopen, token_pool):
+        response_cm = _mock_urlopen(json.dumps({"sha": "abc"}).encode())
+        response_cm.__enter__.return_value.headers = {
+            "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "9999999999", "X-RateLimit-Limit": "5000",
+        }
+        mock_urlopen.return_value = response_cm
+
+        assert fetch_latest_commit_id("https://github.com/user/repo") == "abc"
+
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("Authorization") == "token t1"
+        assert token_pool._budget("t1").remaining == 4999
+
+    @patch("rsmetacheck.utils.json_ld_utils.urllib.request.urlopen")
+    def test_rate_limited_request_is_retried_with_next_token(self, mock_urlopen, token_pool):
+        rate_limited = HTTPError(
+            url="https://api.github.com/repos/user/repo/commits/HEAD",
+            code=403,
+            msg="rate limit exceeded",
+            hdrs={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9999999999"},
+            fp=None,
+        )
+        mock_urlopen.side_effect = [rate_limited, _mock_urlopen(json.dumps({"sha": "abc"}).encode())]
+
+        assert fetch_latest_commit_id("https://github.com/user/repo") == "abc"
+
+        tokens = [call[0][0].get_header("Authorization") for call in mock_urlopen.call_args_list]
+        assert tokens == ["token t1", "token t2"]
+
+
 class TestFetchLatestCommitIdGitLab:
     """GitLab.com URLs must use the GitLab API v4 and return the 'id' field."""
 
@@ -148,3 +199,102 @@ class TestFetchLatestCommitIdGitLab:
         )
         assert isinstance(result, str)
         assert len(result) == 40  # Git commit hashes are 40 hex characters
+
+
+class TestComputeCheckId:
+    def test_documented_encoding(self):
+        expected = hashlib.sha256(b"4:P0014:true8:evidence3:N/A").hexdigest()
+        assert compute_check_id("P001", "true", "evidence", "N/A") == expected
+
+    def test_same_fields_give_same_id(self):
+        assert compute_check_id("W002", "true", "é", "fix it") == compute_check_id("W002", "true", "é", "fix it")
+
+    def test_field_boundaries_are_unambiguous(self):
+        assert compute_check_id("P001", "true", "ab", "c") != compute_check_id("P001", "true", "a", "bc")
+
+    @pytest.mark.parametrize("field_index", range(4))
+    def test_every_field_changes_the_id(self, field_index):
+        fields = ["P001", "true", "evidence", "suggestion"]
+        changed = list(fields)
+        changed[field_index] += "x"
+        assert compute_check_id(*fields) != compute_check_id(*changed)
+
+    @patch("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", return_value="Unknown")
+    def test_check_ids_are_stable_across_runs(self, _mock_fetch):
+        results = [{"pitfall_code": "P005", "has_pitfall": False}]
+        first = create_pitfall_jsonld({}, results, "repo.json", verbose=True)
+        second = create_pitfall_jsonld({}, results, "repo.json", verbose=True)
+
+        check = first["checks"][0]
+        assert check["checkId"] == second["checks"][0]["checkId"]
+        assert check["checkId"] == compute_check_id("P005", check["output"], check["evidence"], check["suggestion"])
+
+
+class TestIncompleteChecks:
+    @patch("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", return_value="Unknown")
+    def test_timed_out_check_is_listed_without_verbose(self, _mock_fetch):
+        results = [DetectorResult.timed_out("P010", "repo.json", 5.0), DetectorResult("P002", "repo.json")]
+
+        checks = create_pitfall_jsonld({}, results, "repo.json")["checks"]
+
+        assert len(checks) == 1
+        assert checks[0]["output"] == "incomplete"
+        assert checks[0]["status"] == {"@id": "schema:FailedActionStatus"}
+        assert checks[0]["evidence"] == "P010 incomplete: the check did not finish within 5s"
+        assert checks[0]["checkId"] == compute_check_id("P010", "incomplete", checks[0]["evidence"], "N/A")
+
+
+
+class TestEvidenceTemplates:
+    """Test suite for the per-code evidence templates"""
+
+    def test_field_template(self):
+        result = {"repository_url": "https://example.org", "metadata_source_files": ["codemeta.json", "package.json"]}
+        assert format_evidence_text("P009", result) == (
+            "P009 detected: codemeta.json and package.json codeRepository points to homepage instead of repository: "
+            "https://example.org"
+        )
+
+    def test_missing_required_field_falls_back(self):
+        assert format_evidence_text("P009", {"file_name": "repo.json"}) == "P009 detected: Issue detected in repo.json"
+        assert format_evidence_text("X999", {}) == "X999 detected: Issue detected in unknown file"
+
+    def test_template_without_required_fields(self):
+        assert format_evidence_text("W007", {"source": "repository/codemeta.json"}) == (
+            "W007 detected: codemeta.json identifier field is empty or missing"
+        )
+
+
+class TestSuggestionTemplates:
+    """Test suite for the per-code suggestion templates and their repository lookups"""
+
+    @pytest.fixture
+    def somef_data(self):
+        return {
+            "code_repository": [
+                {"technique": "code_parser", "result": {"value": "https://example.org"}},
+                {"technique": "GitHub_API", "result": {"value": "https://github.com/a/b"}},
+            ],
+        }
+
+    def test_lookup_is_shared_across_checks(self, somef_data):
+        lookups = RepositoryLookups(somef_data)
+        assert "https://github.com/a/b" in get_suggestion_text("P009", {}, somef_data, lookups)
+        somef_data["code_repository"].clear()
+        assert "https://github.com/a/b" in get_suggestion_text("W010", {}, somef_data, lookups)
+
+    def test_lookups_are_only_computed_when_needed(self):
+        lookups = RepositoryLookups({"code_repository": ["not an entry"]})
+        assert get_suggestion_text("W006", {"other_identifier": "10.1/x"}, lookups=lookups).endswith(
+            "such as 10.1/x to improve discoverability."
+        )
+        assert "github_api_repo" not in vars(lookups)
+
+    def test_missing_values_fall_back(self):
+        assert get_suggestion_text("P009") == get_suggestion_text("P009", {}, {"code_repository": []})
+        assert get_suggestion_text("X999") == "Review and address the issue described for X999"
+
+    def test_p003_splits_authors(self):
+        assert get_suggestion_text("P003", {"author_value": "Ann and Bob, Cy"}) == (
+            "You should separate multiple authors into a structured list. For example: ['Ann', 'Bob', 'Cy']"
+        )
@@ -0,0 +1,95 @@
+import gzip
+import json
+
+import pytest
+
+from rsmetacheck.utils.jsonld_stream import (
+    PitfallStreamWriter,
+    export_pitfall_stream,
+    read_pitfall_stream,
+)
+
+ASSESSMENT = {
+    "@type": "SoftwareQualityAssessment",
+    "name": "Quality Assessment for repo",
+    "checks": [{"@type": "CheckResult", "output": "true", "evidence": "ünïcode"}],
+}
+
+
+class TestPitfallStreamWriter:
+    """Test suite for the batch JSON Lines writer"""
+
+    def test_one_compact_line_per_assessment(self, tmp_path):
+        stream = tmp_path / "pitfalls.jsonl"
+        with PitfallStreamWriter(stream) as writer:
+            writer.write(ASSESSMENT, "repo_1.json")
+            writer.write(ASSESSMENT, "repo_2.json")
+
+        lines = stream.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert writer.records_written == 2
+        assert ", " not in lines[0] and '": ' not in lines[0]
+        assert "ünïcode" in lines[0]
+        assert json.loads(lines[1]) == {"file_name": "repo_2.json", "assessment": ASSESSMENT}
+
+    def test_non_compact_mode_uses_default_separators(self, tmp_path):
+        stream = tmp_path / "pitfalls.jsonl"
+        with PitfallStreamWriter(stream, compact=False) as writer:
+            writer.write(ASSESSMENT, "repo_1.json")
+
+        assert '"file_name": "repo_1.json"' in stream.read_text(encoding="utf-8")
+
+    def test_gz_suffix_writes_gzip(self, tmp_path):
+        stream = tmp_path / "pitfalls.jsonl.gz"
+        with PitfallStreamWriter(stream) as writer:
+            writer.write(ASSESSMENT, "repo_1.json")
+
+        with gzip.open(stream, "rt", encoding="utf-8") as f:
+            record = json.loads(f.readline())
+        assert record["assessment"] == ASSESSMENT
+
+    def test_sets_are_serialized_as_lists(self, tmp_path):
+        stream = tmp_path / "pitfalls.jsonl"
+        with PitfallStreamWriter(stream) as writer:
+            writer.write({"values": {"only"}}, "repo_1.json")
+
+        [(_, assessment)] = list(read_pitfall_stream(stream))
+        assert assessment == {"values": ["only"]}
+
+    def test_unserializable_objects_raise(self, tmp_path):
+        with PitfallStreamWriter(tmp_path / "pitfalls.jsonl") as writer:
+            with pytest.raises(TypeError):
+                writer.write({"value": object()}, "repo_1.json")
+
+
+class TestReadAndExport:
+    """Test suite for reading a stream back and exporting per-file JSON-LD"""
+
+    @pytest.mark.parametrize("name", ["pitfalls.jsonl", "pitfalls.jsonl.gz"])
+    def test_round_trip(self, tmp_path, name):
+        stream = tmp_path / name
+        with PitfallStreamWriter(stream) as writer:
+            writer.write(ASSESSMENT, "repo_1.json")
+
+        assert list(read_pitfall_stream(stream)) == [("repo_1.json", ASSESSMENT)]
+
+    def test_blank_lines_are_ignored(self, tmp_path):
+        stream = tmp_path / "pitfalls.jsonl"
+        stream.write_text(
+            "\n" + json.dumps({"file_name": "repo_1.json", "assessment": ASSESSMENT}) + "\n\n",
+            encoding="utf-8",
+        )
+        assert len(list(read_pitfall_stream(stream))) == 1
+
+    def test_export_matches_individual_files(self, tmp_path):
+        stream = tmp_path / "pitfalls.jsonl.gz"
+        with PitfallStreamWriter(stream) as writer:
+            writer.write(ASSESSMENT, "repo_1.json")
+            writer.write(ASSESSMENT, "repo_2.json")
+
+        output_dir = tmp_path / "pitfalls_outputs"
+        assert export_pitfall_stream(stream, output_dir) == 2
+
+        exported = output_dir / "repo_1_pitfalls.jsonld"
+        assert exported.read_text(encoding="utf-8") == json.dumps(ASSESSMENT, indent=2, ensure_ascii=False)
+        assert (output_dir / "repo_2_pitfalls.jsonld").exists()
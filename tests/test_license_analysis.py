@@ -0,0 +1,117 @@
+import pytest
+
+from rsmetacheck.scripts.pitfalls.p002 import detect_license_template_placeholders
+from rsmetacheck.scripts.pitfalls.p010 import detect_copyright_only_license
+from rsmetacheck.scripts.pitfalls.p013 import detect_license_no_version_pitfall
+from rsmetacheck.scripts.warnings.w003 import detect_dual_license_missing_codemeta_pitfall
+from rsmetacheck.utils.license_analysis import LicenseView, license_view, unversioned_families
+from rsmetacheck.utils.pitfall_utils import is_metadata_file_source, shared_category_views
+
+
+def _entry(value, source, technique="file_exploration"):
+    return {"result": {"value": value}, "source": source, "technique": technique}
+
+
+@pytest.fixture
+def somef_data():
+    return {
+        "license": [
+            _entry("MIT License\nCopyright (c) <year> <copyright holders>", "repository/LICENSE"),
+            _entry("GPL", "repository/CodeMeta.json", "code_parser"),
+            _entry("This project is dual licensed under MIT or Apache-2.0", "repository/README.md"),
+            _entry("Apache-2.0", "repository/pom.xml", "code_parser"),
+        ]
+    }
+
+
+class TestLicenseView:
+    """Test suite for the shared classification of license entries"""
+
+    def test_entries_are_classified(self, somef_data):
+        view = LicenseView(somef_data["license"])
+
+        assert view.license_file.source == "repository/LICENSE"
+        assert [entry.source for entry in view.metadata_entries()] == ["repository/CodeMeta.json", "repository/pom.xml"]
+        assert view.codemeta_license_count() == 1
+        assert view.dual_license_entry().source == "repository/README.md"
+
+    def test_license_file_needs_a_value(self):
+        view = LicenseView([
+            {"source": "repository/LICENSE", "technique": "file_exploration"},
+            _entry("MIT", "repository/LICENSE.md"),
+        ])
+        assert view.license_file.source == "repository/LICENSE.md"
+
+    def test_non_dict_entries_are_ignored(self):
+        view = LicenseView(["MIT", _entry("MIT", "repository/LICENSE")])
+        assert len(view.entries) == 1
+
+    def test_view_is_shared_by_the_detectors(self, somef_data):
+        with shared_category_views():
+            view = license_view(somef_data)
+            for detector in (
+                detect_license_template_placeholders,
+                detect_copyright_only_license,
+                detect_license_no_version_pitfall,
+                detect_dual_license_missing_codemeta_pitfall,
+            ):
+                detector(somef_data, "test.json")
+            assert license_view(somef_data) is view
+
+    def test_view_is_rebuilt_outside_an_analysis(self, somef_data):
+        view = license_view(somef_data)
+        somef_data["license"][1]["result"]["value"] = "GPL-3.0"
+        assert license_view(somef_data) is not view
+        assert not detect_license_no_version_pitfall(somef_data, "test.json")["has_pitfall"]
+
+    def test_missing_license_list(self):
+        assert license_view({}) is None
+        assert license_view({"license": "MIT"}) is None
+
+
+class TestSharedMatching:
+    """Test suite for the matching rules the license checks now have in common"""
+
+    def test_metadata_file_names_are_case_insensitive(self, somef_data):
+        result = detect_license_no_version_pitfall(somef_data, "test.json")
+
+        assert result["has_pitfall"]
+        assert result["metadata_source_files"] == ["CodeMeta.json"]
+
+    def test_repository_named_after_a_metadata_file_is_not_one(self):
+        somef_data = {"license": [
+            _entry("GPL", "https://raw.githubusercontent.com/o/text-description-tool/main/README.md", "code_parser"),
+        ]}
+
+        assert LicenseView(somef_data["license"]).metadata_entries() == []
+        assert not detect_license_no_version_pitfall(somef_data, "test.json")["has_pitfall"]
+
+    @pytest.mark.parametrize("source,expected", [
+        ("repository/DESCRIPTION", True),
+        ("https://raw.githubusercontent.com/o/r/main/DESCRIPTION", True),
+        ("repository/DESCRIPTION.md", False),
+        ("repository/CodeMeta.json", True),
+        ("C:\\repo\\pom.xml", True),
+        ("https://raw.githubusercontent.com/o/text-description-tool/main/README.md", False),
+        ("https://github.com/o/setup.py-helpers/blob/main/LICENSE", False),
+    ])
+    def test_metadata_files_are_matched_by_name(self, source, expected):
+        assert is_metadata_file_source(source) is expected
+
+    def test_p002_and_p010_read_the_same_license_file(self, somef_data):
+        somef_data["license"].insert(0, _entry("Copyright 2017 Someone", "repository/COPYING.LICENSE"))
+
+        p002 = detect_license_template_placeholders(somef_data, "test.json")
+        p010 = detect_copyright_only_license(somef_data, "test.json")
+        assert p002["license_source"] == p010["license_source"] == "repository/COPYING.LICENSE"
+
+    @pytest.mark.parametrize("value,expected", [
+        ("GPL", ["GPL"]),
+        ("GPL-3.0-or-later", []),
+        ("LGPL (>= 2.1)", []),
+        ("GPL OR BSD", ["GPL", "BSD"]),
+        ("0BSD", []),
+        ("LicenseRef-GPL", []),
+    ])
+    def test_unversioned_families(self, value, expected):
+        assert unversioned_families(value) == expected
@@ -31,6 +31,7 @@ class TestNormalizeRepositoryUrl:
         # Empty/None handling
         ("", ""),
         (None, ""),
+        (["https://github.com/user/repo"], ""),
 
         # HTTP vs HTTPS (should be same after normalization)
         ("http://github.com/user/repo", "https://github.com/user/repo"),
@@ -387,4 +388,24 @@ class TestDetectDifferentRepositoryPitfall:
         }
 
         result = detect_different_repository_pitfall(somef_data, "test.json")
-        assert result["has_pitfall"] is True
\ No newline at end of file
+        assert result["has_pitfall"] is True
+
+    def test_list_valued_repository_is_skipped(self):
+        """Test that a codeRepository list does not crash the check nor count as different"""
+        somef_data = {
+            "code_repository": [
+                {
+                    "source": "GitHub_API",
+                    "technique": "GitHub_API",
+                    "result": {"value": "https://github.com/user/repo"}
+                },
+                {
+                    "source": "repository/codemeta.json",
+                    "technique": "code_parser",
+                    "result": {"value": ["https://github.com/user/repo"]}
+                }
+            ]
+        }
+
+        result = detect_different_repository_pitfall(somef_data, "test.json")
+        assert result["has_pitfall"] is False
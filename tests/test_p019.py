@@ -2,6 +2,7 @@ import pytest
 from rsmetacheck.scripts.pitfalls.p019 import (
     get_author_identifier,
     extract_authors_from_somef,
+    group_sources_by_author_count,
     find_author_count_inconsistencies,
     detect_inconsistent_author_count
 )
@@ -233,6 +234,27 @@ class TestExtractAuthorsFromSomef:
         assert result[0]["source_file"] == expected_file
 
 
+class TestGroupSourcesByAuthorCount:
+    """Test suite for group_sources_by_author_count function"""
+
+    def test_empty_sources(self):
+        assert group_sources_by_author_count([]) == []
+
+    def test_groups_sorted_by_count(self):
+        sources = [
+            {"author_count": 3, "source_file": "package.json", "source": "repository/package.json", "authors": []},
+            {"author_count": 1, "source_file": "codemeta.json", "source": "repository/codemeta.json", "authors": []},
+            {"author_count": 3, "source_file": "CITATION.cff", "source": "repository/CITATION.cff", "authors": []},
+        ]
+
+        groups = group_sources_by_author_count(sources)
+
+        assert [g["author_count"] for g in groups] == [1, 3]
+        assert groups[0]["source_files"] == ["codemeta.json"]
+        assert groups[1]["source_files"] == ["package.json", "CITATION.cff"]
+        assert groups[1]["sources"] == ["repository/package.json", "repository/CITATION.cff"]
+
+
 class TestFindAuthorCountInconsistencies:
     """Test suite for find_author_count_inconsistencies function"""
 
@@ -287,8 +309,16 @@ class TestFindAuthorCountInconsistencies:
         
         has_inconsistency, inconsistencies = find_author_count_inconsistencies(sources)
         assert has_inconsistency is True
-        # Should have 3 inconsistencies: (1,2), (1,3), (2,3)
-        assert len(inconsistencies) == 3
+        # A single record compares the fewest-authors group with the most-authors group
+        assert len(inconsistencies) == 1
+        assert inconsistencies[0]["fewer_count"] == 1
+        assert inconsistencies[0]["more_count"] == 3
+        assert inconsistencies[0]["difference"] == 2
+
+        has_inconsistency, pairs = find_author_count_inconsistencies(sources, expand_pairs=True)
+        assert has_inconsistency is True
+        # Should have 3 pairs: (1,2), (1,3), (2,3)
+        assert len(pairs) == 3
 
     def test_multiple_sources_some_matching(self):
         """Test with multiple sources where some have matching counts"""
@@ -300,8 +330,14 @@ class TestFindAuthorCountInconsistencies:
         
         has_inconsistency, inconsistencies = find_author_count_inconsistencies(sources)
         assert has_inconsistency is True
-        # Should have 2 inconsistencies: codemeta(2) vs package(3), CITATION(2) vs package(3)
-        assert len(inconsistencies) == 2
+        assert len(inconsistencies) == 1
+        assert inconsistencies[0]["sources_with_fewer"] == ["codemeta.json", "CITATION.cff"]
+        assert inconsistencies[0]["sources_with_more"] == ["package.json"]
+
+        has_inconsistency, pairs = find_author_count_inconsistencies(sources, expand_pairs=True)
+        assert has_inconsistency is True
+        # Should have 2 pairs: codemeta(2) vs package(3), CITATION(2) vs package(3)
+        assert len(pairs) == 2
 
     def test_inconsistency_details_structure(self):
         """Test that inconsistency details have correct structure"""
@@ -317,15 +353,49 @@ class TestFindAuthorCountInconsistencies:
         assert "source_with_fewer" in inc
         assert "source_with_fewer_full" in inc
         assert "fewer_count" in inc
-        assert "fewer_authors" in inc
+        assert "sources_with_fewer" in inc
         assert "source_with_more" in inc
         assert "source_with_more_full" in inc
         assert "more_count" in inc
-        assert "more_authors" in inc
+        assert "sources_with_more" in inc
         assert "difference" in inc
-        
-        assert inc["fewer_authors"] == ["Alice"]
-        assert inc["more_authors"] == ["Alice", "Bob", "Charlie"]
+
+        # Author lists live in author_sources only and are not copied into records
+        assert "fewer_authors" not in inc
+        assert "more_authors" not in inc
+
+    def test_expanded_pairs_are_compact(self):
+        """Test that expanded pair records do not copy author lists"""
+        sources = [
+            {"author_count": 1, "source_file": "codemeta.json", "source": "repository/codemeta.json", "authors": ["Alice"]},
+            {"author_count": 3, "source_file": "CITATION.cff", "source": "repository/CITATION.cff", "authors": ["Alice", "Bob", "Charlie"]}
+        ]
+
+        _, pairs = find_author_count_inconsistencies(sources, expand_pairs=True)
+
+        assert pairs == [{
+            "source_with_fewer": "codemeta.json",
+            "source_with_fewer_full": "repository/codemeta.json",
+            "fewer_count": 1,
+            "source_with_more": "CITATION.cff",
+            "source_with_more_full": "repository/CITATION.cff",
+            "more_count": 3,
+            "difference": 2
+        }]
+
+    def test_many_sources_produce_single_record(self):
+        """Test that the default mode stays linear for many contributor sources"""
+        sources = [
+            {"author_count": i % 7 + 1, "source_file": f"file_{i}", "source": f"repository/file_{i}", "authors": []}
+            for i in range(500)
+        ]
+
+        has_inconsistency, inconsistencies = find_author_count_inconsistencies(sources)
+
+        assert has_inconsistency is True
+        assert len(inconsistencies) == 1
+        assert inconsistencies[0]["fewer_count"] == 1
+        assert inconsistencies[0]["more_count"] == 7
 
     def test_zero_author_count(self):
         """Test handling of zero author count"""
@@ -442,6 +512,10 @@ class TestDetectInconsistentAuthorCount:
         assert result["total_sources"] == 3
         assert result["min_author_count"] == 1
         assert result["max_author_count"] == 3
+        assert len(result["inconsistencies"]) == 1
+        assert [g["author_count"] for g in result["author_count_groups"]] == [1, 2, 3]
+
+        result = detect_inconsistent_author_count(somef_data, "test_repo.json", expand_pairs=True)
         # Should have 3 inconsistencies: (1,2), (1,3), (2,3)
         assert len(result["inconsistencies"]) == 3
 
@@ -453,6 +527,7 @@ class TestDetectInconsistentAuthorCount:
         assert "has_warning" in result
         assert "file_name" in result
         assert "author_sources" in result
+        assert "author_count_groups" in result
         assert "inconsistencies" in result
         assert "total_sources" in result
         assert "min_author_count" in result
@@ -516,7 +591,7 @@ class TestDetectInconsistentAuthorCount:
                 True,
                 1,
                 3,
-                3
+                1
             ),
         ])
     def test_detection_scenarios(self, somef_data, expected_warning, expected_min, 
@@ -571,8 +646,8 @@ class TestDetectInconsistentAuthorCount:
         assert result["min_author_count"] == 1
         assert result["max_author_count"] == 2
 
-    def test_inconsistency_contains_author_lists(self):
-        """Test that inconsistencies contain author lists"""
+    def test_author_lists_kept_once_in_author_sources(self):
+        """Test that author lists are reported per source, not per inconsistency"""
         somef_data = {
             "author": [
                 {
@@ -590,6 +665,8 @@ class TestDetectInconsistentAuthorCount:
         
         assert result["has_warning"] is True
         inc = result["inconsistencies"][0]
-        assert inc["fewer_authors"] == ["Alice"]
-        assert inc["more_authors"] == ["Alice", "Bob", "Charlie"]
+        assert "fewer_authors" not in inc
+        assert "more_authors" not in inc
         assert inc["difference"] == 2
+        assert result["author_sources"][0]["authors"] == ["Alice"]
+        assert result["author_sources"][1]["authors"] == ["Alice", "Bob", "Charlie"]
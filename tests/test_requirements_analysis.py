@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+import pytest
+
+from rsmetacheck.scripts.pitfalls.p008 import detect_invalid_software_requirement_pitfall
+from rsmetacheck.scripts.warnings.w001 import detect_unversioned_requirements
+from rsmetacheck.scripts.warnings.w004 import detect_programming_language_no_version_pitfall
+from rsmetacheck.scripts.warnings.w005 import detect_multiple_requirements_string_warning
+from rsmetacheck.utils import requirements_analysis
+from rsmetacheck.utils.pitfall_utils import shared_category_views
+from rsmetacheck.utils.requirements_analysis import (
+    RequirementsView,
+    extract_urls,
+    requirements_view,
+    split_requirements,
+    version_parts,
+)
+
+
+def _entry(result, source, technique="code_parser"):
+    return {"result": result, "source": source, "technique": technique}
+
+
+@pytest.fixture
+def somef_data():
+    return {
+        "requirements": [
+            _entry({"value": "numpy>=1.20, pandas", "name": "numpy>=1.20, pandas"}, "repository/setup.py"),
+            _entry({"value": "https://example.org/dep.tar.gz"}, "repository/CodeMeta.json"),
+            _entry({"value": "R (>= 4.0)", "name": "R", "version": ">= 4.0"}, "repository/DESCRIPTION"),
+            _entry({"value": "pip install -r requirements.txt"}, "repository/README.md", "header_analysis"),
+        ]
+    }
+
+
+class TestRequirementsView:
+    """Test suite for the shared classification and parsing of requirements"""
+
+    def test_entries_are_classified(self, somef_data):
+        view = RequirementsView(somef_data["requirements"])
+
+        assert [entry.source for entry in view.metadata_entries()] == [
+            "repository/setup.py", "repository/CodeMeta.json", "repository/DESCRIPTION",
+        ]
+        assert [entry.source for entry in view.codemeta_entries()] == ["repository/CodeMeta.json"]
+        assert [entry.source for entry in view.split_source_entries()] == [
+            "repository/setup.py", "repository/CodeMeta.json",
+        ]
+
+    def test_entries_are_parsed(self, somef_data):
+        setup, codemeta, description, _ = RequirementsView(somef_data["requirements"]).entries
+
+        assert codemeta.is_url
+        assert setup.urls() == []
+        assert setup.version_parts() == [("numpy>=1.20", True), ("pandas", False)]
+        assert setup.split() == ("numpy>=1.20, pandas", ["numpy>=1.20", "pandas"])
+        assert description.version_parts() == [("R", True)]
+
+    def test_requirements_are_parsed_once_per_repository(self, somef_data, monkeypatch):
+        calls = []
+        original = requirements_analysis.version_parts
+        monkeypatch.setattr(requirements_analysis, "version_parts", lambda req: calls.append(req) or original(req))
+
+        with shared_category_views(), patch("rsmetacheck.scripts.pitfalls.p008.check_url_status", return_value={
+            "is_accessible": True, "status_code": 200, "error": None,
+        }):
+            detect_invalid_software_requirement_pitfall(somef_data, "test.json")
+            for detector in (
+                detect_unversioned_requirements,
+                detect_unversioned_requirements,
+                detect_multiple_requirements_string_warning,
+                detect_programming_language_no_version_pitfall,
+            ):
+                detector(somef_data, "test.json")
+            assert requirements_view(somef_data) is requirements_view(somef_data)
+
+        # One call per metadata-file entry, despite W001 running twice.
+        assert len(calls) == 3
+
+    def test_view_is_rebuilt_outside_an_analysis(self, somef_data):
+        view = requirements_view(somef_data)
+        somef_data["requirements"][1]["result"]["version"] = "1.0"
+        assert requirements_view(somef_data) is not view
+        assert detect_programming_language_no_version_pitfall(somef_data, "test.json")["requirements_without_version"] == []
+
+
+class TestParsing:
+    """Test suite for the requirement parsing functions"""
+
+    def test_extract_urls(self):
+        assert extract_urls("see https://example.org/a, and www.example.com/b.") == [
+            "https://example.org/a", "www.example.com/b",
+        ]
+
+    @pytest.mark.parametrize("text,expected", [
+        ("numpy, pandas", ["numpy", "pandas"]),
+        ("numpy; pandas", ["numpy", "pandas"]),
+        ("NumPy SciPy", ["NumPy", "SciPy"]),
+        ("numpy  pandas", ["numpy", "pandas"]),
+        ("numpy>=1.20", []),
+        ("pip install numpy, pandas", []),
+    ])
+    def test_split_requirements(self, text, expected):
+        assert split_requirements(text) == expected
+
+    def test_version_parts_skips_install_commands_and_empty_names(self):
+        assert version_parts([
+            {"name": "npm install"},
+            {"name": "a,,b"},
+            {"name": "c", "version": "1.0"},
+            "not a dict",
+        ]) == [("a", False), ("b", False), ("c", True)]
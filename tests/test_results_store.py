@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from rsmetacheck.detect_pitfalls_main import detect_all_pitfalls
+from rsmetacheck.utils.results_store import KIND_NOTE, KIND_PITFALL, KIND_WARNING, ResultsStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(tmp_path / "results.sqlite", batch_size=2) as store:
+        yield store
+
+
+def _add_run(store, findings_per_repo):
+    run_id = store.start_run()
+    for repository, (languages, findings) in findings_per_repo.items():
+        store.add_repository(f"{repository}.json", repository, f"https://github.com/{repository}", "sha",
+                             languages, findings)
+    store.finish_run()
+    return run_id
+
+
+class TestResultsStore:
+    """Test suite for writing runs and querying them"""
+
+    def test_buffered_repositories_are_written_by_finish_run(self, store):
+        store.start_run()
+        store.add_repository("a.json", "o/a", None, None, [], [("P001", KIND_PITFALL, "e", "s")])
+        assert store.runs()[0]["repositories"] == 0
+
+        store.finish_run()
+
+        run = store.runs()[0]
+        assert (run["repositories"], run["findings"]) == (1, 1)
+        assert run["finished_at"] is not None
+
+    def test_repository_requires_a_run(self, store):
+        with pytest.raises(RuntimeError):
+            store.add_repository("a.json", "o/a", None, None, [], [])
+
+    def test_code_and_language_counts(self, store):
+        run_id = _add_run(store, {
+            "o/a": (["Python"], [("P015", KIND_PITFALL, "e", "s"), ("W004", KIND_WARNING, "e", "s")]),
+            "o/b": (["Python", "R"], [("P015", KIND_PITFALL, "e", "s"), ("P001", KIND_NOTE, "close", None)]),
+            "o/c": (["R"], []),
+            "o/d": ([], []),
+        })
+
+        assert store.code_counts(run_id) == [
+            {"code": "P015", "kind": KIND_PITFALL, "repositories": 2, "percentage": 50.0},
+            {"code": "W004", "kind": KIND_WARNING, "repositories": 1, "percentage": 25.0},
+        ]
+        assert store.language_counts(run_id) == [
+            {"language": "Python", "repositories": 2, "with_findings": 2},
+            {"language": "R", "repositories": 2, "with_findings": 1},
+        ]
+        assert store.language_counts(run_id, "W004")[0]["with_findings"] == 1
+
+    def test_delta_only_compares_repositories_in_both_runs(self, store):
+        old = _add_run(store, {
+            "o/a": ([], [("P015", KIND_PITFALL, "e", "s")]),
+            "o/b": ([], [("P015", KIND_PITFALL, "e", "s")]),
+            "o/gone": ([], [("P015", KIND_PITFALL, "e", "s")]),
+            "o/c": ([], []),
+        })
+        new = _add_run(store, {
+            "o/a": ([], []),
+            "o/b": ([], [("P015", KIND_PITFALL, "e", "s")]),
+            "o/c": ([], [("P015", KIND_PITFALL, "e", "s")]),
+        })
+
+        assert store.delta("P015", old, new) == {"fixed": ["o/a"], "new": ["o/c"], "unchanged": ["o/b"]}
+
+    def test_notes_are_not_findings_of_their_code(self, store):
+        old = _add_run(store, {
+            "o/a": (["Python"], [("P001", KIND_PITFALL, "e", "s")]),
+            "o/b": (["Python"], [("P001", KIND_NOTE, "close", None)]),
+        })
+        new = _add_run(store, {
+            "o/a": (["Python"], [("P001", KIND_NOTE, "close", None)]),
+            "o/b": (["Python"], [("P001", KIND_PITFALL, "e", "s")]),
+        })
+
+        assert store.delta("P001", old, new) == {"fixed": ["o/a"], "new": ["o/b"], "unchanged": []}
+        assert store.language_counts(new, "P001") == [{"language": "Python", "repositories": 2, "with_findings": 1}]
+
+    def test_resolve_run(self, store):
+        assert store.resolve_run() is None
+        first = _add_run(store, {})
+        second = _add_run(store, {})
+
+        assert store.resolve_run() == second
+        assert store.resolve_run(str(first)) == first
+        assert store.resolve_run("1999-01-01") is None
+        assert store.resolve_run("2999-01-01") == second
+
+
+class TestAnalysisResultsDb:
+    """Test suite for the findings recorded by an analysis run"""
+
+    def test_findings_match_the_jsonld(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+        somef_file = tmp_path / "repo_output.json"
+        somef_file.write_text(json.dumps({
+            "full_name": [{"result": {"value": "owner/repo"}}],
+            "code_repository": [{"result": {"value": "https://github.com/owner/repo"}}],
+            "version": [{"source": "repository/codemeta.json", "result": {"value": "3.0.0"}}],
+            "releases": [{"tag": "1.0.0"}],
+            "programming_languages": [{"result": {"value": "Python"}}],
+        }))
+        db = tmp_path / "results.sqlite"
+
+        detect_all_pitfalls([somef_file], tmp_path / "pitfalls", tmp_path / "summary.json", results_db=db)
+
+        jsonld = json.loads((tmp_path / "pitfalls" / "repo_output_pitfalls.jsonld").read_text())
+        with ResultsStore(db) as store:
+            rows = store._connection.execute(
+                "SELECT r.repository, r.commit_id, f.code, f.evidence, f.suggestion "
+                "FROM findings f JOIN repositories r ON r.id = f.repository_id"
+            ).fetchall()
+            assert store.language_counts(1)[0]["language"] == "Python"
+        assert [(code, evidence, suggestion) for _, _, code, evidence, suggestion in rows] == [
+            (check["assessesIndicator"]["@id"].rsplit("#", 1)[1], check["evidence"], check["suggestion"])
+            for check in jsonld["checks"]
+        ]
+        assert rows[0][:2] == ("owner/repo", "abc123")
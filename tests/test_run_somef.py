@@ -0,0 +1,253 @@
+import json
+import os
+import sys
+import time
+
+import pytest
+
+from rsmetacheck import run_somef as run_somef_module
+from rsmetacheck.utils import github_rate_limit
+from rsmetacheck.utils.github_rate_limit import GitHubTokenPool
+from rsmetacheck.run_somef import (
+    RetryPolicy,
+    classify_somef_failure,
+    run_somef_batch,
+    run_somef_single,
+    write_failed_repositories,
+)
+
+REPO_URL = "https://github.com/SoftwareUnderstanding/sw-metadata-bot"
+
+
+def _scripted_attempts(monkeypatch, outcomes):
+    """Make every SoMEF attempt return the next scripted outcome for its repository."""
+    calls = []
+
+    def fake_attempt(repo_url, output_file, *args, **kwargs):
+        calls.append(repo_url)
+        return outcomes[repo_url].pop(0)
+
+    monkeypatch.setattr(run_somef_module, "run_somef_attempt", fake_attempt)
+    return calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(run_somef_module.time, "sleep", recorded.append)
+    return recorded
+
+
+class TestClassifySomefFailure:
+    """Test suite for classifying SoMEF failures"""
+
+    @pytest.mark.parametrize(
+        "output, expected",
+        [
+            ("Exception: GitHub token lacks required permissions or scopes.", "auth"),
+            ("Exception: Invalid GitHub token. Run `somef configure` to set a valid token.", "auth"),
+            ('{"message": "API rate limit exceeded for 1.2.3.4."}', "rate_limit"),
+            ("ERROR-Error: repository name is incorrect", "not_found"),
+            ("KeyError: 'name'", "error"),
+            ("", "error"),
+        ],
+    )
+    def test_reasons(self, output, expected):
+        assert classify_somef_failure(output) == expected
+
+    def test_only_the_end_of_the_log_is_used(self):
+        output = "\n".join(
+            ["INFO-Remaining GitHub API requests: 0 ### Next rate limit reset at: 2024-01-01"]
+            + ["DEBUG-processing"] * 10
+            + ["KeyError: 'name'"]
+        )
+        assert classify_somef_failure(output) == "error"
+
+
+class TestRetryQueue:
+    """Test suite for the bounded retry queue with exponential backoff"""
+
+    def test_retriable_failure_is_retried_with_backoff(self, monkeypatch, tmp_path, sleeps):
+        calls = _scripted_attempts(monkeypatch, {REPO_URL: [("rate_limit", "limited"), None]})
+        produced = []
+        failures = []
+
+        assert run_somef_single(
+            REPO_URL, str(tmp_path), on_output=produced.append,
+            retry_policy=RetryPolicy(backoff=5), failures=failures,
+        )
+
+        assert calls == [REPO_URL, REPO_URL]
+        assert len(sleeps) == 1 and 0 < sleeps[0] <= 5
+        assert produced == [str(tmp_path / "output_1.json")]
+        assert failures == []
+
+    def test_retries_are_bounded_and_delays_double(self, monkeypatch, tmp_path, sleeps):
+        _scripted_attempts(monkeypatch, {REPO_URL: [("timeout", "timed out after 1s")] * 3})
+        monkeypatch.setattr(run_somef_module.time, "monotonic", lambda: 0)
+        failures = []
+
+        assert not run_somef_single(
+            REPO_URL, str(tmp_path), retry_policy=RetryPolicy(max_retries=2, backoff=3), failures=failures
+        )
+
+        assert sleeps == [3, 6]
+        assert failures == [{
+            "repository": REPO_URL,
+            "reason": "timeout",
+            "attempts": 3,
+            "error": "timed out after 1s",
+        }]
+
+    @pytest.mark.parametrize("reason", ["auth", "not_found"])
+    def test_permanent_failures_are_not_retried(self, monkeypatch, tmp_path, sleeps, reason):
+        calls = _scripted_attempts(monkeypatch, {REPO_URL: [(reason, "nope")]})
+        failures = []
+
+        assert not run_somef_single(REPO_URL, str(tmp_path), failures=failures)
+
+        assert calls == [REPO_URL]
+        assert sleeps == []
+        assert failures[0]["reason"] == reason
+        assert failures[0]["attempts"] == 1
+
+    def test_batch_retries_after_first_pass(self, monkeypatch, tmp_path, sleeps):
+        repos = [f"https://github.com/owner/repo{i}" for i in range(3)]
+        batch_file = tmp_path / "repos.json"
+        batch_file.write_text(json.dumps({"repositories": repos}))
+        calls = _scripted_attempts(monkeypatch, {
+            repos[0]: [("error", "boom"), None],
+            repos[1]: [None],
+            repos[2]: [("auth", "bad token")],
+        })
+        produced = []
+        failures = []
+
+        assert run_somef_batch(
+            str(batch_file), str(tmp_path / "out"), on_output=produced.append, failures=failures
+        )
+
+        assert calls == [repos[0], repos[1], repos[2], repos[0]]
+        assert [os.path.basename(p) for p in produced] == ["repos_output_2.json", "repos_output_1.json"]
+        assert [f["repository"] for f in failures] == [repos[2]]
+
+
+class TestTimeout:
+    """Test suite for killing hung SoMEF processes"""
+
+    def test_timeout_kills_the_whole_process_group(self, tmp_path):
+        pid_file = tmp_path / "grandchild.pid"
+        script = (
+            "import subprocess, sys, time\n"
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+            f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+            "time.sleep(60)\n"
+        )
+        started = time.monotonic()
+
+        with pytest.raises(run_somef_module.subprocess.TimeoutExpired):
+            run_somef_module._run_somef_command([sys.executable, "-c", script], timeout=2)
+
+        assert time.monotonic() - started < 30
+        grandchild = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                with open(f"/proc/{grandchild}/status") as f:
+                    if "\nState:\tZ" in f.read():
+                        break
+            except FileNotFoundError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("grandchild process survived the timeout")
+
+    def test_timed_out_attempt_is_classified(self, monkeypatch):
+        def hang(cmd, timeout, env=None):
+            raise run_somef_module.subprocess.TimeoutExpired(cmd, timeout)
+
+        monkeypatch.setattr(run_somef_module, "_run_somef_command", hang)
+
+        assert run_somef_module.run_somef_attempt(REPO_URL, "out.json", 0.8, timeout=5) == (
+            "timeout", "timed out after 5s"
+        )
+
+    def test_failed_command_keeps_cli_error_message(self, monkeypatch, capsys):
+        monkeypatch.setattr(
+            run_somef_module, "_run_somef_command",
+            lambda cmd, timeout, env=None: (1, "", "Traceback...\nException: GitHub token lacks required permissions or scopes."),
+        )
+
+        reason, error = run_somef_module.run_somef_attempt(REPO_URL, "out.json", 0.8)
+
+        assert reason == "auth"
+        assert "lacks required permissions" in error
+        out = capsys.readouterr().out
+        assert "invalid/insufficient GitHub token" in out
+        assert "returned non-zero exit status 1" in out
+
+
+class TestGitHubTokens:
+    """Test suite for running SoMEF with tokens from the shared pool"""
+
+    @pytest.fixture
+    def token_pool(self, monkeypatch, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"Authorization": "token user", "base_uri": "https://w3id.org/okn/o/"}))
+        monkeypatch.setenv("SOMEF_CONFIGURATION_FILE", str(config_file))
+        pool = GitHubTokenPool(["t1", "t2"], max_wait=60, sleep=lambda seconds: None)
+        monkeypatch.setattr(github_rate_limit, "_pool", pool)
+        return pool
+
+    def test_cli_runs_with_token_config_and_records_budget(self, monkeypatch, token_pool):
+        seen = {}
+
+        def fake_command(cmd, timeout, env=None):
+            config_path = env["SOMEF_CONFIGURATION_FILE"]
+            seen["config"] = json.loads(open(config_path).read())
+            seen["path"] = config_path
+            log = "INFO Remaining GitHub API requests: 4321 ### Next rate limit reset at: 2030-01-01 10:00:00"
+            return 0, "", log
+
+        monkeypatch.setattr(run_somef_module, "_run_somef_command", fake_command)
+
+        assert run_somef_module.run_somef_attempt(REPO_URL, "out.json", 0.8) is None
+
+        assert seen["config"] == {"Authorization": "token t1", "base_uri": "https://w3id.org/okn/o/"}
+        assert not os.path.exists(seen["path"])
+        assert token_pool._budget("t1").remaining == 4321
+        assert token_pool.acquire() == "t2"
+
+    def test_rate_limited_token_is_rotated_out(self, monkeypatch, token_pool):
+        monkeypatch.setattr(
+            run_somef_module, "_run_somef_command",
+            lambda cmd, timeout, env=None: (1, "", "Exception: API rate limit exceeded"),
+        )
+
+        reason, _ = run_somef_module.run_somef_attempt(REPO_URL, "out.json", 0.8)
+
+        assert reason == "rate_limit"
+        assert token_pool._budget("t1").remaining == 0
+        assert token_pool.acquire() == "t2"
+
+    def test_exhausted_pool_postpones_the_run(self, monkeypatch, token_pool):
+        for token in ("t1", "t2"):
+            token_pool.record_remaining(token, 0, time.time() + 3600)
+        monkeypatch.setattr(run_somef_module, "_run_somef_command", pytest.fail)
+
+        reason, error = run_somef_module.run_somef_attempt(REPO_URL, "out.json", 0.8)
+
+        assert reason == "rate_limit"
+        assert "rate limit exhausted" in error
+
+
+class TestWriteFailedRepositories:
+    def test_file_can_be_used_as_input(self, tmp_path):
+        failures = [{"repository": REPO_URL, "reason": "timeout", "attempts": 3, "error": "timed out after 5s"}]
+        output_file = tmp_path / "failed_repositories.json"
+
+        write_failed_repositories(failures, output_file)
+
+        data = json.loads(output_file.read_text())
+        assert data["repositories"] == [REPO_URL]
+        assert data["failures"] == failures
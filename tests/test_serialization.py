@@ -0,0 +1,111 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from rsmetacheck.utils import serialization
+
+SAMPLE = {
+    "name": "Quality Assessment for répo",
+    "checks": [{"output": "true", "evidence": "line\nbreak \"quoted\""}],
+    "count": 3,
+    "percentage": 12.5,
+    "languages": {},
+    "tags": [],
+    "flag": None,
+}
+
+
+@pytest.fixture(params=serialization.AVAILABLE_BACKENDS)
+def json_backend(request):
+    previous = serialization.backend
+    serialization.use_backend(request.param)
+    yield request.param
+    serialization.use_backend(previous)
+
+
+class TestBackendSelection:
+    """Test suite for choosing the JSON backend"""
+
+    def test_stdlib_is_always_available(self):
+        assert "json" in serialization.AVAILABLE_BACKENDS
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            serialization.use_backend("simplejson-does-not-exist")
+
+    def test_unavailable_environment_backend_falls_back(self, monkeypatch, capsys):
+        monkeypatch.setenv("RSMETACHECK_JSON_BACKEND", "simplejson-does-not-exist")
+
+        assert serialization._default_backend() == serialization.AVAILABLE_BACKENDS[-1]
+        assert "is not available" in capsys.readouterr().out
+
+    def test_environment_backend_is_used(self, monkeypatch):
+        monkeypatch.setenv("RSMETACHECK_JSON_BACKEND", "json")
+
+        assert serialization._default_backend() == "json"
+
+    def test_tool_starts_with_an_unavailable_backend(self):
+        env = dict(os.environ, RSMETACHECK_JSON_BACKEND="simplejson-does-not-exist")
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(Path(serialization.__file__).parents[2]), env.get("PYTHONPATH")]))
+
+        completed = subprocess.run(
+            [sys.executable, "-c", "import rsmetacheck.cli"], env=env, capture_output=True, text=True
+        )
+
+        assert completed.returncode == 0, completed.stderr
+
+
+class TestDecoding:
+    """Test suite for loads and read_json on every installed backend"""
+
+    def test_loads_bytes_and_text(self, json_backend):
+        text = json.dumps(SAMPLE)
+        assert serialization.loads(text) == SAMPLE
+        assert serialization.loads(text.encode("utf-8")) == SAMPLE
+
+    def test_read_json(self, json_backend, tmp_path):
+        path = tmp_path / "somef.json"
+        path.write_text(json.dumps(SAMPLE, ensure_ascii=False), encoding="utf-8")
+        assert serialization.read_json(path) == SAMPLE
+
+    def test_documents_only_the_stdlib_accepts_still_parse(self, json_backend):
+        assert serialization.loads('{"value": NaN, "big": 123456789012345678901234567890}')["big"] == (
+            123456789012345678901234567890
+        )
+
+    def test_invalid_json_raises_stdlib_error(self, json_backend):
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads("{not json")
+
+
+class TestEncoding:
+    """Test suite for canonical and compact output"""
+
+    def test_canonical_output_matches_stdlib(self, json_backend):
+        assert serialization.dumps(SAMPLE) == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+    def test_write_json_is_canonical(self, json_backend, tmp_path):
+        path = tmp_path / "out.json"
+        serialization.write_json(SAMPLE, path)
+        assert path.read_text(encoding="utf-8") == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+    def test_compact_output_round_trips(self, json_backend):
+        compact = serialization.dumps(SAMPLE, compact=True)
+        assert "\n" not in compact
+        assert "répo" in compact
+        assert json.loads(compact) == SAMPLE
+
+    def test_sets_are_serialized_as_lists(self, json_backend):
+        assert json.loads(serialization.dumps({"values": {"a"}}, compact=True)) == {"values": ["a"]}
+        assert json.loads(serialization.dumps({"values": {"a"}})) == {"values": ["a"]}
+
+    def test_non_string_keys_fall_back_to_stdlib(self, json_backend):
+        assert serialization.dumps({1: "one"}, compact=True) == '{"1":"one"}'
+
+    def test_unserializable_objects_raise(self, json_backend):
+        with pytest.raises(TypeError):
+            serialization.dumps({"value": object()}, compact=True)
@@ -0,0 +1,264 @@
+import gzip
+import io
+import json
+import tarfile
+
+import pytest
+
+from rsmetacheck import shard as shard_module
+from rsmetacheck.detect_pitfalls_main import detect_all_pitfalls
+from rsmetacheck.shard import (
+    ITEM_REPOSITORY,
+    ITEM_SOMEF_OUTPUT,
+    WorkQueue,
+    collect_work_items,
+    merge_shards,
+    run_shard_worker,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _somef_data(repo_name, version):
+    return {
+        "full_name": [{"result": {"value": repo_name}}],
+        "code_repository": [{"result": {"value": f"https://github.com/{repo_name}"}}],
+        "version": [{"source": "repository/codemeta.json", "result": {"value": version}}],
+        "releases": [{"tag": "1.0.0"}],
+        "programming_languages": [{"result": {"value": "Python"}}],
+    }
+
+
+@pytest.fixture
+def somef_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "sha-" + url[-1])
+    monkeypatch.setattr("rsmetacheck.utils.commit_resolver.CommitResolver.prefetch", lambda self, urls: 0)
+    directory = tmp_path / "somef_outputs"
+    directory.mkdir()
+    versions = ["2.0.0", "1.0.0", "1.0.1", "3.0.0", "5.0.0"]
+    for idx, version in enumerate(versions, start=1):
+        (directory / f"output_{idx}.json").write_text(json.dumps(_somef_data(f"owner/repo{idx}", version)))
+    return directory
+
+
+class TestWorkQueue:
+    """Test suite for the SQLite work queue and its leases"""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        clock = FakeClock()
+        queue = WorkQueue(tmp_path / "queue.sqlite", clock=clock)
+        queue.clock = clock
+        queue.add_items([(ITEM_REPOSITORY, f"https://github.com/o/r{i}", f"output_{i}.json") for i in range(3)])
+        yield queue
+        queue.close()
+
+    def test_items_are_added_once(self, queue):
+        assert queue.add_items([(ITEM_REPOSITORY, "https://github.com/o/r0", "output_0.json")]) == 0
+        assert queue.counts() == {"pending": 3}
+
+    def test_claims_follow_queue_order_and_never_overlap(self, queue):
+        first = queue.claim("a")
+        second = queue.claim("b")
+
+        assert (first.id, second.id) == (1, 2)
+        assert first.attempts == 1
+        assert queue.counts() == {"claimed": 2, "pending": 1}
+
+    def test_expired_lease_is_handed_out_again(self, queue):
+        first = queue.claim("a", lease=10)
+        queue.claim("b", lease=10)
+        queue.claim("b", lease=10)
+        assert queue.claim("b") is None
+
+        queue.clock.now += 11
+        again = queue.claim("b")
+
+        assert again.id == first.id
+        assert again.attempts == 2
+        assert queue.complete("a", first.id) is False
+        assert queue.complete("b", first.id) is True
+
+    def test_failed_item_can_be_put_back(self, queue):
+        item = queue.claim("a")
+        queue.fail("a", item.id, "timeout: timed out after 5s", retry=True)
+        assert queue.claim("a").id == item.id
+
+        queue.fail("a", item.id, "auth: bad token")
+        assert queue.failed_items() == [("https://github.com/o/r0", "auth: bad token")]
+
+
+class TestCollectWorkItems:
+    """Test suite for turning --input values into work items"""
+
+    def test_all_input_kinds(self, tmp_path, somef_dir):
+        repo_list = tmp_path / "repositories.json"
+        repo_list.write_text(json.dumps({"repositories": ["https://github.com/a/b", "https://github.com/c/d"]}))
+        repo_csv = tmp_path / "corpus.csv"
+        repo_csv.write_text("base_project_url\nhttps://github.com/e/f\n")
+        (somef_dir / "output_1_somef_generated_codemeta.json").write_text("{}")
+
+        items = collect_work_items(["https://github.com/x/y", str(repo_list), str(repo_csv), str(somef_dir)])
+
+        assert items[:4] == [
+            (ITEM_REPOSITORY, "https://github.com/x/y", "output_1.json"),
+            (ITEM_REPOSITORY, "https://github.com/a/b", "repositories_output_1.json"),
+            (ITEM_REPOSITORY, "https://github.com/c/d", "repositories_output_2.json"),
+            (ITEM_REPOSITORY, "https://github.com/e/f", "corpus_output_1.json"),
+        ]
+        # output_1.json is already the name of the direct URL's output.
+        assert [(kind, name) for kind, _, name in items[4:]] == [
+            (ITEM_SOMEF_OUTPUT, name) for name in ["output_1_2.json"] + [f"output_{idx}.json" for idx in range(2, 6)]
+        ]
+
+    def test_compressed_outputs_and_archives(self, tmp_path, somef_dir):
+        with tarfile.open(somef_dir / "batch.tar.gz", "w:gz") as archive:
+            for member in ["a/repo.json", "b/repo.json"]:
+                data = json.dumps(_somef_data("owner/" + member[0], "1.0.0")).encode("utf-8")
+                info = tarfile.TarInfo(member)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        (tmp_path / "single.json.gz").write_bytes(gzip.compress(b"{}"))
+
+        items = collect_work_items([str(somef_dir), str(tmp_path / "single.json.gz")])
+
+        assert [name for _, _, name in items[5:]] == ["repo.json", "batch_b_repo.json", "single.json"]
+        assert items[6][1] == f"{somef_dir.resolve() / 'batch.tar.gz'}:b/repo.json"
+
+    def test_names_are_unique_across_directories(self, tmp_path, somef_dir):
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "output_2.json").write_text("{}")
+
+        names = [name for _, _, name in collect_work_items([str(somef_dir), str(other)])]
+
+        assert names[-1] == "output_2_2.json"
+        assert len(set(names)) == len(names)
+
+    def test_queue_rejects_a_name_used_by_another_item(self, tmp_path):
+        with WorkQueue(tmp_path / "queue.sqlite") as queue:
+            queue.add_items([(ITEM_REPOSITORY, "https://github.com/o/a", "output_1.json")])
+
+            with pytest.raises(ValueError):
+                queue.add_items([(ITEM_REPOSITORY, "https://github.com/o/b", "output_1.json")])
+            assert queue.add_items([(ITEM_REPOSITORY, "https://github.com/o/a", "output_1.json")]) == 0
+            assert queue.counts() == {"pending": 1}
+
+
+class TestShardRun:
+    """Test suite for splitting a run across nodes and merging the shards"""
+
+    def _run_nodes(self, tmp_path, somef_dir, monkeypatch, items_per_node):
+        queue_path = tmp_path / "queue.sqlite"
+        with WorkQueue(queue_path) as queue:
+            queue.add_items(collect_work_items([str(somef_dir)]))
+
+        original_claim = WorkQueue.claim
+        for node, limit in items_per_node:
+            claims = {"left": limit}
+
+            def limited_claim(self, node_name, lease=shard_module.DEFAULT_LEASE):
+                if claims["left"] == 0:
+                    return None
+                claims["left"] -= 1
+                return original_claim(self, node_name, lease)
+
+            monkeypatch.setattr(WorkQueue, "claim", limited_claim)
+            run_shard_worker(queue_path, tmp_path / "shards", node=node)
+        monkeypatch.setattr(WorkQueue, "claim", original_claim)
+        return queue_path
+
+    def test_merge_matches_single_node_run(self, tmp_path, somef_dir, monkeypatch):
+        self._run_nodes(tmp_path, somef_dir, monkeypatch, [("node-b", 2), ("node-a", 10)])
+        merged = tmp_path / "merged"
+        assert merge_shards(
+            [tmp_path / "shards"], merged / "pitfalls", merged / "analysis_results.json", merged / "notes.json"
+        ) == 5
+
+        single = tmp_path / "single"
+        detect_all_pitfalls(
+            sorted(somef_dir.glob("*.json")),
+            single / "pitfalls",
+            single / "analysis_results.json",
+            notes_output=single / "notes.json",
+        )
+
+        assert json.loads((merged / "analysis_results.json").read_text()) == json.loads(
+            (single / "analysis_results.json").read_text()
+        )
+        assert json.loads((merged / "notes.json").read_text()) == json.loads((single / "notes.json").read_text())
+        assert sorted(p.name for p in (merged / "pitfalls").iterdir()) == sorted(
+            p.name for p in (single / "pitfalls").iterdir()
+        )
+
+    def test_archive_members_are_analyzed(self, tmp_path, somef_dir, monkeypatch):
+        with tarfile.open(somef_dir / "batch.tar.gz", "w:gz") as archive:
+            for member in ["a/output_1.json", "b/output_1.json"]:
+                data = json.dumps(_somef_data("owner/" + member[0], "2.0.0")).encode("utf-8")
+                info = tarfile.TarInfo(member)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        self._run_nodes(tmp_path, somef_dir, monkeypatch, [("node-a", 3), ("node-b", 10)])
+
+        assert merge_shards([tmp_path / "shards"], tmp_path / "pitfalls", tmp_path / "analysis_results.json") == 7
+
+        summary = json.loads((tmp_path / "analysis_results.json").read_text())["summary"]
+        assert summary["total_repositories_analyzed"] == 7
+        assert {"batch_a_output_1_pitfalls.jsonld", "batch_b_output_1_pitfalls.jsonld"} <= {
+            p.name for p in (tmp_path / "pitfalls").iterdir()
+        }
+
+    def test_merge_keeps_the_first_of_two_items_with_the_same_name(self, tmp_path, somef_dir, monkeypatch, capsys):
+        self._run_nodes(tmp_path, somef_dir, monkeypatch, [("node-a", 10)])
+        # Records from a queue built before names were made unique.
+        records_file = tmp_path / "shards" / "node-a" / "records.jsonl"
+        records = [json.loads(line) for line in records_file.read_text().splitlines()]
+        records[1]["jsonld_file"] = records[0]["jsonld_file"]
+        records_file.write_text("".join(json.dumps(record) + "\n" for record in records))
+        first = (tmp_path / "shards" / "node-a" / "pitfalls_outputs" / records[0]["jsonld_file"]).read_text()
+
+        merge_shards([tmp_path / "shards"], tmp_path / "pitfalls", tmp_path / "analysis_results.json")
+
+        assert "used by several items" in capsys.readouterr().out
+        assert (tmp_path / "pitfalls" / records[0]["jsonld_file"]).read_text() == first
+
+    def test_item_processed_twice_is_merged_once(self, tmp_path, somef_dir, monkeypatch):
+        self._run_nodes(tmp_path, somef_dir, monkeypatch, [("node-a", 10)])
+        # A node whose lease expired re-analyzed the first item.
+        records = (tmp_path / "shards" / "node-a" / "records.jsonl").read_text().splitlines()
+        slow_node = tmp_path / "shards" / "node-z"
+        (slow_node / "pitfalls_outputs").mkdir(parents=True)
+        (slow_node / "records.jsonl").write_text(records[0] + "\n")
+
+        merge_shards([tmp_path / "shards"], tmp_path / "pitfalls", tmp_path / "analysis_results.json")
+
+        summary = json.loads((tmp_path / "analysis_results.json").read_text())["summary"]
+        assert summary["total_repositories_analyzed"] == 5
+
+    def test_failed_repository_is_requeued_then_failed(self, tmp_path, monkeypatch):
+        queue_path = tmp_path / "queue.sqlite"
+        with WorkQueue(queue_path) as queue:
+            queue.add_items([(ITEM_REPOSITORY, "https://github.com/o/r", "output_1.json")])
+        attempts = []
+
+        def failing_attempt(repo_url, *args, **kwargs):
+            attempts.append(repo_url)
+            return "rate_limit", "API rate limit exceeded"
+
+        monkeypatch.setattr(shard_module, "run_somef_attempt", failing_attempt)
+        monkeypatch.setattr(shard_module, "ensure_somef_configured", lambda: True)
+
+        processed = run_shard_worker(
+            queue_path, tmp_path / "shards", node="a", retry_policy=shard_module.RetryPolicy(max_retries=1)
+        )
+
+        assert processed == 0
+        assert len(attempts) == 2
+        with WorkQueue(queue_path) as queue:
+            assert queue.counts() == {"failed": 1}
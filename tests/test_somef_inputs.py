@@ -0,0 +1,194 @@
+import gzip
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from rsmetacheck.detect_pitfalls_main import main
+from rsmetacheck.utils import somef_inputs
+from rsmetacheck.utils.somef_inputs import (
+    SomefInput,
+    collect_somef_inputs,
+    expand_somef_input,
+    expand_somef_inputs,
+    load_somef_output,
+)
+
+needs_zstd = pytest.mark.skipif(somef_inputs._zstd_reader is None, reason="zstandard is not installed")
+
+
+def _somef_data(version):
+    return {
+        "full_name": [{"result": {"value": f"owner/repo-{version}"}}],
+        "version": [{"source": "repository/codemeta.json", "result": {"value": version}}],
+        "releases": [{"tag": "1.0.0"}],
+    }
+
+
+def _bytes(version):
+    return json.dumps(_somef_data(version)).encode("utf-8")
+
+
+def _zstd_compress(data):
+    import zstandard
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def _write_tar(path, members, mode="w"):
+    with tarfile.open(path, mode) as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+MEMBERS = {
+    "outputs/a_output.json": _bytes("1.0.0"),
+    "outputs/b_output.json.gz": gzip.compress(_bytes("2.0.0")),
+    "outputs/a_output_somef_generated_codemeta.json": b"{}",
+    "outputs/README.md": b"not an output",
+}
+
+
+class TestSomefInputs:
+    """Test suite for reading SoMEF outputs from compressed files and archives"""
+
+    def test_plain_json_file_is_kept_as_a_path(self, tmp_path):
+        path = tmp_path / "repo.json"
+        path.write_bytes(_bytes("1.0.0"))
+        assert expand_somef_input(path) == [path]
+
+    def test_gzip_file(self, tmp_path):
+        path = tmp_path / "repo_output.json.gz"
+        path.write_bytes(gzip.compress(_bytes("1.0.0")))
+
+        [source] = expand_somef_input(path)
+        assert isinstance(source, SomefInput)
+        assert source.name == "repo_output.json"
+        assert load_somef_output(source) == _somef_data("1.0.0")
+
+    @needs_zstd
+    def test_zstd_file(self, tmp_path):
+        path = tmp_path / "repo_output.json.zst"
+        path.write_bytes(_zstd_compress(_bytes("1.0.0")))
+
+        [source] = expand_somef_input(path)
+        assert source.name == "repo_output.json"
+        assert load_somef_output(source) == _somef_data("1.0.0")
+
+    @pytest.mark.parametrize("suffix,mode", [(".tar", "w"), (".tar.gz", "w:gz")])
+    def test_tar_members(self, tmp_path, suffix, mode):
+        path = tmp_path / f"batch{suffix}"
+        _write_tar(path, MEMBERS, mode)
+
+        sources = expand_somef_input(path)
+        assert [source.name for source in sources] == ["a_output.json", "b_output.json"]
+        assert str(sources[0]) == f"{path}:outputs/a_output.json"
+        # Members read out of order reopen the archive.
+        assert load_somef_output(sources[1]) == _somef_data("2.0.0")
+        assert load_somef_output(sources[0]) == _somef_data("1.0.0")
+
+    @needs_zstd
+    def test_zstd_tar_members(self, tmp_path):
+        plain = tmp_path / "batch.tar"
+        _write_tar(plain, MEMBERS)
+        path = tmp_path / "batch.tar.zst"
+        path.write_bytes(_zstd_compress(plain.read_bytes()))
+
+        sources = expand_somef_input(path)
+        assert [load_somef_output(source) for source in sources] == [_somef_data("1.0.0"), _somef_data("2.0.0")]
+
+    @pytest.mark.parametrize("compress,suffix", [
+        (gzip.compress, ".tar.gz"), pytest.param(_zstd_compress, ".tar.zst", marks=needs_zstd),
+    ])
+    def test_archive_is_closed_after_its_last_output(self, tmp_path, monkeypatch, compress, suffix):
+        plain = tmp_path / "batch.tar"
+        _write_tar(plain, MEMBERS)
+        path = tmp_path / f"batch{suffix}"
+        path.write_bytes(compress(plain.read_bytes()))
+        opened = []
+
+        def tracked(open_function):
+            return lambda *args, **kwargs: opened.append(open_function(*args, **kwargs)) or opened[-1]
+
+        monkeypatch.setattr(somef_inputs, "open", tracked(open), raising=False)
+        monkeypatch.setattr(somef_inputs.tarfile, "open", tracked(tarfile.open))
+
+        first, last = expand_somef_input(path)
+        load_somef_output(first)
+        assert not all(handle.closed for handle in opened)
+        load_somef_output(last)
+
+        assert opened and all(handle.closed for handle in opened)
+
+    def test_zip_members(self, tmp_path):
+        path = tmp_path / "batch.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            for name, data in MEMBERS.items():
+                archive.writestr(name, data)
+
+        sources = expand_somef_input(path)
+        assert [source.name for source in sources] == ["a_output.json", "b_output.json"]
+        assert load_somef_output(sources[1]) == _somef_data("2.0.0")
+
+    def test_corrupt_archive_is_reported(self, tmp_path, capsys):
+        path = tmp_path / "broken.zip"
+        path.write_bytes(b"not a zip file")
+
+        assert expand_somef_input(path) == []
+        assert "Could not read archive" in capsys.readouterr().out
+
+    def test_missing_zstandard_is_reported(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(somef_inputs, "_zstd_reader", None)
+        path = tmp_path / "batch.tar.zst"
+        path.write_bytes(b"")
+
+        assert expand_somef_input(path) == []
+        assert "zstandard" in capsys.readouterr().out
+
+    def test_collect_directory(self, tmp_path):
+        (tmp_path / "plain.json").write_bytes(_bytes("1.0.0"))
+        (tmp_path / "plain_somef_generated_codemeta.json").write_bytes(b"{}")
+        (tmp_path / "single.json.gz").write_bytes(gzip.compress(_bytes("2.0.0")))
+        (tmp_path / "single_somef_generated_codemeta.json.gz").write_bytes(gzip.compress(b"{}"))
+        _write_tar(tmp_path / "batch.tar", MEMBERS)
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        names = [source.name for source in collect_somef_inputs(tmp_path)]
+        assert names == ["plain.json", "a_output.json", "b_output.json", "single.json"]
+
+    def test_names_are_unique(self, tmp_path):
+        _write_tar(tmp_path / "batch.tar.gz", {"a/repo.json": _bytes("1.0.0"), "b/repo.json": _bytes("2.0.0")}, "w:gz")
+        _write_tar(tmp_path / "other.tar", {"a/repo.json": _bytes("3.0.0")})
+        (tmp_path / "x.json").write_bytes(_bytes("1.0.0"))
+        (tmp_path / "x.json.gz").write_bytes(gzip.compress(_bytes("2.0.0")))
+
+        names = [source.name for source in collect_somef_inputs(tmp_path)]
+        assert names == ["x.json", "repo.json", "batch_b_repo.json", "other_a_repo.json", "x_2.json"]
+
+    def test_names_are_unique_across_input_files(self, tmp_path):
+        for archive in ("one.zip", "two.zip"):
+            with zipfile.ZipFile(tmp_path / archive, "w") as zipped:
+                zipped.writestr("repo.json", _bytes("1.0.0"))
+
+        sources = expand_somef_inputs([tmp_path / "one.zip", tmp_path / "two.zip"])
+        assert [source.name for source in sources] == ["repo.json", "two_repo.json"]
+
+
+def test_main_analyzes_archive_members(tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+    input_dir = tmp_path / "somef_outputs"
+    input_dir.mkdir()
+    _write_tar(input_dir / "batch.tar.gz", {
+        "a_output.json": _bytes("3.0.0"),
+        "b_output.json": _bytes("1.0.0"),
+    }, "w:gz")
+
+    main(input_dir=input_dir, pitfalls_dir=tmp_path / "pitfalls", analysis_output=tmp_path / "summary.json")
+
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["summary"]["total_repositories_analyzed"] == 2
+    assert summary["pitfalls & warnings"][0]["count"] == 1
+    assert (tmp_path / "pitfalls" / "a_output_pitfalls.jsonld").exists()
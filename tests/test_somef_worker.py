@@ -0,0 +1,191 @@
+import inspect
+import json
+import os
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+
+from rsmetacheck import run_somef as run_somef_module
+from rsmetacheck.somef_worker import SomefBackendUnavailable, SomefWorkerPool, run_cli_arguments
+
+REPO_URL = "https://github.com/SoftwareUnderstanding/sw-metadata-bot"
+
+
+def _popen_mock(returncode=0, stdout="", stderr=""):
+    """Return a subprocess.Popen mock for a somef process exiting with returncode."""
+    popen_mock = MagicMock()
+    popen_mock.return_value.communicate.return_value = (stdout, stderr)
+    popen_mock.return_value.returncode = returncode
+    return popen_mock
+
+FAKE_SOMEF_CLI = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+    import time
+
+
+    # Same signature as somef_cli.run_cli in SoMEF 0.10.3
+    def run_cli(*,
+                threshold=0.8,
+                ignore_classifiers=False,
+                repo_url=None,
+                ignore_github_metadata=False,
+                readme_only=False,
+                doc_src=None,
+                local_repo=None,
+                in_file=None,
+                output=None,
+                graph_out=None,
+                graph_format="turtle",
+                codemeta_out=None,
+                google_codemeta_out=None,
+                pretty=False,
+                missing=False,
+                keep_tmp=None,
+                ignore_test_folder=True,
+                requirements_mode="all",
+                reconcile_authors=False,
+                branch=None,
+                tag=None
+                ):
+        kwargs = dict(locals())
+        if kwargs["repo_url"].endswith("/broken"):
+            raise Exception("GitHub token lacks required permissions or scopes.")
+        if kwargs["repo_url"].endswith("/exit"):
+            sys.exit()
+        if kwargs["repo_url"].endswith("/hang"):
+            time.sleep(60)
+        config_file = os.environ.get("SOMEF_CONFIGURATION_FILE")
+        if config_file:
+            with open(config_file) as f:
+                kwargs["config"] = [config_file, json.load(f).get("Authorization")]
+        with open(kwargs["output"], "w") as f:
+            json.dump(kwargs, f)
+    """
+)
+
+
+@pytest.fixture
+def fake_somef(tmp_path, monkeypatch):
+    """Install a stub `somef` package whose run_cli records the arguments it receives."""
+    package = tmp_path / "fake_site" / "somef"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "somef_cli.py").write_text(FAKE_SOMEF_CLI)
+    monkeypatch.syspath_prepend(str(tmp_path / "fake_site"))
+    monkeypatch.delenv("SOMEF_CONFIGURATION_FILE", raising=False)
+    return package
+
+
+class TestSomefWorkerPool:
+    """Test suite for running SoMEF in a long-lived worker process"""
+
+    def test_describe_matches_cli_arguments(self, fake_somef, tmp_path):
+        output_file = tmp_path / "output_1.json"
+
+        with SomefWorkerPool() as pool:
+            error = pool.describe(REPO_URL, str(output_file), 0.8, branch="develop")
+
+        assert error is None
+        recorded = json.loads(output_file.read_text())
+        expected = {
+            "threshold": 0.8,
+            "repo_url": REPO_URL,
+            "output": str(output_file),
+            "codemeta_out": None,
+            "branch": "develop",
+            "requirements_mode": "all",
+        }
+        assert {key: recorded[key] for key in expected} == expected
+
+    def test_describe_uses_token_through_configuration_file(self, fake_somef, tmp_path, monkeypatch):
+        base_config = tmp_path / "config.json"
+        base_config.write_text(json.dumps({"Authorization": "token base"}))
+        monkeypatch.setenv("SOMEF_CONFIGURATION_FILE", str(base_config))
+        output_file = tmp_path / "output_1.json"
+
+        with SomefWorkerPool() as pool:
+            assert pool.describe(REPO_URL, str(output_file), 0.8, token="abc") is None
+            assert pool.describe(REPO_URL, str(tmp_path / "output_2.json"), 0.8) is None
+
+        config_file, authorization = json.loads(output_file.read_text())["config"]
+        assert authorization == "token abc"
+        assert not os.path.exists(config_file)
+        assert json.loads((tmp_path / "output_2.json").read_text())["config"] == [str(base_config), "token base"]
+
+    def test_worker_is_reused_and_reports_failures(self, fake_somef, tmp_path):
+        with SomefWorkerPool() as pool:
+            assert "lacks required permissions" in pool.describe(REPO_URL + "/broken", str(tmp_path / "a.json"), 0.8)
+            assert pool.describe(REPO_URL + "/exit", str(tmp_path / "b.json"), 0.8) == "SystemExit"
+            assert pool.describe(REPO_URL, str(tmp_path / "c.json"), 0.8) is None
+
+    def test_timeout_kills_and_restarts_worker(self, fake_somef, tmp_path):
+        with SomefWorkerPool() as pool:
+            with pytest.raises(TimeoutError):
+                pool.describe(REPO_URL + "/hang", str(tmp_path / "a.json"), 0.8, timeout=2)
+            assert pool.describe(REPO_URL, str(tmp_path / "b.json"), 0.8, timeout=30) is None
+
+    def test_killing_workers_survives_executor_internals_changing(self):
+        pool = SomefWorkerPool()
+        executor = pool._executor = MagicMock(spec=["shutdown"])
+
+        pool._kill_workers()
+
+        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert pool._executor is None
+
+    def test_missing_somef_raises_unavailable(self, monkeypatch):
+        monkeypatch.setattr("rsmetacheck.somef_worker.importlib.util.find_spec", lambda name: None)
+        pool = SomefWorkerPool()
+
+        with pytest.raises(SomefBackendUnavailable):
+            pool.describe(REPO_URL, "output.json", 0.8)
+
+
+def test_arguments_match_the_installed_somef():
+    somef_cli = pytest.importorskip("somef.somef_cli")
+
+    inspect.signature(somef_cli.run_cli).bind(**run_cli_arguments(REPO_URL, "out.json", 0.8, "dev", "codemeta.json"))
+
+
+class TestRunSomefWithWorkerPool:
+    """Test suite for the in-process path of run_somef and its CLI fallback"""
+
+    def test_success_does_not_start_subprocess(self, monkeypatch):
+        subprocess_popen_mock = _popen_mock()
+        monkeypatch.setattr("rsmetacheck.run_somef.subprocess.Popen", subprocess_popen_mock)
+        pool = MagicMock()
+        pool.describe.return_value = None
+
+        assert run_somef_module.run_somef(REPO_URL, "out.json", 0.8, worker_pool=pool) is True
+
+        pool.describe.assert_called_once_with(
+            REPO_URL, "out.json", 0.8, None, None, timeout=None, token=None
+        )
+        subprocess_popen_mock.assert_not_called()
+
+    def test_failure_is_reported_like_the_cli(self, monkeypatch, capsys):
+        monkeypatch.setattr("rsmetacheck.run_somef.subprocess.Popen", _popen_mock())
+        pool = MagicMock()
+        pool.describe.return_value = "GitHub token lacks required permissions or scopes."
+
+        assert run_somef_module.run_somef(REPO_URL, "out.json", 0.8, worker_pool=pool) is False
+
+        out = capsys.readouterr().out
+        assert "invalid/insufficient GitHub token" in out
+        assert f"Error running SoMEF for {REPO_URL}" in out
+
+    def test_unavailable_backend_falls_back_to_cli(self, monkeypatch):
+        subprocess_popen_mock = _popen_mock()
+        monkeypatch.setattr("rsmetacheck.run_somef.subprocess.Popen", subprocess_popen_mock)
+        pool = MagicMock()
+        pool.describe.side_effect = SomefBackendUnavailable("not importable")
+
+        assert run_somef_module.run_somef(REPO_URL, "out.json", 0.8, branch="dev", worker_pool=pool) is True
+
+        command = subprocess_popen_mock.call_args.args[0]
+        assert command[0:2] == ["somef", "describe"]
+        assert ["-b", "dev"] == command[-2:]
@@ -0,0 +1,113 @@
+import pytest
+
+from rsmetacheck.scripts.pitfalls.p009 import detect_coderepository_homepage_pitfall
+from rsmetacheck.scripts.pitfalls.p016 import detect_different_repository_pitfall
+from rsmetacheck.scripts.warnings.w006 import detect_identifier_name_warning
+from rsmetacheck.scripts.warnings.w010 import detect_git_remote_shorthand_pitfall
+from rsmetacheck.utils.pitfall_utils import shared_category_views
+from rsmetacheck.utils.url_analysis import UrlView, classify_url, url_view
+
+
+def _entry(value, source, technique="code_parser"):
+    return {"result": {"value": value}, "source": source, "technique": technique}
+
+
+@pytest.fixture
+def somef_data():
+    return {
+        "code_repository": [
+            _entry("https://github.com/SoftwareUnderstanding/RsMetaCheck", "", "GitHub_API"),
+            _entry("git+https://www.github.com/SoftwareUnderstanding/RsMetaCheck.git/", "repository/codemeta.json"),
+            _entry("https://rsmetacheck.readthedocs.io/", "repository/package.json", "file_exploration"),
+        ],
+        "identifier": [
+            _entry("RsMetaCheck", "repository/CodeMeta.json"),
+            _entry("10.5281/zenodo.1234", "repository/README.md", "regular_expression"),
+        ],
+    }
+
+
+class TestUrlRecord:
+    """Test suite for the classification of a URL or identifier string"""
+
+    def test_records_are_cached(self):
+        assert classify_url("https://github.com/a/b") is classify_url("https://github.com/a/b")
+
+    @pytest.mark.parametrize("url,provider,owner_repo", [
+        ("https://github.com/SoftwareUnderstanding/RsMetaCheck", "github", "softwareunderstanding/rsmetacheck"),
+        ("https://www.gitlab.com/group/project.git", "gitlab", "group/project"),
+        ("git@bitbucket.org:team/repo.git", "bitbucket", "team/repo"),
+        ("https://sourceforge.net/projects/tool/", "sourceforge", None),
+        ("github.com:user/repo.git", "github", "user/repo"),
+        ("https://example.org/a/b", None, None),
+    ])
+    def test_provider_and_owner_repo(self, url, provider, owner_repo):
+        record = classify_url(url)
+        assert record.provider == provider
+        assert record.owner_repo == owner_repo
+
+    def test_repository_and_homepage(self):
+        assert classify_url("https://gitlab.com/group/project").is_repository
+        assert classify_url("https://user.github.io/project/").is_homepage
+        assert not classify_url("https://github.com/a/b").is_homepage
+
+    def test_normalized(self):
+        assert classify_url("git+http://www.github.com/A/B.git/").normalized == "https://github.com/a/b"
+        assert classify_url("git@github.com:A/B.git").normalized == "https://github.com/a/b"
+
+    @pytest.mark.parametrize("value,kind,is_doi,is_swhid", [
+        ("https://doi.org/10.5281/zenodo.1", "url", False, False),
+        ("doi:10.5281/zenodo.1", "bare", True, False),
+        ("DOI:10.5281/zenodo.1", None, True, False),
+        ("swh:1:dir:" + "a" * 40, None, False, True),
+        ("https://archive.softwareheritage.org/swh:1:dir:" + "a" * 40, None, False, False),
+    ])
+    def test_identifier_kinds(self, value, kind, is_doi, is_swhid):
+        record = classify_url(value)
+        assert record.doi_kind == kind
+        assert record.is_doi == is_doi
+        assert record.is_raw_swhid == is_swhid
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://github.com/a/b/issues", True),
+        ("https://example.org/tickets/", True),
+        ("https://github.com/a/b", False),
+        ("github.com/a/b/issues", False),
+    ])
+    def test_issue_tracker(self, url, expected):
+        assert classify_url(url).is_issue_tracker == expected
+
+
+class TestUrlView:
+    """Test suite for the shared URL and identifier category views"""
+
+    def test_entries_are_classified(self, somef_data):
+        view = UrlView(somef_data["code_repository"])
+        assert [entry.source for entry in view.metadata_entries()] == [
+            "repository/codemeta.json", "repository/package.json",
+        ]
+
+        identifiers = UrlView(somef_data["identifier"])
+        assert [entry.value for entry in identifiers.codemeta_entries()] == ["RsMetaCheck"]
+        assert [entry.value for entry in identifiers.other_entries()] == ["10.5281/zenodo.1234"]
+
+    def test_view_is_shared_by_the_detectors(self, somef_data):
+        with shared_category_views():
+            view = url_view(somef_data, "code_repository")
+            assert detect_coderepository_homepage_pitfall(somef_data, "test.json")["has_pitfall"]
+            assert not detect_git_remote_shorthand_pitfall(somef_data, "test.json")["has_warning"]
+            assert not detect_different_repository_pitfall(somef_data, "test.json")["has_pitfall"]
+            assert url_view(somef_data, "code_repository") is view
+
+    def test_codemeta_source_is_case_insensitive(self, somef_data):
+        result = detect_identifier_name_warning(somef_data, "test.json")
+        assert result["has_warning"]
+        assert result["codemeta_source"] == "repository/CodeMeta.json"
+
+    def test_non_string_values_are_not_urls(self):
+        somef_data = {"code_repository": [_entry(["https://a.org/", "https://b.org/"], "repository/codemeta.json")]}
+        assert not detect_coderepository_homepage_pitfall(somef_data, "test.json")["has_pitfall"]
+
+    def test_missing_category(self):
+        assert url_view({}, "identifier") is None
+        assert url_view({"identifier": "x"}, "identifier") is None
@@ -0,0 +1,84 @@
+import pytest
+
+from rsmetacheck.scripts.pitfalls.p001 import detect_version_mismatch
+from rsmetacheck.utils import pitfall_utils
+from rsmetacheck.utils.version_analysis import (
+    canonical_version,
+    differs_significantly,
+    is_ahead,
+    normalize_version,
+    version_components,
+    version_text,
+)
+
+
+class TestNormalization:
+    """Test suite for the version normalizations the checks use"""
+
+    @pytest.mark.parametrize("version,expected", [
+        ("v1.2.3", "1.2.3"),
+        ("V2.0 ", "2.0"),
+        (" v1.0", "v1.0"),
+        ("", ""),
+        (None, ""),
+    ])
+    def test_normalize_version(self, version, expected):
+        assert normalize_version(version) == expected
+
+    @pytest.mark.parametrize("version,expected", [
+        (" V1.0.0-Beta ", "1.0.0-beta"),
+        ("v", None),
+        ("   ", None),
+        (None, None),
+    ])
+    def test_canonical_version(self, version, expected):
+        assert canonical_version(version) == expected
+
+    def test_version_text(self):
+        assert version_text(" v1.0\n") == "v1.0"
+
+    def test_pitfall_utils_keeps_normalize_version(self):
+        assert pitfall_utils.normalize_version is normalize_version
+
+
+class TestComparison:
+    """Test suite for the memoized release number comparisons"""
+
+    @pytest.mark.parametrize("version,expected", [
+        ("1.2.3", (1, 2, 3)),
+        ("2.0", (2, 0, 0)),
+        ("1.2.3.4", (1, 2, 3)),
+        ("1.2.0rc1", (1, 2, 0)),
+        ("1.2.0-beta.3", (1, 2, 0)),
+        ("2.0.post1", (2, 0, 0)),
+        ("0.4-2", (0, 4, 2)),
+        ("latest", (0, 0, 0)),
+    ])
+    def test_version_components(self, version, expected):
+        assert version_components(version) == expected
+
+    def test_is_ahead(self):
+        assert is_ahead("1.10.0", "1.9.0")
+        assert not is_ahead("1.2.0rc1", "1.2.0")
+        assert not is_ahead("1.0", "1.0.0")
+
+    def test_differs_significantly(self):
+        assert differs_significantly("3.0.0", "1.0.0")
+        assert not differs_significantly("1.1.0", "1.0.0")
+        assert differs_significantly("1.1.0", "1.0.0", threshold=1)
+
+    def test_release_version_is_parsed_once(self):
+        somef_data = {
+            "version": [
+                {"source": f"repository/{name}", "result": {"value": "1.0.1"}}
+                for name in ("codemeta.json", "setup.py", "package.json")
+            ],
+            "releases": [{"tag": "v1.0.0"}],
+        }
+        version_components.cache_clear()
+
+        result = detect_version_mismatch(somef_data, "test.json")[0]
+
+        assert result["has_note"]
+        assert len(result["notes"]) == 3
+        assert version_components.cache_info().misses == 2
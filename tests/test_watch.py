@@ -0,0 +1,183 @@
+import json
+import time
+
+import pytest
+
+from rsmetacheck.detect_pitfalls_main import AnalysisSession
+from rsmetacheck.watch import DirectoryWatch, InotifyWatcher, PollingWatcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWatcher:
+    """Watcher whose events are queued by the test."""
+
+    def __init__(self):
+        self.events = []
+        self.closed = False
+
+    def changes(self, timeout):
+        if self.events:
+            return self.events.pop(0)
+        return set(), set()
+
+    def close(self):
+        self.closed = True
+
+
+def _somef_data(version):
+    return {
+        "full_name": [{"result": {"value": "owner/repo"}}],
+        "version": [{"source": "repository/codemeta.json", "result": {"value": version}}],
+        "releases": [{"tag": "1.0.0"}],
+        "programming_languages": [{"result": {"value": "Python"}}],
+    }
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    monkeypatch.setattr("rsmetacheck.utils.json_ld_utils.fetch_latest_commit_id", lambda url: "abc123")
+    somef_dir = tmp_path / "somef_outputs"
+    somef_dir.mkdir()
+    (somef_dir / "existing.json").write_text(json.dumps(_somef_data("1.0.0")))
+    session = AnalysisSession(tmp_path / "pitfalls", tmp_path / "analysis_results.json")
+    watcher = FakeWatcher()
+    clock = FakeClock()
+    watch = DirectoryWatch(session, [somef_dir], debounce=2.0, watcher=watcher, clock=clock)
+    return somef_dir, tmp_path, watch, watcher, clock
+
+
+def _summary(tmp_path):
+    return json.loads((tmp_path / "analysis_results.json").read_text())
+
+
+class TestDirectoryWatch:
+    """Test suite for analyzing SoMEF outputs as they are written"""
+
+    def test_existing_files_are_analyzed_at_start(self, setup):
+        somef_dir, tmp_path, watch, _, _ = setup
+
+        assert watch.step(0) == 1
+        assert _summary(tmp_path)["summary"]["total_repositories_analyzed"] == 1
+
+    def test_new_file_waits_for_the_debounce_delay(self, setup):
+        somef_dir, tmp_path, watch, watcher, clock = setup
+        watch.step(0)
+        new_file = somef_dir / "new.json"
+        new_file.write_text(json.dumps(_somef_data("3.0.0")))
+
+        watcher.events.append(({new_file}, set()))
+        assert watch.step(0) == 0
+        clock.now += 2.5
+        assert watch.step(0) == 1
+
+        summary = _summary(tmp_path)
+        assert summary["summary"]["total_repositories_analyzed"] == 2
+        assert summary["pitfalls & warnings"][0]["count"] == 1
+        assert (tmp_path / "pitfalls" / "new_pitfalls.jsonld").exists()
+
+    def test_modified_file_replaces_its_previous_results(self, setup):
+        somef_dir, tmp_path, watch, watcher, clock = setup
+        changed_file = somef_dir / "existing.json"
+        changed_file.write_text(json.dumps(_somef_data("3.0.0")))
+        watch.step(0)
+        assert (tmp_path / "pitfalls" / "existing_pitfalls.jsonld").exists()
+
+        changed_file.write_text(json.dumps(_somef_data("1.0.0")))
+        watcher.events.append(({changed_file}, set()))
+        watch.step(0)
+        clock.now += 3
+        watch.step(0)
+
+        summary = _summary(tmp_path)
+        assert summary["summary"]["total_repositories_analyzed"] == 1
+        assert summary["pitfalls & warnings"][0]["count"] == 0
+        assert not (tmp_path / "pitfalls" / "existing_pitfalls.jsonld").exists()
+
+    def test_partial_file_is_retried_on_its_next_change(self, setup, capsys):
+        somef_dir, tmp_path, watch, watcher, clock = setup
+        watch.step(0)
+        partial = somef_dir / "partial.json"
+        partial.write_text('{"full_name": [')
+
+        watcher.events.append(({partial}, set()))
+        assert watch.step(0) == 0
+        clock.now += 3
+        assert watch.step(0) == 0
+        assert "not valid JSON yet" in capsys.readouterr().out
+        clock.now += 3
+        assert watch.step(0) == 0
+
+        partial.write_text(json.dumps(_somef_data("1.0.0")))
+        watcher.events.append(({partial}, set()))
+        watch.step(0)
+        clock.now += 3
+        assert watch.step(0) == 1
+
+    def test_deleted_file_leaves_the_summary(self, setup):
+        somef_dir, tmp_path, watch, watcher, _ = setup
+        watch.step(0)
+        (somef_dir / "existing.json").unlink()
+
+        watcher.events.append((set(), {somef_dir / "existing.json"}))
+        assert watch.step(0) == 1
+        assert _summary(tmp_path)["summary"]["total_repositories_analyzed"] == 0
+
+    def test_codemeta_files_are_ignored(self, setup):
+        somef_dir, _, watch, watcher, clock = setup
+        watch.step(0)
+        codemeta = somef_dir / "existing_somef_generated_codemeta.json"
+        codemeta.write_text("{}")
+
+        watcher.events.append(({codemeta}, set()))
+        watch.step(0)
+        clock.now += 3
+        assert watch.step(0) == 0
+
+    def test_run_stops_and_closes_the_watcher(self, setup):
+        _, _, watch, watcher, _ = setup
+        watch.run(stop=lambda: True)
+        assert watcher.closed
+
+
+class TestWatchers:
+    """Test suite for the change detection backends"""
+
+    def test_polling_watcher(self, tmp_path):
+        kept = tmp_path / "kept.json"
+        kept.write_text("{}")
+        gone = tmp_path / "gone.json"
+        gone.write_text("{}")
+        watcher = PollingWatcher([tmp_path], interval=0)
+
+        new = tmp_path / "new.json"
+        new.write_text("{}")
+        gone.unlink()
+
+        assert watcher.changes(0) == ({new}, {gone})
+        assert watcher.changes(0) == (set(), set())
+
+    def test_inotify_watcher(self, tmp_path):
+        try:
+            watcher = InotifyWatcher([tmp_path])
+        except (OSError, AttributeError):
+            pytest.skip("inotify is not available")
+        try:
+            new = tmp_path / "new.json"
+            new.write_text("{}")
+            changed, removed = watcher.changes(1)
+            assert changed == {new}
+            new.unlink()
+            deadline = time.monotonic() + 1
+            removed = set()
+            while not removed and time.monotonic() < deadline:
+                _, removed = watcher.changes(0.1)
+            assert removed == {new}
+        finally:
+            watcher.close()